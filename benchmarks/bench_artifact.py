@@ -0,0 +1,133 @@
+"""
+Cold-start-to-first-prediction benchmark: session vs inference artifact.
+
+Trains a session per model type on synthetic data, exports it with
+``myclt export`` and times fresh interpreters that
+    - import numpy only (floor)
+    - restore the session (model_registry.load_session_state) and predict one row
+    - load the artifact (inference.load_artifact) and predict one row
+Also reports the file sizes and the warm single-row latency of both paths.
+
+Usage (from the repository root):
+    python benchmarks/bench_artifact.py
+    python benchmarks/bench_artifact.py --samples 5000 --models kernel_svm,ovr_svm
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from myclt.ML.inference import load_artifact
+from myclt.ML.model_registry import load_session_state
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _cli(*argv: str) -> dict:
+    proc = subprocess.run([sys.executable, "-m", "myclt", *argv], capture_output=True,
+                          text=True, env=_env(), check=True)
+    return json.loads(proc.stdout)
+
+
+def _wall_ms(code: str, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=_env())
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+_SESSION_CODE = """
+import numpy as np
+from myclt.ML.model_registry import load_session_state
+_, s = load_session_state({path!r})
+std = getattr(s, "scaled_std", None)
+std = std if std is not None else s.scaler_std
+x = np.zeros((1, {d}))
+s.model.predict((x - s.scaler_mean) / std)
+"""
+
+_ARTIFACT_CODE = """
+from myclt.ML.inference import load_artifact
+load_artifact({path!r}).predict([[0.0] * {d}])
+"""
+
+
+def _warm_us(session: str, artifact: str, d: int, repeats: int = 200):
+    """Warm single-row predict latency (session model vs Predictor), in µs."""
+    _, s = load_session_state(session)
+    std = getattr(s, "scaled_std", None)
+    std = std if std is not None else s.scaler_std
+    p = load_artifact(artifact)
+    x = np.zeros((1, d))
+    out = []
+    for fn in (lambda: s.model.predict((x - s.scaler_mean) / std), lambda: p.predict(x)):
+        fn()
+        t0 = time.perf_counter()
+        for _ in range(repeats):
+            fn()
+        out.append((time.perf_counter() - t0) / repeats * 1e6)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--features", type=int, default=10)
+    parser.add_argument("--models", default="logistic_regression,linear_svm,kernel_svm,ovr_svm")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    d = args.features
+    X = rng.normal(size=(args.samples, d))
+    score = X @ rng.normal(size=d)
+    y = np.digitize(score, np.quantile(score, [1 / 3, 2 / 3]))
+
+    floor = _wall_ms("import numpy", args.repeats)
+    print(f"samples={args.samples} features={d}  (python + import numpy: {floor:.0f} ms)\n")
+    header = (f"{'model':<22} {'session KB':>10} {'artifact KB':>11} {'cold session ms':>16} "
+              f"{'cold artifact ms':>17} {'warm session µs':>16} {'warm artifact µs':>17}")
+    print(header)
+    print("-" * len(header))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = os.path.join(tmp, "train.csv")
+        cols = [f"x{i}" for i in range(d)]
+        np.savetxt(csv, np.column_stack([X, y >= 1, y]), delimiter=";", comments="", fmt="%.5f",
+                   header=";".join(cols + ["binary", "multi"]))
+
+        for model in args.models.split(","):
+            target = "multi" if model.startswith(("ovr", "multinomial")) else "binary"
+            extra = ["--base", "kernel"] if model == "ovr_svm" else []
+            session, artifact = os.path.join(tmp, model), os.path.join(tmp, model + ".npz")
+            _cli("train", csv, "--target", target, "--features", ",".join(cols),
+                 "--model", model, "--epochs", "100", "--save", session, *extra)
+            _cli("export", session, artifact)
+
+            session_kb = sum(os.path.getsize(os.path.join(session, f))
+                             for f in os.listdir(session)) / 1024
+            cold_session = _wall_ms(_SESSION_CODE.format(path=session, d=d), args.repeats)
+            cold_artifact = _wall_ms(_ARTIFACT_CODE.format(path=artifact, d=d), args.repeats)
+            warm_session, warm_artifact = _warm_us(session, artifact, d)
+            label = model + (" (kernel)" if extra else "")
+            print(f"{label:<22} {session_kb:>10.0f} {os.path.getsize(artifact) / 1024:>11.0f} "
+                  f"{cold_session:>16.0f} {cold_artifact:>17.0f} "
+                  f"{warm_session:>16.0f} {warm_artifact:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
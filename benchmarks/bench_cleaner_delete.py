@@ -0,0 +1,107 @@
+"""
+Temp-file cleaner scan-and-delete benchmark.
+
+Builds a fresh synthetic tree for every case and times the whole clean:
+    - the previous implementation: scan_directory for the totals, then a
+      second walk with os.path.getsize + send2trash one file at a time
+    - one scan into a manifest + send2trash in batches
+    - one scan into a manifest + os.unlink, 1 thread and a thread pool
+HOME and XDG_DATA_HOME point into the benchmark directory, so the trashed
+files land in a throw-away trash on the same filesystem, not in yours.
+
+Usage (from the repository root):
+    python benchmarks/bench_cleaner_delete.py
+    python benchmarks/bench_cleaner_delete.py --files 100000 --batch-size 2000 --workers 16
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from myclt.legacy_code.cleaner import delete_files, scan_directories, scan_directory
+
+
+def _legacy_clean(path: str):
+    """scan_directory + the os.walk/getsize/send2trash loop clean_directory used before."""
+    from send2trash import send2trash
+
+    scan_directory(path)
+    deleted = freed = 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            fp = os.path.join(root, f)
+            try:
+                size = os.path.getsize(fp)
+                send2trash(fp)
+                deleted += 1
+                freed += size
+            except Exception:
+                pass
+    return deleted, freed
+
+
+def _manifest_clean(path: str, **kwargs):
+    st = scan_directories([path], collect=True)[0]
+    report = delete_files(st.entries, **kwargs)
+    return report.files, report.bytes
+
+
+def _build_tree(root: str, n_files: int, per_dir: int) -> None:
+    payload = bytes(4096)
+    for d in range(-(-n_files // per_dir)):
+        directory = os.path.join(root, f"d{d // 100:03d}", f"d{d:05d}")
+        os.makedirs(directory)
+        for f in range(min(per_dir, n_files - d * per_dir)):
+            fd = os.open(os.path.join(directory, f"f{f:04d}"), os.O_CREAT | os.O_WRONLY, 0o644)
+            os.write(fd, payload[:(d * 7 + f * 13) % 4096])
+            os.close(fd)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--per-dir", type=int, default=100, help="files per leaf directory")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp(prefix="clean_bench_")
+    os.environ["HOME"] = base
+    os.environ["XDG_DATA_HOME"] = os.path.join(base, "share")
+    try:
+        print(f"tree: {args.files:,} files, {args.per_dir} per directory\n")
+        header = f"{'cleaner':<36} {'time s':>8} {'files/s':>10} {'MB/s':>8} {'speedup':>8}"
+        print(header)
+        print("-" * len(header))
+        cases = [
+            ("two walks, send2trash per file", _legacy_clean),
+            (f"manifest, send2trash x{args.batch_size}",
+             lambda p: _manifest_clean(p, batch_size=args.batch_size)),
+            ("manifest, unlink, 1 thread",
+             lambda p: _manifest_clean(p, permanent=True, workers=1)),
+            (f"manifest, unlink, pool ({args.workers or 'default'})",
+             lambda p: _manifest_clean(p, permanent=True, workers=args.workers,
+                                       batch_size=args.batch_size)),
+        ]
+        baseline = reference = None
+        for i, (name, fn) in enumerate(cases):
+            tree = os.path.join(base, f"tree{i}")
+            _build_tree(tree, args.files, args.per_dir)
+            t0 = time.perf_counter()
+            result = fn(tree)
+            elapsed = time.perf_counter() - t0
+            baseline = baseline or elapsed
+            reference = reference or result
+            assert result == reference, f"{name}: {result} != {reference}"
+            files, size = result
+            print(f"{name:<36} {elapsed:>8.2f} {files / elapsed:>10,.0f} "
+                  f"{size / 1024**2 / elapsed:>8.1f} {baseline / elapsed:>7.1f}x")
+            shutil.rmtree(os.path.join(base, "share"), ignore_errors=True)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Temp-file cleaner scan benchmark.
+
+Builds a synthetic tree (default 1M small files under several roots) and
+times counting files/bytes with:
+    - the previous implementation: os.walk + os.path.getsize per file,
+      one root after another
+    - cleaner.scan_directories with 1 worker (scandir + DirEntry.stat)
+    - cleaner.scan_directories with a thread pool
+    - cleaner.scan_directories with the ScanIndex of a previous run
+      (unchanged tree: one stat per directory instead of a listing)
+All passes run on a warm page cache (an untimed pass runs first).
+
+Usage (from the repository root):
+    python benchmarks/bench_cleaner_scan.py
+    python benchmarks/bench_cleaner_scan.py --files 200000 --workers 16
+    python benchmarks/bench_cleaner_scan.py --tree /tmp/scan_tree   # keep the tree between runs
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from myclt.legacy_code.cleaner import ScanIndex, scan_directories
+
+
+def _legacy_scan(path: str):
+    """The os.walk + getsize scan that cleaner.scan_directory used before."""
+    total_size = 0
+    file_count = 0
+    if not os.path.exists(path):
+        return 0, 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            try:
+                fp = os.path.join(root, f)
+                total_size += os.path.getsize(fp)
+                file_count += 1
+            except (FileNotFoundError, PermissionError):
+                pass
+    return file_count, total_size
+
+
+def _build_tree(base: str, n_files: int, n_roots: int, per_dir: int) -> list:
+    """roots/rN/dAAA/dBBB/fCCC with files of 0..511 bytes."""
+    roots = [os.path.join(base, f"r{i}") for i in range(n_roots)]
+    marker = os.path.join(base, f".built_{n_files}_{n_roots}_{per_dir}")
+    if os.path.exists(marker):
+        return roots
+    shutil.rmtree(base, ignore_errors=True)
+    payload = bytes(512)
+    n_dirs = -(-n_files // per_dir)
+    for d in range(n_dirs):
+        root = roots[d % n_roots]
+        directory = os.path.join(root, f"d{d // 100 % 100:03d}", f"d{d:06d}")
+        os.makedirs(directory, exist_ok=True)
+        for f in range(min(per_dir, n_files - d * per_dir)):
+            fd = os.open(os.path.join(directory, f"f{f:04d}"), os.O_CREAT | os.O_WRONLY, 0o644)
+            os.write(fd, payload[:(d * 7 + f * 13) % 512])
+            os.close(fd)
+        if d % 1000 == 0:
+            print(f"\r  building tree: {d * per_dir:,}/{n_files:,} files", end="", flush=True)
+    open(marker, "w").close()
+    print()
+    return roots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--roots", type=int, default=4)
+    parser.add_argument("--per-dir", type=int, default=100, help="files per leaf directory")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--tree", help="directory for the synthetic tree (kept)")
+    args = parser.parse_args()
+
+    base = args.tree or tempfile.mkdtemp(prefix="scan_tree_")
+    try:
+        t0 = time.perf_counter()
+        roots = _build_tree(base, args.files, args.roots, args.per_dir)
+        print(f"tree: {args.files:,} files in {args.roots} roots ({time.perf_counter() - t0:.0f} s to build)\n")
+        index = ScanIndex()
+        scan_directories(roots, index=index)    # warm the page cache, fill the index
+        time.sleep(ScanIndex.RACY_SECONDS)      # the tree was just written
+        index = ScanIndex()
+        scan_directories(roots, index=index)
+        previous = index.current
+
+        header = f"{'scanner':<40} {'time s':>8} {'files/s':>12} {'speedup':>8}"
+        print(header)
+        print("-" * len(header))
+        cases = [
+            ("os.walk + getsize, roots in sequence", lambda: [_legacy_scan(r) for r in roots]),
+            ("scandir, 1 worker", lambda: [(s.files, s.bytes) for s in scan_directories(roots, workers=1)]),
+            (f"scandir, thread pool ({args.workers or 'default'})",
+             lambda: [(s.files, s.bytes) for s in scan_directories(roots, workers=args.workers)]),
+            ("scandir + index of the previous run",
+             lambda: [(s.files, s.bytes) for s in scan_directories(
+                 roots, workers=args.workers, index=ScanIndex(previous))]),
+        ]
+        baseline = reference = None
+        for name, fn in cases:
+            t0 = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - t0
+            baseline = baseline or elapsed
+            reference = reference or result
+            assert result == reference, f"{name}: {result} != {reference}"
+            n = sum(f for f, _ in result)
+            print(f"{name:<40} {elapsed:>8.2f} {n / elapsed:>12,.0f} {baseline / elapsed:>7.1f}x")
+    finally:
+        if not args.tree:
+            shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Decision-boundary mesh evaluation benchmark.
+
+Times three ways of scoring the resolution² mesh of a 2D kernel SVM plot:
+    - decision_function + predict on the full mesh (previous behaviour)
+    - decision_function once, labels derived from the scores
+    - coarse-to-fine adaptive grid (only fine points near the contours)
+and reports how many mesh labels the adaptive grid gets wrong.
+
+Usage (from the repository root):
+    python benchmarks/bench_decision_boundary.py
+    python benchmarks/bench_decision_boundary.py --resolution 801 --train 3000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from myclt.ML.supervised_learning.svm.core import KernelSVM, OneVsRestSVM
+from myclt.ML.supervised_learning.svm.visualization import _decision_grid, _labels_from_scores
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--train", type=int, default=1500)
+    parser.add_argument("--resolution", type=int, default=401)
+    parser.add_argument("--coarse-step", type=int, default=8)
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    X = rng.normal(size=(args.train, 2))
+    y_bin = (X[:, 0] ** 2 + X[:, 1] ** 2 < 1.2).astype(int)
+    y_multi = np.digitize(np.arctan2(X[:, 1], X[:, 0]), [-1.0, 1.0])
+
+    binary = KernelSVM(kernel="rbf", gamma=1.0, C=10, learning_rate=0.05, epochs=args.epochs)
+    binary.fit(X, y_bin)
+    ovr = OneVsRestSVM(KernelSVM(kernel="rbf", gamma=1.0, C=10, learning_rate=0.05,
+                                 epochs=args.epochs // 3))
+    ovr.fit(X, y_multi)
+
+    step = args.coarse_step
+    res = -(-(args.resolution - 1) // step) * step + 1
+    xs = np.linspace(X[:, 0].min() - 0.5, X[:, 0].max() + 0.5, res)
+    ys = np.linspace(X[:, 1].min() - 0.5, X[:, 1].max() + 0.5, res)
+    xx, yy = np.meshgrid(xs, ys)
+    grid = np.c_[xx.ravel(), yy.ravel()]
+
+    print(f"train={args.train} mesh={res}x{res} coarse_step={step}\n")
+    header = f"{'model':<16} {'mode':<26} {'time s':>8} {'evaluated':>10} {'label err':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for name, model in (("KernelSVM", binary), ("OneVsRest(rbf)", ovr)):
+        t_old, _ = _timed(lambda: (model.decision_function(grid), model.predict(grid)))
+        t_once, (full, n_full) = _timed(lambda: _decision_grid(model, xs, ys, False, step))
+        t_adapt, (adapt, n_adapt) = _timed(lambda: _decision_grid(model, xs, ys, True, step))
+        multiclass = full.ndim == 3
+        err = np.mean(_labels_from_scores(full, multiclass) != _labels_from_scores(adapt, multiclass))
+
+        print(f"{name:<16} {'decision + predict':<26} {t_old:>8.3f} {2 * grid.shape[0]:>10}")
+        print(f"{'':<16} {'decision once':<26} {t_once:>8.3f} {n_full:>10}")
+        print(f"{'':<16} {'adaptive coarse-to-fine':<26} {t_adapt:>8.3f} {n_adapt:>10} {err:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
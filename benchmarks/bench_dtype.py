@@ -0,0 +1,109 @@
+"""
+float32 vs float64 compute mode benchmark.
+
+Trains every model family on the same synthetic data in both precisions
+and reports fit / predict time and the metric difference between them.
+
+Usage (from the repository root):
+    python benchmarks/bench_dtype.py
+    python benchmarks/bench_dtype.py --samples 50000 --features 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from myclt.ML.base_models import standardize_fit
+from myclt.ML.supervised_learning.linear_regression.core import LinearRegressionGD
+from myclt.ML.supervised_learning.logistic_regression.core import (
+    LogisticRegressionGD, MultinomialLogisticRegression,
+)
+from myclt.ML.supervised_learning.svm.core import KernelSVM, LinearSVM
+
+
+def _make_data(n_samples: int, n_features: int, seed: int):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_samples, n_features))
+    w = rng.normal(size=n_features)
+    z = X @ w + 0.1 * rng.normal(size=n_samples)
+    y_reg = z
+    y_bin = (z > 0).astype(int)
+    y_multi = np.digitize(z, np.quantile(z, [1 / 3, 2 / 3]))
+    X, _, _ = standardize_fit(X)
+    return X, y_reg, y_bin, y_multi
+
+
+def _mse(y_true, y_pred) -> float:
+    return float(np.mean((y_true - y_pred) ** 2))
+
+
+def _accuracy(y_true, y_pred) -> float:
+    return float(np.mean(y_true == y_pred))
+
+
+def _time_model(make_model, X, y, metric, repeats: int):
+    fit_times, predict_times = [], []
+    for _ in range(repeats):
+        model = make_model()
+        t0 = time.perf_counter()
+        model.fit(X, y)
+        fit_times.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        pred = model.predict(X)
+        predict_times.append(time.perf_counter() - t0)
+    return min(fit_times), min(predict_times), metric(y, pred)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--features", type=int, default=100)
+    parser.add_argument("--kernel-samples", type=int, default=2000)
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    X, y_reg, y_bin, y_multi = _make_data(args.samples, args.features, args.seed)
+    n_k = min(args.kernel_samples, args.samples)
+    epochs = args.epochs
+
+    # (name, model factory taking dtype, X, y, metric name, metric)
+    cases = [
+        ("LinearRegressionGD",
+         lambda dt: LinearRegressionGD(epochs=epochs, tol=None, dtype=dt),
+         X, y_reg, "mse", _mse),
+        ("LogisticRegressionGD",
+         lambda dt: LogisticRegressionGD(learning_rate=0.1, epochs=epochs, tol=None, dtype=dt),
+         X, y_bin, "acc", _accuracy),
+        ("MultinomialLogisticRegression",
+         lambda dt: MultinomialLogisticRegression(learning_rate=0.1, epochs=epochs, tol=None, dtype=dt),
+         X, y_multi, "acc", _accuracy),
+        ("LinearSVM",
+         lambda dt: LinearSVM(learning_rate=0.01, epochs=epochs, tol=None, dtype=dt),
+         X, y_bin, "acc", _accuracy),
+        ("KernelSVM (rbf)",
+         lambda dt: KernelSVM(kernel="rbf", gamma=1.0 / args.features,
+                              learning_rate=0.01, epochs=epochs // 3, dtype=dt),
+         X[:n_k], y_bin[:n_k], "acc", _accuracy),
+    ]
+
+    print(f"samples={args.samples} features={args.features} "
+          f"kernel_samples={n_k} epochs={epochs} repeats={args.repeats}\n")
+    header = (f"{'model':<30} {'fit64 s':>9} {'fit32 s':>9} {'speedup':>8} "
+              f"{'pred64 s':>9} {'pred32 s':>9} {'metric':>7} {'Δmetric':>10}")
+    print(header)
+    print("-" * len(header))
+
+    for name, make_model, Xc, yc, metric_name, metric in cases:
+        fit64, pred64, m64 = _time_model(lambda: make_model("float64"), Xc, yc, metric, args.repeats)
+        X32 = Xc.astype(np.float32)
+        fit32, pred32, m32 = _time_model(lambda: make_model("float32"), X32, yc, metric, args.repeats)
+        print(f"{name:<30} {fit64:>9.4f} {fit32:>9.4f} {fit64 / fit32:>7.2f}x "
+              f"{pred64:>9.4f} {pred32:>9.4f} {metric_name:>7} {m32 - m64:>+10.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Confusion-matrix / classification-metric kernel benchmark.
+
+Compares the previous per-sample Python loop against the single
+``np.bincount(K * y_true + y_pred)`` kernel in myclt.ML.base_metrics,
+then times a full macro/micro/weighted report derived from one matrix.
+Also compares the old per-sample ROC/AUC loop with the sort + cumsum
+roc_curve / roc_auc_score.
+
+The loop is slow, so it runs on a subset (--loop-samples) and its time
+is extrapolated linearly to the full sample count.
+
+Usage (from the repository root):
+    python benchmarks/bench_metrics.py
+    python benchmarks/bench_metrics.py --samples 10000000 --classes 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from myclt.ML.base_metrics import (
+    confusion_matrix_counts, precision_recall_f1_from_cm, roc_curve, auc, roc_auc_score,
+)
+from myclt.ML.supervised_learning.logistic_regression.metrics import multiclass_confusion_matrix
+from myclt.ML.supervised_learning.svm.metrics import confusion_matrix
+
+
+def _loop_confusion_matrix(y_true, y_pred, n_classes):
+    cm = np.zeros((n_classes, n_classes), dtype=int)
+    for t, p in zip(y_true, y_pred):
+        cm[int(t), int(p)] += 1
+    return cm
+
+
+def _loop_roc_auc(y_true, y_score):
+    order = np.argsort(-y_score)
+    y_sorted = y_true[order]
+    n_pos = np.sum(y_true == 1)
+    n_neg = np.sum(y_true == 0)
+    fpr_list, tpr_list = [0.0], [0.0]
+    tp = fp = 0
+    for i in range(len(order)):
+        if y_sorted[i] == 1:
+            tp += 1
+        else:
+            fp += 1
+        fpr_list.append(fp / n_neg)
+        tpr_list.append(tp / n_pos)
+    area = 0.0
+    for i in range(1, len(fpr_list)):
+        area += (fpr_list[i] - fpr_list[i - 1]) * (tpr_list[i] + tpr_list[i - 1]) / 2.0
+    return area
+
+
+def _best_of(fn, repeats: int):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=10_000_000)
+    parser.add_argument("--classes", type=int, default=100)
+    parser.add_argument("--loop-samples", type=int, default=200_000)
+    parser.add_argument("--roc-samples", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    K, n = args.classes, args.samples
+    y_true = rng.integers(0, K, n)
+    # ~70% correct predictions
+    y_pred = np.where(rng.random(n) < 0.7, y_true, rng.integers(0, K, n))
+
+    n_loop = min(args.loop_samples, n)
+    loop_t, loop_cm = _best_of(
+        lambda: _loop_confusion_matrix(y_true[:n_loop], y_pred[:n_loop], K), 1)
+    loop_full = loop_t * n / n_loop
+    sub_cm = multiclass_confusion_matrix(y_true[:n_loop], y_pred[:n_loop], K)
+    assert np.array_equal(loop_cm, sub_cm), "!bincount kernel disagrees with the loop!"
+
+    cases = [
+        ("bincount (labels 0..K-1)",
+         lambda: multiclass_confusion_matrix(y_true, y_pred, K)),
+        ("bincount (inferred labels)",
+         lambda: confusion_matrix(y_true, y_pred)),
+        ("bincount (shuffled labels)",
+         lambda: confusion_matrix_counts(y_true, y_pred, labels=rng.permutation(K))),
+    ]
+
+    print(f"samples={n:,} classes={K} loop_samples={n_loop:,} repeats={args.repeats}\n")
+    header = f"{'kernel':<30} {'time s':>10} {'speedup':>10}"
+    print(header)
+    print("-" * len(header))
+    print(f"{'python loop (extrapolated)':<30} {loop_full:>10.3f} {'1.00x':>10}")
+
+    cm = None
+    for name, fn in cases:
+        t, result = _best_of(fn, args.repeats)
+        if cm is None:
+            cm = result
+        print(f"{name:<30} {t:>10.3f} {loop_full / t:>9.1f}x")
+
+    t, _ = _best_of(lambda: [precision_recall_f1_from_cm(cm, a)
+                             for a in (None, "macro", "micro", "weighted")], args.repeats)
+    print(f"\nAll P/R/F1 averages from one {K}x{K} matrix: {t * 1e3:.3f} ms")
+
+    # ROC / AUC
+    n_roc = min(args.roc_samples, n)
+    y_bin = (y_true[:n_roc] % 2).astype(int)
+    score = y_bin + rng.normal(size=n_roc)
+    loop_t, loop_auc = _best_of(lambda: _loop_roc_auc(y_bin, score), 1)
+
+    def _vectorised():
+        fpr, tpr, _ = roc_curve(y_bin, score)
+        return auc(fpr, tpr)
+
+    vec_t, vec_auc = _best_of(_vectorised, args.repeats)
+    proba = rng.dirichlet(np.ones(K), size=n_roc // 10)
+    ovr_t, _ = _best_of(lambda: roc_auc_score(y_true[:n_roc // 10], proba), 1)
+
+    print(f"\nROC + AUC on {n_roc:,} scores")
+    print(f"{'python loop':<30} {loop_t:>10.3f} {'1.00x':>10}   AUC={loop_auc:.6f}")
+    print(f"{'sort + cumsum':<30} {vec_t:>10.3f} {loop_t / vec_t:>9.1f}x   AUC={vec_auc:.6f}")
+    print(f"One-vs-rest macro AUC, {n_roc // 10:,} x {K} scores: {ovr_t:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
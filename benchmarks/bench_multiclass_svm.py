@@ -0,0 +1,86 @@
+"""
+Multiclass linear SVM benchmark: Crammer–Singer vs One-vs-Rest.
+
+Generates a --classes-class Gaussian-blob dataset and trains, for the same
+number of epochs (convergence stopping off, so every model does the same
+amount of work):
+    - OneVsRestSVM over LinearSVM: K binary SVMs, K passes over X per epoch
+    - MulticlassLinearSVM: one (n_features x K) weight matrix, one X @ W
+      per batch
+both full-batch and with --batch-size mini-batches. Reports fit time,
+predict time and test accuracy; speedups are relative to OvR with the
+same batching.
+
+Usage (from the repository root):
+    python benchmarks/bench_multiclass_svm.py
+    python benchmarks/bench_multiclass_svm.py --samples 50000 --features 64 --classes 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from myclt.ML.supervised_learning.svm import LinearSVM, MulticlassLinearSVM, OneVsRestSVM
+
+
+def _make_blobs(n_samples: int, n_features: int, n_classes: int, seed: int):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(0.0, 1.0, (n_classes, n_features))
+    y = rng.integers(0, n_classes, n_samples)
+    X = centers[y] + rng.normal(0.0, 0.6, (n_samples, n_features))
+    n_train = int(0.8 * n_samples)
+    return X[:n_train], y[:n_train], X[n_train:], y[n_train:]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--features", type=int, default=32)
+    parser.add_argument("--classes", type=int, default=50)
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--lr", type=float, default=0.05)
+    parser.add_argument("--C", type=float, default=10.0)
+    parser.add_argument("--dtype", choices=["float32", "float64"], default="float64")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    X_train, y_train, X_test, y_test = _make_blobs(args.samples, args.features,
+                                                   args.classes, args.seed)
+    print(f"data: {len(X_train):,} train / {len(X_test):,} test rows, "
+          f"{args.features} features, {args.classes} classes, {args.epochs} epochs\n")
+
+    params = dict(C=args.C, learning_rate=args.lr, epochs=args.epochs, tol=None,
+                  dtype=args.dtype)
+    cases = []
+    for batch_size in (0, args.batch_size):
+        batching = "full batch" if batch_size == 0 else f"batch {batch_size}"
+        cases.append((f"one-vs-rest, {batching}",
+                      lambda b=batch_size: OneVsRestSVM(LinearSVM(batch_size=b, **params))))
+        cases.append((f"crammer-singer, {batching}",
+                      lambda b=batch_size: MulticlassLinearSVM(batch_size=b, **params)))
+
+    header = (f"{'model':<30} {'fit s':>8} {'predict ms':>11} {'accuracy':>9} "
+              f"{'fit speedup':>12} {'predict speedup':>16}")
+    print(header)
+    print("-" * len(header))
+    baseline = None
+    for name, make in cases:
+        np.random.seed(args.seed)           # same mini-batch shuffles for every model
+        model = make()
+        t0 = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        pred = model.predict(X_test)
+        predict_s = time.perf_counter() - t0
+        acc = float(np.mean(pred == y_test))
+        if name.startswith("one-vs-rest"):
+            baseline = (fit_s, predict_s)
+        print(f"{name:<30} {fit_s:>8.3f} {predict_s * 1e3:>11.2f} {acc:>9.4f} "
+              f"{baseline[0] / fit_s:>11.1f}x {baseline[1] / predict_s:>15.1f}x")
+
+
+if __name__ == "__main__":
+    main()
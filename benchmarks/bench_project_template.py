@@ -0,0 +1,136 @@
+"""
+Project template rendering benchmark.
+
+Builds a synthetic multi-package template (--packages packages with
+--modules modules each, a third of the files using {{ variables }}, plus
+binary assets) in a temporary templates directory and times generating a
+project from it with:
+    - a naive renderer: os.walk of the template, os.makedirs + read +
+      substitute + write per file, one file after another (what
+      generate_project_structure did with its hardcoded files)
+    - load_templates with a cold manifest (index the tree) + render_template
+    - load_templates with the cached manifest + render_template
+Every run writes a fresh project (best of --repeats runs is reported);
+the outputs are compared.
+
+Usage (from the repository root):
+    python benchmarks/bench_project_template.py
+    python benchmarks/bench_project_template.py --packages 200 --modules 50 --workers 16
+"""
+
+import argparse
+import filecmp
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from myclt.legacy_code.project_creator import (default_variables, load_templates,
+                                               render_template, substitute)
+
+
+def _build_template(root: str, packages: int, modules: int) -> int:
+    os.makedirs(root)
+    with open(os.path.join(root, "template.json"), "w", encoding="utf-8") as f:
+        json.dump({"description": "benchmark skeleton", "variables": {"license": "MIT"}}, f)
+    files = os.path.join(root, "files")
+    body = "".join(f"def function_{i}(x):\n    return x * {i}\n\n" for i in range(40))
+    n = 0
+    for p in range(packages):
+        package = os.path.join(files, "src", "{{package_name}}", f"pkg{p:03d}")
+        os.makedirs(os.path.join(package, "assets"))
+        for m in range(modules):
+            header = f'"""{{{{project_name}}}} module {m} ({{{{license}}}})"""\n\n' if m % 3 == 0 else ""
+            with open(os.path.join(package, f"mod{m:03d}.py"), "w", encoding="utf-8") as f:
+                f.write(header + body)
+            n += 1
+        with open(os.path.join(package, "assets", "logo.bin"), "wb") as f:
+            f.write(os.urandom(4096))
+        n += 1
+    return n
+
+
+def _naive_render(template_root: str, project_path: str, variables: dict) -> None:
+    files = os.path.join(template_root, "files")
+    for root, _, names in os.walk(files):
+        for name in names:
+            src = os.path.join(root, name)
+            rel = substitute(os.path.relpath(src, files), variables)
+            target = os.path.join(project_path, rel)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(src, "rb") as f:
+                data = f.read()
+            try:
+                data = substitute(data.decode("utf-8"), variables).encode("utf-8")
+            except UnicodeDecodeError:
+                pass
+            with open(target, "wb") as f:
+                f.write(data)
+
+
+def _same_tree(a: str, b: str) -> bool:
+    cmp = filecmp.dircmp(a, b)
+    if cmp.left_only or cmp.right_only or cmp.diff_files or cmp.funny_files:
+        return False
+    return all(_same_tree(os.path.join(a, d), os.path.join(b, d)) for d in cmp.common_dirs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--packages", type=int, default=100)
+    parser.add_argument("--modules", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp(prefix="template_bench_")
+    try:
+        templates_dir = os.path.join(base, "templates")
+        manifest = os.path.join(base, "manifest.json")
+        n_files = _build_template(os.path.join(templates_dir, "big"), args.packages, args.modules)
+        print(f"template: {n_files:,} files in {args.packages} packages\n")
+
+        def naive(project):
+            variables = default_variables(project)
+            variables["license"] = "MIT"
+            _naive_render(os.path.join(templates_dir, "big"), project, variables)
+
+        def engine(project):
+            template = load_templates(templates_dir, manifest)["big"]
+            render_template(template, project, workers=args.workers)
+
+        def cold(project):
+            if os.path.exists(manifest):
+                os.unlink(manifest)
+            engine(project)
+
+        header = f"{'renderer':<36} {'time s':>8} {'files/s':>10} {'speedup':>8}"
+        print(header)
+        print("-" * len(header))
+        cases = [("naive walk, file by file", naive),
+                 ("engine, cold manifest", cold),
+                 (f"engine, cached manifest ({args.workers or 'default'})", engine)]
+        baseline = None
+        times = {name: [] for name, _ in cases}
+        for r in range(args.repeats):
+            for i, (name, fn) in enumerate(cases):
+                project = os.path.join(base, f"out{r}_{i}", "bench_project")
+                os.makedirs(project)
+                t0 = time.perf_counter()
+                fn(project)
+                times[name].append(time.perf_counter() - t0)
+                if r or i:
+                    assert _same_tree(os.path.join(base, "out0_0", "bench_project"), project), \
+                        f"{name}: output differs"
+                    shutil.rmtree(os.path.dirname(project))
+        for name, _ in cases:
+            elapsed = min(times[name])
+            baseline = baseline or elapsed
+            print(f"{name:<36} {elapsed:>8.3f} {n_files / elapsed:>10,.0f} {baseline / elapsed:>7.1f}x")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Headless report rendering benchmark.
+
+Renders a dozen evaluation figures (regression + classification plots on
+a large test set) to files with the Agg backend and compares:
+    - serial rendering, every scatter point drawn
+    - serial rendering, scatter plots downsampled to --max-points
+    - process-pool rendering, downsampled (myclt.ML.report.render_jobs)
+
+Usage (from the repository root):
+    python benchmarks/bench_report.py
+    python benchmarks/bench_report.py --samples 500000 --workers 8 --format svg
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from myclt.ML.report import PlotJob, render_jobs
+from myclt.ML.supervised_learning.svm import visualization as svm_viz
+from myclt.ML.supervised_learning.logistic_regression import visualization as log_viz
+from myclt.ML.supervised_learning.logistic_regression.metrics import confusion_matrix
+
+
+def _jobs(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 2))
+    y_true = X @ np.array([1.5, -2.0]) + rng.normal(scale=0.5, size=n)
+    y_pred = y_true + rng.normal(scale=0.3, size=n)
+    labels = (X[:, 0] + X[:, 1] > 0).astype(int)
+    proba = 1.0 / (1.0 + np.exp(-2.0 * (X[:, 0] + X[:, 1]) + rng.normal(size=n)))
+    history = list(np.exp(-np.linspace(0, 5, 2000)))
+
+    jobs = []
+    for i in range(3):
+        jobs += [
+            PlotJob(f"true_vs_pred_{i}", svm_viz.plot_true_vs_pred, (y_true, y_pred)),
+            PlotJob(f"residuals_{i}", svm_viz.plot_residuals, (y_true, y_pred)),
+            PlotJob(f"svr_tube_{i}", svm_viz.plot_svr_tube, (X, y_true, y_pred, 0.5)),
+        ]
+    jobs += [
+        PlotJob("loss_curve", svm_viz.plot_loss_curve, (history,)),
+        PlotJob("roc_curve", log_viz.plot_roc_curve, (labels, proba)),
+        PlotJob("confusion_matrix", log_viz.plot_confusion_matrix_heatmap,
+                tuple(confusion_matrix(labels, (proba >= 0.5).astype(int)))),
+    ]
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200_000)
+    parser.add_argument("--max-points", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--format", default="png")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    jobs = _jobs(args.samples, args.seed)
+    print(f"figures={len(jobs)} samples={args.samples:,} max_points={args.max_points:,} "
+          f"format={args.format}\n")
+    header = f"{'mode':<36} {'time s':>8} {'speedup':>9}"
+    print(header)
+    print("-" * len(header))
+
+    cases = [
+        ("serial, all points", 1, None),
+        ("serial, downsampled", 1, args.max_points),
+        ("process pool, downsampled", args.workers, args.max_points),
+    ]
+    baseline = None
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name, workers, max_points in cases:
+            t0 = time.perf_counter()
+            render_jobs(jobs, out_dir, fmt=args.format, workers=workers,
+                        max_points=max_points, verbose=False)
+            elapsed = time.perf_counter() - t0
+            baseline = baseline or elapsed
+            print(f"{name:<36} {elapsed:>8.2f} {baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Load test for the local prediction server (myclt serve).
+
+Starts ``python -m myclt serve`` on a free localhost port (once with
+micro-batching, once without), fires single-row requests from concurrent
+keep-alive clients and reports throughput, client-side latency percentiles
+and the mean number of rows per model call from the server's /metrics.
+
+Without --session a synthetic logistic regression session is trained in a
+temporary directory first. With --url an already running server is tested.
+
+Usage (from the repository root):
+    python benchmarks/bench_serve.py
+    python benchmarks/bench_serve.py --clients 32 --requests 500 --rows 4
+    python benchmarks/bench_serve.py --url http://127.0.0.1:8000 --model run1
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _make_session(tmp: str, n_features: int, seed: int) -> str:
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(2000, n_features))
+    y = (X @ rng.normal(size=n_features) > 0).astype(int)
+    csv = os.path.join(tmp, "train.csv")
+    header = ";".join([f"x{i}" for i in range(n_features)] + ["y"])
+    np.savetxt(csv, np.column_stack([X, y]), delimiter=";", header=header, comments="", fmt="%.5f")
+    session = os.path.join(tmp, "session")
+    subprocess.run([sys.executable, "-m", "myclt", "train", csv, "--target", "y",
+                    "--model", "logistic_regression", "--save", session],
+                   check=True, env=_env(), capture_output=True)
+    return session
+
+
+def _start_server(session: str, extra: list) -> tuple:
+    proc = subprocess.Popen([sys.executable, "-m", "myclt", "serve", session, "--port", "0", *extra],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                            env=_env())
+    for line in proc.stderr:        # startup line: {"url": ..., "models": [...]}
+        if line.startswith("{"):
+            return proc, json.loads(line)["url"]
+    raise RuntimeError("server did not start")
+
+
+def _get(url: str, path: str) -> dict:
+    u = urlparse(url)
+    conn = http.client.HTTPConnection(u.hostname, u.port, timeout=30)
+    conn.request("GET", path)
+    body = json.loads(conn.getresponse().read())
+    conn.close()
+    return body
+
+
+def _load(url: str, path: str, clients: int, requests: int, rows: int, n_features: int):
+    """Run the clients; returns (latencies_ms, errors, wall_seconds)."""
+    u = urlparse(url)
+    latencies = [[] for _ in range(clients)]
+    errors = [0] * clients
+    start = threading.Barrier(clients + 1)
+
+    def client(i: int) -> None:
+        rng = np.random.default_rng(i)
+        conn = http.client.HTTPConnection(u.hostname, u.port, timeout=30)
+        # bytes, so http.client sends headers and body in one segment
+        bodies = [json.dumps({"instances": rng.normal(size=(rows, n_features)).round(4).tolist()})
+                  .encode("utf-8") for _ in range(requests)]
+        headers = {"Content-Type": "application/json"}
+        start.wait()
+        for body in bodies:
+            t0 = time.perf_counter()
+            conn.request("POST", path, body, headers)
+            resp = conn.getresponse()
+            resp.read()
+            latencies[i].append((time.perf_counter() - t0) * 1e3)
+            errors[i] += resp.status != 200
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    return np.concatenate(latencies), sum(errors), time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--session", help="session to serve (default: train a synthetic one)")
+    parser.add_argument("--url", help="test a running server instead of starting one")
+    parser.add_argument("--model", help="model name for /predict/<model>")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="per client")
+    parser.add_argument("--rows", type=int, default=1, help="rows per request")
+    parser.add_argument("--features", type=int, default=8, help="features of the synthetic session")
+    parser.add_argument("--max-wait-ms", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    path = f"/predict/{args.model}" if args.model else "/predict"
+    print(f"clients={args.clients} requests/client={args.requests} rows/request={args.rows}\n")
+    header = (f"{'server':<22} {'req/s':>9} {'rows/s':>10} {'p50 ms':>8} {'p90 ms':>8} "
+              f"{'p99 ms':>8} {'rows/call':>10} {'errors':>7}")
+    print(header)
+    print("-" * len(header))
+
+    def run(label: str, url: str) -> None:
+        n_features = len(_get(url, "/models")["models"][0]["features"])
+        lat, errors, wall = _load(url, path, args.clients, args.requests, args.rows, n_features)
+        metrics = _get(url, "/metrics")["models"]
+        batch = next(iter(metrics.values()))["batch_rows"]
+        p50, p90, p99 = np.percentile(lat, [50, 90, 99])
+        print(f"{label:<22} {len(lat) / wall:>9.0f} {len(lat) * args.rows / wall:>10.0f} "
+              f"{p50:>8.2f} {p90:>8.2f} {p99:>8.2f} {batch['mean']:>10.1f} {errors:>7}")
+
+    if args.url:
+        run("external", args.url)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = args.session or _make_session(tmp, args.features, args.seed)
+        for label, extra in (("no batching", ["--no-batching"]),
+                             (f"micro-batch {args.max_wait_ms:g} ms",
+                              ["--max-wait-ms", str(args.max_wait_ms)])):
+            proc, url = _start_server(session, extra)
+            try:
+                run(label, url)
+            finally:
+                proc.send_signal(signal.SIGINT)
+                proc.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Sparse (CSR) vs dense input benchmark for the linear models.
+
+Builds a one-hot-encoded dataset (--columns categorical columns with
+--levels levels each, so every row has --columns non-zeros out of
+columns x levels features), then for each model trains on the dense
+array and on a CSRMatrix of the same data (scale-only scaling for both)
+and reports the matrix memory, fit time, predict time and whether the
+predictions match.
+
+Usage (from the repository root):
+    python benchmarks/bench_sparse.py
+    python benchmarks/bench_sparse.py --rows 50000 --columns 20 --levels 200 --epochs 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from myclt.ML.base_models import Scaler
+from myclt.ML.sparse import CSRMatrix
+from myclt.ML.supervised_learning.linear_regression.core import LinearRegressionGD
+from myclt.ML.supervised_learning.logistic_regression.core import LogisticRegressionGD
+from myclt.ML.supervised_learning.svm import LinearSVM
+
+
+def _one_hot(rows: int, columns: int, levels: int, seed: int):
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, levels, (rows, columns))
+    cols = (codes + np.arange(columns) * levels).ravel()
+    indptr = np.arange(0, rows * columns + 1, columns)
+    X = CSRMatrix(np.ones(rows * columns), cols, indptr, (rows, columns * levels))
+    w = rng.normal(0.0, 1.0, columns * levels)
+    score = X @ w
+    return X, score, (score > np.median(score)).astype(float)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--levels", type=int, default=200)
+    parser.add_argument("--epochs", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    X_sparse, y_reg, y_bin = _one_hot(args.rows, args.columns, args.levels, args.seed)
+    X_sparse = Scaler(with_mean=False).fit_transform(X_sparse)
+    X_dense = X_sparse.toarray()
+    print(f"data: {X_sparse.shape[0]:,} x {X_sparse.shape[1]:,}, "
+          f"{X_sparse.nnz:,} non-zeros ({X_sparse.density:.2%})")
+    print(f"memory: dense {X_dense.nbytes / 1024**2:,.1f} MB, "
+          f"CSR {X_sparse.nbytes / 1024**2:,.1f} MB\n")
+
+    models = [("linear regression", LinearRegressionGD, y_reg),
+              ("logistic regression", LogisticRegressionGD, y_bin),
+              ("linear SVM", LinearSVM, y_bin)]
+    header = (f"{'model':<22} {'input':<7} {'fit s':>8} {'predict ms':>11} "
+              f"{'speedup':>8} {'same':>5}")
+    print(header)
+    print("-" * len(header))
+    for name, cls, y in models:
+        results = {}
+        for kind, X in (("dense", X_dense), ("sparse", X_sparse)):
+            model = cls(epochs=args.epochs, tol=None)
+            t0 = time.perf_counter()
+            model.fit(X, y)
+            fit_s = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            pred = model.predict(X)
+            results[kind] = (fit_s, time.perf_counter() - t0, pred)
+        base = results["dense"][0]
+        same = np.allclose(results["dense"][2], results["sparse"][2])
+        for kind, (fit_s, predict_s, _) in results.items():
+            print(f"{name:<22} {kind:<7} {fit_s:>8.3f} {predict_s * 1e3:>11.2f} "
+                  f"{base / fit_s:>7.1f}x {('yes' if same else 'NO'):>5}")
+
+
+if __name__ == "__main__":
+    main()
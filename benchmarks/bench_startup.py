@@ -0,0 +1,94 @@
+"""
+CLI startup (time-to-first-menu) benchmark.
+
+Spawns fresh interpreters and measures:
+    - bare interpreter startup (``python -c pass``)
+    - ``import myclt.main`` — everything the menu needs before it is printed
+    - the import cost paid when each menu entry is selected (lazy imports)
+and lists the slowest modules of ``python -X importtime -c "import myclt.main"``.
+
+Usage (from the repository root):
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeats 20 --target-ms 100 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+def _wall_ms(code: str, repeats: int) -> float:
+    """Best-of wall time of a fresh interpreter running code, in ms."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=_env())
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _importtime(module: str):
+    """Parse -X importtime output into [(cumulative_us, self_us, module)]."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, check=True, env=_env())
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--target-ms", type=float, default=100.0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    from myclt.main import MENU_STRUCTURE
+
+    bare = _wall_ms("pass", args.repeats)
+    menu = _wall_ms("import myclt.main", args.repeats)
+    rows = _importtime("myclt.main")
+    total_us = next((c for c, _, name in rows if name.strip() == "myclt.main"), 0)
+    heavy = [m for m in ("numpy", "matplotlib", "send2trash") if any(
+        name.strip() == m for _, _, name in rows)]
+
+    print(f"python={sys.version.split()[0]} repeats={args.repeats}\n")
+    header = f"{'stage':<44} {'wall ms':>9}"
+    print(header)
+    print("-" * len(header))
+    print(f"{'interpreter startup (python -c pass)':<44} {bare:>9.1f}")
+    print(f"{'time-to-first-menu (import myclt.main)':<44} {menu:>9.1f}")
+    print(f"{'  of which myclt.main imports':<44} {total_us / 1e3:>9.1f}")
+    status = "OK" if menu <= args.target_ms else "OVER"
+    print(f"\nTarget {args.target_ms:.0f} ms: {status}"
+          f"  (heavy modules at startup: {', '.join(heavy) or 'none'})")
+
+    print(f"\nSlowest imports at startup (-X importtime, top {args.top}):")
+    for cumulative, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"  {cumulative / 1e3:>8.2f} ms cumulative  {self_us / 1e3:>7.2f} ms self  {name}")
+
+    print("\nImport cost paid on menu selection:")
+    for category, operations in MENU_STRUCTURE.items():
+        for op_name, entry in operations.items():
+            if callable(entry):
+                continue
+            module = entry.split(":")[0]
+            ms = _wall_ms(f"import {module}", max(1, args.repeats // 3)) - bare
+            print(f"  {ms:>8.1f} ms  {op_name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,478 @@
+"""
+ML stack benchmark suite with JSON results and baseline comparison.
+
+Generates a synthetic dataset (Gaussian features with regression, binary
+and 3-class targets), writes it to a temporary CSV and times every stage
+of the pipeline:
+    - data:    load_csv_dataset, select_features_and_target (scripted
+               answers), train_test_split, standardize_fit
+    - fit / predict of every model type in the model registry (kernel
+      models on the first --kernel-samples rows)
+    - tune:    linear grid_search_regularization, logistic and SVM
+               grid_search_cv / random_search_cv on small grids
+    - batch_predict_from_csv, session save and load per model type
+Each case runs --repeats times; min and median seconds are reported.
+Nothing touches the network and all files live in a temporary directory.
+
+--output writes the results with machine info (CPU, memory, Python,
+NumPy/BLAS, git commit) as JSON; --baseline compares against such a file
+and marks cases slower / faster than --tolerance. With
+--fail-on-regression the exit status is 1 when a case got slower, so the
+suite can gate a release.
+
+Usage (from the repository root):
+    python benchmarks/bench_suite.py --size small --output results.json
+    python benchmarks/bench_suite.py --size small --baseline results.json --fail-on-regression
+    python benchmarks/bench_suite.py --size medium --only fit/ --only tune/ --repeats 5
+    python benchmarks/bench_suite.py --list
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from myclt.ML.base.base_data import Dataset, load_csv_dataset, select_features_and_target
+from myclt.ML.base_models import standardize_fit, train_test_split
+from myclt.ML.batch_predict import batch_predict_from_csv
+from myclt.ML.model_registry import (MODEL_TYPES, build_model, encode_target, get_spec,
+                                     import_ref, load_session_state, new_state,
+                                     save_session_state)
+
+RESULTS_FORMAT = 1
+
+# (samples, features, kernel samples, tuning samples, epochs)
+SIZES = {
+    "small": (2_000, 20, 300, 1_000, 100),
+    "medium": (20_000, 50, 1_000, 4_000, 200),
+    "large": (200_000, 100, 2_000, 10_000, 300),
+}
+
+TARGETS = {"regression": "y_reg", "binary": "y_bin", "multiclass": "y_cls"}
+_BATCH_TYPES = {"regression": "regression", "binary": "binary", "multiclass": "multinomial"}
+
+# Machine fields that make timings incomparable when they differ
+_MACHINE_KEYS = ("cpu", "cpu_count", "python", "numpy", "blas")
+
+
+# ============================================================================
+# Machine info
+# ============================================================================
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _blas() -> Optional[str]:
+    try:
+        deps = np.show_config(mode="dicts")["Build Dependencies"]
+        blas = deps.get("blas", {})
+        return f"{blas.get('name')} {blas.get('version', '')}".strip()
+    except Exception:
+        return None
+
+
+def _git_commit() -> Optional[str]:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=root, text=True,
+                                capture_output=True, timeout=10).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               cwd=root, text=True, capture_output=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return f"{commit}-dirty" if commit and dirty else (commit or None)
+
+
+def machine_info() -> Dict[str, Any]:
+    """What the timings depend on: hardware, interpreter, NumPy build, code version."""
+    info = {
+        "cpu": _cpu_model(), "cpu_count": os.cpu_count(), "machine": platform.machine(),
+        "platform": platform.platform(), "python": platform.python_version(),
+        "numpy": np.__version__, "blas": _blas(), "commit": _git_commit(),
+        "memory_bytes": None,
+    }
+    try:
+        import psutil
+        info["memory_bytes"] = psutil.virtual_memory().total
+    except ImportError:
+        pass
+    return info
+
+
+# ============================================================================
+# Data
+# ============================================================================
+
+def _make_table(n_samples: int, n_features: int, seed: int) -> Dataset:
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_samples, n_features))
+    z = X @ rng.normal(size=n_features) + 0.3 * rng.normal(size=n_samples)
+    y_bin = (z > 0).astype(float)
+    y_cls = np.digitize(z, np.quantile(z, [1 / 3, 2 / 3])).astype(float)
+    columns = [f"f{i}" for i in range(n_features)] + list(TARGETS.values())
+    return Dataset(data=np.column_stack([X, z, y_bin, y_cls]), columns=columns)
+
+
+def _write_csv(path: str, data: np.ndarray, columns: List[str]) -> None:
+    np.savetxt(path, data, delimiter=",", header=",".join(columns), comments="", fmt="%.6g")
+
+
+@contextlib.contextmanager
+def _scripted_input(answers: List[str]):
+    """Feed answers to input() and swallow the menu output."""
+    it = iter(answers)
+    original = builtins.input
+    builtins.input = lambda prompt="": next(it)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original
+
+
+class _Context:
+    """Data, files and trained app states shared by the cases."""
+
+    def __init__(self, args: argparse.Namespace, workdir: str):
+        self.args = args
+        self.workdir = workdir
+        self.table = _make_table(args.samples, args.features, args.seed)
+        self.n_features = args.features
+        self.csv = os.path.join(workdir, "train.csv")
+        _write_csv(self.csv, self.table.data, self.table.columns)
+        features = self.table.data[:, :args.features]
+        self.predict_csv = os.path.join(workdir, "predict.csv")
+        _write_csv(self.predict_csv, features, self.table.columns[:args.features])
+        self.kernel_predict_csv = os.path.join(workdir, "predict_kernel.csv")
+        _write_csv(self.kernel_predict_csv, features[:args.kernel_samples],
+                   self.table.columns[:args.features])
+        self._states: Dict[str, Any] = {}
+
+    def rows(self, model_type: str) -> int:
+        return self.args.kernel_samples if "kernel" in model_type else self.args.samples
+
+    def params(self) -> Dict[str, Any]:
+        return {"epochs": self.args.epochs, "base_estimator_type": "linear",
+                "gamma": 1.0 / self.n_features}
+
+    def xy(self, task: str, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Standardized features and encoded target for a task."""
+        X, _, _ = standardize_fit(self.table.data[:n, :self.n_features])
+        y, _ = encode_target(task, self.table.data[:n, self.table.columns.index(TARGETS[task])])
+        return X, y
+
+    def split_state(self, model_type: str) -> Any:
+        """A fresh app state with the dataset loaded and split (not trained)."""
+        from myclt.ML.base.base_data import prepare_features_and_target
+
+        task = get_spec(model_type).task
+        n = self.rows(model_type)
+        ds = Dataset(data=self.table.data[:n, :self.n_features + 1].copy(),
+                     columns=self.table.columns[:self.n_features + 1])
+        ds.data[:, -1] = self.table.data[:n, self.table.columns.index(TARGETS[task])]
+        ds.columns[-1] = TARGETS[task]
+        prepared = prepare_features_and_target(ds, TARGETS[task])
+        prepared.Y, class_names = encode_target(task, prepared.Y)
+        state = new_state(model_type)
+        state.dataset, state.prepareddata = ds, prepared
+        state.test_size, state.seed, state.use_scaling = 0.2, self.args.seed, True
+        if class_names and hasattr(state, "class_names"):
+            state.class_names = class_names
+        import_ref(get_spec(model_type).state.split(":")[0] + ":rebuild_split")(state)
+        return state
+
+    def trained(self, model_type: str) -> Any:
+        """Trained app state of a model type (the fit case's, or fitted here once)."""
+        if model_type not in self._states:
+            state = self.split_state(model_type)
+            state.model = build_model(model_type, self.params())
+            state.model.fit(state.X_train, state.y_train)
+            self._states[model_type] = state
+        return self._states[model_type]
+
+
+# ============================================================================
+# Cases
+# ============================================================================
+
+# A case is (name, setup); setup(ctx) runs untimed and returns the timed callable
+Case = Tuple[str, Callable[[_Context], Callable[[], Any]]]
+
+
+def _data_cases() -> List[Case]:
+    def load(ctx):
+        return lambda: load_csv_dataset(ctx.csv, delimiter=",")
+
+    def select(ctx):
+        ds = load_csv_dataset(ctx.csv, delimiter=",")
+        target = str(ds.columns.index(TARGETS["regression"]) + 1)
+
+        def run():
+            with _scripted_input([target, "n"]):
+                return select_features_and_target(ds)
+        return run
+
+    def split(ctx):
+        X, y = ctx.table.data[:, :ctx.n_features], ctx.table.data[:, ctx.n_features]
+        return lambda: train_test_split(X, y, 0.2, ctx.args.seed)
+
+    def standardize(ctx):
+        X = ctx.table.data[:, :ctx.n_features]
+        return lambda: standardize_fit(X)
+
+    return [("data/load_csv_dataset", load), ("data/select_features_and_target", select),
+            ("data/train_test_split", split), ("data/standardize_fit", standardize)]
+
+
+def _model_cases(model_type: str) -> List[Case]:
+    task = get_spec(model_type).task
+
+    def fit(ctx):
+        state = ctx.split_state(model_type)
+        params = ctx.params()
+
+        def run():
+            state.model = build_model(model_type, params)
+            state.model.fit(state.X_train, state.y_train)
+            ctx._states[model_type] = state
+        return run
+
+    def predict(ctx):
+        state = ctx.trained(model_type)
+        return lambda: state.model.predict(state.X_test)
+
+    def batch(ctx):
+        state = ctx.trained(model_type)
+        std = getattr(state, "scaled_std", None)
+        if std is None:
+            std = getattr(state, "scaler_std", None)
+        csv = ctx.kernel_predict_csv if "kernel" in model_type else ctx.predict_csv
+        out = os.path.join(ctx.workdir, f"pred_{model_type}.csv")
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return batch_predict_from_csv(
+                    csv, state.model, state.prepareddata.feature_names,
+                    use_scaling=state.use_scaling, scaler_mean=state.scaler_mean,
+                    scaler_std=std, delimiter=",", output_path=out,
+                    model_type=_BATCH_TYPES[task],
+                    class_names=getattr(state, "class_names", None) or None)
+        return run
+
+    def save(ctx):
+        state = ctx.trained(model_type)
+        path = os.path.join(ctx.workdir, "sessions", model_type)
+        return lambda: save_session_state(model_type, state, path)
+
+    def load(ctx):
+        path = os.path.join(ctx.workdir, "sessions", f"{model_type}_load")
+        save_session_state(model_type, ctx.trained(model_type), path)
+        return lambda: load_session_state(path)
+
+    return [(f"fit/{model_type}", fit), (f"predict/{model_type}", predict),
+            (f"batch_predict/{model_type}", batch),
+            (f"session_save/{model_type}", save), (f"session_load/{model_type}", load)]
+
+
+def _tune_cases() -> List[Case]:
+    from myclt.ML.supervised_learning.linear_regression.hyperparameter_tuning import \
+        grid_search_regularization
+    from myclt.ML.supervised_learning.logistic_regression import hyperparameter_tuning as log_ht
+    from myclt.ML.supervised_learning.svm import hyperparameter_tuning as svm_ht
+
+    def quiet(fn):
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return fn()
+        return run
+
+    def linear(ctx):
+        X, y = ctx.xy("regression", ctx.args.tune_samples)
+        return quiet(lambda: grid_search_regularization(
+            X, y, epochs=ctx.args.epochs, lambda_l1_grid=[0.0, 0.01],
+            lambda_l2_grid=[0.0, 0.01], k_folds=3, seed=ctx.args.seed))
+
+    def logistic(search):
+        def setup(ctx):
+            X, y = ctx.xy("binary", ctx.args.tune_samples)
+            grid = {"learning_rate": [0.01, 0.1], "epochs": [ctx.args.epochs],
+                    "lambda_l2": [0.0, 0.01]}
+            if search == "grid":
+                return quiet(lambda: log_ht.grid_search_cv(X, y, grid, 3, verbose=False))
+            return quiet(lambda: log_ht.random_search_cv(X, y, grid, 4, 3, seed=ctx.args.seed,
+                                                         verbose=False))
+        return setup
+
+    def svm(model_type, search):
+        def setup(ctx):
+            spec = get_spec(model_type)
+            n = min(ctx.args.tune_samples, ctx.rows(model_type))
+            X, y = ctx.xy(spec.task, n)
+            task = "regressor" if spec.task == "regression" else "classifier"
+            model_class = import_ref(spec.model)
+            grid = {"C": [0.1, 1.0], "epochs": [ctx.args.epochs]}
+            if "kernel" in model_type:
+                grid["gamma"] = [1.0 / ctx.n_features]
+            if search == "grid":
+                return quiet(lambda: svm_ht.grid_search_cv(X, y, model_class, grid, 3, task,
+                                                           verbose=False))
+            return quiet(lambda: svm_ht.random_search_cv(X, y, model_class, grid, 2, 3, task,
+                                                         seed=ctx.args.seed, verbose=False))
+        return setup
+
+    return [("tune/grid/linear_regression", linear),
+            ("tune/grid/logistic_regression", logistic("grid")),
+            ("tune/random/logistic_regression", logistic("random")),
+            ("tune/grid/linear_svm", svm("linear_svm", "grid")),
+            ("tune/random/linear_svm", svm("linear_svm", "random")),
+            ("tune/grid/kernel_svm", svm("kernel_svm", "grid")),
+            ("tune/grid/linear_svr", svm("linear_svr", "grid"))]
+
+
+def all_cases() -> List[Case]:
+    cases = _data_cases()
+    for model_type in MODEL_TYPES:
+        cases += _model_cases(model_type)
+    return cases + _tune_cases()
+
+
+# ============================================================================
+# Running and comparing
+# ============================================================================
+
+def run_case(setup: Callable, ctx: _Context, repeats: int) -> Dict[str, Any]:
+    fn = setup(ctx)
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {"min": min(times), "median": statistics.median(times), "times": times}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print current vs baseline min times; return the names of slower cases."""
+    for key in _MACHINE_KEYS:
+        if baseline["machine"].get(key) != results["machine"].get(key):
+            print(f"warning: {key} differs from the baseline "
+                  f"({baseline['machine'].get(key)!r} vs {results['machine'].get(key)!r})",
+                  file=sys.stderr)
+    print(f"\nbaseline: {baseline['machine'].get('commit')} ({baseline.get('timestamp')}), "
+          f"tolerance {tolerance:.0%}\n")
+    header = f"{'case':<46} {'time s':>10} {'baseline s':>11} {'ratio':>7}  status"
+    print(header)
+    print("-" * len(header))
+    slower = []
+    for name, res in results["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<46} {res['min']:>10.4f} {'-':>11} {'-':>7}  new")
+            continue
+        ratio = res["min"] / base["min"] if base["min"] > 0 else float("inf")
+        status = "~"
+        if ratio > 1 + tolerance:
+            status = "SLOWER"
+            slower.append(name)
+        elif ratio < 1 / (1 + tolerance):
+            status = "faster"
+        print(f"{name:<46} {res['min']:>10.4f} {base['min']:>11.4f} {ratio:>6.2f}x  {status}")
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", choices=list(SIZES), default="small",
+                        help="dataset preset (samples, features, kernel/tuning rows, epochs)")
+    parser.add_argument("--samples", type=int)
+    parser.add_argument("--features", type=int)
+    parser.add_argument("--kernel-samples", type=int, help="rows for kernel models")
+    parser.add_argument("--tune-samples", type=int, help="rows for the tuning cases")
+    parser.add_argument("--epochs", type=int)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", action="append", default=[],
+                        help="run cases whose name contains this (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list the case names and exit")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="relative slowdown still counted as unchanged (default 0.10)")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 1 if a case is slower than the baseline")
+    args = parser.parse_args()
+
+    cases = [c for c in all_cases() if not args.only or any(s in c[0] for s in args.only)]
+    if args.list:
+        print("\n".join(name for name, _ in cases))
+        return
+    for name, value in zip(("samples", "features", "kernel_samples", "tune_samples", "epochs"),
+                           SIZES[args.size]):
+        if getattr(args, name) is None:
+            setattr(args, name, value)
+    args.kernel_samples = min(args.kernel_samples, args.samples)
+    args.tune_samples = min(args.tune_samples, args.samples)
+    config = {k: getattr(args, k) for k in ("size", "samples", "features", "kernel_samples",
+                                            "tune_samples", "epochs", "repeats", "seed")}
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        differs = {k: (baseline["config"].get(k), v) for k, v in config.items()
+                   if k != "repeats" and baseline["config"].get(k) != v}
+        if differs:
+            sys.exit(f"!Baseline was run with a different configuration: {differs}!")
+
+    results = {"format": RESULTS_FORMAT, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+               "machine": machine_info(), "config": config, "results": {}}
+    m = results["machine"]
+    print(f"{m['cpu']} ({m['cpu_count']} CPUs), Python {m['python']}, NumPy {m['numpy']}, "
+          f"commit {m['commit']}")
+    print(f"samples={args.samples} features={args.features} kernel_samples={args.kernel_samples} "
+          f"tune_samples={args.tune_samples} epochs={args.epochs} repeats={args.repeats}\n")
+
+    workdir = tempfile.mkdtemp(prefix="myclt_bench_")
+    try:
+        ctx = _Context(args, workdir)
+        header = f"{'case':<46} {'min s':>10} {'median s':>10}"
+        print(header)
+        print("-" * len(header))
+        for name, setup in cases:
+            res = run_case(setup, ctx, args.repeats)
+            results["results"][name] = res
+            print(f"{name:<46} {res['min']:>10.4f} {res['median']:>10.4f}", flush=True)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nresults written to {args.output}")
+    if baseline is not None:
+        slower = compare(results, baseline, args.tolerance)
+        if slower and args.fail_on_regression:
+            sys.exit(f"\n{len(slower)} case(s) slower than the baseline: {', '.join(slower)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+System monitor sampling-cost benchmark.
+
+Times one sample of the same statistics taken two ways:
+    - a naive sampler: separate psutil calls per process (no oneshot) and
+      a dict per sample appended to a list
+    - sysinfo.SystemMonitor.sample: oneshot() per process, one structured
+      NumPy record written into the ring buffer
+for 0, 1 and --processes watched processes, and reports the CPU time per
+sample, the resulting overhead at the given interval, and the bytes per
+sample of the recording file vs JSON lines.
+
+Usage (from the repository root):
+    python benchmarks/bench_sysinfo.py
+    python benchmarks/bench_sysinfo.py --samples 2000 --processes 20 --interval 0.5
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import psutil
+
+from myclt.legacy_code.sysinfo import SystemMonitor
+
+
+class _NaiveSampler:
+    def __init__(self, pids):
+        self.procs = [psutil.Process(pid) for pid in pids]
+        self.history = []
+        self.prev = None
+
+    def sample(self) -> dict:
+        now = time.time()
+        disk, net = psutil.disk_io_counters(), psutil.net_io_counters()
+        row = {"time": now, "cpu": psutil.cpu_percent(None),
+               "mem_used": psutil.virtual_memory().used,
+               "mem_percent": psutil.virtual_memory().percent,
+               "swap_used": psutil.swap_memory().used,
+               "disk_read": disk.read_bytes if disk else 0,
+               "disk_write": disk.write_bytes if disk else 0,
+               "net_sent": net.bytes_sent, "net_recv": net.bytes_recv, "processes": []}
+        for p in self.procs:
+            try:
+                row["processes"].append({"pid": p.pid, "cpu": p.cpu_percent(None),
+                                         "rss": p.memory_info().rss,
+                                         "threads": p.num_threads()})
+            except psutil.Error:
+                pass
+        self.history.append(row)
+        return row
+
+
+def _cpu_us(sample, n: int) -> float:
+    sample()
+    t0 = time.thread_time()
+    for _ in range(n):
+        sample()
+    return (time.thread_time() - t0) / n * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=10, help="largest watched-process count")
+    parser.add_argument("--interval", type=float, default=1.0, help="for the overhead column")
+    args = parser.parse_args()
+
+    others = [p.pid for p in psutil.process_iter() if p.pid != os.getpid()]
+    header = (f"{'processes':>9} {'naive µs':>9} {'monitor µs':>11} {'speedup':>8} "
+              f"{'overhead %':>11} {'record B':>9} {'JSON B':>7}")
+    print(f"{args.samples} samples per case, overhead at a {args.interval:g} s interval\n")
+    print(header)
+    print("-" * len(header))
+    for n in sorted({0, 1, args.processes}):
+        pids = ([os.getpid()] + others)[:n]
+        naive = _NaiveSampler(pids)
+        monitor = SystemMonitor(interval=args.interval, capacity=args.samples, pids=pids)
+        naive_us = _cpu_us(naive.sample, args.samples)
+        monitor_us = _cpu_us(monitor.sample, args.samples)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rec.bin")
+            monitor.start_recording(path)
+            monitor.stop_recording()
+            header_bytes = os.path.getsize(path)
+            monitor.start_recording(path)
+            for _ in range(10):
+                monitor.sample()
+            monitor.stop_recording()
+            record_bytes = (os.path.getsize(path) - header_bytes) // 10
+        json_bytes = len(json.dumps(naive.history[-1])) + 1
+        print(f"{len(pids):>9} {naive_us:>9.0f} {monitor_us:>11.0f} {naive_us / monitor_us:>7.2f}x "
+              f"{monitor_us / 1e6 / args.interval * 100:>11.3f} {record_bytes:>9} {json_bytes:>7}")
+
+
+if __name__ == "__main__":
+    main()
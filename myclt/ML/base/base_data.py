@@ -12,6 +12,7 @@ from typing import List
 import numpy as np
 
 from myclt.common.input_validation import ask_int, ask_yes_no
+from myclt.ML.base_models import resolve_dtype
 
 
 @dataclass
@@ -246,7 +247,7 @@ def manual_input_dataset() -> Dataset:
     return Dataset(data=data, columns=columns)
 
 
-def select_features_and_target(ds: Dataset) -> Prepareddata:
+def select_features_and_target(ds: Dataset, dtype: str = "float64") -> Prepareddata:
     """
     Lets user select target column and feature columns from dataset columns.
     
@@ -256,6 +257,7 @@ def select_features_and_target(ds: Dataset) -> Prepareddata:
     
     Args:
         ds: Dataset object with loaded data
+        dtype: Compute precision for the feature matrix ("float32" or "float64")
     
     Returns:
         Prepareddata object with selected features and target
@@ -263,6 +265,7 @@ def select_features_and_target(ds: Dataset) -> Prepareddata:
     Raises:
         ValueError: If selection is invalid
     """
+    dtype = resolve_dtype(dtype)
     cols = ds.columns[:]
     print("\nColumns:")
     for i, name in enumerate(cols, start=1):
@@ -298,6 +301,51 @@ def select_features_and_target(ds: Dataset) -> Prepareddata:
     else:
         feature_idxs = default_feature_idxs
 
+    return _build_prepareddata(ds, feature_idxs, target_idx, dtype)
+
+
+def prepare_features_and_target(ds: Dataset, target: str, features: List[str] = None,
+                                dtype: str = "float64") -> Prepareddata:
+    """
+    Non-interactive counterpart of select_features_and_target (for scripts).
+
+    Args:
+        ds: Dataset object with loaded data
+        target: Target column name
+        features: Feature column names (default: all columns except target)
+        dtype: Compute precision for the feature matrix ("float32" or "float64")
+
+    Returns:
+        Prepareddata object with selected features and target
+
+    Raises:
+        ValueError: If a column is unknown or the selection is invalid
+    """
+    dtype = resolve_dtype(dtype)
+    cols = ds.columns[:]
+    if target not in cols:
+        raise ValueError(f"!Unknown target column '{target}'. Columns: {cols}!")
+    target_idx = cols.index(target)
+
+    if features is None:
+        feature_idxs = [i for i in range(len(cols)) if i != target_idx]
+    else:
+        unknown = [f for f in features if f not in cols]
+        if unknown:
+            raise ValueError(f"!Unknown feature column(s) {unknown}. Columns: {cols}!")
+        feature_idxs = [cols.index(f) for f in features]
+        if target_idx in feature_idxs:
+            raise ValueError("!Target column cannot be included in features!")
+        if len(feature_idxs) < 1:
+            raise ValueError("!You must select at least 1 feature!")
+
+    return _build_prepareddata(ds, feature_idxs, target_idx, dtype)
+
+
+def _build_prepareddata(ds: Dataset, feature_idxs: List[int], target_idx: int,
+                        dtype) -> Prepareddata:
+    """Validate the selected columns and slice X / Y out of the dataset."""
+    cols = ds.columns
     # Validate that feature columns are numeric (not strings)
     for idx in feature_idxs:
         if not _col_is_numeric([ds.data[r, idx] for r in range(ds.data.shape[0])]):
@@ -306,7 +354,7 @@ def select_features_and_target(ds: Dataset) -> Prepareddata:
                 f"Feature columns must be numeric. Use this column as TARGET instead."
             )
 
-    X = ds.data[:, feature_idxs].astype(float, copy=False)
+    X = ds.data[:, feature_idxs].astype(dtype, copy=False)
     Y = ds.data[:, target_idx]
 
     feature_names = [cols[i] for i in feature_idxs]
@@ -0,0 +1,636 @@
+"""
+Shared classification metric kernels (used by every model's metrics module).
+
+Every label-based classification metric is derived from ONE confusion
+matrix built with a single ``np.bincount(K * y_true + y_pred)`` pass:
+
+    cm       = confusion_matrix_counts(y_true, y_pred, labels)   # O(n)
+    p, r, f1 = precision_recall_f1_from_cm(cm, average)          # O(K²)
+
+so precision / recall / F1 / specificity / support for all classes (and
+their micro / macro / weighted averages) never re-scan the predictions.
+"""
+
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+
+
+AVERAGES = (None, 'binary', 'micro', 'macro', 'weighted')
+
+Score = Union[float, np.ndarray]
+
+
+# ============================================================================
+# Confusion-matrix kernel
+# ============================================================================
+
+def unique_labels(*arrays: np.ndarray) -> np.ndarray:
+    """
+    Sorted union of the label values in ``arrays``.
+
+    Integer labels with a compact range are found with ``np.bincount`` in
+    O(n) instead of sorting every value as ``np.unique`` does.
+    """
+    arrays = [np.asarray(a).ravel() for a in arrays]
+    if arrays and all(np.issubdtype(a.dtype, np.integer) for a in arrays):
+        non_empty = [a for a in arrays if a.size]
+        if not non_empty:
+            return np.empty(0, dtype=arrays[0].dtype)
+        lo = min(int(a.min()) for a in non_empty)
+        hi = max(int(a.max()) for a in non_empty)
+        if hi - lo <= 4 * sum(a.size for a in non_empty) + 1024:
+            seen = np.zeros(hi - lo + 1, dtype=bool)
+            for a in non_empty:
+                seen |= np.bincount(a - lo, minlength=hi - lo + 1).astype(bool)
+            return np.flatnonzero(seen) + lo
+    return np.unique(np.concatenate(arrays))
+
+
+def _encode_labels(y: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Map label values to indices 0..K-1 of the sorted ``labels`` array.
+
+    Returns:
+        (indices, valid_mask or None when every value is a known label)
+    """
+    K = labels.shape[0]
+    # Fast path: labels are exactly 0..K-1 and y is already integer
+    if np.issubdtype(y.dtype, np.integer) and np.array_equal(labels, np.arange(K)):
+        idx = y.astype(np.intp, copy=False)
+        valid = (idx >= 0) & (idx < K)
+        return idx, (None if valid.all() else valid)
+
+    idx = np.searchsorted(labels, y)
+    np.minimum(idx, K - 1, out=idx)
+    valid = labels[idx] == y
+    return idx, (None if valid.all() else valid)
+
+
+def confusion_matrix_counts(y_true: np.ndarray, y_pred: np.ndarray,
+                            labels: Optional[Sequence] = None) -> np.ndarray:
+    """
+    Confusion matrix in O(n + K²) with one ``np.bincount`` pass.
+
+    cm[i, j] = number of samples with true label labels[i] predicted as
+    labels[j]. Samples whose true or predicted label is not in ``labels``
+    are ignored.
+
+    Args:
+        y_true: True labels (n_samples,)
+        y_pred: Predicted labels (n_samples,)
+        labels: Label values in row/column order (default:
+                unique_labels(y_true, y_pred))
+
+    Returns:
+        Integer matrix (K, K)
+    """
+    y_true = np.asarray(y_true).ravel()
+    y_pred = np.asarray(y_pred).ravel()
+    if y_true.shape[0] != y_pred.shape[0]:
+        raise ValueError(
+            f"!y_true and y_pred have different lengths: {y_true.shape[0]} vs {y_pred.shape[0]}!"
+        )
+    if labels is None:
+        labels = unique_labels(y_true, y_pred)
+    labels = np.asarray(labels)
+    K = labels.shape[0]
+    if K == 0:
+        return np.zeros((0, 0), dtype=np.int64)
+
+    order = np.argsort(labels, kind='stable')
+    sorted_labels = labels[order]
+    t_idx, t_valid = _encode_labels(y_true, sorted_labels)
+    p_idx, p_valid = _encode_labels(y_pred, sorted_labels)
+
+    codes = t_idx * K + p_idx
+    if t_valid is not None or p_valid is not None:
+        mask = np.ones(codes.shape[0], dtype=bool)
+        if t_valid is not None:
+            mask &= t_valid
+        if p_valid is not None:
+            mask &= p_valid
+        codes = codes[mask]
+
+    cm = np.bincount(codes, minlength=K * K).reshape(K, K)
+    if not np.array_equal(order, np.arange(K)):
+        # Back to the caller's label order
+        inv = np.empty_like(order)
+        inv[order] = np.arange(K)
+        cm = cm[np.ix_(inv, inv)]
+    return cm
+
+
+def binary_counts(y_true: np.ndarray, y_pred: np.ndarray,
+                  pos_label=1) -> Tuple[int, int, int, int]:
+    """
+    (TP, FP, FN, TN) for ``pos_label`` vs everything else, in one pass.
+    """
+    t = np.asarray(y_true).ravel() == pos_label
+    p = np.asarray(y_pred).ravel() == pos_label
+    # code = 2*t + p -> 0: TN, 1: FP, 2: FN, 3: TP
+    tn, fp, fn, tp = np.bincount(2 * t.view(np.int8) + p.view(np.int8), minlength=4)
+    return int(tp), int(fp), int(fn), int(tn)
+
+
+# ============================================================================
+# Metrics derived from a confusion matrix
+# ============================================================================
+
+def _safe_divide(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Element-wise num / den with 0.0 where den == 0."""
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    out = np.zeros(np.broadcast(num, den).shape, dtype=float)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+def per_class_counts(cm: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-class (TP, FP, FN, support) vectors from a confusion matrix.
+    """
+    tp = np.diag(cm).astype(np.int64)
+    predicted = cm.sum(axis=0)
+    support = cm.sum(axis=1)
+    return tp, predicted - tp, support - tp, support
+
+
+def precision_recall_f1_from_cm(cm: np.ndarray, average: Optional[str] = 'macro',
+                                pos_index: int = 1) -> Tuple[Score, Score, Score]:
+    """
+    Precision, recall and F1 from a confusion matrix.
+
+    Args:
+        cm: Confusion matrix (K, K) from confusion_matrix_counts()
+        average:
+            None       -> per-class arrays (K,)
+            'binary'   -> scores of the class at ``pos_index``
+            'micro'    -> global counts (equals accuracy for single-label data)
+            'macro'    -> unweighted mean over classes
+            'weighted' -> mean weighted by class support
+
+    Returns:
+        Tuple of (precision, recall, f1)
+    """
+    if average not in AVERAGES:
+        raise ValueError(f"!Unknown average '{average}'. Use one of: {AVERAGES}!")
+    tp, fp, fn, support = per_class_counts(cm)
+
+    if average == 'micro':
+        tp_sum, fp_sum, fn_sum = tp.sum(), fp.sum(), fn.sum()
+        p = float(_safe_divide(tp_sum, tp_sum + fp_sum))
+        r = float(_safe_divide(tp_sum, tp_sum + fn_sum))
+        f1 = float(_safe_divide(2 * p * r, p + r))
+        return p, r, f1
+
+    p = _safe_divide(tp, tp + fp)
+    r = _safe_divide(tp, tp + fn)
+    f1 = _safe_divide(2 * p * r, p + r)
+
+    if average is None:
+        return p, r, f1
+    if average == 'binary':
+        if cm.shape[0] <= pos_index:
+            return 0.0, 0.0, 0.0
+        return float(p[pos_index]), float(r[pos_index]), float(f1[pos_index])
+    if p.shape[0] == 0:
+        return 0.0, 0.0, 0.0
+    if average == 'macro':
+        return float(p.mean()), float(r.mean()), float(f1.mean())
+    # weighted
+    total = support.sum()
+    if total == 0:
+        return 0.0, 0.0, 0.0
+    w = support / total
+    return float(p @ w), float(r @ w), float(f1 @ w)
+
+
+def accuracy_from_cm(cm: np.ndarray) -> float:
+    """Accuracy: trace / total."""
+    total = cm.sum()
+    return float(np.trace(cm) / total) if total > 0 else 0.0
+
+
+def specificity_from_cm(cm: np.ndarray) -> np.ndarray:
+    """Per-class specificity (true-negative rate) TN / (TN + FP)."""
+    tp, fp, fn, _ = per_class_counts(cm)
+    tn = cm.sum() - tp - fp - fn
+    return _safe_divide(tn, tn + fp)
+
+
+# ============================================================================
+# Threshold curves (ROC / precision-recall) and AUC
+# ============================================================================
+
+def _binary_clf_curve(y_true: np.ndarray, y_score: np.ndarray,
+                      pos_label=1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cumulative (FP, TP) counts at every distinct score threshold.
+
+    One sort + one cumsum: samples are ordered by decreasing score and
+    tied scores collapse into a single threshold, so ties move the curve
+    diagonally instead of in an order-dependent staircase.
+
+    Returns:
+        (fps, tps, thresholds) — thresholds in decreasing order
+    """
+    y_true = np.asarray(y_true).ravel()
+    y_score = np.asarray(y_score, dtype=float).ravel()
+    if y_true.shape[0] != y_score.shape[0]:
+        raise ValueError(
+            f"!y_true and y_score have different lengths: {y_true.shape[0]} vs {y_score.shape[0]}!"
+        )
+    if y_true.shape[0] == 0:
+        raise ValueError("!Cannot compute a curve on empty arrays!")
+
+    order = np.argsort(y_score)[::-1]
+    y_score = y_score[order]
+    hits = (y_true[order] == pos_label)
+
+    # Last index of every run of equal scores
+    threshold_idx = np.r_[np.flatnonzero(np.diff(y_score)), y_score.shape[0] - 1]
+    tps = np.cumsum(hits, dtype=np.int64)[threshold_idx]
+    fps = (threshold_idx + 1) - tps
+    return fps, tps, y_score[threshold_idx]
+
+
+def roc_curve(y_true: np.ndarray, y_score: np.ndarray, pos_label=1,
+              drop_intermediate: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Receiver operating characteristic curve for a binary problem.
+
+    Args:
+        y_true: True labels (n_samples,)
+        y_score: Scores for ``pos_label`` (probabilities or decision values)
+        pos_label: Label of the positive class
+        drop_intermediate: Drop collinear points that do not change the
+                           curve's shape (keeps plots light on big test sets)
+
+    Returns:
+        (fpr, tpr, thresholds), starting at (0, 0) with threshold +inf
+
+    Raises:
+        ValueError: If y_true has no positive or no negative samples
+    """
+    fps, tps, thresholds = _binary_clf_curve(y_true, y_score, pos_label)
+    if tps[-1] == 0 or fps[-1] == 0:
+        raise ValueError("!ROC curve requires both positive and negative samples!")
+
+    if drop_intermediate and fps.shape[0] > 2:
+        keep = np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True]
+        fps, tps, thresholds = fps[keep], tps[keep], thresholds[keep]
+
+    fpr = np.r_[0.0, fps / fps[-1]]
+    tpr = np.r_[0.0, tps / tps[-1]]
+    return fpr, tpr, np.r_[np.inf, thresholds]
+
+
+def precision_recall_curve(y_true: np.ndarray, y_score: np.ndarray,
+                           pos_label=1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Precision-recall pairs for every distinct score threshold.
+
+    Args:
+        y_true: True labels (n_samples,)
+        y_score: Scores for ``pos_label``
+        pos_label: Label of the positive class
+
+    Returns:
+        (precision, recall, thresholds) — thresholds increasing, recall
+        decreasing, with a final (precision=1, recall=0) point
+
+    Raises:
+        ValueError: If y_true has no positive samples
+    """
+    fps, tps, thresholds = _binary_clf_curve(y_true, y_score, pos_label)
+    if tps[-1] == 0:
+        raise ValueError("!Precision-recall curve requires positive samples!")
+
+    # Stop once full recall is reached; lower thresholds only add FPs
+    last = int(np.searchsorted(tps, tps[-1])) + 1
+    precision = tps[:last] / (tps[:last] + fps[:last])
+    recall = tps[:last] / tps[-1]
+    return (np.r_[precision[::-1], 1.0], np.r_[recall[::-1], 0.0],
+            thresholds[:last][::-1])
+
+
+def auc(x: np.ndarray, y: np.ndarray) -> float:
+    """
+    Area under a curve by the trapezoidal rule (x monotonic).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape[0] < 2:
+        raise ValueError("!At least 2 points are needed to compute an area under a curve!")
+    area = float(np.sum(np.diff(x) * (y[1:] + y[:-1])) / 2.0)
+    return abs(area)
+
+
+def average_precision_score(y_true: np.ndarray, y_score: np.ndarray, pos_label=1) -> float:
+    """
+    Average precision: sum over thresholds of (R_n - R_{n-1}) * P_n.
+    """
+    precision, recall, _ = precision_recall_curve(y_true, y_score, pos_label)
+    return float(-np.sum(np.diff(recall) * precision[:-1]))
+
+
+def roc_auc_score(y_true: np.ndarray, y_score: np.ndarray,
+                  average: Optional[str] = 'macro',
+                  labels: Optional[Sequence] = None,
+                  pos_label=1) -> Score:
+    """
+    Area under the ROC curve — binary or one-vs-rest multiclass.
+
+    Args:
+        y_true: True labels (n_samples,)
+        y_score:
+            (n_samples,)    -> binary scores for ``pos_label``
+            (n_samples, K)  -> per-class scores, e.g.
+                               MultinomialLogisticRegression.predict_proba or
+                               OneVsRestSVM.decision_function. With K == 2
+                               the second column is the positive score.
+        average: For K > 2: 'macro', 'weighted' (by class prevalence) or
+                 None (per-class array, NaN for classes absent from y_true)
+        labels: Class label of each score column (default: 0..K-1)
+        pos_label: Positive class for binary scores
+
+    Returns:
+        AUC in [0, 1] (or per-class array when average=None)
+    """
+    y_score = np.asarray(y_score, dtype=float)
+    if y_score.ndim == 1 or y_score.shape[1] == 1:
+        fpr, tpr, _ = roc_curve(y_true, y_score.ravel(), pos_label)
+        return auc(fpr, tpr)
+
+    K = y_score.shape[1]
+    labels = np.arange(K) if labels is None else np.asarray(labels)
+    if labels.shape[0] != K:
+        raise ValueError(f"!Got {labels.shape[0]} labels for {K} score columns!")
+    if K == 2:
+        fpr, tpr, _ = roc_curve(y_true, y_score[:, 1], labels[1])
+        return auc(fpr, tpr)
+    if average not in (None, 'macro', 'weighted'):
+        raise ValueError(f"!Unknown average '{average}' for one-vs-rest AUC!")
+
+    y_true = np.asarray(y_true).ravel()
+    scores = np.full(K, np.nan)
+    prevalence = np.zeros(K)
+    for k in range(K):
+        n_pos = int(np.count_nonzero(y_true == labels[k]))
+        if 0 < n_pos < y_true.shape[0]:
+            fpr, tpr, _ = roc_curve(y_true, y_score[:, k], labels[k])
+            scores[k] = auc(fpr, tpr)
+            prevalence[k] = n_pos
+    if average is None:
+        return scores
+    defined = ~np.isnan(scores)
+    if not defined.any():
+        raise ValueError("!ROC AUC is undefined: every class is missing positives or negatives!")
+    if average == 'weighted':
+        return float(scores[defined] @ (prevalence[defined] / prevalence[defined].sum()))
+    return float(scores[defined].mean())
+
+
+# ============================================================================
+# Streaming accumulators (chunked / multi-process evaluation)
+# ============================================================================
+#
+# Each accumulator keeps O(K²) or O(bins) state instead of the predictions:
+#
+#     acc = ConfusionMatrixAccumulator()
+#     for y_chunk, pred_chunk in chunks:
+#         acc.update(y_chunk, pred_chunk)
+#     acc.merge(other_worker_acc)        # e.g. another process or CV fold
+#     acc.result()
+
+class ConfusionMatrixAccumulator:
+    """
+    Running confusion matrix for classification metrics.
+
+    With ``labels`` fixed, samples with other labels are ignored; without
+    them the label set grows as new labels appear in the chunks.
+    """
+
+    def __init__(self, labels: Optional[Sequence] = None):
+        self.fixed_labels = labels is not None
+        self.labels_ = np.sort(np.asarray(labels)) if labels is not None else None
+        self.cm_ = (np.zeros((len(self.labels_),) * 2, dtype=np.int64)
+                    if labels is not None else None)
+
+    @property
+    def n_samples(self) -> int:
+        return int(self.cm_.sum()) if self.cm_ is not None else 0
+
+    def _grow(self, labels: np.ndarray) -> None:
+        """Extend the label set, keeping the counts of known labels."""
+        if self.labels_ is None:
+            self.labels_ = labels
+            self.cm_ = np.zeros((len(labels), len(labels)), dtype=np.int64)
+            return
+        if np.isin(labels, self.labels_).all():
+            return
+        union = np.union1d(self.labels_, labels)
+        pos = np.searchsorted(union, self.labels_)
+        cm = np.zeros((len(union), len(union)), dtype=np.int64)
+        cm[np.ix_(pos, pos)] = self.cm_
+        self.labels_, self.cm_ = union, cm
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> "ConfusionMatrixAccumulator":
+        """Add one chunk of labels / predictions."""
+        if not self.fixed_labels:
+            self._grow(unique_labels(y_true, y_pred))
+        self.cm_ += confusion_matrix_counts(y_true, y_pred, labels=self.labels_)
+        return self
+
+    def merge(self, other: "ConfusionMatrixAccumulator") -> "ConfusionMatrixAccumulator":
+        """Add the counts of another accumulator (labels are aligned)."""
+        if other.cm_ is None:
+            return self
+        if not self.fixed_labels:
+            self._grow(other.labels_)
+        common = np.isin(other.labels_, self.labels_)
+        src = np.flatnonzero(common)
+        dst = np.searchsorted(self.labels_, other.labels_[common])
+        self.cm_[np.ix_(dst, dst)] += other.cm_[np.ix_(src, src)]
+        return self
+
+    def result(self) -> dict:
+        """
+        Returns:
+            {"accuracy", "precision_<avg>", "recall_<avg>", "f1_<avg>" for
+            avg in macro/micro/weighted, "n_samples", "labels",
+            "confusion_matrix"}
+        """
+        if self.cm_ is None:
+            return {"n_samples": 0}
+        out = {"accuracy": accuracy_from_cm(self.cm_)}
+        for average in ('macro', 'micro', 'weighted'):
+            p, r, f1 = precision_recall_f1_from_cm(self.cm_, average)
+            out[f"precision_{average}"] = p
+            out[f"recall_{average}"] = r
+            out[f"f1_{average}"] = f1
+        out["n_samples"] = self.n_samples
+        out["labels"] = self.labels_.tolist()
+        out["confusion_matrix"] = self.cm_.copy()
+        return out
+
+
+class RegressionAccumulator:
+    """
+    Running regression error sums.
+
+    The target variance behind R² uses the Welford/Chan update, so chunks
+    and merged accumulators give the same R² as a single pass over all data
+    without the cancellation of a sum-of-squares formula.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.sse = 0.0          # sum of squared errors
+        self.sae = 0.0          # sum of absolute errors
+        self.sape = 0.0         # sum of |error / y| over y != 0
+        self.n_nonzero = 0
+        self.mean_y = 0.0
+        self.m2_y = 0.0         # sum of squared deviations of y from its mean
+
+    def _combine(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        n = self.n + n_b
+        delta = mean_b - self.mean_y
+        self.mean_y += delta * n_b / n
+        self.m2_y += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> "RegressionAccumulator":
+        """Add one chunk of targets / predictions."""
+        y_true = np.asarray(y_true, dtype=np.float64).ravel()
+        y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+        if y_true.shape[0] != y_pred.shape[0]:
+            raise ValueError(
+                f"!y_true and y_pred have different lengths: {y_true.shape[0]} vs {y_pred.shape[0]}!"
+            )
+        if y_true.shape[0] == 0:
+            return self
+        err = y_true - y_pred
+        self.sse += float(err @ err)
+        abs_err = np.abs(err)
+        self.sae += float(abs_err.sum())
+        nz = y_true != 0
+        self.sape += float(np.sum(abs_err[nz] / np.abs(y_true[nz])))
+        self.n_nonzero += int(np.count_nonzero(nz))
+
+        mean_b = float(y_true.mean())
+        dev = y_true - mean_b
+        self._combine(y_true.shape[0], mean_b, float(dev @ dev))
+        return self
+
+    def merge(self, other: "RegressionAccumulator") -> "RegressionAccumulator":
+        """Add the sums of another accumulator."""
+        if other.n == 0:
+            return self
+        self.sse += other.sse
+        self.sae += other.sae
+        self.sape += other.sape
+        self.n_nonzero += other.n_nonzero
+        self._combine(other.n, other.mean_y, other.m2_y)
+        return self
+
+    def result(self) -> dict:
+        """
+        Returns:
+            {"mse", "rmse", "mae", "r2", "mape", "n_samples"} — MAPE is a
+            percentage over non-zero targets (NaN if there are none)
+        """
+        if self.n == 0:
+            return {"n_samples": 0}
+        mse = self.sse / self.n
+        return {
+            "mse": mse,
+            "rmse": float(np.sqrt(mse)),
+            "mae": self.sae / self.n,
+            "r2": 1.0 - self.sse / self.m2_y if self.m2_y > 0 else 0.0,
+            "mape": self.sape / self.n_nonzero * 100 if self.n_nonzero else float('nan'),
+            "n_samples": self.n,
+        }
+
+
+class HistogramAUCAccumulator:
+    """
+    Approximate binary ROC AUC from per-class score histograms.
+
+    Scores are binned into ``n_bins`` equal-width bins over ``score_range``
+    (values outside are clipped to the edge bins); samples sharing a bin are
+    treated as ties. The error is bounded by the pairs that share a bin, so
+    1024+ bins are usually within 1e-3 of the exact AUC.
+
+    Args:
+        n_bins: Number of histogram bins
+        score_range: (low, high) of the scores, e.g. (0, 1) for
+                     probabilities. None squashes any real-valued score
+                     (SVM decision values) through a sigmoid first; the
+                     transform is monotonic, so the ranking is unchanged.
+        pos_label: Label of the positive class
+    """
+
+    def __init__(self, n_bins: int = 1024,
+                 score_range: Optional[Tuple[float, float]] = (0.0, 1.0),
+                 pos_label=1):
+        if n_bins < 2:
+            raise ValueError("!n_bins must be at least 2!")
+        self.n_bins = int(n_bins)
+        self.score_range = tuple(score_range) if score_range is not None else None
+        self.pos_label = pos_label
+        self.pos_hist_ = np.zeros(self.n_bins, dtype=np.int64)
+        self.neg_hist_ = np.zeros(self.n_bins, dtype=np.int64)
+
+    def _bin(self, y_score: np.ndarray) -> np.ndarray:
+        s = np.asarray(y_score, dtype=np.float64).ravel()
+        if self.score_range is None:
+            lo, hi = 0.0, 1.0
+            s = 0.5 * (1.0 + np.tanh(0.5 * s))  # numerically stable sigmoid
+        else:
+            lo, hi = self.score_range
+        idx = np.floor((s - lo) * (self.n_bins / (hi - lo)))
+        return np.clip(idx, 0, self.n_bins - 1).astype(np.intp)
+
+    def update(self, y_true: np.ndarray, y_score: np.ndarray) -> "HistogramAUCAccumulator":
+        """Add one chunk of labels / positive-class scores."""
+        bins = self._bin(y_score)
+        pos = np.asarray(y_true).ravel() == self.pos_label
+        if pos.shape[0] != bins.shape[0]:
+            raise ValueError(
+                f"!y_true and y_score have different lengths: {pos.shape[0]} vs {bins.shape[0]}!"
+            )
+        self.pos_hist_ += np.bincount(bins[pos], minlength=self.n_bins)
+        self.neg_hist_ += np.bincount(bins[~pos], minlength=self.n_bins)
+        return self
+
+    def merge(self, other: "HistogramAUCAccumulator") -> "HistogramAUCAccumulator":
+        """Add the histograms of another accumulator with the same binning."""
+        if (other.n_bins, other.score_range) != (self.n_bins, self.score_range):
+            raise ValueError("!Cannot merge AUC accumulators with different binning!")
+        self.pos_hist_ += other.pos_hist_
+        self.neg_hist_ += other.neg_hist_
+        return self
+
+    def roc_curve(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate (fpr, tpr) with one point per bin edge, from (0, 0)."""
+        n_pos, n_neg = self.pos_hist_.sum(), self.neg_hist_.sum()
+        if n_pos == 0 or n_neg == 0:
+            raise ValueError("!ROC curve requires both positive and negative samples!")
+        # Thresholds sweep from the highest bin down
+        tpr = np.r_[0, np.cumsum(self.pos_hist_[::-1])] / n_pos
+        fpr = np.r_[0, np.cumsum(self.neg_hist_[::-1])] / n_neg
+        return fpr, tpr
+
+    def result(self) -> dict:
+        """
+        Returns:
+            {"roc_auc", "n_pos", "n_neg"} (roc_auc is NaN without both classes)
+        """
+        n_pos, n_neg = int(self.pos_hist_.sum()), int(self.neg_hist_.sum())
+        if n_pos == 0 or n_neg == 0:
+            return {"roc_auc": float('nan'), "n_pos": n_pos, "n_neg": n_neg}
+        # Negatives strictly below each bin + half of the ties inside it
+        neg_below = np.cumsum(self.neg_hist_) - self.neg_hist_
+        wins = self.pos_hist_ @ (neg_below + 0.5 * self.neg_hist_)
+        return {"roc_auc": float(wins / (n_pos * n_neg)), "n_pos": n_pos, "n_neg": n_neg}
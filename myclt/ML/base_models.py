@@ -1,7 +1,43 @@
 import numpy as np
-from typing import Dict , Any, Callable, Optional, Tuple
+from typing import Dict , Any, Callable, Iterator, Optional, Tuple
 from abc import ABC , abstractmethod
 
+from .sparse import issparse
+
+
+# ============================================================================
+# Compute precision (float32 / float64)
+# ============================================================================
+
+# Floating dtypes the models can train in. float32 halves memory bandwidth
+# for wide datasets; float64 is the default.
+SUPPORTED_DTYPES = ("float32", "float64")
+
+
+def resolve_dtype(dtype: Optional[Any] = None, X: Optional[np.ndarray] = None) -> np.dtype:
+    """
+    Pick the compute dtype for training/prediction.
+    
+    Args:
+        dtype: Explicit dtype ("float32", "float64", np.float32, ...) or None
+        X: Optional data array; when dtype is None, float32 data keeps float32
+    
+    Returns:
+        np.dtype (float32 or float64)
+    
+    Raises:
+        ValueError: If dtype is not one of SUPPORTED_DTYPES
+    """
+    if dtype is None:
+        if getattr(X, "dtype", None) == np.float32:
+            return np.dtype(np.float32)
+        return np.dtype(np.float64)
+    
+    dt = np.dtype(dtype)
+    if dt.name not in SUPPORTED_DTYPES:
+        raise ValueError(f"!Unsupported dtype '{dtype}'. Use one of: {', '.join(SUPPORTED_DTYPES)}!")
+    return dt
+
 
 # ============================================================================
 # Universal preprocessing functions (shared by all supervised models)
@@ -50,29 +86,279 @@ def train_test_split(X: np.ndarray, y: np.ndarray, test_size: float, seed: int)
     return X_train, X_test, y_train, y_test, train_idx, test_idx
 
 
-def standardize_fit(X_train: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+class KFold:
+    """
+    Index-only K-fold splitter, computed once and reused.
+
+    Every row gets a fold id from a seeded Generator; iterating yields
+    (train_idx, val_idx) index arrays in row order, so no fold copies of X
+    are kept around and every configuration in a search sees the same
+    folds. With y the folds are stratified: rows are shuffled, grouped by
+    class and dealt round-robin, so each class is spread over the folds
+    with counts differing by at most one.
+
+    Args:
+        n_samples: Number of rows to split
+        n_splits: Number of folds (2..n_samples)
+        y: Class labels to stratify on (None for a plain shuffled split)
+        seed: Random seed (or a np.random.Generator)
+    """
+
+    def __init__(self, n_samples: int, n_splits: int = 5,
+                 y: Optional[np.ndarray] = None, seed: Any = 42):
+        if not (2 <= n_splits <= n_samples):
+            raise ValueError(f"!n_splits must be between 2 and {n_samples}, got {n_splits}!")
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(n_samples)
+        if y is not None:
+            y = np.asarray(y)
+            if len(y) != n_samples:
+                raise ValueError(f"!y has {len(y)} rows, expected {n_samples}!")
+            _, codes = np.unique(y, return_inverse=True)
+            order = order[np.argsort(codes.ravel()[order], kind="stable")]
+        self.n_splits = n_splits
+        self.stratified = y is not None
+        self.fold_ids = np.empty(n_samples, dtype=np.int32)
+        self.fold_ids[order] = np.arange(n_samples) % n_splits
+
+    def __len__(self) -> int:
+        return self.n_splits
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for fold in range(self.n_splits):
+            in_fold = self.fold_ids == fold
+            yield np.flatnonzero(~in_fold), np.flatnonzero(in_fold)
+
+
+def _sum_squared_deviations(X: np.ndarray, mean: np.ndarray,
+                            block_bytes: int = 8 * 1024 * 1024) -> np.ndarray:
+    """
+    Column sums of (X - mean)² in float64, one block of rows at a time.
+
+    Same two-pass result as X.var(axis=0) * n, but the X - mean temporary
+    is bounded by ``block_bytes`` instead of being a full copy of X.
+    """
+    block_rows = max(1, block_bytes // (8 * max(1, X.shape[1])))
+    m2 = np.zeros(X.shape[1], dtype=np.float64)
+    for start in range(0, X.shape[0], block_rows):
+        d = np.subtract(X[start:start + block_rows], mean, dtype=np.float64)
+        m2 += np.einsum("ij,ij->j", d, d)
+    return m2
+
+
+class Scaler:
+    """
+    Per-feature standardization: (X - mean) / std.
+    
+    Statistics are accumulated in float64 with a streaming (Welford / Chan)
+    mean-variance update, so ``partial_fit`` can be called chunk by chunk on
+    data that does not fit in memory; ``fit`` is the single-chunk case.
+    ``mean_`` / ``scale_`` are kept in the dtype of the fitted data, so
+    float32 data stays float32.
+    
+    ``transform`` / ``inverse_transform`` accept ``out=`` (pass ``out=X``
+    to scale in place without allocating a second matrix).
+    
+    With ``with_mean=False`` the data is only divided by the std and
+    ``mean_`` is all zeros: centering would turn every zero of a sparse
+    CSRMatrix into a stored value, so sparse input requires it.
+    
+    Example:
+        >>> scaler = Scaler().fit(X_train)
+        >>> X_test_scaled = scaler.transform(X_test)
+        >>> scaler.transform(X_train, out=X_train)  # in place
+        
+        >>> scaler = Scaler()
+        >>> for chunk in chunks:
+        ...     scaler.partial_fit(chunk)
+    """
+    
+    def __init__(self, with_mean: bool = True):
+        self.with_mean = with_mean
+        self.n_samples_seen_: int = 0
+        self.mean_: Optional[np.ndarray] = None   # (n_features,), data dtype
+        self.scale_: Optional[np.ndarray] = None  # std with 1.0 for zero-std features
+        self._mean64: Optional[np.ndarray] = None
+        self._m2: Optional[np.ndarray] = None     # sum of squared deviations
+        self._dtype: Optional[np.dtype] = None
+    
+    @property
+    def is_fitted(self) -> bool:
+        """Check if statistics are available."""
+        return self.mean_ is not None
+    
+    @property
+    def var_(self) -> Optional[np.ndarray]:
+        """Population variance per feature (float64)."""
+        if self._m2 is None or self.n_samples_seen_ == 0:
+            return None
+        return self._m2 / self.n_samples_seen_
+    
+    def fit(self, X: np.ndarray) -> "Scaler":
+        """Fit statistics on X from scratch."""
+        self.n_samples_seen_ = 0
+        self._mean64 = self._m2 = self._dtype = None
+        return self.partial_fit(X)
+    
+    def partial_fit(self, X: np.ndarray) -> "Scaler":
+        """
+        Update the statistics with one more chunk of rows.
+        
+        Merges the chunk's mean / squared deviations into the running ones
+        (Chan et al. parallel update), one pass over the chunk.
+        
+        Args:
+            X: Chunk of the feature matrix (n_chunk_samples, n_features)
+        
+        Returns:
+            self
+        """
+        if issparse(X):
+            if self.with_mean:
+                raise ValueError(
+                    "!Centering would densify sparse input: use Scaler(with_mean=False)!"
+                )
+        else:
+            X = np.asarray(X)
+            if X.ndim == 1:
+                X = X.reshape(1, -1)
+        n_b = X.shape[0]
+        if n_b == 0:
+            return self
+        if self._m2 is not None and X.shape[1] != self._m2.shape[0]:
+            raise ValueError(
+                f"!Scaler was fitted on {self._m2.shape[0]} features, got {X.shape[1]}!"
+            )
+        
+        mean_b = X.mean(axis=0, dtype=np.float64)
+        if issparse(X):
+            m2_b = X.var(axis=0, dtype=np.float64) * n_b
+        else:
+            m2_b = _sum_squared_deviations(X, mean_b)
+        
+        if self._m2 is None:
+            self._dtype = resolve_dtype(None, X)
+            self._mean64, self._m2 = mean_b, m2_b
+            self.n_samples_seen_ = n_b
+        else:
+            n_a = self.n_samples_seen_
+            n = n_a + n_b
+            delta = mean_b - self._mean64
+            self._mean64 = self._mean64 + delta * (n_b / n)
+            self._m2 = self._m2 + m2_b + delta ** 2 * (n_a * n_b / n)
+            self.n_samples_seen_ = n
+        
+        self._update_public_stats()
+        return self
+    
+    def _update_public_stats(self) -> None:
+        """Refresh mean_ / scale_ (data dtype) from the float64 accumulators."""
+        std = np.sqrt(self._m2 / self.n_samples_seen_)
+        # division by zero protection
+        std = np.where(std == 0.0, 1.0, std)
+        mean = self._mean64 if self.with_mean else np.zeros_like(self._mean64)
+        self.mean_ = mean.astype(self._dtype)
+        self.scale_ = std.astype(self._dtype)
+    
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Standardize X with the fitted statistics.
+        
+        Args:
+            X: Feature matrix (n_samples, n_features)
+            out: Optional output array (may be X itself for in-place scaling)
+        
+        Returns:
+            Scaled feature matrix (``out`` if given)
+        """
+        if not self.is_fitted:
+            raise RuntimeError("!Scaler is not fitted yet!")
+        return standardize_apply(X, self.mean_, self.scale_, out=out)
+    
+    def fit_transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """fit(X) followed by transform(X, out=out)."""
+        return self.fit(X).transform(X, out=out)
+    
+    def inverse_transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Map standardized data back to the original feature scale.
+        
+        Args:
+            X: Scaled feature matrix (n_samples, n_features)
+            out: Optional output array (may be X itself)
+        
+        Returns:
+            Unscaled feature matrix (``out`` if given)
+        """
+        if not self.is_fitted:
+            raise RuntimeError("!Scaler is not fitted yet!")
+        if issparse(X):
+            return X.scale_columns(self.scale_, out=out)
+        out = np.multiply(X, self.scale_, out=out)
+        return np.add(out, self.mean_, out=out)
+    
+    @classmethod
+    def from_stats(cls, mean: np.ndarray, std: np.ndarray) -> "Scaler":
+        """
+        Rebuild a fitted scaler from stored statistics (e.g. a saved session).
+        
+        The sample count is unknown, so the result can transform but should
+        not be updated further with partial_fit().
+        """
+        scaler = cls(with_mean=bool(np.any(np.asarray(mean) != 0)))
+        scaler.mean_ = np.asarray(mean)
+        scaler.scale_ = np.asarray(std)
+        scaler._dtype = scaler.mean_.dtype
+        return scaler
+    
+    def get_params(self) -> Dict[str, Any]:
+        """Get scaler statistics for saving (JSON-friendly)."""
+        return {
+            'n_samples_seen': int(self.n_samples_seen_),
+            'mean': self._mean64.tolist() if self._mean64 is not None else None,
+            'm2': self._m2.tolist() if self._m2 is not None else None,
+            'dtype': self._dtype.name if self._dtype is not None else None,
+            'with_mean': self.with_mean,
+        }
+    
+    def set_params(self, params: Dict[str, Any]) -> None:
+        """Restore statistics saved by get_params() (partial_fit can continue)."""
+        self.n_samples_seen_ = int(params.get('n_samples_seen', 0))
+        if params.get('mean') is None or self.n_samples_seen_ == 0:
+            self.__init__(with_mean=params.get('with_mean', True))
+            return
+        self.with_mean = params.get('with_mean', True)
+        self._mean64 = np.array(params['mean'], dtype=np.float64)
+        self._m2 = np.array(params['m2'], dtype=np.float64)
+        self._dtype = resolve_dtype(params.get('dtype'))
+        self._update_public_stats()
+
+
+def standardize_fit(X_train: np.ndarray,
+                    out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Fit standardization on TRAIN only:
     mean, std per feature.
     Returns scaled X_train + mean + std.
     
+    Statistics are accumulated in float64 and returned in X_train's dtype,
+    so float32 data stays float32 (see Scaler). A sparse CSRMatrix is
+    scaled only (mean returned as zeros), so it stays sparse.
+    
     Args:
         X_train: Training feature matrix (n_train_samples, n_features)
+        out: Optional output array for the scaled matrix (``out=X_train`` scales in place)
     
     Returns:
         Tuple of (X_scaled, mean, std_safe) where std_safe has 1.0 for zero-std features
     """
-    mean = X_train.mean(axis=0)
-    std = X_train.std(axis=0)
-
-    # division by zero protection
-    std_safe = np.where(std == 0.0, 1.0, std)
-    X_scaled = (X_train - mean) / std_safe
+    scaler = Scaler(with_mean=not issparse(X_train)).fit(X_train)
+    X_scaled = scaler.transform(X_train, out=out)
+    return X_scaled, scaler.mean_, scaler.scale_
 
-    return X_scaled, mean, std_safe
 
-
-def standardize_apply(X: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+def standardize_apply(X: np.ndarray, mean: np.ndarray, std: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Apply fitted standardization to new data.
     
@@ -80,11 +366,98 @@ def standardize_apply(X: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.nd
         X: Feature matrix to scale (n_samples, n_features)
         mean: Mean from training data (n_features,)
         std: Standard deviation from training data (n_features,)
+        out: Optional output array (may be X itself for in-place scaling)
     
     Returns:
         Scaled feature matrix (n_samples, n_features)
+    
+    Raises:
+        ValueError: If X is a sparse CSRMatrix and mean is not all zeros
     """
-    return (X - mean) / std
+    if issparse(X):
+        if np.any(np.asarray(mean) != 0):
+            raise ValueError(
+                "!Sparse input can only be scaled, not centered: the scaler was "
+                "fitted with a non-zero mean (fit it on sparse data)!"
+            )
+        return X.scale_columns(1.0 / np.asarray(std, dtype=X.dtype), out=out)
+    out = np.subtract(X, mean, out=out)
+    return np.divide(out, std, out=out)
+
+
+# ============================================================================
+# Convergence monitoring (shared by all gradient-descent models)
+# ============================================================================
+
+class ConvergenceMonitor:
+    """
+    Decides when a gradient-descent loop has converged on the TRAINING objective.
+
+    Training is considered converged when either:
+      - the gradient norm drops to ``tol`` or below, or
+      - the loss has not improved on the best seen value by more than ``tol``
+        for ``n_iter_no_change`` consecutive checks.
+
+    A non-finite loss (NaN / inf) never counts towards convergence.
+    Setting ``tol=None`` disables the criterion (the loop runs all epochs).
+
+    Example:
+        >>> monitor = ConvergenceMonitor(tol=1e-6, n_iter_no_change=10)
+        >>> for epoch in range(1, epochs + 1):
+        ...     ...
+        ...     if monitor.update(loss, grad_norm):
+        ...         break
+    """
+
+    def __init__(self, tol: Optional[float] = 1e-6, n_iter_no_change: int = 10):
+        if tol is not None and tol < 0:
+            raise ValueError("!tol must be non-negative or None!")
+        if n_iter_no_change < 1:
+            raise ValueError("!n_iter_no_change must be at least 1!")
+
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.best_loss = float('inf')
+        self.no_improvement_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True if the stopping criterion is active."""
+        return self.tol is not None
+
+    def update(self, loss: Optional[float] = None,
+               grad_norm: Optional[float] = None) -> bool:
+        """
+        Register one check (loss and/or gradient norm).
+
+        Args:
+            loss: Current training loss (skipped if None)
+            grad_norm: Current gradient norm (skipped if None)
+
+        Returns:
+            True if training should stop
+        """
+        if self.tol is None:
+            return False
+
+        if grad_norm is not None and grad_norm <= self.tol:
+            return True
+
+        if loss is None:
+            return False
+
+        # A NaN/inf loss is divergence, not a plateau: start counting afresh
+        if not np.isfinite(loss):
+            self.no_improvement_count = 0
+            return False
+
+        if loss < self.best_loss - self.tol:
+            self.no_improvement_count = 0
+        else:
+            self.no_improvement_count += 1
+
+        self.best_loss = min(self.best_loss, loss)
+        return self.no_improvement_count >= self.n_iter_no_change
 
 
 # ============================================================================
@@ -203,13 +576,14 @@ def universal_rebuild_split(state: Any, train_test_split_fn: Callable,
           - prepareddata: Prepareddata object or None
           - test_size, seed: Split parameters
           - use_scaling: Boolean flag for scaling
+          - dtype (optional): "float32" / "float64" compute precision for X
           - X_train, X_test, y_train, y_test: Will be set
           - scaler_mean, scaled_std: Will be set or None
           - model: Will be reset to None
           - reset_metrics(): Method to reset all metrics
         train_test_split_fn: Function to split data (X, y, test_size, seed) -> (X_train, X_test, y_train, y_test, train_idx, test_idx)
-        standardize_fit_fn: Function to fit scaler (X_train) -> (X_scaled, mean, std)
-        standardize_apply_fn: Function to apply scaler (X_test, mean, std) -> X_scaled
+        standardize_fit_fn: Function to fit scaler (X_train, out=None) -> (X_scaled, mean, std)
+        standardize_apply_fn: Function to apply scaler (X_test, mean, std, out=None) -> X_scaled
     
     Raises:
         RuntimeError: If features/target not selected (prepareddata is None)
@@ -219,15 +593,27 @@ def universal_rebuild_split(state: Any, train_test_split_fn: Callable,
     
     X, y = state.prepareddata.X, state.prepareddata.Y
     
+    # Compute precision (no copy when X already has the requested dtype)
+    dtype = getattr(state, "dtype", None)
+    if dtype is not None:
+        X = X.astype(resolve_dtype(dtype), copy=False)
+        state.prepareddata.X = X
+    
     # Split data
     X_train, X_test, y_train, y_test, train_idx, test_idx = train_test_split_fn(
         X, y, test_size=state.test_size, seed=state.seed
     )
     
-    # Apply scaling if enabled
+    # Apply scaling if enabled. The split arrays are fresh copies (fancy
+    # indexing), so float data is scaled in place instead of copied again.
     if state.use_scaling:
-        X_train_scaled, mean, std = standardize_fit_fn(X_train)
-        X_test_scaled = standardize_apply_fn(X_test, mean, std)
+        inplace = np.issubdtype(X_train.dtype, np.floating)
+        X_train_scaled, mean, std = standardize_fit_fn(
+            X_train, out=X_train if inplace else None
+        )
+        X_test_scaled = standardize_apply_fn(
+            X_test, mean, std, out=X_test if inplace else None
+        )
         state.X_train, state.X_test = X_train_scaled, X_test_scaled
         state.scaler_mean, state.scaled_std = mean, std
     else:
@@ -285,6 +671,7 @@ def universal_print_status(state: Any, model_name: str,
     print(f"Selection:    {sup}")
     print(f"Split:        test_size={state.test_size}; seed={state.seed}")
     print(f"Scaling:      {'ON' if state.use_scaling else 'OFF'}")
+    print(f"Precision:    {getattr(state, 'dtype', 'float64')}")
     print(f"Model:        trained={trained} (lr={state.learning_rate}, epochs={state.epochs})")
     print(f"Regularization: {reg_status}")
     print(f"Metrics:      {metrics}")
@@ -53,7 +53,7 @@ class BaseSessionAdapter(SessionAdapter):
       - hyperparams_config (list of dicts describing hyperparams)
       - model_class (the model class to instantiate on restore)
       - dataset_class, prepareddata_class (for reconstructing data objects)
-      - preprocessing_module (optional, for standardize_apply import)
+      - preprocessing_module (optional, provides Scaler for the split scaling)
     """
 
     # Override in subclass
@@ -61,7 +61,7 @@ class BaseSessionAdapter(SessionAdapter):
     model_class = None
     dataset_class = None
     prepareddata_class = None
-    preprocessing_module = None  # module path for standardize_apply
+    preprocessing_module = None  # module providing Scaler
 
     # List of hyperparam specs: {"name": str, "default": Any, "aliases": Optional[List[str]]}
     hyperparam_specs: List[Dict[str, Any]] = []
@@ -128,11 +128,15 @@ class BaseSessionAdapter(SessionAdapter):
         model_params_json = {k: v for k, v in model_params.items() if k != "w"}
 
         training_config = self._build_training_config(app_state, model_params_json)
+        scaler_params = self._scaler_params(app_state, X_data, train_indices)
+        if scaler_params is not None:
+            training_config.hyperparams["scaler"] = scaler_params
 
         metadata = SessionMetadata(
             algorithm=self.algorithm_name,
             timestamp=datetime.now().isoformat(),
             random_seed=app_state.seed,
+            training_profile=getattr(app_state.model, "profile_", None),
         )
 
         session_data = SessionData(
@@ -186,6 +190,7 @@ class BaseSessionAdapter(SessionAdapter):
             algorithm=self.algorithm_name,
             timestamp=datetime.now().isoformat(),
             random_seed=app_state.seed,
+            training_profile=getattr(app_state.model, "profile_", None),
         )
 
         session_data = SessionData(
@@ -205,6 +210,40 @@ class BaseSessionAdapter(SessionAdapter):
 
         return session_data, arrays_dict
 
+    def _scaler_params(
+        self, app_state: Any, X_data: np.ndarray, train_indices: Optional[List[int]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Scaler.get_params() of the training-split scaler (None without scaling).
+
+        Refits on the raw training rows, the same computation as
+        standardize_fit(), so restore can rebuild the exact Scaler
+        (including n_samples_seen / m2 for further partial_fit calls).
+        """
+        if (
+            not app_state.use_scaling
+            or train_indices is None
+            or self.preprocessing_module is None
+            or getattr(app_state, "scaler_mean", None) is None
+        ):
+            return None
+        X_train_raw = X_data[np.asarray(train_indices, dtype=int)]
+        return self.preprocessing_module.Scaler().fit(X_train_raw).get_params()
+
+    def _restore_scaler(self, session_data: SessionData, arrays: Dict[str, np.ndarray]):
+        """Scaler saved with the session (or rebuilt from mean/std for older sessions)."""
+        if not session_data.use_scaling or self.preprocessing_module is None:
+            return None
+        Scaler = self.preprocessing_module.Scaler
+        params = session_data.training_config.hyperparams.get("scaler")
+        if params:
+            scaler = Scaler()
+            scaler.set_params(params)
+            return scaler
+        if "scaler_mean" in arrays and "scaled_std" in arrays:
+            return Scaler.from_stats(arrays["scaler_mean"], arrays["scaled_std"])
+        return None
+
     def _build_training_config(
         self, app_state: Any, model_params_json: Dict[str, Any]
     ) -> TrainingConfig:
@@ -214,6 +253,7 @@ class BaseSessionAdapter(SessionAdapter):
             "epochs": app_state.epochs,
             "test_size": app_state.test_size,
             "seed": app_state.seed,
+            "dtype": getattr(app_state, "dtype", "float64"),
             "model_params": model_params_json,
         }
         # Add algorithm-specific hyperparams
@@ -221,6 +261,10 @@ class BaseSessionAdapter(SessionAdapter):
             name = spec["name"]
             value = getattr(app_state, name, spec.get("default"))
             hyperparams[name] = value
+        # Original labels of the encoded classification target
+        class_names = getattr(app_state, "class_names", None)
+        if class_names:
+            hyperparams["class_names"] = [str(name) for name in class_names]
 
         return TrainingConfig(hyperparams=hyperparams)
 
@@ -266,34 +310,36 @@ class BaseSessionAdapter(SessionAdapter):
             target_name=session_data.target_name,
         )
 
-        # Preprocessing state
+        # Preprocessing state: the saved Scaler is the source of the statistics
         app_state.use_scaling = session_data.use_scaling
-        if "scaler_mean" in arrays:
-            app_state.scaler_mean = arrays["scaler_mean"]
-        if "scaled_std" in arrays:
-            app_state.scaled_std = arrays["scaled_std"]
+        scaler = self._restore_scaler(session_data, arrays)
+        if scaler is not None:
+            app_state.scaler_mean, app_state.scaled_std = scaler.mean_, scaler.scale_
+        else:
+            if "scaler_mean" in arrays:
+                app_state.scaler_mean = arrays["scaler_mean"]
+            if "scaled_std" in arrays:
+                app_state.scaled_std = arrays["scaled_std"]
 
         # Reconstruct train/test split using indices (preferred)
         if session_data.train_indices is not None and session_data.test_indices is not None:
             train_idx = np.array(session_data.train_indices, dtype=int)
             test_idx = np.array(session_data.test_indices, dtype=int)
 
-            # raw slices from canonical X/Y
+            # raw slices from canonical X/Y (fancy indexing -> fresh copies)
             X_train_raw = X[train_idx]
             X_test_raw = X[test_idx]
 
-            # apply scaling if needed
-            if session_data.use_scaling and getattr(app_state, "scaler_mean", None) is not None and getattr(app_state, "scaled_std", None) is not None:
-                if self.preprocessing_module is not None:
-                    app_state.X_train = self.preprocessing_module.standardize_apply(
-                        X_train_raw, app_state.scaler_mean, app_state.scaled_std
-                    )
-                    app_state.X_test = self.preprocessing_module.standardize_apply(
-                        X_test_raw, app_state.scaler_mean, app_state.scaled_std
-                    )
-                else:
-                    app_state.X_train = X_train_raw
-                    app_state.X_test = X_test_raw
+            # apply scaling if needed: transform with the restored Scaler (no
+            # refit) and scale the fresh slices in place instead of copying them
+            if scaler is not None:
+                inplace = np.issubdtype(X_train_raw.dtype, np.floating)
+                app_state.X_train = scaler.transform(
+                    X_train_raw, out=X_train_raw if inplace else None
+                )
+                app_state.X_test = scaler.transform(
+                    X_test_raw, out=X_test_raw if inplace else None
+                )
             else:
                 app_state.X_train = X_train_raw
                 app_state.X_test = X_test_raw
@@ -321,10 +367,13 @@ class BaseSessionAdapter(SessionAdapter):
         app_state.epochs = hyperparams.get("epochs", 2000)
         app_state.test_size = hyperparams.get("test_size", 0.2)
         app_state.seed = hyperparams.get("seed", 42)
+        app_state.dtype = hyperparams.get("dtype", "float64")
 
         # Set algorithm-specific hyperparams
         for name, value in self._extract_hyperparams(hyperparams).items():
             setattr(app_state, name, value)
+        if hyperparams.get("class_names"):
+            app_state.class_names = list(hyperparams["class_names"])
 
         # Metrics
         app_state.metrics = session_data.metrics if session_data.metrics else {}
@@ -336,6 +385,8 @@ class BaseSessionAdapter(SessionAdapter):
 
         app_state.model = self.model_class()
         app_state.model.set_params(model_params)
+        if session_data.metadata.training_profile:
+            app_state.model.profile_ = session_data.metadata.training_profile
 
     def validate_session(self, session_data: SessionData) -> bool:
         """Validate algorithm-specific requirements."""
@@ -0,0 +1,163 @@
+"""
+Shared gradient-descent training engine for linear-family models.
+
+Models describe ONE epoch as a fused forward/backward ``step`` callback
+(predictions are computed once and reused for both loss and gradients,
+parameters are updated in place using preallocated work buffers).
+The engine owns everything around it:
+
+  - loss evaluation only every ``log_every`` epochs (plus first/last epoch,
+    and the epoch training stopped at)
+  - convergence-based stopping on training loss / gradient norm
+    (tol / n_iter_no_change, see ConvergenceMonitor)
+  - validation-based early stopping (patience measured in epochs)
+  - progress printing
+
+Used by LinearRegressionGD, LogisticRegressionGD,
+MultinomialLogisticRegression and the SVM BaseLinearModel.
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from myclt.ML.base_models import ConvergenceMonitor
+from myclt.ML.profiling import count, profiled
+
+
+# step(compute_loss) -> (training loss before the update or None, gradient norm or None)
+StepFn = Callable[[bool], Tuple[Optional[float], Optional[float]]]
+
+# val_loss() -> validation loss for the CURRENT parameters
+ValLossFn = Callable[[], float]
+
+
+@dataclass
+class TrainingResult:
+    """
+    Outcome of one run_training_loop() call.
+
+    Attributes:
+        n_iter: Number of epochs actually run
+        loss_history: Training losses recorded every ``log_every`` epochs
+                      (see checkpoint_epochs for the matching epoch numbers)
+        val_loss_history: Validation losses (empty without early stopping)
+        stop_reason: "max_epochs", "converged" or "early_stopping"
+    """
+    n_iter: int = 0
+    loss_history: List[float] = field(default_factory=list)
+    val_loss_history: List[float] = field(default_factory=list)
+    stop_reason: str = "max_epochs"
+
+
+def is_log_epoch(epoch: int, epochs: int, log_every: int) -> bool:
+    """True if the loss should be evaluated at this (1-based) epoch."""
+    return epoch == 1 or epoch == epochs or epoch % log_every == 0
+
+
+def checkpoint_epochs(n_points: int, log_every: int = 1,
+                      n_iter: Optional[int] = None) -> np.ndarray:
+    """
+    Epoch numbers (1-based) of the ``n_points`` entries of a loss history.
+
+    run_training_loop() records epoch 1, every ``log_every``-th epoch and
+    the epoch training stopped at (``n_iter``). If the history does not
+    match that schedule (e.g. n_iter unknown) the regular checkpoints
+    1, log_every, 2 * log_every, ... are returned.
+    """
+    log_every = max(1, int(log_every))
+    if n_iter:
+        epochs = np.unique(np.r_[1, np.arange(log_every, n_iter + 1, log_every), n_iter])
+        if len(epochs) == n_points:
+            return epochs
+    return np.unique(np.r_[1, log_every * np.arange(1, n_points + 1)])[:n_points]
+
+
+@profiled("training_loop")
+def run_training_loop(step: StepFn, epochs: int, log_every: int = 10,
+                      tol: Optional[float] = None, n_iter_no_change: int = 10,
+                      val_loss: Optional[ValLossFn] = None,
+                      patience: int = 50, min_delta: float = 0.0,
+                      verbose: bool = False,
+                      train_loss: Optional[ValLossFn] = None) -> TrainingResult:
+    """
+    Run a gradient-descent loop around a model-specific ``step`` callback.
+
+    Args:
+        step: Performs one epoch of updates in place. Called with
+              ``compute_loss=True`` only on logging epochs; returns
+              (loss or None, gradient norm or None)
+        epochs: Maximum number of epochs
+        log_every: Evaluate training (and validation) loss every N epochs
+        tol: Convergence tolerance (None = disabled)
+        n_iter_no_change: Loss checks without improvement > tol before stopping
+        val_loss: Optional validation-loss callback; enables early stopping
+        patience: Epochs without validation improvement before stopping
+        min_delta: Minimum validation improvement that resets patience
+        verbose: Print progress information
+        train_loss: Optional training-loss callback, used to record the loss
+                    of the epoch training stopped at when that epoch was not
+                    a logging epoch
+
+    Returns:
+        TrainingResult with epochs run, loss histories and stop reason
+    """
+    log_every = max(1, int(log_every))
+    monitor = ConvergenceMonitor(tol, n_iter_no_change)
+    result = TrainingResult()
+
+    best_val_loss = float('inf')
+    best_epoch = 0
+    print_every = max(1, epochs // 10)
+    next_print = print_every
+
+    logged = False
+    for epoch in range(1, epochs + 1):
+        compute_loss = is_log_epoch(epoch, epochs, log_every)
+        loss, grad_norm = step(compute_loss)
+        result.n_iter = epoch
+
+        logged = loss is not None
+        if logged:
+            result.loss_history.append(float(loss))
+
+        if monitor.update(loss, grad_norm):
+            result.stop_reason = "converged"
+            if verbose:
+                print(f"Converged at epoch {epoch}")
+            break
+
+        if val_loss is not None and compute_loss:
+            current_val = float(val_loss())
+            result.val_loss_history.append(current_val)
+
+            if current_val < best_val_loss - min_delta:
+                best_val_loss = current_val
+                best_epoch = epoch
+            elif epoch - best_epoch >= patience:
+                result.stop_reason = "early_stopping"
+                if verbose:
+                    print(f"Early stopping at epoch {epoch}. Best val loss: {best_val_loss:.6f}")
+                break
+
+        if verbose and epoch >= next_print:
+            next_print += print_every
+            msg = f"Epoch {epoch}:"
+            if result.loss_history:
+                msg += f" train_loss={result.loss_history[-1]:.6f}"
+            if result.val_loss_history:
+                msg += f" val_loss={result.val_loss_history[-1]:.6f}"
+            print(msg)
+
+    # stopped on a non-logging epoch: keep the final loss in the history
+    if result.n_iter and not logged and train_loss is not None:
+        result.loss_history.append(float(train_loss()))
+
+    count(epochs=result.n_iter)
+    return result
+
+
+def gradient_norm(dw: np.ndarray, db) -> float:
+    """Euclidean norm of the concatenated (dw, db) gradient."""
+    db = np.asarray(db, dtype=float)
+    return float(np.sqrt(np.vdot(dw, dw) + np.vdot(db, db)))
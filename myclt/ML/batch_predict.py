@@ -13,6 +13,9 @@ Design:
     - Uses numpy vectorization (no Python loops over samples)
     - Efficient for large datasets (1000s of rows, 1000s of features)
     - No pandas dependency for core logic (only for optional CSV I/O convenience)
+    - Sparse input: libsvm files ("label index:value ...") and, with
+      ``sparse=True``, CSV files are loaded as a CSRMatrix and predicted
+      without densifying by models with ``accepts_sparse``
 """
 
 import numpy as np
@@ -20,6 +23,7 @@ import os
 from typing import List, Optional, Dict, Any, Tuple
 
 from .base_models import standardize_apply
+from .sparse import issparse, is_libsvm_file, load_libsvm, load_sparse_csv
 
 
 # ============================================================================
@@ -99,6 +103,26 @@ def _load_feature_csv(csv_path: str, expected_n_features: int,
     return data
 
 
+def _load_features(csv_path: str, n_features: int, delimiter: Optional[str],
+                   sparse: Optional[bool]):
+    """
+    Load the feature rows as a dense array or a CSRMatrix.
+
+    libsvm files (by extension or content) are always loaded sparse unless
+    ``sparse=False``; CSV files only with ``sparse=True``.
+    """
+    if not os.path.isfile(csv_path):
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    if sparse is not False and is_libsvm_file(csv_path):
+        X, _ = load_libsvm(csv_path, n_features=n_features)
+        return X.toarray() if sparse is False else X
+    if delimiter is None:
+        delimiter = _detect_csv_delimiter(csv_path)
+    if sparse:
+        return load_sparse_csv(csv_path, n_features, delimiter)
+    return _load_feature_csv(csv_path, n_features, delimiter)
+
+
 def _save_results_csv(results: np.ndarray, header: str, output_path: str,
                       delimiter: str = ";") -> None:
     """
@@ -138,12 +162,14 @@ def batch_predict_from_csv(
     model_type: Optional[str] = None,
     class_names: Optional[List[str]] = None,
     add_original_features: bool = False,
+    sparse: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """
     Batch predict from CSV: load → scale → predict → save → return results summary.
 
     Args:
-        csv_path: Path to CSV with feature columns only (no target column)
+        csv_path: Path to CSV with feature columns only (no target column),
+                  or a libsvm file (a label column there is ignored)
         model: Trained model instance (must have .predict() and optionally .predict_proba())
         feature_names: List of feature column names (order must match CSV columns)
         use_scaling: Whether feature scaling was used during training
@@ -155,6 +181,8 @@ def batch_predict_from_csv(
                      Auto-detected from model if None.
         class_names: Names for classes (multinomial only). Auto-generated if None.
         add_original_features: If True, include original feature columns in output CSV.
+        sparse: Load the rows as a CSRMatrix. None = only for libsvm files;
+                True also parses CSV files sparsely; False always loads dense.
 
     Returns:
         Dict with keys:
@@ -164,6 +192,7 @@ def batch_predict_from_csv(
             - "output_path": path to saved CSV
             - "success": True if successful
             - "model_type": detected model type
+            - "sparse": True if the rows were predicted as a CSRMatrix
 
     Raises:
         FileNotFoundError: If CSV not found
@@ -215,17 +244,27 @@ def batch_predict_from_csv(
     # 2. Auto-detect delimiter if not provided
     # ========================================================================
     if delimiter is None:
-        delimiter = _detect_csv_delimiter(csv_path)
+        delimiter = (_detect_csv_delimiter(csv_path)
+                     if os.path.isfile(csv_path) and not is_libsvm_file(csv_path) else ";")
 
     # ========================================================================
     # 3. Load CSV data
     # ========================================================================
-    X_raw = _load_feature_csv(csv_path, n_features, delimiter)
+    X_raw = _load_features(csv_path, n_features, delimiter, sparse)
     n_samples = X_raw.shape[0]
 
     if n_samples == 0:
         raise ValueError("CSV file is empty (no data rows).")
 
+    # Sparse rows stay sparse only if the model takes them and the scaler
+    # does not center (centering would densify them anyway)
+    if issparse(X_raw):
+        centered = use_scaling and scaler_mean is not None and np.any(scaler_mean != 0)
+        if not getattr(model, "accepts_sparse", False) or centered:
+            reason = "the model needs dense input" if not centered else "the scaler centers the data"
+            print(f"  ℹ Converting {n_samples} sparse rows to dense ({reason})")
+            X_raw = X_raw.toarray()
+
     # ========================================================================
     # 3. Apply scaling if needed
     # ========================================================================
@@ -293,7 +332,7 @@ def batch_predict_from_csv(
     data_parts = []
 
     if add_original_features:
-        data_parts.append(X_raw)
+        data_parts.append(X_raw.toarray() if issparse(X_raw) else X_raw)
 
     # Reshape predictions to column vector
     pred_col = predictions.reshape(-1, 1).astype(float)
@@ -323,6 +362,7 @@ def batch_predict_from_csv(
         "output_path": os.path.abspath(output_path),
         "success": True,
         "model_type": model_type,
+        "sparse": issparse(X_raw),
         "feature_names": feature_names,
         "prediction_column": pred_col_name,
         "probability_columns": probabilities_cols,
@@ -0,0 +1,292 @@
+"""
+Compiled prediction artifacts for low-latency inference.
+
+Restoring a session rebuilds the whole AppState (dataset, X, Y, split,
+scaling) and imports the training code of the algorithm. For scoring only
+the fitted numbers are needed, so ``export_artifact`` writes them into one
+small ``.npz`` file (no pickled objects):
+
+    meta        JSON (model type, task, features, classes, kernel params, ...)
+    mean, std   scaler statistics (only if the model was trained with scaling)
+    W, b        linear models: weights (d,) or (d, K) and bias
+    SV, coef, b kernel models: support vectors (m, d), coefficients (m,) or
+                (m, K) and bias — training rows with a zero coefficient
+                are dropped, and the K estimators of a kernel one-vs-rest
+                model share one support-vector matrix, so a prediction
+                needs a single kernel evaluation instead of K
+
+``load_artifact`` returns a ``Predictor`` that depends on numpy only: the
+loading half of this module imports nothing else from myclt (the file can
+be copied into another application as is).
+
+Command line:
+    myclt export run1 run1.npz
+    python -c "from myclt.ML.inference import load_artifact; \\
+               print(load_artifact('run1.npz').predict([[0.1, 2.0]]))"
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+ARTIFACT_FORMAT = 1
+
+
+# ============================================================================
+# Standalone predictor (numpy only)
+# ============================================================================
+
+def _kernel(name: str, X1: np.ndarray, X2: np.ndarray, gamma: float, degree: int,
+            coef0: float) -> np.ndarray:
+    """Same formulas as svm.core kernels."""
+    if name == "linear":
+        return X1 @ X2.T
+    if name == "poly":
+        return (gamma * (X1 @ X2.T) + coef0) ** degree
+    if name == "sigmoid":
+        return np.tanh(gamma * (X1 @ X2.T) + coef0)
+    if name == "rbf":
+        K = X1 @ X2.T
+        K *= -2.0
+        K += np.einsum("ij,ij->i", X1, X1)[:, None]
+        K += np.einsum("ij,ij->i", X2, X2)[None, :]
+        np.maximum(K, 0.0, out=K)
+        K *= -gamma
+        return np.exp(K, out=K)
+    raise ValueError(f"!Unknown kernel '{name}'!")
+
+
+def _softmax(z: np.ndarray, clip: bool) -> np.ndarray:
+    if clip:
+        z = np.clip(z, -500, 500)
+    z = z - np.max(z, axis=1, keepdims=True)
+    e = np.exp(z)
+    return e / np.sum(e, axis=1, keepdims=True)
+
+
+class Predictor:
+    """
+    Scores new rows from an exported artifact.
+
+    Outputs match the original model: ``predict`` gives regression values
+    or class indices 0..K-1, ``predict_labels`` maps them to class names,
+    ``predict_proba`` exists for logistic models (sigmoid / softmax) and
+    multiclass SVMs (softmax of the scores).
+    """
+
+    def __init__(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        if meta.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"!Unsupported artifact format {meta.get('format')}!")
+        self.meta = meta
+        self.model_type: str = meta["model_type"]
+        self.task: str = meta["task"]
+        self.feature_names: List[str] = meta["feature_names"]
+        self.class_names: List[str] = meta.get("class_names") or []
+        self.dtype = np.dtype(meta["dtype"])
+        self.mean = arrays.get("mean")
+        self.std = arrays.get("std")
+        self.W = arrays.get("W")
+        self.SV = arrays.get("SV")
+        self.coef = arrays.get("coef")
+        self.b = arrays["b"]
+        self.classes = arrays.get("classes")     # multiclass SVM labels when not 0..K-1
+
+    @property
+    def n_features(self) -> int:
+        return len(self.feature_names)
+
+    def _prepare(self, X: Any) -> np.ndarray:
+        X = np.array(X, dtype=self.dtype, ndmin=2)     # fresh copy: scaled in place
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"!Expected {self.n_features} features {self.feature_names}, "
+                             f"got {X.shape[1]}!")
+        if self.mean is not None:
+            X -= self.mean
+            X /= self.std
+        return X
+
+    def decision_function(self, X: Any) -> np.ndarray:
+        """Raw scores: (n,) for regression/binary, (n, K) for multiclass."""
+        X = self._prepare(X)
+        if self.SV is not None:
+            m = self.meta
+            K = _kernel(m["kernel"], X, self.SV, m["gamma"], m["degree"], m["coef0"])
+            return K @ self.coef + self.b
+        return X @ self.W + self.b
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """Probabilities: (n,) for the positive class, (n, K) for multiclass."""
+        proba = self.meta.get("proba")
+        if proba is None:
+            raise AttributeError(f"!{self.model_type} has no probabilities!")
+        z = self.decision_function(X)
+        if proba == "sigmoid":
+            return 1.0 / (1.0 + np.exp(-np.clip(z, -500, 500)))
+        return _softmax(z, clip=proba == "softmax")
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Regression values or class indices."""
+        if self.task == "regression":
+            return self.decision_function(X)
+        if self.task == "multiclass":
+            pred = np.argmax(self.decision_function(X), axis=1)
+            return self.classes[pred] if self.classes is not None else pred
+        if self.meta.get("proba") == "sigmoid":
+            return (self.predict_proba(X) >= self.meta["threshold"]).astype(int)
+        return (self.decision_function(X) >= 0).astype(int)
+
+    def predict_labels(self, X: Any) -> list:
+        """Predictions with class indices replaced by the class names."""
+        pred = self.predict(X)
+        if self.task == "regression" or not self.class_names:
+            return pred.tolist()
+        return [self.class_names[int(p)] for p in pred]
+
+
+def load_artifact(path: str) -> Predictor:
+    """Load an artifact written by export_artifact."""
+    with np.load(path, allow_pickle=False) as npz:
+        arrays = {k: npz[k] for k in npz.files}
+    meta = json.loads(arrays.pop("meta").tobytes().decode("utf-8"))
+    return Predictor(meta, arrays)
+
+
+# ============================================================================
+# Export (needs the training code)
+# ============================================================================
+
+def _kernel_params(model: Any) -> Dict[str, Any]:
+    return {"kernel": model.kernel_name, "gamma": float(model.gamma),
+            "degree": int(model.degree), "coef0": float(model.coef0)}
+
+
+def _prune(SV: np.ndarray, coef: np.ndarray):
+    """Drop training rows whose coefficients are all exactly zero."""
+    keep = np.any(coef.reshape(coef.shape[0], -1) != 0, axis=1)
+    return SV[keep], coef[keep]
+
+
+def _compile_ovr(model: Any, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+    estimators = model.estimators
+    K = len(estimators)
+    if model._inverse_mapping is not None:
+        arrays["classes"] = np.asarray(model.classes_)
+    meta["proba"] = "softmax_scores"
+
+    if hasattr(estimators[0], "w"):
+        arrays["W"] = np.stack([e.w for e in estimators], axis=1)
+        arrays["b"] = np.array([e.b for e in estimators], dtype=arrays["W"].dtype)
+        return
+
+    meta.update(_kernel_params(estimators[0]))
+    X0 = estimators[0].X_train_stored
+    if all(e.X_train_stored is X0 or np.array_equal(e.X_train_stored, X0) for e in estimators):
+        # Same training rows (the usual case): one shared support-vector matrix
+        SV, coef = X0, np.stack([e.beta for e in estimators], axis=1)
+    else:
+        SV = np.vstack([e.X_train_stored for e in estimators])
+        coef = np.zeros((SV.shape[0], K), dtype=estimators[0].beta.dtype)
+        start = 0
+        for k, e in enumerate(estimators):
+            coef[start:start + len(e.beta), k] = e.beta
+            start += len(e.beta)
+    arrays["SV"], arrays["coef"] = _prune(SV, coef)
+    arrays["b"] = np.array([e.b for e in estimators], dtype=coef.dtype)
+
+
+def compile_model(model_type: str, model: Any, feature_names: Sequence[str],
+                  scaler_mean: Optional[np.ndarray] = None,
+                  scaler_std: Optional[np.ndarray] = None,
+                  class_names: Optional[Sequence[str]] = None) -> Predictor:
+    """
+    Reduce a trained model to the arrays a Predictor needs.
+
+    Args:
+        model_type: Key of model_registry.MODEL_TYPES
+        model: Trained model
+        feature_names: Feature column order
+        scaler_mean: Training mean (None = no scaling)
+        scaler_std: Training std (None = no scaling)
+        class_names: Class names of the encoded labels (classification)
+
+    Returns:
+        Predictor over the compiled arrays
+    """
+    from .model_registry import get_spec
+
+    if not getattr(model, "is_trained", False):
+        raise ValueError("!Model is not trained!")
+    meta: Dict[str, Any] = {
+        "format": ARTIFACT_FORMAT, "model_type": model_type,
+        "task": get_spec(model_type).task,
+        "feature_names": list(feature_names), "class_names": list(class_names or []),
+    }
+    arrays: Dict[str, np.ndarray] = {}
+
+    if model_type == "ovr_svm":
+        _compile_ovr(model, meta, arrays)
+    elif hasattr(model, "X_train_stored"):          # kernel_svm / kernel_svr
+        meta.update(_kernel_params(model))
+        arrays["SV"], arrays["coef"] = _prune(model.X_train_stored, model.beta)
+        arrays["b"] = np.asarray(model.b, dtype=model.beta.dtype)
+    elif model_type == "multinomial_logistic_regression":
+        arrays["W"], arrays["b"] = model.W, np.asarray(model.b, dtype=model.W.dtype)
+        meta["proba"] = "softmax"
+    elif model_type == "multiclass_linear_svm":
+        arrays["W"], arrays["b"] = model.w, np.asarray(model.b, dtype=model.w.dtype)
+        if not model._labels_are_indices:
+            arrays["classes"] = np.asarray(model.classes_)
+        meta["proba"] = "softmax_scores"
+    else:                                           # linear models with w, b
+        arrays["W"], arrays["b"] = model.w, np.asarray(model.b, dtype=model.w.dtype)
+        if model_type == "logistic_regression":
+            meta["proba"], meta["threshold"] = "sigmoid", float(model.threshold)
+
+    dtype = (arrays.get("W") if "W" in arrays else arrays["SV"]).dtype
+    meta["dtype"] = dtype.name
+    if scaler_mean is not None and scaler_std is not None:
+        arrays["mean"] = np.asarray(scaler_mean, dtype=dtype)
+        arrays["std"] = np.asarray(scaler_std, dtype=dtype)
+    return Predictor(meta, arrays)
+
+
+def export_artifact(session_path: str, out_path: str) -> Dict[str, Any]:
+    """
+    Compile a saved session into an inference artifact file.
+
+    Args:
+        session_path: Session directory
+        out_path: Output .npz path
+
+    Returns:
+        Summary dict (model_type, path, bytes, n_support_vectors, ...)
+    """
+    from .model_registry import load_session_state
+
+    model_type, state = load_session_state(session_path)
+    std = getattr(state, "scaled_std", None)
+    if std is None:
+        std = getattr(state, "scaler_std", None)
+    predictor = compile_model(
+        model_type, state.model, state.prepareddata.feature_names,
+        state.scaler_mean if state.use_scaling else None,
+        std if state.use_scaling else None,
+        getattr(state, "class_names", None))
+
+    arrays = {k: v for k, v in (("mean", predictor.mean), ("std", predictor.std),
+                                ("W", predictor.W), ("SV", predictor.SV),
+                                ("coef", predictor.coef), ("b", predictor.b),
+                                ("classes", predictor.classes)) if v is not None}
+    meta = np.frombuffer(json.dumps(predictor.meta).encode("utf-8"), dtype=np.uint8)
+    if not out_path.endswith(".npz"):
+        out_path += ".npz"      # np.savez would add it anyway
+    with open(out_path, "wb") as f:
+        np.savez(f, meta=meta, **arrays)
+
+    return {"model_type": model_type, "path": os.path.abspath(out_path),
+            "bytes": os.path.getsize(out_path),
+            "n_support_vectors": int(predictor.SV.shape[0]) if predictor.SV is not None else 0,
+            "features": predictor.feature_names, "class_names": predictor.class_names}
@@ -0,0 +1,179 @@
+"""
+Model registry — one table of every supervised model type.
+
+Maps the session ``model_type`` strings ("linear_regression", "kernel_svm",
+...) to the model class, session adapter and app state of each algorithm,
+so non-interactive entry points (the ``myclt`` command line, reports) can
+build, train, save and restore any model without going through the menus.
+
+Everything is referenced as "module:attribute" and imported on first use:
+importing this module does not import any algorithm, UI or plotting code.
+"""
+
+import importlib
+import inspect
+from typing import Any, Dict, NamedTuple, Tuple
+
+import numpy as np
+
+from .session_storage import SessionStorage
+
+
+class ModelSpec(NamedTuple):
+    """How to build, persist and restore one model type."""
+    task: str       # "regression", "binary" or "multiclass"
+    model: str      # model class "module:Class"
+    adapter: str    # session adapter "module:Class"
+    state: str      # app state "module:Class" (module also provides rebuild_split)
+
+
+_LINREG = "myclt.ML.supervised_learning.linear_regression"
+_LOGREG = "myclt.ML.supervised_learning.logistic_regression"
+_SVM = "myclt.ML.supervised_learning.svm"
+
+MODEL_TYPES: Dict[str, ModelSpec] = {
+    "linear_regression": ModelSpec(
+        "regression", f"{_LINREG}.core:LinearRegressionGD",
+        f"{_LINREG}.session_adapter:LinearRegressionSessionAdapter",
+        f"{_LINREG}.app_state:AppState"),
+    "logistic_regression": ModelSpec(
+        "binary", f"{_LOGREG}.core:LogisticRegressionGD",
+        f"{_LOGREG}.session_adapter:LogisticRegressionSessionAdapter",
+        f"{_LOGREG}.app_state:AppState"),
+    "multinomial_logistic_regression": ModelSpec(
+        "multiclass", f"{_LOGREG}.core:MultinomialLogisticRegression",
+        f"{_LOGREG}.session_adapter:MultinomialSessionAdapter",
+        f"{_LOGREG}.multinomial_app_state:MultinomialAppState"),
+    "linear_svm": ModelSpec(
+        "binary", f"{_SVM}.core:LinearSVM",
+        f"{_SVM}.session_adapter:LinearSVMSessionAdapter",
+        f"{_SVM}.app_state:AppState"),
+    "kernel_svm": ModelSpec(
+        "binary", f"{_SVM}.core:KernelSVM",
+        f"{_SVM}.session_adapter:KernelSVMSessionAdapter",
+        f"{_SVM}.app_state:AppState"),
+    "linear_svr": ModelSpec(
+        "regression", f"{_SVM}.core:LinearSVR",
+        f"{_SVM}.session_adapter:LinearSVRSessionAdapter",
+        f"{_SVM}.app_state:AppState"),
+    "kernel_svr": ModelSpec(
+        "regression", f"{_SVM}.core:KernelSVR",
+        f"{_SVM}.session_adapter:KernelSVRSessionAdapter",
+        f"{_SVM}.app_state:AppState"),
+    "ovr_svm": ModelSpec(
+        "multiclass", f"{_SVM}.core:OneVsRestSVM",
+        f"{_SVM}.session_adapter:OneVsRestSVMSessionAdapter",
+        f"{_SVM}.multinomial_app_state:MultinomialAppState"),
+    "multiclass_linear_svm": ModelSpec(
+        "multiclass", f"{_SVM}.core:MulticlassLinearSVM",
+        f"{_SVM}.session_adapter:MulticlassLinearSVMSessionAdapter",
+        f"{_SVM}.multinomial_app_state:MultinomialAppState"),
+}
+
+
+def import_ref(ref: str) -> Any:
+    """Import "package.module:attribute" and return the attribute."""
+    module_name, attr = ref.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def get_spec(model_type: str) -> ModelSpec:
+    """Look up a model type."""
+    if model_type not in MODEL_TYPES:
+        raise ValueError(f"!Unknown model type '{model_type}'. Use one of: {list(MODEL_TYPES)}!")
+    return MODEL_TYPES[model_type]
+
+
+# ============================================================================
+# Building and training
+# ============================================================================
+
+def new_state(model_type: str) -> Any:
+    """Create an empty app state for a model type."""
+    state = import_ref(get_spec(model_type).state)()
+    if hasattr(state, "model_type"):
+        state.model_type = model_type
+    if hasattr(state, "mode"):
+        state.mode = "regressor" if get_spec(model_type).task == "regression" else "classifier"
+    return state
+
+
+def _accepted_kwargs(cls: type, params: Dict[str, Any]) -> Dict[str, Any]:
+    accepted = inspect.signature(cls).parameters
+    return {k: v for k, v in params.items() if k in accepted and v is not None}
+
+
+def build_model(model_type: str, params: Dict[str, Any]) -> Any:
+    """
+    Instantiate a model, keeping only the hyperparameters its class accepts.
+
+    For "ovr_svm", ``params['base_estimator_type']`` ("linear" or "kernel")
+    selects the binary estimator the other parameters are passed to.
+
+    Args:
+        model_type: Key of MODEL_TYPES
+        params: Hyperparameters (unknown keys and None values are ignored)
+
+    Returns:
+        Untrained model instance
+    """
+    model_class = import_ref(get_spec(model_type).model)
+    if model_type == "ovr_svm":
+        base = params.get("base_estimator_type") or "linear"
+        if base not in ("linear", "kernel"):
+            raise ValueError(f"!base_estimator_type must be 'linear' or 'kernel', got '{base}'!")
+        base_class = import_ref(get_spec(f"{base}_svm").model)
+        return model_class(base_estimator=base_class(**_accepted_kwargs(base_class, params)))
+    return model_class(**_accepted_kwargs(model_class, params))
+
+
+def encode_target(task: str, y: np.ndarray) -> Tuple[np.ndarray, list]:
+    """
+    Encode a raw target column the way the interactive menus do.
+
+    Classification labels (numeric or strings) are mapped to 0..K-1 in
+    sorted order; regression targets are cast to float.
+
+    Args:
+        task: "regression", "binary" or "multiclass"
+        y: Raw target column
+
+    Returns:
+        Tuple of (encoded target, original class names; [] for regression)
+    """
+    if task == "regression":
+        return np.asarray(y, dtype=float), []
+
+    classes, encoded = np.unique(y, return_inverse=True)
+    if task == "binary" and len(classes) != 2:
+        raise ValueError(f"!Target must contain exactly 2 classes, found {len(classes)}!")
+    if len(classes) < 2:
+        raise ValueError(f"!Target must contain at least 2 classes, found {len(classes)}!")
+    return encoded.astype(float), [str(c) for c in classes]
+
+
+# ============================================================================
+# Sessions
+# ============================================================================
+
+def save_session_state(model_type: str, state: Any, session_dir: str, verbose: bool = False) -> None:
+    """Extract a trained app state with its adapter and save it."""
+    session_data, arrays = import_ref(get_spec(model_type).adapter)().extract(state)
+    SessionStorage().save_session(session_data, session_dir, arrays, verbose=verbose)
+
+
+def load_session_state(session_path: str) -> Tuple[str, Any]:
+    """
+    Restore a saved session into a fresh app state of the right model family.
+
+    Args:
+        session_path: Session directory (metadata.json, config.json, data.npz)
+
+    Returns:
+        Tuple of (model_type, app_state)
+    """
+    session_data, arrays = SessionStorage().load_session(session_path, verbose=False)
+    model_type = session_data.model_type
+    state = new_state(model_type)
+    import_ref(get_spec(model_type).adapter)().restore(session_data, arrays, state)
+    return model_type, state
@@ -0,0 +1,351 @@
+"""
+Opt-in training profiler.
+
+Training code marks its phases with ``phase("name")`` (a context manager)
+or the ``profiled("name")`` decorator. Without an active profiler both
+cost one ContextVar lookup, so the hooks stay in place permanently.
+Activate a profiler around any training code:
+
+    with TrainingProfiler() as prof:
+        model.fit(X, y)
+    print(prof.format())
+
+Phases nest (fit > training_loop, fit > kernel, tuning > tuning_evaluation
+> fit ...); repeated calls of the same phase under the same parent are
+merged. Per phase the profiler records calls, wall time, epochs (and so
+epochs/s), bytes of the kernel matrices built, and the RSS high-water
+mark, sampled by a background thread every ``rss_interval`` seconds.
+With ``trace_memory=True`` tracemalloc also reports the peak of Python
+and NumPy allocations above the level at phase start (this slows
+allocation-heavy code down noticeably).
+
+The outermost profiled fit() of a model stores its phase tree as a
+JSON-able dict in ``model.profile_``; session adapters save it in the
+session metadata (``training_profile``).
+"""
+
+import contextlib
+import functools
+import threading
+import time
+import tracemalloc
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+_ACTIVE: ContextVar[Optional["TrainingProfiler"]] = ContextVar("training_profiler", default=None)
+
+
+class PhaseNode:
+    """Aggregated statistics of one phase at one position of the tree."""
+
+    __slots__ = ("name", "calls", "seconds", "epochs", "kernel_bytes",
+                 "peak_rss", "peak_traced", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.epochs = 0
+        self.kernel_bytes = 0
+        self.peak_rss = 0
+        self.peak_traced = 0
+        self.children: Dict[str, "PhaseNode"] = {}
+
+    def add(self, epochs: int = 0, kernel_bytes: int = 0) -> None:
+        """Count epochs run / kernel-matrix bytes built in this phase."""
+        self.epochs += int(epochs)
+        self.kernel_bytes += int(kernel_bytes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"phase": self.name, "calls": self.calls,
+                             "seconds": round(self.seconds, 6)}
+        if self.epochs:
+            d["epochs"] = self.epochs
+            d["epochs_per_s"] = round(self.epochs / self.seconds, 1) if self.seconds > 0 else None
+        if self.kernel_bytes:
+            d["kernel_bytes"] = self.kernel_bytes
+        if self.peak_rss:
+            d["peak_rss"] = self.peak_rss
+        if self.peak_traced:
+            d["peak_traced"] = self.peak_traced
+        if self.children:
+            d["children"] = [c.to_dict() for c in self.children.values()]
+        return d
+
+
+class _NullPhase:
+    """Stand-in returned by phase() when profiling is off."""
+
+    def __enter__(self) -> "_NullPhase":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def add(self, epochs: int = 0, kernel_bytes: int = 0) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Frame:
+    """One open phase: its node plus what is needed to finish it."""
+
+    __slots__ = ("node", "start", "peak_rss", "traced_start", "parent_peak", "child_peak")
+
+    def __init__(self, node: PhaseNode, rss: int, traced: tuple):
+        self.node = node
+        self.start = time.perf_counter()
+        self.peak_rss = rss
+        self.traced_start, self.parent_peak = traced   # (current, peak) at entry
+        self.child_peak = 0
+
+
+class TrainingProfiler:
+    """
+    Collects a phase tree while active (use as a context manager).
+
+    Args:
+        trace_memory: Also track Python/NumPy allocations with tracemalloc
+        rss_interval: Seconds between RSS samples (None = only at phase
+                      boundaries)
+    """
+
+    def __init__(self, trace_memory: bool = False, rss_interval: Optional[float] = 0.01):
+        self.trace_memory = trace_memory
+        self.rss_interval = rss_interval
+        self.roots: List[PhaseNode] = []
+        self._stack: List[_Frame] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._token = None
+        self._started_tracing = False
+        self._process = None
+
+    # ------------------------------------------------------------------
+    # Activation
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> "TrainingProfiler":
+        import psutil
+
+        self._process = psutil.Process()
+        self._token = _ACTIVE.set(self)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.rss_interval:
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_rss, name="profiler-rss",
+                                             daemon=True)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        _ACTIVE.reset(self._token)
+
+    def _rss(self) -> int:
+        try:
+            return self._process.memory_info().rss
+        except Exception:
+            return 0
+
+    def _sample_rss(self) -> None:
+        while not self._stop.wait(self.rss_interval):
+            rss = self._rss()
+            with self._lock:
+                for frame in self._stack:
+                    if rss > frame.peak_rss:
+                        frame.peak_rss = rss
+
+    # ------------------------------------------------------------------
+    # Phases
+    # ------------------------------------------------------------------
+
+    @property
+    def depth(self) -> int:
+        return len(self._stack)
+
+    def enter(self, name: str) -> PhaseNode:
+        if self._stack:
+            siblings = self._stack[-1].node.children
+            node = siblings.get(name)
+            if node is None:
+                node = siblings[name] = PhaseNode(name)
+        else:
+            node = PhaseNode(name)          # every top-level call gets its own tree
+            self.roots.append(node)
+        traced = tracemalloc.get_traced_memory() if self.trace_memory else (0, 0)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        frame = _Frame(node, self._rss(), traced)
+        with self._lock:
+            self._stack.append(frame)
+        return node
+
+    def exit(self) -> PhaseNode:
+        rss = self._rss()
+        with self._lock:
+            frame = self._stack.pop()
+        node = frame.node
+        node.calls += 1
+        node.seconds += time.perf_counter() - frame.start
+        node.peak_rss = max(node.peak_rss, frame.peak_rss, rss)
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak_rss = max(parent.peak_rss, node.peak_rss)
+        if self.trace_memory:
+            # reset_peak() at entry dropped the parent's peak so far:
+            # carry it (and this phase's peak) up to the parent frame
+            peak = max(tracemalloc.get_traced_memory()[1], frame.child_peak)
+            node.peak_traced = max(node.peak_traced, peak - frame.traced_start)
+            if self._stack:
+                parent = self._stack[-1]
+                parent.child_peak = max(parent.child_peak, frame.parent_peak, peak)
+        return node
+
+    def phase(self, name: str) -> "_Phase":
+        return _Phase(self, name)
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Phase trees of all top-level calls, as JSON-able dicts."""
+        return [root.to_dict() for root in self.roots]
+
+    def format(self) -> str:
+        return format_profile(self.summary())
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "node")
+
+    def __init__(self, profiler: TrainingProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.node: Optional[PhaseNode] = None
+
+    def __enter__(self) -> PhaseNode:
+        self.node = self.profiler.enter(self.name)
+        return self.node
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.exit()
+
+
+# ============================================================================
+# Instrumentation hooks
+# ============================================================================
+
+def active_profiler() -> Optional[TrainingProfiler]:
+    return _ACTIVE.get()
+
+
+def phase(name: str):
+    """
+    Context manager marking a phase; yields an object with add(epochs=,
+    kernel_bytes=). A no-op when no profiler is active.
+    """
+    profiler = _ACTIVE.get()
+    if profiler is None:
+        return _NULL_PHASE
+    return _Phase(profiler, name)
+
+
+def count(epochs: int = 0, kernel_bytes: int = 0) -> None:
+    """Add epochs / kernel-matrix bytes to the innermost open phase."""
+    profiler = _ACTIVE.get()
+    if profiler is not None and profiler._stack:
+        profiler._stack[-1].node.add(epochs, kernel_bytes)
+
+
+def _attach(model: Any, profile: Optional[Dict[str, Any]]) -> None:
+    try:
+        model.profile_ = profile
+    except AttributeError:                      # __slots__ models
+        pass
+
+
+def profiled(name: Optional[str] = None, attach: bool = False) -> Callable:
+    """
+    Decorator running a function as a phase (default name: function name).
+
+    With attach=True (model fit methods) the outermost call stores the
+    phase tree in ``self.profile_``.
+    """
+    def decorator(fn: Callable) -> Callable:
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = _ACTIVE.get()
+            if profiler is None:
+                if attach and args:
+                    _attach(args[0], None)      # drop a previous fit's profile
+                return fn(*args, **kwargs)
+            outermost = profiler.depth == 0
+            with profiler.phase(label) as node:
+                result = fn(*args, **kwargs)
+            if attach and outermost and args:
+                _attach(args[0], node.to_dict())
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def maybe_profile(enabled: bool, **kwargs):
+    """TrainingProfiler(**kwargs) if enabled, else a no-op context manager."""
+    return TrainingProfiler(**kwargs) if enabled else contextlib.nullcontext()
+
+
+# ============================================================================
+# Formatting
+# ============================================================================
+
+def _mb(value: Optional[int]) -> str:
+    return f"{value / 1024**2:,.1f}" if value else "-"
+
+
+def format_profile(profile: Any) -> str:
+    """Indented table of a profile (model.profile_ or TrainingProfiler.summary())."""
+    roots = profile if isinstance(profile, list) else [profile]
+    header = (f"{'phase':<34} {'calls':>6} {'time s':>9} {'epochs/s':>10} "
+              f"{'kernel MB':>10} {'peak RSS MB':>12} {'traced MB':>10}")
+    lines = [header, "-" * len(header)]
+
+    def walk(node: Dict[str, Any], depth: int) -> None:
+        eps = node.get("epochs_per_s")
+        lines.append(
+            f"{'  ' * depth + node['phase']:<34} {node['calls']:>6} {node['seconds']:>9.3f} "
+            f"{(f'{eps:,.0f}' if eps else '-'):>10} {_mb(node.get('kernel_bytes')):>10} "
+            f"{_mb(node.get('peak_rss')):>12} {_mb(node.get('peak_traced')):>10}")
+        for child in node.get("children", []):
+            walk(child, depth + 1)
+
+    for root in roots:
+        if root:
+            walk(root, 0)
+    return "\n".join(lines)
+
+
+def print_profile(model: Any) -> None:
+    """Print model.profile_ if the last fit was profiled."""
+    profile = getattr(model, "profile_", None)
+    if profile:
+        print("\nTraining profile:")
+        print(format_profile(profile))
+    else:
+        print("No training profile (train with profiling enabled)")
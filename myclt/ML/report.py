@@ -0,0 +1,331 @@
+"""
+Headless evaluation reports for saved sessions.
+
+Restores a saved session (any supported model), builds the list of
+evaluation plots that the interactive "Visualize" menus offer for that
+model, and renders them to PNG/SVG files with the Agg backend — no
+display and no plt.show() windows.
+
+Figures are independent, so they are rendered by a process pool (one
+matplotlib instance per worker); scatter plots are downsampled to
+MAX_SCATTER_POINTS so large test sets do not dominate the render time.
+
+Command line:
+    python -m myclt.ML.report ./ml_sessions/my_session --out reports/my_session \\
+        --format svg --workers 4 --max-points 20000
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from . import visualization_utils
+from .model_registry import load_session_state
+from .visualization_utils import loss_epochs, render_to
+
+
+FORMATS = ("png", "svg", "pdf")
+
+
+class PlotJob(NamedTuple):
+    """One figure of a report: output name + plotting call."""
+    name: str
+    func: Callable[..., None]
+    args: tuple = ()
+    kwargs: dict = {}
+
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+def _init_worker(max_points: Optional[int]) -> None:
+    """Pool initializer: headless backend + scatter point budget."""
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    visualization_utils.MAX_SCATTER_POINTS = max_points
+
+
+def _render_one(job: PlotJob, path: str) -> Tuple[str, Optional[str], float, Optional[str]]:
+    """
+    Render a single job to path.
+
+    A failing figure is reported, not raised, so the other figures of the
+    report still render.
+
+    Returns:
+        (name, path or None, seconds, error message or None)
+    """
+    import matplotlib.pyplot as plt
+
+    t0 = time.perf_counter()
+    error = None
+    try:
+        with render_to(path):
+            job.func(*job.args, **job.kwargs)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        plt.close("all")
+    # Plot functions that bail out early (e.g. no loss history) save nothing
+    saved = path if error is None and os.path.isfile(path) else None
+    return job.name, saved, time.perf_counter() - t0, error
+
+
+def _submit_error(job: PlotJob, e: BaseException) -> Tuple[str, None, float, str]:
+    """Result for a job that could not be sent to a worker (e.g. unpicklable)."""
+    return job.name, None, 0.0, f"{type(e).__name__}: {e}"
+
+
+def render_jobs(jobs: List[PlotJob], out_dir: str, fmt: str = "png",
+                workers: Optional[int] = None,
+                max_points: Optional[int] = visualization_utils.MAX_SCATTER_POINTS,
+                verbose: bool = True) -> List[Tuple[str, Optional[str], float, Optional[str]]]:
+    """
+    Render plot jobs to files, concurrently.
+
+    Args:
+        jobs: Plot jobs (see build_jobs)
+        out_dir: Output directory (created if missing)
+        fmt: File format, one of FORMATS
+        workers: Worker processes (default: min(len(jobs), cpu count));
+                 1 renders serially in this process
+        max_points: Scatter point budget per plot (None = no limit)
+        verbose: Print one line per figure
+
+    Returns:
+        List of (name, saved path or None, seconds, error or None), in job order
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"!Unknown format '{fmt}'. Use one of: {list(FORMATS)}!")
+    os.makedirs(out_dir, exist_ok=True)
+    paths = [os.path.join(out_dir, f"{job.name}.{fmt}") for job in jobs]
+
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    workers = max(1, int(workers))
+
+    if workers == 1 or len(jobs) <= 1:
+        previous = visualization_utils.MAX_SCATTER_POINTS
+        import matplotlib.pyplot as plt
+        backend = plt.get_backend()
+        try:
+            _init_worker(max_points)
+            results = [_render_one(job, path) for job, path in zip(jobs, paths)]
+        finally:
+            visualization_utils.MAX_SCATTER_POINTS = previous
+            plt.switch_backend(backend)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(max_points,)) as pool:
+            futures = [pool.submit(_render_one, job, path) for job, path in zip(jobs, paths)]
+            results = []
+            for job, future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(_submit_error(job, e))
+
+    if verbose:
+        for name, path, seconds, error in results:
+            if error:
+                status = f"✗ failed ({error})"
+            else:
+                status = f"✓ {path}" if path else "- skipped (nothing to plot)"
+            print(f"  {name:<32} {seconds:>7.2f}s  {status}")
+    return results
+
+
+# ============================================================================
+# Session -> plot jobs
+# ============================================================================
+
+def _raw_test_features(s: Any) -> np.ndarray:
+    return s.prepareddata.X[s.test_idx, :] if s.test_idx is not None else s.X_test
+
+
+def build_jobs(model_type: str, s: Any) -> List[PlotJob]:
+    """
+    Build every evaluation plot for a restored session.
+
+    Predictions are computed once here (in the parent process) and shared
+    by all the plots that need them.
+
+    Args:
+        model_type: Session model type (see model_registry.MODEL_TYPES)
+        s: Restored app state with model and test split
+
+    Returns:
+        List of PlotJob
+    """
+    feature_names = s.prepareddata.feature_names if s.prepareddata else None
+    n_features = s.X_test.shape[1]
+    history = list(getattr(s.model, "loss_history", None) or [])
+    epochs = loss_epochs(s.model) if history else None
+    class_names = getattr(s, "class_names", None) or None
+    jobs: List[PlotJob] = []
+
+    if model_type == "linear_regression":
+        from .supervised_learning.linear_regression import visualization as viz
+        y_pred = s.model.predict(s.X_test)
+        jobs.append(PlotJob("loss_curve", viz.plot_loss_curve, (history,), {"epochs": epochs}))
+        jobs.append(PlotJob("true_vs_pred", viz.plot_true_vs_pred, (s.y_test, y_pred),
+                            {"title": "True vs Predicted (test set)"}))
+        if n_features == 1:
+            jobs.append(PlotJob("regression_1d", viz.plot_1d_regression,
+                                (_raw_test_features(s), s.y_test, s.model,
+                                 s.scaler_mean, s.scaled_std)))
+
+    elif model_type == "logistic_regression":
+        from .supervised_learning.logistic_regression import visualization as viz
+        from .supervised_learning.logistic_regression.metrics import (
+            accuracy, precision, recall, f1_score, confusion_matrix,
+        )
+        y_proba = s.model.predict_proba(s.X_test)
+        y_pred = s.model.predict(s.X_test)
+        jobs += [
+            PlotJob("loss_curve", viz.plot_loss_curve, (history,), {"epochs": epochs}),
+            PlotJob("confusion_matrix", viz.plot_confusion_matrix_heatmap,
+                    tuple(confusion_matrix(s.y_test, y_pred))),
+            PlotJob("metrics", viz.plot_metrics_comparison,
+                    (accuracy(s.y_test, y_pred), precision(s.y_test, y_pred),
+                     recall(s.y_test, y_pred), f1_score(s.y_test, y_pred))),
+            PlotJob("coefficients", viz.plot_feature_coefficients, (feature_names, s.model.w)),
+            PlotJob("probability_distribution", viz.plot_probability_distribution,
+                    (y_proba, s.y_test)),
+            PlotJob("roc_curve", viz.plot_roc_curve, (s.y_test, y_proba)),
+            PlotJob("precision_recall_curve", viz.plot_precision_recall_curve, (s.y_test, y_proba)),
+        ]
+        if n_features == 1:
+            jobs.append(PlotJob("logistic_1d", viz.plot_1d_logistic_regression,
+                                (_raw_test_features(s), s.y_test, s.model,
+                                 s.scaler_mean, s.scaled_std)))
+
+    elif model_type == "multinomial_logistic_regression":
+        from .supervised_learning.logistic_regression import visualization as viz
+        from .supervised_learning.logistic_regression.metrics import multiclass_confusion_matrix
+        y_proba = s.model.predict_proba(s.X_test)
+        y_pred = s.model.predict(s.X_test)
+        cm = multiclass_confusion_matrix(s.y_test, y_pred, s.model.n_classes)
+        jobs += [
+            PlotJob("loss_curve", viz.plot_loss_curve, (history,), {"epochs": epochs}),
+            PlotJob("confusion_matrix", viz.plot_multiclass_confusion_matrix, (cm, class_names)),
+            PlotJob("feature_importance", viz.plot_multiclass_feature_importance,
+                    (feature_names, s.model.W, class_names)),
+            PlotJob("class_probability_distributions", viz.plot_class_probability_distributions,
+                    (y_proba, s.y_test, class_names)),
+            PlotJob("probability_heatmap", viz.plot_multiclass_probability_heatmap,
+                    (y_proba, s.y_test, class_names)),
+            PlotJob("roc_curves", viz.plot_roc_curve, (s.y_test, y_proba, class_names)),
+        ]
+
+    elif model_type in ("linear_svm", "kernel_svm", "ovr_svm", "multiclass_linear_svm"):
+        from .supervised_learning.svm import visualization as viz
+        from .supervised_learning.svm.metrics import confusion_matrix, multiclass_confusion_matrix
+        scores = s.model.decision_function(s.X_test)
+        y_pred = s.model.predict(s.X_test)
+        if model_type in ("ovr_svm", "multiclass_linear_svm"):
+            cm = multiclass_confusion_matrix(s.y_test, y_pred, s.model.n_classes)
+            jobs += [
+                PlotJob("confusion_matrix", viz.plot_confusion_matrix, (cm, class_names)),
+                PlotJob("roc_curves", viz.plot_roc_curve, (s.y_test, scores),
+                        {"labels": s.model.classes_, "class_names": class_names,
+                         "title": "Multiclass SVM ROC"}),
+            ]
+            if model_type == "multiclass_linear_svm":
+                jobs.append(PlotJob("loss_curve", viz.plot_loss_curve, (history,),
+                                    {"ylabel": "Crammer–Singer Hinge Loss", "epochs": epochs}))
+        else:
+            jobs += [
+                PlotJob("loss_curve", viz.plot_loss_curve, (history,),
+                        {"ylabel": "Hinge Loss", "epochs": epochs}),
+                PlotJob("confusion_matrix", viz.plot_confusion_matrix,
+                        (confusion_matrix(s.y_test, y_pred),)),
+                PlotJob("roc_curve", viz.plot_roc_curve, (s.y_test, scores)),
+            ]
+        if n_features == 2:
+            jobs.append(PlotJob("decision_boundary", viz.plot_svm_decision_boundary_2d,
+                                (s.model, s.X_test, s.y_test),
+                                {"feature_names": feature_names}))
+
+    elif model_type in ("linear_svr", "kernel_svr"):
+        from .supervised_learning.svm import visualization as viz
+        y_pred = s.model.predict(s.X_test)
+        jobs += [
+            PlotJob("loss_curve", viz.plot_loss_curve, (history,),
+                    {"ylabel": "ε-Insensitive Loss", "epochs": epochs}),
+            PlotJob("true_vs_pred", viz.plot_true_vs_pred, (s.y_test, y_pred)),
+            PlotJob("residuals", viz.plot_residuals, (s.y_test, y_pred)),
+            PlotJob("svr_tube", viz.plot_svr_tube,
+                    (s.X_test, s.y_test, y_pred, s.model.epsilon)),
+        ]
+
+    # Sessions do not always carry the loss history (it is not persisted)
+    if not history:
+        jobs = [job for job in jobs if job.name != "loss_curve"]
+    return jobs
+
+
+def render_session_report(session_path: str, out_dir: str, fmt: str = "png",
+                          workers: Optional[int] = None,
+                          max_points: Optional[int] = visualization_utils.MAX_SCATTER_POINTS,
+                          verbose: bool = True) -> List[Tuple[str, Optional[str], float, Optional[str]]]:
+    """
+    Render all evaluation plots of a saved session to files.
+
+    Args:
+        session_path: Session directory
+        out_dir: Output directory
+        fmt: File format ('png', 'svg', 'pdf')
+        workers: Worker processes (default: one per figure, up to cpu count)
+        max_points: Scatter point budget per plot (None = no limit)
+        verbose: Print progress
+
+    Returns:
+        List of (name, saved path or None, seconds, error or None)
+    """
+    t0 = time.perf_counter()
+    model_type, state = load_session_state(session_path)
+    jobs = build_jobs(model_type, state)
+    if verbose:
+        print(f"Report: {session_path} ({model_type}) -> {out_dir} "
+              f"[{len(jobs)} figures, format={fmt}]")
+    results = render_jobs(jobs, out_dir, fmt=fmt, workers=workers,
+                          max_points=max_points, verbose=verbose)
+    if verbose:
+        saved = sum(1 for _, path, _, _ in results if path)
+        failed = sum(1 for *_, error in results if error)
+        print(f"✓ {saved}/{len(jobs)} figures written in {time.perf_counter() - t0:.2f}s"
+              + (f", {failed} failed" if failed else ""))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Render a session report from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m myclt.ML.report",
+        description="Render all evaluation plots of a saved session to files (headless).",
+    )
+    parser.add_argument("session", help="session directory (e.g. ./ml_sessions/name)")
+    parser.add_argument("--out", default=None, help="output directory (default: <session>/report)")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per figure, up to cpu count)")
+    parser.add_argument("--max-points", type=int, default=visualization_utils.MAX_SCATTER_POINTS,
+                        help="scatter point budget per plot (0 = no limit)")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    out_dir = args.out or os.path.join(args.session, "report")
+    max_points = args.max_points if args.max_points and args.max_points > 0 else None
+    results = render_session_report(args.session, out_dir, fmt=args.format, workers=args.workers,
+                                     max_points=max_points, verbose=not args.quiet)
+    return 1 if any(error for *_, error in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,403 @@
+"""
+Local HTTP prediction server backed by saved sessions.
+
+Sessions are restored once (SessionStorage.load_session + the registered
+session adapter, see model_registry) and the models stay in memory. The
+server is the stdlib ThreadingHTTPServer with HTTP/1.1 keep-alive:
+
+    GET  /health              -> {"ok": true}
+    GET  /models              -> loaded models, features and classes
+    GET  /metrics             -> latency / batch-size histograms per model
+    POST /predict/<model>     -> predictions (``/predict`` if one model is loaded)
+
+Request body — one row or many:
+    {"features": [1.0, 2.0]}                  or {"features": {"x1": 1.0, "x2": 2.0}}
+    {"instances": [[1.0, 2.0], [3.0, 4.0]]}   or a list of {"name": value} rows
+
+Micro-batching: every model has a MicroBatcher thread. Rows of requests
+that arrive while a batch is being collected (up to ``max_batch_rows`` or
+``max_wait_ms``) are stacked and scored with ONE ``model.predict`` call,
+so concurrent single-row requests cost one vectorized call instead of one
+Python-level call each.
+
+Command line:
+    myclt serve ./ml_sessions/run1 churn=./ml_sessions/run2 --port 8000
+    python benchmarks/bench_serve.py   # load test against localhost
+"""
+
+import bisect
+import json
+import os
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base_models import standardize_apply
+from .model_registry import get_spec, load_session_state
+
+
+DEFAULT_MAX_BATCH_ROWS = 1024
+DEFAULT_MAX_WAIT_MS = 1.0
+
+
+# ============================================================================
+# Latency histograms
+# ============================================================================
+
+class LatencyHistogram:
+    """
+    Thread-safe histogram with log-spaced buckets (10 per decade).
+
+    Percentiles are reported as the upper edge of the bucket they fall in,
+    i.e. with at most ~26% relative error, at O(1) memory per histogram.
+    """
+
+    def __init__(self, low: float = 0.01, high: float = 100_000.0, per_decade: int = 10):
+        decades = int(round(np.log10(high / low)))
+        self.bounds = (low * 10 ** (np.arange(decades * per_decade + 1) / per_decade)).tolist()
+        self.counts = [0] * (len(self.bounds) + 1)      # last bucket: > high
+        self.n = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, value: float) -> None:
+        i = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.n += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """Upper bucket edge below which a fraction q of the values fall."""
+        if self.n == 0:
+            return 0.0
+        rank = q * self.n
+        cumulative = 0
+        for i, c in enumerate(self.counts):
+            cumulative += c
+            if cumulative >= rank and c:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = {f"le_{self.bounds[i]:.4g}" if i < len(self.bounds) else "inf": c
+                       for i, c in enumerate(self.counts) if c}
+            return {
+                "count": self.n,
+                "mean": self.total / self.n if self.n else 0.0,
+                "p50": self.percentile(0.50), "p90": self.percentile(0.90),
+                "p99": self.percentile(0.99), "max": self.max,
+                "buckets": buckets,
+            }
+
+
+# ============================================================================
+# Models kept in memory
+# ============================================================================
+
+class ServedModel:
+    """A restored session: model + scaler + feature/class names."""
+
+    def __init__(self, name: str, model_type: str, state: Any):
+        self.name = name
+        self.model_type = model_type
+        self.task = get_spec(model_type).task
+        self.model = state.model
+        self.feature_names = list(state.prepareddata.feature_names)
+        self.class_names = list(getattr(state, "class_names", None) or [])
+        self.use_scaling = bool(state.use_scaling)
+        self.scaler_mean = state.scaler_mean
+        std = getattr(state, "scaled_std", None)
+        self.scaler_std = std if std is not None else getattr(state, "scaler_std", None)
+        self.dtype = state.prepareddata.X.dtype
+
+        self.latency_ms = LatencyHistogram()     # per request, queueing included
+        self.predict_ms = LatencyHistogram()     # per model call
+        self.batch_rows = LatencyHistogram(low=1.0, high=1e6)
+
+    @classmethod
+    def from_session(cls, session_path: str, name: Optional[str] = None) -> "ServedModel":
+        model_type, state = load_session_state(session_path)
+        if state.model is None or not state.model.is_trained:
+            raise ValueError(f"!Session '{session_path}' has no trained model!")
+        name = name or os.path.basename(os.path.normpath(session_path))
+        return cls(name, model_type, state)
+
+    def rows(self, payload: Dict[str, Any]) -> np.ndarray:
+        """Request body -> (n, n_features) matrix in feature order."""
+        if "instances" in payload:
+            rows = payload["instances"]
+        elif "features" in payload:
+            rows = [payload["features"]]
+        else:
+            raise ValueError("!Request needs 'features' (one row) or 'instances' (rows)!")
+        if not isinstance(rows, list) or not rows:
+            raise ValueError("!'instances' must be a non-empty list!")
+
+        if all(isinstance(r, dict) for r in rows):
+            for i, row in enumerate(rows):
+                missing = [f for f in self.feature_names if f not in row]
+                if missing:
+                    raise ValueError(f"!Row {i}: missing feature(s) {missing}!")
+            rows = [[r[f] for f in self.feature_names] for r in rows]
+        try:
+            X = np.asarray(rows, dtype=self.dtype)
+        except (TypeError, ValueError):
+            raise ValueError("!Feature values must be numeric!")
+        if X.ndim != 2 or X.shape[1] != len(self.feature_names):
+            raise ValueError(f"!Expected rows of {len(self.feature_names)} features "
+                             f"{self.feature_names}!")
+        return X
+
+    def predict_arrays(self, X: np.ndarray) -> Dict[str, np.ndarray]:
+        """Score a stacked batch; every output has one row per input row."""
+        t0 = time.perf_counter()
+        if self.use_scaling:
+            X = standardize_apply(X, self.scaler_mean, self.scaler_std)
+        out = {"predictions": np.asarray(self.model.predict(X))}
+        if self.task != "regression" and hasattr(self.model, "predict_proba"):
+            out["probabilities"] = np.asarray(self.model.predict_proba(X))
+        self.predict_ms.record((time.perf_counter() - t0) * 1e3)
+        self.batch_rows.record(X.shape[0])
+        return out
+
+    def to_response(self, out: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Arrays -> JSON: class labels are mapped back to their names."""
+        preds = out["predictions"]
+        if self.task == "regression":
+            response = {"predictions": preds.astype(float).tolist()}
+        elif self.class_names:
+            response = {"predictions": [self.class_names[int(p)] for p in preds]}
+        else:
+            response = {"predictions": preds.astype(int).tolist()}
+        if "probabilities" in out:
+            response["probabilities"] = out["probabilities"].astype(float).tolist()
+        return response
+
+    def info(self) -> Dict[str, Any]:
+        return {"name": self.name, "model_type": self.model_type, "task": self.task,
+                "features": self.feature_names, "class_names": self.class_names}
+
+
+# ============================================================================
+# Micro-batching
+# ============================================================================
+
+class _Pending:
+    __slots__ = ("X", "done", "result", "error")
+
+    def __init__(self, X: np.ndarray):
+        self.X = X
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into one predict call.
+
+    A worker thread takes the first queued request, then keeps collecting
+    requests for up to ``max_wait_ms`` (or until ``max_batch_rows`` rows),
+    scores the stacked rows once and hands each request its slice.
+
+    Args:
+        predict_fn: (n, d) matrix -> dict of arrays with n rows each
+        max_batch_rows: Upper bound on rows per predict call
+        max_wait_ms: How long to wait for more requests after the first one
+                     (0: only coalesce requests that are already queued)
+    """
+
+    def __init__(self, predict_fn: Callable[[np.ndarray], Dict[str, np.ndarray]],
+                 max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS):
+        if max_batch_rows < 1:
+            raise ValueError("!max_batch_rows must be >= 1!")
+        self.predict_fn = predict_fn
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max(0.0, max_wait_ms) / 1e3
+        self._queue: "queue.Queue[Optional[_Pending]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, X: np.ndarray) -> Dict[str, np.ndarray]:
+        """Block until the batch containing X has been scored."""
+        item = _Pending(X)
+        self._queue.put(item)
+        item.done.wait()
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first: _Pending) -> Tuple[List[_Pending], bool]:
+        batch, rows = [first], first.X.shape[0]
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch_rows:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+            rows += item.X.shape[0]
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, stop = self._collect(first)
+            try:
+                X = batch[0].X if len(batch) == 1 else np.vstack([p.X for p in batch])
+                out = self.predict_fn(X)
+                start = 0
+                for p in batch:
+                    end = start + p.X.shape[0]
+                    p.result = {k: v[start:end] for k, v in out.items()}
+                    start = end
+            except Exception as e:
+                for p in batch:
+                    p.error = e
+            for p in batch:
+                p.done.set()
+
+
+# ============================================================================
+# Service + HTTP
+# ============================================================================
+
+class PredictionService:
+    """All served models, their batchers and request-level metrics."""
+
+    def __init__(self, models: List[ServedModel], batching: bool = True,
+                 max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS):
+        if not models:
+            raise ValueError("!No models to serve!")
+        self.models = {m.name: m for m in models}
+        if len(self.models) != len(models):
+            raise ValueError("!Served model names must be unique!")
+        self.batching = batching
+        self.batchers = {name: MicroBatcher(m.predict_arrays, max_batch_rows, max_wait_ms)
+                         for name, m in self.models.items()} if batching else {}
+        self.started = time.time()
+
+    def get(self, name: Optional[str]) -> ServedModel:
+        if not name:
+            if len(self.models) == 1:
+                return next(iter(self.models.values()))
+            raise LookupError(f"!Several models are loaded, use /predict/<name>: {list(self.models)}!")
+        if name not in self.models:
+            raise LookupError(f"!Unknown model '{name}'. Loaded: {list(self.models)}!")
+        return self.models[name]
+
+    def predict(self, name: Optional[str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        t0 = time.perf_counter()
+        model = self.get(name)
+        X = model.rows(payload)
+        out = self.batchers[model.name].submit(X) if self.batching else model.predict_arrays(X)
+        response = {"model": model.name, **model.to_response(out)}
+        model.latency_ms.record((time.perf_counter() - t0) * 1e3)
+        return response
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "uptime_s": time.time() - self.started,
+            "batching": self.batching,
+            "models": {name: {"latency_ms": m.latency_ms.summary(),
+                              "predict_ms": m.predict_ms.summary(),
+                              "batch_rows": m.batch_rows.summary()}
+                       for name, m in self.models.items()},
+        }
+
+    def close(self) -> None:
+        for batcher in self.batchers.values():
+            batcher.close()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128            # listen backlog for bursts of new clients
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive: clients reuse connections
+    server_version = "myclt-serve/1"
+    disable_nagle_algorithm = True      # headers and body go out as separate writes
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        service: PredictionService = self.server.service
+        if self.path == "/health":
+            self._send(200, {"ok": True})
+        elif self.path == "/models":
+            self._send(200, {"models": [m.info() for m in service.models.values()]})
+        elif self.path == "/metrics":
+            self._send(200, service.metrics())
+        else:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        service: PredictionService = self.server.service
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        parts = self.path.strip("/").split("/")
+        if parts[0] != "predict" or len(parts) > 2:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("!Request body must be a JSON object!")
+            self._send(200, service.predict(parts[1] if len(parts) == 2 else None, payload))
+        except LookupError as e:
+            self._send(404, {"error": str(e).strip("!")})
+        except ValueError as e:     # includes json.JSONDecodeError
+            self._send(400, {"error": str(e).strip("!")})
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+
+
+def make_server(service: PredictionService, host: str = "127.0.0.1", port: int = 8000,
+                verbose: bool = False) -> ThreadingHTTPServer:
+    """Bind a threaded HTTP server for a service (port 0 picks a free port)."""
+    server = _Server((host, port), _Handler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def load_models(sessions: List[str]) -> List[ServedModel]:
+    """Restore sessions given as PATH or NAME=PATH."""
+    models = []
+    for spec in sessions:
+        name, sep, path = spec.partition("=")
+        models.append(ServedModel.from_session(path, name) if sep
+                      else ServedModel.from_session(spec))
+    return models
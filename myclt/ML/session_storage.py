@@ -28,6 +28,8 @@ class SessionMetadata:
     # Optional tracking
     description: str = ""
     git_commit: Optional[str] = None
+    # phase tree of the profiled fit() (myclt.ML.profiling), if any
+    training_profile: Optional[Dict[str, Any]] = None
     
     def __post_init__(self):
         """Auto-populate version info if not provided"""
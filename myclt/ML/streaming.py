@@ -0,0 +1,503 @@
+"""
+Out-of-core (streaming) training for linear-family models.
+
+Trains on CSV files that do not fit in memory:
+
+    1. The CSV is read ONCE in chunks and converted into a binary cache
+       (memory-mapped ``.bin`` files + ``meta.json``). Every row is randomly
+       assigned to train or test (seeded), and scaler statistics are
+       accumulated on the train rows on the fly (streaming Welford, see
+       base_models.Scaler). Later runs reuse the cache while the CSV is
+       unchanged.
+    2. Each epoch walks the train cache in chunks, in a shuffled chunk
+       order with shuffled rows inside each chunk, scales every chunk in
+       place and calls the model's ``partial_fit``.
+    3. Test metrics are accumulated chunk by chunk.
+
+Supported models (``partial_fit``):
+    - LinearRegressionGD             ("linear")
+    - LogisticRegressionGD           ("logistic")
+    - MultinomialLogisticRegression  ("multinomial")
+    - LinearSVM                      ("svm")
+    - LinearSVR                      ("svr")
+
+Command line:
+    python -m myclt.ML.streaming logs.csv --target label --model logistic \\
+        --epochs 5 --chunk-rows 200000 --dtype float32 --save model.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .base_metrics import ConfusionMatrixAccumulator, RegressionAccumulator
+from .base_models import Scaler, resolve_dtype
+from .supervised_learning.linear_regression.core import LinearRegressionGD
+from .supervised_learning.logistic_regression.core import (
+    LogisticRegressionGD, MultinomialLogisticRegression,
+)
+from .supervised_learning.svm.core import LinearSVM, LinearSVR
+
+
+CACHE_VERSION = 1
+DEFAULT_CHUNK_ROWS = 100_000
+
+# name -> (model class, task)
+STREAMING_MODELS: Dict[str, Tuple[type, str]] = {
+    "linear": (LinearRegressionGD, "regression"),
+    "logistic": (LogisticRegressionGD, "binary"),
+    "multinomial": (MultinomialLogisticRegression, "multiclass"),
+    "svm": (LinearSVM, "binary"),
+    "svr": (LinearSVR, "regression"),
+}
+
+
+# ============================================================================
+# On-disk cache (CSV -> memory-mapped train/test arrays)
+# ============================================================================
+
+def _detect_delimiter(header_line: str) -> str:
+    """Pick ',' or ';' (same rule as load_csv_dataset)."""
+    return ";" if header_line.count(";") > header_line.count(",") else ","
+
+
+def _source_signature(csv_path: str) -> Dict[str, Any]:
+    """Identify the CSV version the cache was built from."""
+    st = os.stat(csv_path)
+    return {"path": os.path.abspath(csv_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class StreamCache:
+    """
+    Memory-mapped train/test split of a CSV file, built by open_stream_cache().
+
+    Attributes:
+        cache_dir: Directory with ``meta.json`` and the ``.bin`` arrays
+        feature_names, target_name: Selected columns
+        class_names: Original string labels (targets stored as codes) or None
+        n_train, n_test, n_features: Array shapes
+        dtype: Storage / compute dtype of X
+        scaler: Scaler fitted on the train rows
+    """
+
+    def __init__(self, cache_dir: str, meta: Dict[str, Any]):
+        self.cache_dir = cache_dir
+        self.meta = meta
+        self.feature_names: List[str] = meta["feature_names"]
+        self.target_name: str = meta["target_name"]
+        self.class_names: Optional[List[str]] = meta.get("class_names")
+        self.n_train: int = meta["n_train"]
+        self.n_test: int = meta["n_test"]
+        self.n_features: int = len(self.feature_names)
+        self.dtype = np.dtype(meta["dtype"])
+        self.scaler = Scaler()
+        self.scaler.set_params(meta["scaler"])
+        self._classes: Optional[np.ndarray] = None
+
+    def arrays(self, part: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Read-only memory maps (X, y) for part "train" or "test"."""
+        n = self.n_train if part == "train" else self.n_test
+        if n == 0:
+            return (np.empty((0, self.n_features), dtype=self.dtype),
+                    np.empty(0, dtype=np.float64))
+        X = np.memmap(os.path.join(self.cache_dir, f"X_{part}.bin"),
+                      dtype=self.dtype, mode="r", shape=(n, self.n_features))
+        y = np.memmap(os.path.join(self.cache_dir, f"y_{part}.bin"),
+                      dtype=np.float64, mode="r", shape=(n,))
+        return X, y
+
+    def iter_chunks(self, part: str = "train", chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                    rng: Optional[np.random.Generator] = None
+                    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield (X_chunk, y_chunk) as in-memory copies (safe to scale in place).
+
+        With ``rng`` the chunk order and the rows inside each chunk are
+        shuffled, so every epoch sees a different mini-batch sequence while
+        only one chunk is resident in memory.
+        """
+        X_mm, y_mm = self.arrays(part)
+        n = X_mm.shape[0]
+        starts = np.arange(0, n, max(1, int(chunk_rows)))
+        if rng is not None:
+            rng.shuffle(starts)
+        for start in starts:
+            end = min(start + chunk_rows, n)
+            if rng is None:
+                yield np.array(X_mm[start:end]), np.array(y_mm[start:end])
+            else:
+                perm = rng.permutation(end - start)
+                yield X_mm[start:end][perm], y_mm[start:end][perm]
+
+    def classes(self) -> np.ndarray:
+        """Sorted unique target values over train + test (computed once)."""
+        if self._classes is None:
+            if self.class_names is not None:
+                self._classes = np.arange(len(self.class_names), dtype=np.float64)
+            else:
+                found = np.empty(0)
+                for part in ("train", "test"):
+                    _, y_mm = self.arrays(part)
+                    for start in range(0, y_mm.shape[0], DEFAULT_CHUNK_ROWS * 10):
+                        found = np.union1d(found, y_mm[start:start + DEFAULT_CHUNK_ROWS * 10])
+                self._classes = found
+        return self._classes
+
+    def label_of(self, class_value: float) -> Any:
+        """Original label for a stored class value."""
+        if self.class_names is not None:
+            return self.class_names[int(class_value)]
+        return class_value
+
+
+def _build_cache(csv_path: str, cache_dir: str, target: str,
+                 features: Optional[List[str]], test_size: float, seed: int,
+                 dtype: np.dtype, chunk_rows: int, delimiter: Optional[str],
+                 verbose: bool) -> Dict[str, Any]:
+    """Single pass over the CSV: parse chunks, split rows, fit the scaler."""
+    os.makedirs(cache_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    scaler = Scaler()
+    class_codes: Dict[str, int] = {}
+    target_is_text: Optional[bool] = None
+    n_train = n_test = n_rows = 0
+    t0 = time.perf_counter()
+
+    with open(csv_path, "r", encoding="utf-8") as f:
+        header_line = f.readline()
+        if delimiter is None:
+            delimiter = _detect_delimiter(header_line)
+        header = [c.strip().strip('"') for c in header_line.rstrip("\r\n").split(delimiter)]
+
+        if target not in header:
+            raise ValueError(f"!Target column '{target}' not found. Columns: {header}!")
+        feature_names = features or [c for c in header if c != target]
+        missing = [c for c in feature_names if c not in header]
+        if missing:
+            raise ValueError(f"!Feature column(s) not found: {missing}!")
+        if target in feature_names:
+            raise ValueError("!Target column cannot also be a feature!")
+        feature_cols = [header.index(c) for c in feature_names]
+        target_col = header.index(target)
+
+        files = {name: open(os.path.join(cache_dir, f"{name}.bin"), "wb")
+                 for name in ("X_train", "y_train", "X_test", "y_test")}
+        try:
+            while True:
+                lines = list(itertools.islice(f, chunk_rows))
+                if not lines:
+                    break
+                try:
+                    X = np.loadtxt(lines, delimiter=delimiter, usecols=feature_cols,
+                                   dtype=np.float64, ndmin=2, quotechar='"')
+                except ValueError as e:
+                    raise ValueError(
+                        f"!Non-numeric feature value near data row {n_rows + 1}: {e}!"
+                    ) from e
+                y_raw = np.loadtxt(lines, delimiter=delimiter, usecols=[target_col],
+                                   dtype=str, ndmin=1, quotechar='"')
+                y_raw = np.char.strip(y_raw)
+
+                if target_is_text is None:
+                    try:
+                        y_raw.astype(np.float64)
+                        target_is_text = False
+                    except ValueError:
+                        target_is_text = True
+                if target_is_text:
+                    y = np.array([class_codes.setdefault(v, len(class_codes)) for v in y_raw],
+                                 dtype=np.float64)
+                else:
+                    y = y_raw.astype(np.float64)
+
+                X = X.astype(dtype, copy=False)
+                is_test = rng.random(X.shape[0]) < test_size
+                X_tr, y_tr = X[~is_test], y[~is_test]
+                scaler.partial_fit(X_tr)
+
+                files["X_train"].write(np.ascontiguousarray(X_tr).tobytes())
+                files["y_train"].write(y_tr.tobytes())
+                files["X_test"].write(np.ascontiguousarray(X[is_test]).tobytes())
+                files["y_test"].write(y[is_test].tobytes())
+
+                n_rows += X.shape[0]
+                n_test += int(is_test.sum())
+                n_train = n_rows - n_test
+                if verbose:
+                    print(f"  cached {n_rows:,} rows ({time.perf_counter() - t0:.1f}s)", end="\r")
+        finally:
+            for fh in files.values():
+                fh.close()
+
+    if n_train == 0:
+        raise ValueError("!No training rows: the CSV is empty or test_size is too large!")
+    if verbose:
+        print(f"  cached {n_rows:,} rows ({n_train:,} train / {n_test:,} test) "
+              f"in {time.perf_counter() - t0:.1f}s")
+
+    meta = {
+        "version": CACHE_VERSION,
+        "source": _source_signature(csv_path),
+        "target_name": target,
+        "feature_names": feature_names,
+        "class_names": list(class_codes) if target_is_text else None,
+        "test_size": test_size,
+        "seed": seed,
+        "dtype": dtype.name,
+        "n_train": n_train,
+        "n_test": n_test,
+        "scaler": scaler.get_params(),
+    }
+    with open(os.path.join(cache_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def open_stream_cache(csv_path: str, target: str, features: Optional[List[str]] = None,
+                      cache_dir: Optional[str] = None, test_size: float = 0.2,
+                      seed: int = 42, dtype: str = "float32",
+                      chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                      delimiter: Optional[str] = None, rebuild: bool = False,
+                      verbose: bool = False) -> StreamCache:
+    """
+    Open (or build) the memory-mapped train/test cache for a CSV file.
+
+    The cache is rebuilt when the CSV changed (size / mtime) or any split
+    setting differs; otherwise the CSV is not read at all.
+
+    Args:
+        csv_path: Source CSV with a header row
+        target: Target column name
+        features: Feature column names (default: all other columns)
+        cache_dir: Cache directory (default: "<csv name>.cache" next to the CSV)
+        test_size: Probability of a row going to the test split
+        seed: Seed of the split / shuffling
+        dtype: Storage and compute precision of X ("float32" or "float64")
+        chunk_rows: Rows parsed per chunk while building the cache
+        delimiter: CSV delimiter (None = auto-detect ',' / ';')
+        rebuild: Force rebuilding the cache
+        verbose: Print progress
+
+    Returns:
+        StreamCache
+    """
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"!File not found error: {csv_path}")
+    if not (0.0 <= test_size < 1.0):
+        raise ValueError("!test_size should be in [0, 1)!")
+    dtype = resolve_dtype(dtype)
+    if cache_dir is None:
+        cache_dir = os.path.splitext(os.path.abspath(csv_path))[0] + ".cache"
+
+    meta_path = os.path.join(cache_dir, "meta.json")
+    if not rebuild and os.path.exists(meta_path):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        same = (
+            meta.get("version") == CACHE_VERSION
+            and meta.get("source") == _source_signature(csv_path)
+            and meta.get("target_name") == target
+            and (features is None or meta.get("feature_names") == features)
+            and meta.get("test_size") == test_size
+            and meta.get("seed") == seed
+            and meta.get("dtype") == dtype.name
+        )
+        if same:
+            if verbose:
+                print(f"Using cache: {cache_dir}")
+            return StreamCache(cache_dir, meta)
+
+    if verbose:
+        print(f"Building cache: {cache_dir}")
+    meta = _build_cache(csv_path, cache_dir, target, features, test_size, seed,
+                        dtype, chunk_rows, delimiter, verbose)
+    return StreamCache(cache_dir, meta)
+
+
+# ============================================================================
+# Streaming training / evaluation
+# ============================================================================
+
+def _task_of(model: Any) -> str:
+    for model_class, task in STREAMING_MODELS.values():
+        if isinstance(model, model_class):
+            return task
+    raise TypeError(f"!{type(model).__name__} does not support streaming training!")
+
+
+def _partial_fit(model: Any, task: str, X: np.ndarray, y: np.ndarray,
+                 classes: Optional[np.ndarray]) -> None:
+    """Dispatch one chunk to the model's partial_fit with the right labels."""
+    if task == "regression":
+        model.partial_fit(X, y)
+    elif isinstance(model, LogisticRegressionGD):
+        model.partial_fit(X, (y == classes[1]).astype(X.dtype))
+    else:
+        model.partial_fit(X, y, classes=classes)
+
+
+def evaluate_streaming(model: Any, cache: StreamCache, part: str = "test",
+                       use_scaling: bool = True,
+                       chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Dict[str, float]:
+    """
+    Compute metrics over a cached split, one chunk at a time.
+
+    Returns:
+        Regression: {"mse", "rmse", "mae", "r2"};
+        classification: {"accuracy", "f1_macro"}
+    """
+    task = _task_of(model)
+    if task == "regression":
+        acc = RegressionAccumulator()
+    else:
+        classes = cache.classes()
+        acc = ConfusionMatrixAccumulator(labels=classes)
+
+    for X, y in cache.iter_chunks(part, chunk_rows):
+        if use_scaling:
+            cache.scaler.transform(X, out=X)
+        pred = model.predict(X)
+        # Classifiers predict indices into the sorted class list
+        acc.update(y, pred if task == "regression" else classes[pred])
+
+    result = acc.result()
+    if result["n_samples"] == 0:
+        return {}
+    keys = ("mse", "rmse", "mae", "r2") if task == "regression" else ("accuracy", "f1_macro")
+    return {k: result[k] for k in keys}
+
+
+def train_streaming(model: Any, cache: StreamCache, epochs: int = 5,
+                    chunk_rows: int = DEFAULT_CHUNK_ROWS, use_scaling: bool = True,
+                    seed: int = 42, verbose: bool = False) -> Dict[str, float]:
+    """
+    Train a model with partial_fit over a StreamCache.
+
+    Each epoch is one shuffled pass over the train split; only one chunk is
+    held in memory at a time. Chunks are scaled in place with the cached
+    train-set statistics.
+
+    Args:
+        model: Untrained model from STREAMING_MODELS
+        cache: StreamCache from open_stream_cache()
+        epochs: Number of passes over the train split
+        chunk_rows: Rows per chunk (= mini-batch size of each partial_fit)
+        use_scaling: Standardize features with the cached scaler
+        seed: Seed of the per-epoch shuffling
+        verbose: Print per-epoch timing and test metrics
+
+    Returns:
+        Test metrics after the last epoch (see evaluate_streaming)
+    """
+    task = _task_of(model)
+    classes = cache.classes() if task != "regression" else None
+    if task == "binary" and len(classes) != 2:
+        raise ValueError(f"!Binary model needs exactly 2 classes, found {len(classes)}!")
+
+    rng = np.random.default_rng(seed)
+    for epoch in range(1, epochs + 1):
+        t0 = time.perf_counter()
+        for X, y in cache.iter_chunks("train", chunk_rows, rng=rng):
+            if use_scaling:
+                cache.scaler.transform(X, out=X)
+            _partial_fit(model, task, X, y, classes)
+        model.n_iter_ = epoch
+        if verbose:
+            metrics = evaluate_streaming(model, cache, "test", use_scaling, chunk_rows)
+            shown = " ".join(f"{k}={v:.4f}" for k, v in metrics.items())
+            print(f"Epoch {epoch}/{epochs}: {time.perf_counter() - t0:.1f}s {shown}")
+
+    return evaluate_streaming(model, cache, "test", use_scaling, chunk_rows)
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _build_model(args: argparse.Namespace) -> Any:
+    model_class, _ = STREAMING_MODELS[args.model]
+    kwargs: Dict[str, Any] = {"dtype": args.dtype}
+    if args.lr is not None:
+        kwargs["learning_rate"] = args.lr
+    if args.model in ("linear", "logistic", "multinomial"):
+        kwargs["lambda_l2"] = args.l2
+    else:
+        kwargs["C"] = args.C
+    if args.model == "svr":
+        kwargs["epsilon"] = args.epsilon
+    return model_class(**kwargs)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Train a model on a CSV larger than RAM."""
+    parser = argparse.ArgumentParser(
+        prog="python -m myclt.ML.streaming",
+        description="Out-of-core training over large CSV files (chunked partial_fit).",
+    )
+    parser.add_argument("csv", help="CSV file with a header row")
+    parser.add_argument("--target", required=True, help="target column name")
+    parser.add_argument("--features", help="comma-separated feature columns (default: all others)")
+    parser.add_argument("--model", choices=sorted(STREAMING_MODELS), default="linear")
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dtype", choices=["float32", "float64"], default="float32")
+    parser.add_argument("--lr", type=float, default=None, help="learning rate (model default if omitted)")
+    parser.add_argument("--l2", type=float, default=0.0, help="L2 strength (linear/logistic/multinomial)")
+    parser.add_argument("--C", type=float, default=1.0, help="SVM regularization (svm/svr)")
+    parser.add_argument("--epsilon", type=float, default=0.1, help="SVR tube width")
+    parser.add_argument("--no-scaling", action="store_true", help="disable standardization")
+    parser.add_argument("--delimiter", default=None)
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--rebuild-cache", action="store_true")
+    parser.add_argument("--save", default=None, help="write model + scaler to this JSON file")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    verbose = not args.quiet
+
+    features = [c.strip() for c in args.features.split(",")] if args.features else None
+    cache = open_stream_cache(
+        args.csv, args.target, features, cache_dir=args.cache_dir,
+        test_size=args.test_size, seed=args.seed, dtype=args.dtype,
+        chunk_rows=args.chunk_rows, delimiter=args.delimiter,
+        rebuild=args.rebuild_cache, verbose=verbose,
+    )
+    model = _build_model(args)
+    use_scaling = not args.no_scaling
+    metrics = train_streaming(model, cache, epochs=args.epochs, chunk_rows=args.chunk_rows,
+                              use_scaling=use_scaling, seed=args.seed, verbose=verbose)
+
+    print("Test metrics: " + " ".join(f"{k}={v:.6f}" for k, v in metrics.items()))
+
+    if args.save:
+        payload = {
+            "model_type": model.model_type,
+            "model_params": model.get_params(),
+            "feature_names": cache.feature_names,
+            "target_name": cache.target_name,
+            "class_names": cache.class_names,
+            "use_scaling": use_scaling,
+            "scaler_mean": cache.scaler.mean_ if use_scaling else None,
+            "scaled_std": cache.scaler.scale_ if use_scaling else None,
+            "metrics": metrics,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, default=_json_default)
+        print(f"Saved: {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
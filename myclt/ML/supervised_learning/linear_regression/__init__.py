@@ -1,3 +1,10 @@
-from .cli import main
+__all__ = ['main']
 
-__all__ = ['main']
\ No newline at end of file
+
+def __getattr__(name):
+    # The interactive entry point is imported on first access, so importing
+    # the core model (e.g. from the command line) does not load the menus.
+    if name == "main":
+        from .cli import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,7 @@ class AppState:
     test_size: float = 0.2
     seed: int = 42
     use_scaling: bool = True
+    dtype: str = "float64"  # compute precision: "float32" or "float64"
     learning_rate: float = 0.05
     epochs: int = 2000
     
@@ -1,7 +1,9 @@
 import numpy as np 
 from typing import Optional, List, Dict, Any
 
-from myclt.ML.base_models import SupervisedModel, BaseModel
+from myclt.ML.base_models import SupervisedModel, BaseModel, resolve_dtype
+from myclt.ML.base_training import StepFn, run_training_loop, gradient_norm
+from myclt.ML.profiling import profiled
 
 
 class LinearRegressionGD(BaseModel, SupervisedModel):
@@ -9,77 +11,136 @@ class LinearRegressionGD(BaseModel, SupervisedModel):
     y_hat = X @ w + b
     Batch Gradient Descent minimizing MSE.
     Supports L1 (Lasso) and L2 (Ridge) regularization.
+
+    fit() stops early once the training loss stops improving by more than
+    ``tol`` for ``n_iter_no_change`` loss checks (or the gradient norm drops
+    below ``tol``). Set ``tol=None`` to always run all epochs. The number of
+    epochs actually run is stored in ``n_iter_``.
+
+    The loss is only evaluated every ``log_every`` epochs, so ``loss_history``
+    holds one entry per checkpoint rather than per epoch.
+
+    ``dtype`` selects the compute precision ("float32" / "float64");
+    None follows the training data (float32 X trains in float32).
     """
     model_type = "linear_regression"
+    accepts_sparse = True  # X may be a myclt.ML.sparse.CSRMatrix
     
     # Initialize the class (model) constructor
     def __init__(self, learning_rate: float = 0.05, epochs: int = 2000, 
-                 lambda_l1: float = 0.0, lambda_l2: float = 0.0):
+                 lambda_l1: float = 0.0, lambda_l2: float = 0.0,
+                 tol: Optional[float] = 1e-6, n_iter_no_change: int = 10,
+                 log_every: int = 10, dtype: Optional[str] = None):
         self.learning_rate = learning_rate
         self.epochs = epochs
+        self.log_every = log_every  # evaluate loss every N epochs
         self.lambda_l1 = lambda_l1  # L1 regularization strength (Lasso)
         self.lambda_l2 = lambda_l2  # L2 regularization strength (Ridge)
+        self.tol = tol  # convergence tolerance (None = run all epochs)
+        self.n_iter_no_change = n_iter_no_change
+        self.dtype = dtype  # compute precision (None = follow X)
         self.w: Optional[np.ndarray] = None
         self.b: float = 0.0
         self.loss_history: List[float] = []
+        self.n_iter_: int = 0  # epochs actually run by the last fit
 
     # check if the model is trained
     @property
     def is_trained(self) -> bool:
         return self.w is not None
 
-    # model training method
-    def fit(self, X: np.ndarray, y: np.ndarray) -> None:
-        # Initializing initial weights
+    # regularization part of the objective: λ₁ × Σ|w| + (λ₂/2) × Σ(w²)
+    def _penalty(self) -> float:
+        penalty = 0.0
+        if self.lambda_l1 > 0:
+            penalty += self.lambda_l1 * float(np.sum(np.abs(self.w)))
+        if self.lambda_l2 > 0:
+            penalty += (self.lambda_l2 / 2) * float(np.dot(self.w, self.w))
+        return penalty
+
+    # full objective (MSE + L1 + L2) for the current weights, used for validation
+    def _loss(self, X: np.ndarray, y: np.ndarray) -> float:
+        errors = X @ self.w + self.b - y
+        return float(np.dot(errors, errors)) / X.shape[0] + self._penalty()
+
+    # one fused forward/backward epoch over preallocated buffers
+    def _make_step(self, X: np.ndarray, y: np.ndarray) -> StepFn:
         n_samples, n_features = X.shape
-        self.w = np.zeros(n_features, dtype=float)
-        self.b = 0.0 
-        self.loss_history = []
-        
-        # model training cycle
-        for epoch in range(1, self.epochs + 1):
-            # prediction and error detection
-            y_pred = X @ self.w + self.b
-            errors = y_pred - y
-            
-            # Base MSE loss
-            mse_loss = float(np.mean(errors ** 2))
-            
-            # L1 regularization penalty: λ₁ × Σ|w|
-            l1_penalty = self.lambda_l1 * np.sum(np.abs(self.w))
-            
-            # L2 regularization penalty: (λ₂/2) × Σ(w²)
-            l2_penalty = (self.lambda_l2 / 2) * np.sum(self.w ** 2)
-            
-            # Total loss: MSE + L1 + L2
-            loss = mse_loss + l1_penalty + l2_penalty
-            
-            # determination of new weights
-            self.loss_history.append(loss)
-            dw = (2.0 / n_samples) * (X.T @ errors)
-            
-            # Add L1 gradient penalty: λ₁ × sign(w)
+        errors = np.empty(n_samples, dtype=self.w.dtype)
+        dw = np.empty(n_features, dtype=self.w.dtype)
+        scale = 2.0 / n_samples
+
+        def step(compute_loss: bool):
+            # prediction and error detection (errors = X @ w + b - y)
+            np.matmul(X, self.w, out=errors)
+            np.add(errors, self.b, out=errors)
+            np.subtract(errors, y, out=errors)
+
+            # loss (MSE + L1 + L2) is only evaluated on logging epochs
+            loss = None
+            if compute_loss:
+                loss = float(np.dot(errors, errors)) / n_samples + self._penalty()
+
+            # gradients: MSE + L1 (λ₁ × sign(w)) + L2 (λ₂ × w)
+            np.matmul(X.T, errors, out=dw)
+            np.multiply(dw, scale, out=dw)
             if self.lambda_l1 > 0:
-                dw += self.lambda_l1 * np.sign(self.w)
-            
-            # Add L2 gradient penalty: λ₂ × w
+                np.add(dw, self.lambda_l1 * np.sign(self.w), out=dw)
             if self.lambda_l2 > 0:
-                dw += self.lambda_l2 * self.w
-            
-            db = (2.0 / n_samples) * float(np.sum(errors))
+                np.add(dw, self.lambda_l2 * self.w, out=dw)
+            db = scale * float(np.sum(errors))
 
             # weight change
             self.w -= self.learning_rate * dw
-            self.b -= self.learning_rate * db 
+            self.b -= self.learning_rate * db
+            return loss, gradient_norm(dw, db)
+
+        return step
+
+    # shared training routine for fit() and fit_with_early_stopping()
+    def _train(self, X: np.ndarray, y: np.ndarray,
+               X_val: Optional[np.ndarray] = None, y_val: Optional[np.ndarray] = None,
+               patience: int = 50, verbose: bool = False) -> None:
+        # Cast once to the compute dtype (no copy if already matching)
+        dtype = resolve_dtype(self.dtype, X)
+        X = X.astype(dtype, copy=False)
+        y = np.asarray(y, dtype=dtype)
+
+        # Initializing initial weights
+        self.w = np.zeros(X.shape[1], dtype=dtype)
+        self.b = 0.0
+
+        val_loss = None
+        if X_val is not None and y_val is not None:
+            X_val = X_val.astype(dtype, copy=False)
+            y_val = np.asarray(y_val, dtype=dtype)
+            val_loss = lambda: self._loss(X_val, y_val)
+
+        result = run_training_loop(
+            self._make_step(X, y), self.epochs,
+            log_every=self.log_every,
+            tol=self.tol, n_iter_no_change=self.n_iter_no_change,
+            val_loss=val_loss, patience=patience, verbose=verbose,
+            train_loss=lambda: self._loss(X, y),
+        )
+        self.loss_history = result.loss_history
+        self.n_iter_ = result.n_iter
+
+    # model training method
+    @profiled("fit", attach=True)
+    def fit(self, X: np.ndarray, y: np.ndarray) -> None:
+        self._train(X, y)
     
     # New method: training with early stopping for acceleration
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50, verbose: bool = False) -> None:
         """
         Training with Early Stopping for convergence acceleration.
         
-        Stops training if validation loss doesn't improve for 'patience' epochs.
+        Stops training if validation loss doesn't improve for 'patience' epochs
+        (validation loss is checked every ``log_every`` epochs).
         
         Args:
             X_train, y_train: training data
@@ -87,69 +148,38 @@ class LinearRegressionGD(BaseModel, SupervisedModel):
             patience: number of epochs without improvement before stopping
             verbose: print progress information
         """
-        # Initializing initial weights
-        n_samples, n_features = X_train.shape
-        self.w = np.zeros(n_features, dtype=float)
-        self.b = 0.0
-        self.loss_history = []
-        
-        best_val_loss = float('inf')
-        patience_counter = 0
-        
-        # Training with validation check
-        for epoch in range(1, self.epochs + 1):
-            # ===== TRAINING =====
-            y_pred = X_train @ self.w + self.b
-            errors = y_pred - y_train
-            
-            mse_loss = float(np.mean(errors ** 2))
-            l1_penalty = self.lambda_l1 * np.sum(np.abs(self.w))
-            l2_penalty = (self.lambda_l2 / 2) * np.sum(self.w ** 2)
-            train_loss = mse_loss + l1_penalty + l2_penalty
-            
-            self.loss_history.append(train_loss)
-            dw = (2.0 / n_samples) * (X_train.T @ errors)
-            
-            if self.lambda_l1 > 0:
-                dw += self.lambda_l1 * np.sign(self.w)
-            if self.lambda_l2 > 0:
-                dw += self.lambda_l2 * self.w
-            
-            db = (2.0 / n_samples) * float(np.sum(errors))
-            self.w -= self.learning_rate * dw
-            self.b -= self.learning_rate * db
-            
-            # ===== VALIDATION =====
-            y_val_pred = X_val @ self.w + self.b
-            val_errors = y_val_pred - y_val
-            
-            val_mse = float(np.mean(val_errors ** 2))
-            val_l1 = self.lambda_l1 * np.sum(np.abs(self.w))
-            val_l2 = (self.lambda_l2 / 2) * np.sum(self.w ** 2)
-            val_loss = val_mse + val_l1 + val_l2
-            
-            # ===== EARLY STOPPING =====
-            if val_loss < best_val_loss:
-                best_val_loss = val_loss
-                patience_counter = 0
-            else:
-                patience_counter += 1
-            
-            # Stop if no improvement
-            if patience_counter >= patience:
-                if verbose:
-                    print(f"Early stopping at epoch {epoch}. Best val loss: {best_val_loss:.6f}")
-                break
-            
-            if verbose and epoch % max(1, self.epochs // 10) == 0:
-                print(f"Epoch {epoch}: train_loss={train_loss:.6f}, val_loss={val_loss:.6f}")
+        self._train(X_train, y_train, X_val, y_val, patience=patience, verbose=verbose)
+
+    # incremental training: one gradient step on a chunk (out-of-core mode)
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> "LinearRegressionGD":
+        """
+        Update the model with one gradient step on a chunk of rows.
+
+        Weights are initialized on the first call; later calls continue from
+        the current weights, so repeated calls over all chunks of a file make
+        one epoch of mini-batch gradient descent (see myclt.ML.streaming).
+
+        Args:
+            X: Feature chunk (n_chunk_samples, n_features)
+            y: Target chunk (n_chunk_samples,)
+
+        Returns:
+            self
+        """
+        if self.w is None:
+            self.w = np.zeros(X.shape[1], dtype=resolve_dtype(self.dtype, X))
+            self.b = 0.0
+        X = X.astype(self.w.dtype, copy=False)
+        y = np.asarray(y, dtype=self.w.dtype)
+        self._make_step(X, y)(False)
+        return self
             
     # method of making predictions         
     def predict(self, X: np.ndarray) -> np.ndarray:
         if self.w is None:
             raise RuntimeError("!Model is not trained yet!")
         
-        return X @ self.w + self.b
+        return X.astype(self.w.dtype, copy=False) @ self.w + self.b
     
     def get_params(self) -> Dict[str, Any]:
         """
@@ -163,16 +193,26 @@ class LinearRegressionGD(BaseModel, SupervisedModel):
             "epochs": self.epochs,
             "lambda_l1": self.lambda_l1,
             "lambda_l2": self.lambda_l2,
+            "tol": self.tol,
+            "n_iter_no_change": self.n_iter_no_change,
+            "log_every": self.log_every,
+            "dtype": self.w.dtype.name if self.w is not None else self.dtype,
+            "n_iter_": self.n_iter_,
             "loss_history": self.loss_history,
         }
     
     # set parameters from downloaded data
     def set_params(self, params: Dict[str, Any]) -> None:
         if params["w"] is not None:
-            self.w = np.array(params["w"], dtype=float)
+            self.dtype = params.get("dtype", self.dtype)
+            self.w = np.array(params["w"], dtype=resolve_dtype(self.dtype))
             self.b = params["b"]
             self.learning_rate = params["learning_rate"]
             self.epochs = params["epochs"]
             self.lambda_l1 = params.get("lambda_l1", 0.0)
             self.lambda_l2 = params.get("lambda_l2", 0.0)
+            self.tol = params.get("tol", self.tol)
+            self.n_iter_no_change = params.get("n_iter_no_change", self.n_iter_no_change)
+            self.log_every = params.get("log_every", self.log_every)
+            self.n_iter_ = params.get("n_iter_", len(params.get("loss_history", [])))
             self.loss_history = params.get("loss_history", [])
@@ -1,42 +1,11 @@
 import numpy as np
-from typing import Tuple, Dict, Any, List
+from typing import Dict, Any, List
 from .core import LinearRegressionGD
-from .preprocessing import standardize_fit, standardize_apply
+from .preprocessing import standardize_fit, standardize_apply, KFold
 from .metrics import mse
+from myclt.ML.profiling import phase, profiled
 
-def k_fold_split(X: np.ndarray, y: np.ndarray, k: int = 5, seed: int = 42) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
-    """
-    K-Fold Cross-Validation split generator.
-    Returns k tuples of (X_train, X_val, y_train, y_val)
-    """
-    if k < 2:
-        raise ValueError("k must be at least 2")
-    
-    n = X.shape[0]
-    rng = np.random.default_rng(seed)  
-    
-    # Shuffle indices
-    idx = np.arange(n)
-    rng.shuffle(idx)
-    
-      
-    fold_indices = np.array_split(idx, k)
-    
-    folds = []
-    
-    for fold_idx in range(k):
-        val_idx = fold_indices[fold_idx]
-        train_idx = np.concatenate([fold_indices[i] for i in range(k) if i != fold_idx])
-        
-        X_train = X[train_idx]
-        y_train = y[train_idx]
-        X_val = X[val_idx]
-        y_val = y[val_idx]
-        
-        folds.append((X_train, X_val, y_train, y_val))
-    
-    return folds
-
+@profiled("tuning")
 def grid_search_regularization(
     X: np.ndarray,
     y: np.ndarray,
@@ -64,8 +33,9 @@ def grid_search_regularization(
     if lambda_l2_grid is None:
         lambda_l2_grid = [0.0, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0]
     
-    # Generate k-fold splits
-    folds = k_fold_split(X, y, k=k_folds, seed=seed)
+    # Fold indices are drawn once and shared by every combination
+    folds = KFold(X.shape[0], k_folds, seed=seed)
+    inplace = np.issubdtype(X.dtype, np.floating)
     
     results = []
     best_mse = float('inf')
@@ -86,39 +56,45 @@ def grid_search_regularization(
             fold_mses = []
             
             
-            for fold_idx, (X_train, X_val, y_train, y_val) in enumerate(folds):
-                
-                if use_scaling:
-                    X_train_scaled, scaler_mean, scaler_std = standardize_fit(X_train)
-                    X_val_scaled = standardize_apply(X_val, scaler_mean, scaler_std)
-                else:
-                    X_train_scaled = X_train
-                    X_val_scaled = X_val
+            with phase("tuning_evaluation"):
+                for train_idx, val_idx in folds:
+                    X_train, X_val = X[train_idx], X[val_idx]
+                    y_train, y_val = y[train_idx], y[val_idx]
+
+                    if use_scaling:
+                        # the fold slices are fresh copies: scale them in place
+                        X_train_scaled, scaler_mean, scaler_std = standardize_fit(
+                            X_train, out=X_train if inplace else None)
+                        X_val_scaled = standardize_apply(
+                            X_val, scaler_mean, scaler_std, out=X_val if inplace else None)
+                    else:
+                        X_train_scaled = X_train
+                        X_val_scaled = X_val
                 
-                # Create and train model
-                model = LinearRegressionGD(
-                    learning_rate=learning_rate,
-                    epochs=epochs,
-                    lambda_l1=l1,
-                    lambda_l2=l2
-                )
+                    # Create and train model
+                    model = LinearRegressionGD(
+                        learning_rate=learning_rate,
+                        epochs=epochs,
+                        lambda_l1=l1,
+                        lambda_l2=l2
+                    )
                 
                 
-                if early_stopping:
-                    model.fit_with_early_stopping(
-                        X_train_scaled, 
-                        y_train,
-                        X_val_scaled,
-                        y_val,
-                        patience=early_stopping_patience
-                    )
-                else:
-                    model.fit(X_train_scaled, y_train)
+                    if early_stopping:
+                        model.fit_with_early_stopping(
+                            X_train_scaled, 
+                            y_train,
+                            X_val_scaled,
+                            y_val,
+                            patience=early_stopping_patience
+                        )
+                    else:
+                        model.fit(X_train_scaled, y_train)
                 
-                # Evaluate on validation fold
-                y_pred = model.predict(X_val_scaled)
-                fold_mse = mse(y_val, y_pred)
-                fold_mses.append(fold_mse)
+                    # Evaluate on validation fold
+                    y_pred = model.predict(X_val_scaled)
+                    fold_mse = mse(y_val, y_pred)
+                    fold_mses.append(fold_mse)
             
             # Calculate mean and std across folds
             mean_mse = float(np.mean(fold_mses))
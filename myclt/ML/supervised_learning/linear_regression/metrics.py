@@ -1,5 +1,8 @@
 import numpy as np 
 
+# chunked / multi-process evaluation: update(y, pred) per chunk, merge(), result()
+from myclt.ML.base_metrics import RegressionAccumulator
+
 # simple model performance testing functions
 def mse(y_true: np.ndarray , y_pred: np.ndarray) -> float:
     return float(np.mean((y_true - y_pred) ** 2))
@@ -5,6 +5,6 @@ Reuses preprocessing functions from base_models since
 train_test_split and standardization are shared across all supervised models.
 """
 
-from ...base_models import train_test_split, standardize_fit, standardize_apply
+from ...base_models import train_test_split, standardize_fit, standardize_apply, Scaler, KFold
 
-__all__ = ['train_test_split', 'standardize_fit', 'standardize_apply']
\ No newline at end of file
+__all__ = ['train_test_split', 'standardize_fit', 'standardize_apply', 'Scaler', 'KFold']
\ No newline at end of file
@@ -13,6 +13,8 @@ from myclt.common.input_validation import ask_choice , ask_int , ask_float , ask
 from myclt.common.ui_helpers import clear_screen , print_header , pause
 from myclt.ML.session_storage import SessionStorage
 from myclt.ML.batch_predict import batch_predict_from_csv, batch_predict_interactive
+from myclt.ML.profiling import maybe_profile, print_profile
+from myclt.ML.visualization_utils import loss_epochs
 
 def menu_save_load(s: AppState) -> None:
     """
@@ -239,7 +241,7 @@ def menu_data(s: AppState) -> None:
                 pause()
                 continue
             try:
-                s.prepareddata = select_features_and_target(s.dataset)
+                s.prepareddata = select_features_and_target(s.dataset, dtype=s.dtype)
                 rebuild_split(s)
                 print("\nSelection saved and train/test split rebuilt.")
             except Exception as e:
@@ -280,6 +282,7 @@ def menu_train(s: AppState) -> None:
 
         if choice == 0:
             s.use_scaling = ask_yes_no("Enable standardization scaling? (y/n): ")
+            s.dtype = "float32" if ask_yes_no("Use float32 compute mode (halves memory)?", default=(s.dtype == "float32")) else "float64"
             s.learning_rate = ask_float("learning_rate (e.g. 0.01..0.2): ", 1e-6, 10.0)
             s.epochs = ask_int("epochs (e.g. 500..10000): ", 1, 1_000_000)
 
@@ -421,6 +424,7 @@ def menu_train(s: AppState) -> None:
             
             # Ask about early stopping
             use_early_stopping = ask_yes_no("Use early stopping?", default=False)
+            profile = ask_yes_no("Profile training (time, memory)?", default=False)
             
             # Create model with regularization parameters
             model = LinearRegressionGD(
@@ -441,10 +445,12 @@ def menu_train(s: AppState) -> None:
                 patience = ask_int("Patience (epochs without improvement):", min_val=5, max_val=200, default=50)
                 
                 print(f"\nTraining with early stopping (patience={patience})...")
-                model.fit_with_early_stopping(X_train_part, y_train_part, X_val, y_val, patience=patience, verbose=True)
+                with maybe_profile(profile):
+                    model.fit_with_early_stopping(X_train_part, y_train_part, X_val, y_val, patience=patience, verbose=True)
             else:
                 print("\nTraining without early stopping...")
-                model.fit(s.X_train , s.y_train)
+                with maybe_profile(profile):
+                    model.fit(s.X_train , s.y_train)
 
             s.model = model
 
@@ -454,9 +460,11 @@ def menu_train(s: AppState) -> None:
 
             if final_loss is not None:
                 print(f"\nTraining finished. Final train loss: {final_loss:.6f}")
-                print(f"Total epochs trained: {len(model.loss_history)}")
+                print(f"Total epochs trained: {model.n_iter_}")
             else:
                 print("Training finished.")
+            if profile:
+                print_profile(model)
             pause()
         else:
             return
@@ -655,7 +663,7 @@ def menu_visualize(s: AppState) -> None:
                 pause()
                 continue
 
-            plot_loss_curve(s.model.loss_history)
+            plot_loss_curve(s.model.loss_history, epochs=loss_epochs(s.model))
             pause()
 
         elif choice == 1:
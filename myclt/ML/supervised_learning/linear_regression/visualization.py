@@ -1,10 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import List , Optional
 
 from .core import LinearRegressionGD
 from .preprocessing import standardize_apply
-from ...visualization_utils import plot_loss_curve, plot_true_vs_pred
+from ...visualization_utils import plot_loss_curve, plot_true_vs_pred, show_figure, downsample
 
 def plot_1d_regression(x_raw: np.ndarray , y_true: np.ndarray , model: LinearRegressionGD , scaler_mean: Optional[np.ndarray] , scaler_std: Optional[np.ndarray],) -> None:
     """
@@ -14,6 +13,8 @@ def plot_1d_regression(x_raw: np.ndarray , y_true: np.ndarray , model: LinearReg
     """
 
     # transforming the shape of an array
+    import matplotlib.pyplot as plt
+
     x_raw = x_raw.reshape(-1 , 1)
 
     x_min , x_max = float(x_raw.min()) , float(x_raw.max())
@@ -37,10 +38,10 @@ def plot_1d_regression(x_raw: np.ndarray , y_true: np.ndarray , model: LinearReg
     y_line = model.predict(x_grid_scaled)
         
     plt.figure()
-    plt.scatter(x_raw.flatten() , y_true)
+    plt.scatter(*downsample(x_raw.flatten() , y_true))
     plt.plot(x_grid.flatten() , y_line)
     plt.xlabel("Feature (raw)")
     plt.ylabel("Target")
     plt.title("1D Regression: data points + fitted line")
     plt.grid(True)
-    plt.show()
\ No newline at end of file
+    show_figure()
\ No newline at end of file
@@ -19,15 +19,25 @@ Example usage:
 
 from .core import LogisticRegressionGD, MultinomialLogisticRegression
 from .data import Dataset, Prepareddata, load_csv_dataset
-from .preprocessing import train_test_split, standardize_fit, standardize_apply
-from .metrics import accuracy, precision, recall, f1_score, confusion_matrix
+from .preprocessing import train_test_split, standardize_fit, standardize_apply, Scaler
+from .metrics import accuracy, precision, recall, f1_score, confusion_matrix, roc_curve, roc_auc_score
 from .app_state import AppState, print_status, rebuild_split
 from .multinomial_app_state import MultinomialAppState, print_status as m_print_status, rebuild_split as m_rebuild_split
-from .multinomial_ui import (
-    menu_data_multinomial, menu_train_multinomial, menu_evaluate_multinomial,
-    menu_predict_multinomial, menu_visualize_multinomial, menu_save_load_multinomial
+
+# Menus are imported on first access, so importing the core models
+# (e.g. from the command line) does not load the interactive UI.
+_MULTINOMIAL_MENUS = (
+    'menu_data_multinomial', 'menu_train_multinomial', 'menu_evaluate_multinomial',
+    'menu_predict_multinomial', 'menu_visualize_multinomial', 'menu_save_load_multinomial',
 )
 
+
+def __getattr__(name):
+    if name in _MULTINOMIAL_MENUS:
+        from . import multinomial_ui
+        return getattr(multinomial_ui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     # Core models
     'LogisticRegressionGD',
@@ -40,12 +50,15 @@ __all__ = [
     'train_test_split',
     'standardize_fit',
     'standardize_apply',
+    'Scaler',
     # Metrics
     'accuracy',
     'precision',
     'recall',
     'f1_score',
     'confusion_matrix',
+    'roc_curve',
+    'roc_auc_score',
     # Binary state & menus
     'AppState',
     'print_status',
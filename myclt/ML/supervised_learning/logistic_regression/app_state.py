@@ -5,7 +5,7 @@ Manages data, model, hyperparameters, and metrics throughout the session.
 """
 
 from dataclasses import dataclass
-from typing import Optional 
+from typing import List, Optional 
 import numpy as np
 
 from .data import Dataset, Prepareddata
@@ -34,6 +34,7 @@ class AppState:
     test_size: float = 0.2
     seed: int = 42
     use_scaling: bool = True
+    dtype: str = "float64"  # compute precision: "float32" or "float64"
     
     # Model hyperparameters
     learning_rate: float = 0.01
@@ -61,6 +62,9 @@ class AppState:
     # Evaluation metrics
     metrics: dict[str, float] = None
     
+    # Original labels of the encoded 0/1 target (e.g. ["no", "yes"])
+    class_names: Optional[List[str]] = None
+    
     def __post_init__(self):
         if self.metrics is None:
             self.metrics = {}
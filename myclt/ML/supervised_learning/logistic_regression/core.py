@@ -1,7 +1,24 @@
 import numpy as np 
 from typing import Optional, List, Dict, Any, Union
 
-from myclt.ML.base_models import SupervisedModel, BaseModel
+from myclt.ML.base_models import SupervisedModel, BaseModel, resolve_dtype
+from myclt.ML.base_training import StepFn, run_training_loop, gradient_norm
+from myclt.ML.profiling import profiled
+
+
+def _clip_proba(proba: np.ndarray) -> np.ndarray:
+    """Clip probabilities away from 0 and 1 so log(p) and log(1-p) stay finite.
+
+    The margin follows the dtype: ``1 - 1e-15`` rounds to 1.0 in float32.
+    """
+    eps = max(1e-15, float(np.finfo(proba.dtype).eps))
+    return np.clip(proba, eps, 1 - eps)
+
+
+def _logit_bound(dtype: np.dtype) -> float:
+    """Largest |z| for which exp(z) does not overflow (500 in float64, ~88 in float32)."""
+    return min(500.0, float(np.log(np.finfo(dtype).max)) - 1.0)
+
 
 class LogisticRegressionGD(BaseModel, SupervisedModel):
     """
@@ -23,13 +40,18 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
     Features:
         - L2 (Ridge) regularization support
         - Early stopping for faster convergence
+        - Convergence-based stopping in fit() (tol / n_iter_no_change)
         - Probability predictions via predict_proba()
+        - float32 / float64 compute precision (``dtype``)
     """
     
     model_type = "logistic_regression"
+    accepts_sparse = True  # X may be a myclt.ML.sparse.CSRMatrix
     
     def __init__(self, learning_rate: float = 0.01, epochs: int = 1000, 
-                 lambda_l2: float = 0.0, threshold: float = 0.5):
+                 lambda_l2: float = 0.0, threshold: float = 0.5,
+                 tol: Optional[float] = 1e-6, n_iter_no_change: int = 10,
+                 log_every: int = 10, dtype: Optional[str] = None):
         """
         Initialize Logistic Regression model.
         
@@ -38,15 +60,25 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
             epochs: Maximum number of training iterations
             lambda_l2: L2 regularization strength (Ridge)
             threshold: Classification threshold for binary output (default 0.5)
+            tol: Convergence tolerance on training loss / gradient norm
+                 (None = always run all epochs)
+            n_iter_no_change: Loss checks without improvement > tol before stopping
+            log_every: Evaluate the loss every N epochs (loss_history granularity)
+            dtype: Compute precision "float32" / "float64" (None = follow X)
         """
         self.learning_rate = learning_rate
         self.epochs = epochs
+        self.log_every = log_every
         self.lambda_l2 = lambda_l2  # L2 regularization (Ridge)
         self.threshold = threshold  # Classification threshold
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.dtype = dtype
         
         self.w: Optional[np.ndarray] = None
         self.b: float = 0.0
         self.loss_history: List[float] = []
+        self.n_iter_: int = 0  # epochs actually run by the last fit
     
     @property
     def is_trained(self) -> bool:
@@ -59,7 +91,9 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
         Sigmoid activation function: 1 / (1 + exp(-z))
         Numerically stable version to prevent overflow.
         """
-        z = np.clip(z, -500, 500)  # Prevent overflow
+        z = np.asarray(z)
+        bound = _logit_bound(z.dtype) if np.issubdtype(z.dtype, np.floating) else 500
+        z = np.clip(z, -bound, bound)  # Prevent overflow
         return 1.0 / (1.0 + np.exp(-z))
     
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
@@ -75,7 +109,7 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
         if not self.is_trained:
             raise RuntimeError("Model not trained yet!")
         
-        z = X @ self.w + self.b
+        z = X.astype(self.w.dtype, copy=False) @ self.w + self.b
         return self._sigmoid(z)
     
     def predict(self, X: np.ndarray) -> np.ndarray:
@@ -91,60 +125,114 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
         proba = self.predict_proba(X)
         return (proba >= self.threshold).astype(int)
     
-    def fit(self, X: np.ndarray, y: np.ndarray) -> None:
+    @staticmethod
+    def _bce(proba: np.ndarray, y: np.ndarray) -> float:
+        """Binary cross-entropy with clipping to avoid log(0)."""
+        p = _clip_proba(proba)
+        return float(-np.mean(y * np.log(p) + (1 - y) * np.log(1 - p)))
+    
+    def _penalty(self) -> float:
+        """L2 regularization penalty: (λ/2) × Σ(w²)."""
+        return (self.lambda_l2 / 2) * float(np.dot(self.w, self.w))
+    
+    def _loss(self, X: np.ndarray, y: np.ndarray) -> float:
+        """Full objective (BCE + L2) for the current weights."""
+        return self._bce(self.predict_proba(X), y) + self._penalty()
+    
+    def _make_step(self, X: np.ndarray, y: np.ndarray) -> StepFn:
         """
-        Train the logistic regression model using batch gradient descent.
+        Build one fused forward/backward epoch over preallocated buffers.
         
-        Args:
-            X: Feature matrix (n_samples, n_features)
-            y: Target vector (n_samples,) with values 0 or 1
+        The sigmoid is applied in place, the same probabilities are reused
+        for the loss (only on logging epochs) and for the gradient.
         """
         n_samples, n_features = X.shape
-        
-        # Initialize weights and bias
-        self.w = np.zeros(n_features, dtype=float)
-        self.b = 0.0
-        self.loss_history = []
-        
-        # Training loop
-        for epoch in range(1, self.epochs + 1):
-            # Forward pass: predictions
-            z = X @ self.w + self.b
-            y_pred = self._sigmoid(z)
-            
-            # Binary cross-entropy loss
-            # Avoid log(0) by clipping predictions
-            y_pred_clipped = np.clip(y_pred, 1e-15, 1 - 1e-15)
-            bce_loss = -np.mean(y * np.log(y_pred_clipped) + (1 - y) * np.log(1 - y_pred_clipped))
-            
-            # L2 regularization penalty: (λ/2) × Σ(w²)
-            l2_penalty = (self.lambda_l2 / 2) * np.sum(self.w ** 2)
-            
-            # Total loss
-            loss = bce_loss + l2_penalty
-            self.loss_history.append(loss)
-            
-            # Backward pass: compute gradients
-            errors = y_pred - y
-            dw = (1.0 / n_samples) * (X.T @ errors)
+        proba = np.empty(n_samples, dtype=self.w.dtype)
+        dw = np.empty(n_features, dtype=self.w.dtype)
+        bound = _logit_bound(proba.dtype)
+        
+        def step(compute_loss: bool):
+            # Forward pass: proba = sigmoid(X @ w + b), computed in place
+            np.matmul(X, self.w, out=proba)
+            np.add(proba, self.b, out=proba)
+            np.clip(proba, -bound, bound, out=proba)
+            np.negative(proba, out=proba)
+            np.exp(proba, out=proba)
+            np.add(proba, 1.0, out=proba)
+            np.reciprocal(proba, out=proba)
+            
+            loss = self._bce(proba, y) + self._penalty() if compute_loss else None
+            
+            # Backward pass: errors = proba - y (reuses the same buffer)
+            np.subtract(proba, y, out=proba)
+            np.matmul(X.T, proba, out=dw)
+            np.divide(dw, n_samples, out=dw)
             
             # Add L2 gradient penalty: λ × w
             if self.lambda_l2 > 0:
-                dw += self.lambda_l2 * self.w
+                np.add(dw, self.lambda_l2 * self.w, out=dw)
             
-            db = (1.0 / n_samples) * np.sum(errors)
+            db = float(np.sum(proba)) / n_samples
             
             # Update weights and bias
             self.w -= self.learning_rate * dw
             self.b -= self.learning_rate * db
+            return loss, gradient_norm(dw, db)
+        
+        return step
+    
+    def _train(self, X: np.ndarray, y: np.ndarray,
+               X_val: Optional[np.ndarray] = None, y_val: Optional[np.ndarray] = None,
+               patience: int = 50, verbose: bool = False) -> None:
+        """Shared training routine for fit() and fit_with_early_stopping()."""
+        # Cast once to the compute dtype (no copy if already matching)
+        dtype = resolve_dtype(self.dtype, X)
+        X = X.astype(dtype, copy=False)
+        y = np.asarray(y, dtype=dtype)
+        
+        # Initialize weights and bias
+        self.w = np.zeros(X.shape[1], dtype=dtype)
+        self.b = 0.0
+        
+        val_loss = None
+        if X_val is not None and y_val is not None:
+            X_val = X_val.astype(dtype, copy=False)
+            y_val = np.asarray(y_val, dtype=dtype)
+            val_loss = lambda: self._loss(X_val, y_val)
+        
+        result = run_training_loop(
+            self._make_step(X, y), self.epochs,
+            log_every=self.log_every,
+            tol=self.tol, n_iter_no_change=self.n_iter_no_change,
+            val_loss=val_loss, patience=patience, verbose=verbose,
+            train_loss=lambda: self._loss(X, y),
+        )
+        self.loss_history = result.loss_history
+        self.n_iter_ = result.n_iter
     
+    @profiled("fit", attach=True)
+    def fit(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Train the logistic regression model using batch gradient descent.
+        
+        Stops early once the training loss has converged (see ``tol``);
+        the number of epochs run is stored in ``n_iter_``.
+        
+        Args:
+            X: Feature matrix (n_samples, n_features)
+            y: Target vector (n_samples,) with values 0 or 1
+        """
+        self._train(X, y)
+    
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50, verbose: bool = False) -> None:
         """
         Train with early stopping to prevent overfitting.
         
-        Stops training if validation loss doesn't improve for 'patience' epochs.
+        Stops training if validation loss doesn't improve for 'patience' epochs
+        (validation loss is checked every ``log_every`` epochs).
         
         Args:
             X_train, y_train: Training data
@@ -152,56 +240,30 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
             patience: Number of epochs without improvement before stopping
             verbose: Print progress information
         """
-        n_samples, n_features = X_train.shape
+        self._train(X_train, y_train, X_val, y_val, patience=patience, verbose=verbose)
+    
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> "LogisticRegressionGD":
+        """
+        Update the model with one gradient step on a chunk of rows.
         
-        # Initialize weights and bias
-        self.w = np.zeros(n_features, dtype=float)
-        self.b = 0.0
-        self.loss_history = []
+        Weights are initialized on the first call; repeated calls over all
+        chunks of a file make one epoch of mini-batch gradient descent
+        (out-of-core training, see myclt.ML.streaming).
         
-        best_val_loss = float('inf')
-        patience_counter = 0
+        Args:
+            X: Feature chunk (n_chunk_samples, n_features)
+            y: Target chunk (n_chunk_samples,) with values 0 or 1
         
-        for epoch in range(1, self.epochs + 1):
-            # Training step
-            z_train = X_train @ self.w + self.b
-            y_pred_train = self._sigmoid(z_train)
-            
-            errors_train = y_pred_train - y_train
-            dw = (1.0 / n_samples) * (X_train.T @ errors_train)
-            if self.lambda_l2 > 0:
-                dw += self.lambda_l2 * self.w
-            
-            db = (1.0 / n_samples) * np.sum(errors_train)
-            
-            self.w -= self.learning_rate * dw
-            self.b -= self.learning_rate * db
-            
-            # Validation step
-            z_val = X_val @ self.w + self.b
-            y_pred_val = self._sigmoid(z_val)
-            y_pred_val_clipped = np.clip(y_pred_val, 1e-15, 1 - 1e-15)
-            
-            bce_val = -np.mean(y_val * np.log(y_pred_val_clipped) + (1 - y_val) * np.log(1 - y_pred_val_clipped))
-            l2_penalty = (self.lambda_l2 / 2) * np.sum(self.w ** 2)
-            val_loss = bce_val + l2_penalty
-            
-            self.loss_history.append(val_loss)
-            
-            # Early stopping check
-            if val_loss < best_val_loss:
-                best_val_loss = val_loss
-                patience_counter = 0
-            else:
-                patience_counter += 1
-            
-            if verbose and epoch % 100 == 0:
-                print(f"Epoch {epoch}: Val Loss = {val_loss:.6f}")
-            
-            if patience_counter >= patience:
-                if verbose:
-                    print(f"Early stopping at epoch {epoch}")
-                break
+        Returns:
+            self
+        """
+        if self.w is None:
+            self.w = np.zeros(X.shape[1], dtype=resolve_dtype(self.dtype, X))
+            self.b = 0.0
+        X = X.astype(self.w.dtype, copy=False)
+        y = np.asarray(y, dtype=self.w.dtype)
+        self._make_step(X, y)(False)
+        return self
     
     def get_params(self) -> Dict[str, Any]:
         """
@@ -217,6 +279,11 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
             'epochs': int(self.epochs),
             'lambda_l2': float(self.lambda_l2),
             'threshold': float(self.threshold),
+            'tol': self.tol,
+            'n_iter_no_change': int(self.n_iter_no_change),
+            'log_every': int(self.log_every),
+            'dtype': self.w.dtype.name if self.w is not None else self.dtype,
+            'n_iter_': int(self.n_iter_),
         }
     
     def set_params(self, params: Dict[str, Any]) -> None:
@@ -226,8 +293,9 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
         Args:
             params: Dictionary from get_params()
         """
+        self.dtype = params.get('dtype', self.dtype)
         if params['w'] is not None:
-            self.w = np.array(params['w'], dtype=float)
+            self.w = np.array(params['w'], dtype=resolve_dtype(self.dtype))
         else:
             self.w = None
         
@@ -236,6 +304,10 @@ class LogisticRegressionGD(BaseModel, SupervisedModel):
         self.epochs = int(params.get('epochs', 1000))
         self.lambda_l2 = float(params.get('lambda_l2', 0.0))
         self.threshold = float(params.get('threshold', 0.5))
+        self.tol = params.get('tol', self.tol)
+        self.n_iter_no_change = int(params.get('n_iter_no_change', self.n_iter_no_change))
+        self.log_every = int(params.get('log_every', self.log_every))
+        self.n_iter_ = int(params.get('n_iter_', 0))
 
 
 class MultinomialLogisticRegression(BaseModel, SupervisedModel):
@@ -262,13 +334,18 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
         - Supports any K >= 2 classes
         - L2 (Ridge) regularization support
         - Early stopping for faster convergence
+        - Convergence-based stopping in fit() (tol / n_iter_no_change)
         - Full probability matrix via predict_proba()
+        - float32 / float64 compute precision (``dtype``)
     """
     
     model_type = "multinomial_logistic_regression"
+    accepts_sparse = True  # X may be a myclt.ML.sparse.CSRMatrix
     
     def __init__(self, learning_rate: float = 0.01, epochs: int = 1000, 
-                 lambda_l2: float = 0.0):
+                 lambda_l2: float = 0.0, tol: Optional[float] = 1e-6,
+                 n_iter_no_change: int = 10, log_every: int = 10,
+                 dtype: Optional[str] = None):
         """
         Initialize Multinomial Logistic Regression model.
         
@@ -276,10 +353,20 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
             learning_rate: Step size for gradient descent
             epochs: Maximum number of training iterations
             lambda_l2: L2 regularization strength (Ridge)
+            tol: Convergence tolerance on training loss / gradient norm
+                 (None = always run all epochs)
+            n_iter_no_change: Loss checks without improvement > tol before stopping
+            log_every: Evaluate the loss every N epochs (loss_history granularity)
+            dtype: Compute precision "float32" / "float64" (None = follow X)
         """
         self.learning_rate = learning_rate
         self.epochs = epochs
+        self.log_every = log_every
         self.lambda_l2 = lambda_l2
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.dtype = dtype
+        self.n_iter_: int = 0  # epochs actually run by the last fit
         
         # Weight matrix (n_features, n_classes) and bias vector (n_classes,)
         self.W: Optional[np.ndarray] = None
@@ -342,7 +429,7 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
         if not self.is_trained:
             raise RuntimeError("Model not trained yet!")
         
-        z = X @ self.W + self.b
+        z = X.astype(self.W.dtype, copy=False) @ self.W + self.b
         return self._softmax(z)
     
     def predict(self, X: np.ndarray) -> np.ndarray:
@@ -376,80 +463,134 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
         proba = self.predict_proba(X)
         return proba[:, class_idx]
     
-    def fit(self, X: np.ndarray, y: np.ndarray) -> None:
-        """
-        Train the multinomial logistic regression model.
-        
-        Uses batch gradient descent with categorical cross-entropy loss.
-        
-        Args:
-            X: Feature matrix (n_samples, n_features)
-            y: Target vector (n_samples,) with integer labels 0, 1, ..., K-1
-        """
-        n_samples, n_features = X.shape
-        
-        # Determine number of classes from unique values in y
-        unique_classes = np.unique(y)
+    def _fit_class_mapping(self, unique_classes: np.ndarray) -> None:
+        """Set n_classes and the label remapping (None if labels are already 0..K-1)."""
         self.n_classes = len(unique_classes)
-        
-        # Validate that classes are 0..K-1; remap if needed
         if not np.array_equal(unique_classes, np.arange(self.n_classes)):
             # Remap arbitrary labels to 0..K-1
             self._class_mapping = {old: new for new, old in enumerate(sorted(unique_classes))}
             self._inverse_mapping = {new: old for old, new in self._class_mapping.items()}
-            y_mapped = np.array([self._class_mapping[val] for val in y])
         else:
             self._class_mapping = None
             self._inverse_mapping = None
-            y_mapped = y.astype(int)
-        
-        # One-hot encode targets
-        y_onehot = self._to_onehot(y_mapped, self.n_classes)
+    
+    def _map_labels(self, y: np.ndarray) -> np.ndarray:
+        """Convert original labels to integer indices 0..K-1."""
+        if self._class_mapping is None:
+            return y.astype(int)
+        return np.array([self._class_mapping[val] for val in y])
+    
+    def _penalty(self) -> float:
+        """L2 regularization penalty: (λ/2) × Σ(W²)."""
+        return (self.lambda_l2 / 2) * float(np.vdot(self.W, self.W))
+    
+    def _loss(self, X: np.ndarray, y_mapped: np.ndarray) -> float:
+        """Full objective (categorical cross-entropy + L2) for the current weights."""
+        proba = self.predict_proba(X)
+        p_true = _clip_proba(proba[np.arange(X.shape[0]), y_mapped])
+        return float(-np.mean(np.log(p_true))) + self._penalty()
+    
+    def _make_step(self, X: np.ndarray, y_mapped: np.ndarray) -> StepFn:
+        """
+        Build one fused forward/backward epoch over preallocated buffers.
         
-        # Initialize weight matrix (n_features, n_classes) and bias vector (n_classes,)
-        self.W = np.zeros((n_features, self.n_classes), dtype=float)
-        self.b = np.zeros(self.n_classes, dtype=float)
-        self.loss_history = []
-        
-        # Training loop
-        for epoch in range(1, self.epochs + 1):
-            # Forward pass: logits -> softmax probabilities
-            logits = X @ self.W + self.b  # (n_samples, n_classes)
-            y_pred = self._softmax(logits)  # (n_samples, n_classes)
-            
-            # Categorical cross-entropy loss
-            y_pred_clipped = np.clip(y_pred, 1e-15, 1 - 1e-15)
-            cce_loss = -np.mean(np.sum(y_onehot * np.log(y_pred_clipped), axis=1))
-            
-            # L2 regularization penalty: (λ/2) × Σ(W²)
-            l2_penalty = (self.lambda_l2 / 2) * np.sum(self.W ** 2)
-            
-            # Total loss
-            loss = cce_loss + l2_penalty
-            self.loss_history.append(loss)
-            
-            # Backward pass: gradient of cross-entropy with softmax
-            errors = y_pred - y_onehot  # (n_samples, n_classes)
-            
-            dW = (1.0 / n_samples) * (X.T @ errors)  # (n_features, n_classes)
+        Softmax is applied in place and the one-hot matrix is never built:
+        the loss only needs the true-class probabilities, and the gradient
+        errors (P - Y_onehot) are obtained by subtracting 1 at those entries.
+        """
+        n_samples, n_features = X.shape
+        rows = np.arange(n_samples)
+        proba = np.empty((n_samples, self.n_classes), dtype=self.W.dtype)
+        row_buf = np.empty((n_samples, 1), dtype=self.W.dtype)
+        dW = np.empty((n_features, self.n_classes), dtype=self.W.dtype)
+        
+        def step(compute_loss: bool):
+            # Forward pass: logits -> softmax probabilities (in place)
+            np.matmul(X, self.W, out=proba)
+            np.add(proba, self.b, out=proba)
+            np.clip(proba, -500, 500, out=proba)
+            np.max(proba, axis=1, keepdims=True, out=row_buf)
+            np.subtract(proba, row_buf, out=proba)
+            np.exp(proba, out=proba)
+            np.sum(proba, axis=1, keepdims=True, out=row_buf)
+            np.divide(proba, row_buf, out=proba)
+            
+            loss = None
+            if compute_loss:
+                p_true = _clip_proba(proba[rows, y_mapped])
+                loss = float(-np.mean(np.log(p_true))) + self._penalty()
+            
+            # Backward pass: errors = P - Y_onehot
+            proba[rows, y_mapped] -= 1.0
+            np.matmul(X.T, proba, out=dW)
+            np.divide(dW, n_samples, out=dW)
             
             # Add L2 gradient penalty: λ × W
             if self.lambda_l2 > 0:
-                dW += self.lambda_l2 * self.W
+                np.add(dW, self.lambda_l2 * self.W, out=dW)
             
-            db = (1.0 / n_samples) * np.sum(errors, axis=0)  # (n_classes,)
+            db = np.sum(proba, axis=0) / n_samples
             
             # Update parameters
             self.W -= self.learning_rate * dW
             self.b -= self.learning_rate * db
+            return loss, gradient_norm(dW, db)
+        
+        return step
+    
+    def _train(self, X: np.ndarray, y_mapped: np.ndarray,
+               X_val: Optional[np.ndarray] = None, y_val_mapped: Optional[np.ndarray] = None,
+               patience: int = 50, verbose: bool = False) -> None:
+        """Shared training routine for fit() and fit_with_early_stopping()."""
+        # Cast once to the compute dtype (labels stay integer indices)
+        dtype = resolve_dtype(self.dtype, X)
+        X = X.astype(dtype, copy=False)
+        
+        # Initialize weight matrix (n_features, n_classes) and bias vector (n_classes,)
+        self.W = np.zeros((X.shape[1], self.n_classes), dtype=dtype)
+        self.b = np.zeros(self.n_classes, dtype=dtype)
+        
+        val_loss = None
+        if X_val is not None and y_val_mapped is not None:
+            X_val = X_val.astype(dtype, copy=False)
+            val_loss = lambda: self._loss(X_val, y_val_mapped)
+        
+        result = run_training_loop(
+            self._make_step(X, y_mapped), self.epochs,
+            log_every=self.log_every,
+            tol=self.tol, n_iter_no_change=self.n_iter_no_change,
+            val_loss=val_loss, patience=patience, verbose=verbose,
+            train_loss=lambda: self._loss(X, y_mapped),
+        )
+        self.loss_history = result.loss_history
+        self.n_iter_ = result.n_iter
+    
+    @profiled("fit", attach=True)
+    def fit(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Train the multinomial logistic regression model.
+        
+        Uses batch gradient descent with categorical cross-entropy loss.
+        Stops early once the training loss has converged (see ``tol``);
+        the number of epochs run is stored in ``n_iter_``.
+        
+        Args:
+            X: Feature matrix (n_samples, n_features)
+            y: Target vector (n_samples,) with integer labels 0, 1, ..., K-1
+        """
+        # Determine number of classes from unique values in y
+        self._fit_class_mapping(np.unique(y))
+        self._train(X, self._map_labels(y))
     
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50, verbose: bool = False) -> None:
         """
         Train with early stopping to prevent overfitting.
         
-        Stops training if validation loss doesn't improve for 'patience' epochs.
+        Stops training if validation loss doesn't improve for 'patience' epochs
+        (validation loss is checked every ``log_every`` epochs).
         
         Args:
             X_train, y_train: Training data
@@ -457,74 +598,45 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
             patience: Number of epochs without improvement before stopping
             verbose: Print progress information
         """
-        n_samples, n_features = X_train.shape
-        
         # Determine classes from union of train and val
-        unique_classes = np.unique(np.concatenate([y_train, y_val]))
-        self.n_classes = len(unique_classes)
-        
-        # Remap if needed (same logic as fit)
-        if not np.array_equal(unique_classes, np.arange(self.n_classes)):
-            self._class_mapping = {old: new for new, old in enumerate(sorted(unique_classes))}
-            self._inverse_mapping = {new: old for old, new in self._class_mapping.items()}
-            y_train_mapped = np.array([self._class_mapping[val] for val in y_train])
-            y_val_mapped = np.array([self._class_mapping[val] for val in y_val])
-        else:
-            self._class_mapping = None
-            self._inverse_mapping = None
-            y_train_mapped = y_train.astype(int)
-            y_val_mapped = y_val.astype(int)
-        
-        y_train_onehot = self._to_onehot(y_train_mapped, self.n_classes)
-        y_val_onehot = self._to_onehot(y_val_mapped, self.n_classes)
+        self._fit_class_mapping(np.unique(np.concatenate([y_train, y_val])))
+        self._train(
+            X_train, self._map_labels(y_train),
+            X_val, self._map_labels(y_val),
+            patience=patience, verbose=verbose,
+        )
+    
+    def partial_fit(self, X: np.ndarray, y: np.ndarray,
+                    classes: Optional[np.ndarray] = None) -> "MultinomialLogisticRegression":
+        """
+        Update the model with one gradient step on a chunk of rows.
         
-        # Initialize weights
-        self.W = np.zeros((n_features, self.n_classes), dtype=float)
-        self.b = np.zeros(self.n_classes, dtype=float)
-        self.loss_history = []
+        A single chunk rarely contains every class, so the full set of
+        labels must be passed via ``classes`` on the first call; later calls
+        reuse the stored label mapping (out-of-core training, see
+        myclt.ML.streaming).
         
-        best_val_loss = float('inf')
-        patience_counter = 0
+        Args:
+            X: Feature chunk (n_chunk_samples, n_features)
+            y: Target chunk (n_chunk_samples,) with labels from ``classes``
+            classes: All class labels (required on the first call)
         
-        for epoch in range(1, self.epochs + 1):
-            # Training step
-            logits_train = X_train @ self.W + self.b
-            y_pred_train = self._softmax(logits_train)
-            
-            errors_train = y_pred_train - y_train_onehot
-            dW = (1.0 / n_samples) * (X_train.T @ errors_train)
-            if self.lambda_l2 > 0:
-                dW += self.lambda_l2 * self.W
-            db = (1.0 / n_samples) * np.sum(errors_train, axis=0)
-            
-            self.W -= self.learning_rate * dW
-            self.b -= self.learning_rate * db
-            
-            # Validation step
-            logits_val = X_val @ self.W + self.b
-            y_pred_val = self._softmax(logits_val)
-            y_pred_val_clipped = np.clip(y_pred_val, 1e-15, 1 - 1e-15)
-            
-            cce_val = -np.mean(np.sum(y_val_onehot * np.log(y_pred_val_clipped), axis=1))
-            l2_penalty = (self.lambda_l2 / 2) * np.sum(self.W ** 2)
-            val_loss = cce_val + l2_penalty
-            
-            self.loss_history.append(val_loss)
-            
-            # Early stopping check
-            if val_loss < best_val_loss:
-                best_val_loss = val_loss
-                patience_counter = 0
-            else:
-                patience_counter += 1
-            
-            if verbose and epoch % 100 == 0:
-                print(f"Epoch {epoch}: Val Loss = {val_loss:.6f}")
-            
-            if patience_counter >= patience:
-                if verbose:
-                    print(f"Early stopping at epoch {epoch}")
-                break
+        Returns:
+            self
+        
+        Raises:
+            ValueError: If classes is missing on the first call
+        """
+        if self.W is None:
+            if classes is None:
+                raise ValueError("!classes must be passed on the first partial_fit() call!")
+            self._fit_class_mapping(np.unique(classes))
+            dtype = resolve_dtype(self.dtype, X)
+            self.W = np.zeros((X.shape[1], self.n_classes), dtype=dtype)
+            self.b = np.zeros(self.n_classes, dtype=dtype)
+        X = X.astype(self.W.dtype, copy=False)
+        self._make_step(X, self._map_labels(y))(False)
+        return self
     
     def get_params(self) -> Dict[str, Any]:
         """
@@ -540,6 +652,11 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
             'learning_rate': float(self.learning_rate),
             'epochs': int(self.epochs),
             'lambda_l2': float(self.lambda_l2),
+            'tol': self.tol,
+            'n_iter_no_change': int(self.n_iter_no_change),
+            'log_every': int(self.log_every),
+            'dtype': self.W.dtype.name if self.W is not None else self.dtype,
+            'n_iter_': int(self.n_iter_),
             '_class_mapping': self._class_mapping,
             '_inverse_mapping': self._inverse_mapping,
         }
@@ -551,13 +668,15 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
         Args:
             params: Dictionary from get_params()
         """
+        self.dtype = params.get('dtype', self.dtype)
+        dtype = resolve_dtype(self.dtype)
         if params.get('W') is not None:
-            self.W = np.array(params['W'], dtype=float)
+            self.W = np.array(params['W'], dtype=dtype)
         else:
             self.W = None
         
         if params.get('b') is not None:
-            self.b = np.array(params['b'], dtype=float)
+            self.b = np.array(params['b'], dtype=dtype)
         else:
             self.b = None
         
@@ -565,5 +684,9 @@ class MultinomialLogisticRegression(BaseModel, SupervisedModel):
         self.learning_rate = float(params.get('learning_rate', 0.01))
         self.epochs = int(params.get('epochs', 1000))
         self.lambda_l2 = float(params.get('lambda_l2', 0.0))
+        self.tol = params.get('tol', self.tol)
+        self.n_iter_no_change = int(params.get('n_iter_no_change', self.n_iter_no_change))
+        self.log_every = int(params.get('log_every', self.log_every))
+        self.n_iter_ = int(params.get('n_iter_', 0))
         self._class_mapping = params.get('_class_mapping')
         self._inverse_mapping = params.get('_inverse_mapping')
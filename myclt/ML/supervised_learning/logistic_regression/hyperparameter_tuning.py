@@ -12,13 +12,33 @@ from typing import Dict, List, Tuple, Any
 from itertools import product
 
 from .core import LogisticRegressionGD
-from .preprocessing import train_test_split, standardize_fit, standardize_apply
-from .metrics import accuracy, precision, recall, f1_score
+from .preprocessing import train_test_split, standardize_fit, standardize_apply, KFold
+from .metrics import accuracy, precision, recall, f1_score, roc_auc_score
+from myclt.ML.profiling import profiled
 
 
+# Scoring name -> (display label, scorer(model, X_test, y_test))
+SCORERS = {
+    'f1': ('F1', lambda m, X, y: f1_score(y, m.predict(X))),
+    'accuracy': ('accuracy', lambda m, X, y: accuracy(y, m.predict(X))),
+    'precision': ('precision', lambda m, X, y: precision(y, m.predict(X))),
+    'recall': ('recall', lambda m, X, y: recall(y, m.predict(X))),
+    'roc_auc': ('ROC AUC', lambda m, X, y: roc_auc_score(y, m.predict_proba(X))),
+}
+
+
+def _get_scorer(scoring: str):
+    """Look up a scorer by name."""
+    if scoring not in SCORERS:
+        raise ValueError(f"!Unknown scoring '{scoring}'. Use one of: {list(SCORERS)}!")
+    return SCORERS[scoring]
+
+
+@profiled("tuning_evaluation")
 def _evaluate_params_cv(X: np.ndarray, y: np.ndarray, 
                        params: Dict[str, Any],
-                       cv_folds: int = 5) -> float:
+                       folds: KFold,
+                       scoring: str = 'f1') -> float:
     """
     Evaluate a single parameter configuration using k-fold CV.
     
@@ -26,42 +46,40 @@ def _evaluate_params_cv(X: np.ndarray, y: np.ndarray,
         X: Feature matrix
         y: Target vector
         params: Dictionary of hyperparameters for LogisticRegressionGD
-        cv_folds: Number of cross-validation folds
+        folds: Stratified KFold shared by every configuration of the search
+        scoring: Fold score, one of SCORERS ('f1', 'accuracy',
+                 'precision', 'recall', 'roc_auc')
     
     Returns:
-        Mean F1-score across folds
+        Mean score across folds
     """
+    _, scorer = _get_scorer(scoring)
     fold_scores = []
-    n_samples = len(X)
-    fold_size = n_samples // cv_folds
+    inplace = np.issubdtype(X.dtype, np.floating)
     
-    for fold in range(cv_folds):
-        test_start = fold * fold_size
-        test_end = test_start + fold_size if fold < cv_folds - 1 else n_samples
-        
-        test_mask = np.zeros(n_samples, dtype=bool)
-        test_mask[test_start:test_end] = True
-        train_mask = ~test_mask
+    for train_idx, test_idx in folds:
+        X_train, y_train = X[train_idx], y[train_idx]
+        X_test, y_test = X[test_idx], y[test_idx]
         
-        X_train, y_train = X[train_mask], y[train_mask]
-        X_test, y_test = X[test_mask], y[test_mask]
-        
-        X_train_scaled, mean, std = standardize_fit(X_train)
-        X_test_scaled = standardize_apply(X_test, mean, std)
+        # the fold slices are fresh copies: scale them in place
+        X_train_scaled, mean, std = standardize_fit(X_train, out=X_train if inplace else None)
+        X_test_scaled = standardize_apply(X_test, mean, std, out=X_test if inplace else None)
         
         model = LogisticRegressionGD(**params)
         model.fit(X_train_scaled, y_train)
         
-        y_pred = model.predict(X_test_scaled)
-        fold_scores.append(f1_score(y_test, y_pred))
+        fold_scores.append(scorer(model, X_test_scaled, y_test))
     
     return np.mean(fold_scores)
 
 
+@profiled("tuning")
 def grid_search_cv(X: np.ndarray, y: np.ndarray, 
                    param_grid: Dict[str, List[Any]],
                    cv_folds: int = 5,
-                   verbose: bool = True) -> Tuple[Dict[str, Any], float]:
+                   verbose: bool = True,
+                   scoring: str = 'f1',
+                   seed: int = 42) -> Tuple[Dict[str, Any], float]:
     """
     Grid search with k-fold cross-validation.
     
@@ -76,6 +94,9 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
                               'lambda_l2': [0.0, 0.01]}
         cv_folds: Number of cross-validation folds
         verbose: Print progress
+        scoring: Metric to maximise ('f1', 'accuracy', 'precision',
+                 'recall', 'roc_auc')
+        seed: Random seed for the stratified fold assignment
     
     Returns:
         Tuple of (best_params, best_score)
@@ -91,6 +112,8 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
         >>> print(f"Best F1 score: {best_score:.4f}")
     """
     
+    metric, _ = _get_scorer(scoring)
+    
     # Generate all parameter combinations
     param_names = list(param_grid.keys())
     param_values = [param_grid[name] for name in param_names]
@@ -98,6 +121,7 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
     
     best_score = -1
     best_params = None
+    folds = KFold(X.shape[0], cv_folds, y=y, seed=seed)
     
     if verbose:
         print(f"\nGrid Search: {len(combinations)} combinations to test")
@@ -108,7 +132,7 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
         params = dict(zip(param_names, values))
         
         # Cross-validation
-        avg_score = _evaluate_params_cv(X, y, params, cv_folds)
+        avg_score = _evaluate_params_cv(X, y, params, folds, scoring)
         
         # Update best if improved
         if avg_score > best_score:
@@ -116,22 +140,24 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
             best_params = params
         
         if verbose and combo_idx % max(1, len(combinations) // 10) == 0:
-            print(f"Progress: {combo_idx}/{len(combinations)} | Best F1: {best_score:.4f}")
+            print(f"Progress: {combo_idx}/{len(combinations)} | Best {metric}: {best_score:.4f}")
     
     if verbose:
         print("=" * 70)
         print(f"Best params found: {best_params}")
-        print(f"Best F1 score: {best_score:.4f}\n")
+        print(f"Best {metric} score: {best_score:.4f}\n")
     
     return best_params, best_score
 
 
+@profiled("tuning")
 def random_search_cv(X: np.ndarray, y: np.ndarray,
                      param_distributions: Dict[str, List[Any]],
                      n_iter: int = 10,
                      cv_folds: int = 5,
                      seed: int = 42,
-                     verbose: bool = True) -> Tuple[Dict[str, Any], float]:
+                     verbose: bool = True,
+                     scoring: str = 'f1') -> Tuple[Dict[str, Any], float]:
     """
     Random search with k-fold cross-validation.
     
@@ -143,16 +169,20 @@ def random_search_cv(X: np.ndarray, y: np.ndarray,
         param_distributions: Dictionary of parameter names -> list of values
         n_iter: Number of random combinations to test
         cv_folds: Number of cross-validation folds
-        seed: Random seed for reproducibility
+        seed: Random seed for the parameter sampling and fold assignment
         verbose: Print progress
+        scoring: Metric to maximise ('f1', 'accuracy', 'precision',
+                 'recall', 'roc_auc')
     
     Returns:
         Tuple of (best_params, best_score)
     """
     
+    metric, _ = _get_scorer(scoring)
     rng = np.random.RandomState(seed)
     best_score = -1
     best_params = None
+    folds = KFold(X.shape[0], cv_folds, y=y, seed=seed)
     
     if verbose:
         print(f"\nRandom Search: {n_iter} random combinations to test")
@@ -166,18 +196,18 @@ def random_search_cv(X: np.ndarray, y: np.ndarray,
             params[param_name] = rng.choice(values)
         
         # Cross-validation
-        avg_score = _evaluate_params_cv(X, y, params, cv_folds)
+        avg_score = _evaluate_params_cv(X, y, params, folds, scoring)
         
         if avg_score > best_score:
             best_score = avg_score
             best_params = params
         
         if verbose and (iteration + 1) % max(1, n_iter // 5) == 0:
-            print(f"Progress: {iteration + 1}/{n_iter} | Best F1: {best_score:.4f}")
+            print(f"Progress: {iteration + 1}/{n_iter} | Best {metric}: {best_score:.4f}")
     
     if verbose:
         print("=" * 70)
         print(f"Best params found: {best_params}")
-        print(f"Best F1 score: {best_score:.4f}\n")
+        print(f"Best {metric} score: {best_score:.4f}\n")
     
     return best_params, best_score
\ No newline at end of file
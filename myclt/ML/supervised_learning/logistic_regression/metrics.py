@@ -4,11 +4,31 @@ Classification metrics for Logistic Regression.
 Provides metrics for both:
     - Binary classification (2 classes)
     - Multiclass classification (K > 2 classes)
+    - Threshold curves: roc_curve, precision_recall_curve, roc_auc_score
+      (binary and one-vs-rest, re-exported from myclt.ML.base_metrics)
+    - Streaming accumulators (ConfusionMatrixAccumulator,
+      HistogramAUCAccumulator) with update/merge/result for chunked or
+      multi-process evaluation
 """
 
 import numpy as np
 from typing import Tuple, Optional
 
+from myclt.ML.base_metrics import (
+    confusion_matrix_counts,
+    binary_counts,
+    precision_recall_f1_from_cm,
+    roc_curve,
+    precision_recall_curve,
+    auc,
+    roc_auc_score,
+    average_precision_score,
+    ConfusionMatrixAccumulator,
+    RegressionAccumulator,
+    HistogramAUCAccumulator,
+    accuracy_from_cm,
+)
+
 # ============================================================================
 # Binary classification metrics (original)
 # ============================================================================
@@ -47,8 +67,7 @@ def precision(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     Returns:
         Precision score in range [0, 1]
     """
-    tp = np.sum((y_pred == 1) & (y_true == 1))
-    fp = np.sum((y_pred == 1) & (y_true == 0))
+    tp, fp, _, _ = binary_counts(y_true, y_pred)
     
     denominator = tp + fp
     if denominator == 0:
@@ -72,8 +91,7 @@ def recall(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     Returns:
         Recall score in range [0, 1]
     """
-    tp = np.sum((y_pred == 1) & (y_true == 1))
-    fn = np.sum((y_pred == 0) & (y_true == 1))
+    tp, _, fn, _ = binary_counts(y_true, y_pred)
     
     denominator = tp + fn
     if denominator == 0:
@@ -97,29 +115,26 @@ def f1_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     Returns:
         F1 score in range [0, 1]
     """
-    prec = precision(y_true, y_pred)
-    rec = recall(y_true, y_pred)
+    tp, fp, fn, _ = binary_counts(y_true, y_pred)
     
-    denominator = prec + rec
+    # Equivalent to 2PR / (P + R) without computing P and R separately
+    denominator = 2 * tp + fp + fn
     if denominator == 0:
         return 0.0
     
-    return float(2 * (prec * rec) / denominator)
+    return float(2 * tp / denominator)
 
 
 def confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[int, int, int, int]:
     """
     Calculate confusion matrix for binary classification.
     
+    Single ``np.bincount`` pass over the predictions.
+    
     Returns:
         (TP, FP, FN, TN)
     """
-    tp = int(np.sum((y_pred == 1) & (y_true == 1)))
-    fp = int(np.sum((y_pred == 1) & (y_true == 0)))
-    fn = int(np.sum((y_pred == 0) & (y_true == 1)))
-    tn = int(np.sum((y_pred == 0) & (y_true == 0)))
-    
-    return tp, fp, fn, tn
+    return binary_counts(y_true, y_pred)
 
 
 def specificity(y_true: np.ndarray, y_pred: np.ndarray) -> float:
@@ -135,8 +150,7 @@ def specificity(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     Returns:
         Specificity score in range [0, 1]
     """
-    tn = np.sum((y_pred == 0) & (y_true == 0))
-    fp = np.sum((y_pred == 1) & (y_true == 0))
+    _, fp, _, tn = binary_counts(y_true, y_pred)
     
     denominator = tn + fp
     if denominator == 0:
@@ -153,12 +167,14 @@ def print_classification_report(y_true: np.ndarray, y_pred: np.ndarray) -> None:
         y_true: True binary labels (0 or 1)
         y_pred: Predicted binary labels (0 or 1)
     """
-    acc = accuracy(y_true, y_pred)
-    prec = precision(y_true, y_pred)
-    rec = recall(y_true, y_pred)
-    f1 = f1_score(y_true, y_pred)
-    spec = specificity(y_true, y_pred)
+    # One pass over the data; every metric below is derived from the counts
     tp, fp, fn, tn = confusion_matrix(y_true, y_pred)
+    total = tp + fp + fn + tn
+    acc = (tp + tn) / total if total > 0 else 0.0
+    prec = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+    rec = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+    f1 = 2 * tp / (2 * tp + fp + fn) if (2 * tp + fp + fn) > 0 else 0.0
+    spec = tn / (tn + fp) if (tn + fp) > 0 else 0.0
     
     print("\n" + "=" * 60)
     print("CLASSIFICATION REPORT (BINARY)")
@@ -182,12 +198,18 @@ def print_classification_report(y_true: np.ndarray, y_pred: np.ndarray) -> None:
 # Multiclass classification metrics
 # ============================================================================
 
+def _n_classes(y_true: np.ndarray, y_pred: np.ndarray) -> int:
+    """Number of classes implied by labels 0..K-1 in either array."""
+    return max(int(np.max(y_true)), int(np.max(y_pred))) + 1
+
+
 def multiclass_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray, 
                                  n_classes: Optional[int] = None) -> np.ndarray:
     """
     Calculate full confusion matrix for multiclass classification.
     
     cm[i, j] = number of samples of class i predicted as class j.
+    Built in O(n + K²) with a single ``np.bincount(K * y_true + y_pred)``.
     
     Args:
         y_true: True labels (0..K-1)
@@ -197,14 +219,14 @@ def multiclass_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray,
     Returns:
         Confusion matrix (K, K) as numpy array
     """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
     if n_classes is None:
-        n_classes = max(int(y_true.max()), int(y_pred.max())) + 1
+        n_classes = _n_classes(y_true, y_pred)
     
-    cm = np.zeros((n_classes, n_classes), dtype=int)
-    for t, p in zip(y_true, y_pred):
-        cm[int(t), int(p)] += 1
-    
-    return cm
+    return confusion_matrix_counts(y_true.astype(int, copy=False),
+                                   y_pred.astype(int, copy=False),
+                                   labels=np.arange(n_classes))
 
 
 def multiclass_precision(y_true: np.ndarray, y_pred: np.ndarray, 
@@ -215,28 +237,14 @@ def multiclass_precision(y_true: np.ndarray, y_pred: np.ndarray,
     Args:
         y_true: True labels (0..K-1)
         y_pred: Predicted labels (0..K-1)
-        average: 'macro' (average per-class) or 'micro' (global)
+        average: 'macro' (average per-class), 'micro' (global) or
+                 'weighted' (per-class weighted by support)
     
     Returns:
         Precision score in range [0, 1]
     """
-    n_classes = max(int(y_true.max()), int(y_pred.max())) + 1
-    cm = multiclass_confusion_matrix(y_true, y_pred, n_classes)
-    
-    if average == 'micro':
-        # Global: TP / (TP + FP) across all classes
-        tp_total = np.trace(cm)
-        fp_total = np.sum(cm) - tp_total
-        return float(tp_total / (tp_total + fp_total)) if (tp_total + fp_total) > 0 else 0.0
-    
-    # Macro: average per-class precision
-    precisions = []
-    for k in range(n_classes):
-        tp = cm[k, k]
-        fp = np.sum(cm[:, k]) - tp
-        precisions.append(float(tp / (tp + fp)) if (tp + fp) > 0 else 0.0)
-    
-    return float(np.mean(precisions))
+    cm = multiclass_confusion_matrix(y_true, y_pred)
+    return precision_recall_f1_from_cm(cm, average)[0]
 
 
 def multiclass_recall(y_true: np.ndarray, y_pred: np.ndarray,
@@ -247,28 +255,14 @@ def multiclass_recall(y_true: np.ndarray, y_pred: np.ndarray,
     Args:
         y_true: True labels (0..K-1)
         y_pred: Predicted labels (0..K-1)
-        average: 'macro' (average per-class) or 'micro' (global)
+        average: 'macro' (average per-class), 'micro' (global) or
+                 'weighted' (per-class weighted by support)
     
     Returns:
         Recall score in range [0, 1]
     """
-    n_classes = max(int(y_true.max()), int(y_pred.max())) + 1
-    cm = multiclass_confusion_matrix(y_true, y_pred, n_classes)
-    
-    if average == 'micro':
-        # Global: TP / (TP + FN) across all classes
-        tp_total = np.trace(cm)
-        fn_total = np.sum(cm) - tp_total
-        return float(tp_total / (tp_total + fn_total)) if (tp_total + fn_total) > 0 else 0.0
-    
-    # Macro: average per-class recall
-    recalls = []
-    for k in range(n_classes):
-        tp = cm[k, k]
-        fn = np.sum(cm[k, :]) - tp
-        recalls.append(float(tp / (tp + fn)) if (tp + fn) > 0 else 0.0)
-    
-    return float(np.mean(recalls))
+    cm = multiclass_confusion_matrix(y_true, y_pred)
+    return precision_recall_f1_from_cm(cm, average)[1]
 
 
 def multiclass_f1_score(y_true: np.ndarray, y_pred: np.ndarray,
@@ -276,26 +270,18 @@ def multiclass_f1_score(y_true: np.ndarray, y_pred: np.ndarray,
     """
     Calculate F1 score for multiclass classification.
     
+    Macro F1 is the mean of the per-class F1 scores.
+    
     Args:
         y_true: True labels (0..K-1)
         y_pred: Predicted labels (0..K-1)
-        average: 'macro' or 'micro'
+        average: 'macro', 'micro' or 'weighted'
     
     Returns:
         F1 score in range [0, 1]
     """
-    if average == 'micro':
-        prec = multiclass_precision(y_true, y_pred, average='micro')
-        rec = multiclass_recall(y_true, y_pred, average='micro')
-    else:
-        prec = multiclass_precision(y_true, y_pred, average='macro')
-        rec = multiclass_recall(y_true, y_pred, average='macro')
-    
-    denominator = prec + rec
-    if denominator == 0:
-        return 0.0
-    
-    return float(2 * (prec * rec) / denominator)
+    cm = multiclass_confusion_matrix(y_true, y_pred)
+    return precision_recall_f1_from_cm(cm, average)[2]
 
 
 def print_multiclass_classification_report(y_true: np.ndarray, y_pred: np.ndarray,
@@ -303,19 +289,23 @@ def print_multiclass_classification_report(y_true: np.ndarray, y_pred: np.ndarra
     """
     Print detailed multiclass classification report.
     
-    Shows per-class precision, recall, F1, support and macro/micro averages.
+    Shows per-class precision, recall, F1, support and macro/micro/weighted
+    averages. The confusion matrix is computed once and every number is
+    derived from it.
     
     Args:
         y_true: True labels (0..K-1)
         y_pred: Predicted labels (0..K-1)
         class_names: Optional list of class names for display
     """
-    n_classes = max(int(y_true.max()), int(y_pred.max())) + 1
+    cm = multiclass_confusion_matrix(y_true, y_pred)
+    n_classes = cm.shape[0]
     
     if class_names is None:
         class_names = [f"Class {k}" for k in range(n_classes)]
     
-    cm = multiclass_confusion_matrix(y_true, y_pred, n_classes)
+    precisions, recalls, f1s = precision_recall_f1_from_cm(cm, average=None)
+    supports = cm.sum(axis=1)
     
     print("\n" + "=" * 70)
     print("MULTICLASS CLASSIFICATION REPORT")
@@ -324,33 +314,18 @@ def print_multiclass_classification_report(y_true: np.ndarray, y_pred: np.ndarra
     print("-" * 70)
     
     for k in range(n_classes):
-        tp = cm[k, k]
-        fp = np.sum(cm[:, k]) - tp
-        fn = np.sum(cm[k, :]) - tp
-        support = int(np.sum(cm[k, :]))
-        
-        prec = float(tp / (tp + fp)) if (tp + fp) > 0 else 0.0
-        rec = float(tp / (tp + fn)) if (tp + fn) > 0 else 0.0
-        f1 = float(2 * prec * rec / (prec + rec)) if (prec + rec) > 0 else 0.0
-        
-        print(f"{class_names[k]:<15} {prec:>10.4f} {rec:>10.4f} {f1:>10.4f} {support:>10}")
+        print(f"{class_names[k]:<15} {precisions[k]:>10.4f} {recalls[k]:>10.4f} "
+              f"{f1s[k]:>10.4f} {int(supports[k]):>10}")
     
     print("-" * 70)
     
-    # Macro avg
-    macro_prec = multiclass_precision(y_true, y_pred, average='macro')
-    macro_rec = multiclass_recall(y_true, y_pred, average='macro')
-    macro_f1 = multiclass_f1_score(y_true, y_pred, average='macro')
-    print(f"{'Macro avg':<15} {macro_prec:>10.4f} {macro_rec:>10.4f} {macro_f1:>10.4f} {'':>10}")
-    
-    # Micro avg
-    micro_prec = multiclass_precision(y_true, y_pred, average='micro')
-    micro_rec = multiclass_recall(y_true, y_pred, average='micro')
-    micro_f1 = multiclass_f1_score(y_true, y_pred, average='micro')
-    print(f"{'Micro avg':<15} {micro_prec:>10.4f} {micro_rec:>10.4f} {micro_f1:>10.4f} {'':>10}")
+    for name, average in (('Macro avg', 'macro'), ('Micro avg', 'micro'),
+                          ('Weighted avg', 'weighted')):
+        prec, rec, f1 = precision_recall_f1_from_cm(cm, average)
+        print(f"{name:<15} {prec:>10.4f} {rec:>10.4f} {f1:>10.4f} {'':>10}")
     
     # Accuracy
-    acc = accuracy(y_true, y_pred)
+    acc = accuracy_from_cm(cm)
     print(f"\nAccuracy: {acc:.4f}")
     
     # Confusion matrix
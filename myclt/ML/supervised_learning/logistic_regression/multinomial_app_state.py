@@ -37,6 +37,7 @@ class MultinomialAppState:
     test_size: float = 0.2
     seed: int = 42
     use_scaling: bool = True
+    dtype: str = "float64"  # compute precision: "float32" or "float64"
     
     # Model hyperparameters
     learning_rate: float = 0.01
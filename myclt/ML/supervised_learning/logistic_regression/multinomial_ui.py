@@ -19,11 +19,14 @@ from .metrics import (
 )
 from .visualization import (
     plot_loss_curve, plot_multiclass_confusion_matrix, plot_multiclass_feature_importance,
-    plot_multiclass_probability_heatmap, plot_class_probability_distributions
+    plot_multiclass_probability_heatmap, plot_class_probability_distributions,
+    plot_roc_curve
 )
 from .session_adapter import MultinomialSessionAdapter
 from myclt.ML.session_storage import SessionStorage
 from myclt.ML.batch_predict import batch_predict_from_csv, batch_predict_interactive
+from myclt.ML.profiling import maybe_profile, print_profile
+from myclt.ML.visualization_utils import loss_epochs
 from myclt.common.input_validation import ask_yes_no, ask_int, ask_float, ask_choice
 from myclt.common.ui_helpers import clear_screen, print_header, pause
 
@@ -201,6 +204,7 @@ def configure_split_interactive_multinomial(s: MultinomialAppState) -> None:
     s.test_size = ask_float("Test set size (0.05-0.5):", min_val=0.05, max_val=0.5, default=0.2)
     s.seed = ask_int("Random seed:", min_val=0, max_val=10000, default=42)
     s.use_scaling = ask_yes_no("Use feature scaling (standardization)?", default=True)
+    s.dtype = "float32" if ask_yes_no("Use float32 compute mode (halves memory)?", default=(s.dtype == "float32")) else "float64"
     rebuild_split(s)
     print("✓ Split configuration updated")
 
@@ -229,22 +233,26 @@ def train_model_interactive_multinomial(s: MultinomialAppState) -> None:
             lambda_l2=s.lambda_l2
         )
         use_early_stopping = ask_yes_no("Use early stopping?", default=False)
-        if use_early_stopping:
-            n_train = len(s.X_train)
-            val_size = int(0.2 * n_train)
-            X_train_part = s.X_train[val_size:]
-            y_train_part = s.y_train[val_size:]
-            X_val = s.X_train[:val_size]
-            y_val = s.y_train[:val_size]
-            patience = ask_int("Patience (epochs without improvement):", min_val=5, max_val=200, default=50)
-            s.model.fit_with_early_stopping(X_train_part, y_train_part, X_val, y_val, patience=patience)
-        else:
-            s.model.fit(s.X_train, s.y_train)
-        print(f"✓ Training complete ({len(s.model.loss_history)} epochs)")
+        profile = ask_yes_no("Profile training (time, memory)?", default=False)
+        with maybe_profile(profile):
+            if use_early_stopping:
+                n_train = len(s.X_train)
+                val_size = int(0.2 * n_train)
+                X_train_part = s.X_train[val_size:]
+                y_train_part = s.y_train[val_size:]
+                X_val = s.X_train[:val_size]
+                y_val = s.y_train[:val_size]
+                patience = ask_int("Patience (epochs without improvement):", min_val=5, max_val=200, default=50)
+                s.model.fit_with_early_stopping(X_train_part, y_train_part, X_val, y_val, patience=patience)
+            else:
+                s.model.fit(s.X_train, s.y_train)
+        print(f"✓ Training complete ({s.model.n_iter_} epochs)")
         print(f"  Model supports {s.model.n_classes} classes")
+        if profile:
+            print_profile(s.model)
         
         if ask_yes_no("Show loss history?", default=True):
-            plot_loss_curve(s.model.loss_history)
+            plot_loss_curve(s.model.loss_history, epochs=loss_epochs(s.model))
     except Exception as e:
         print(f"✗ Training error: {e}")
         s.model = None
@@ -389,6 +397,7 @@ def menu_data_multinomial(s: MultinomialAppState) -> None:
             s.test_size = ask_float("Test set size (0.05-0.5):", min_val=0.05, max_val=0.5, default=0.2)
             s.seed = ask_int("Random seed:", min_val=0, max_val=10000, default=42)
             s.use_scaling = ask_yes_no("Use feature scaling (standardization)?", default=True)
+            s.dtype = "float32" if ask_yes_no("Use float32 compute mode (halves memory)?", default=(s.dtype == "float32")) else "float64"
             rebuild_split(s)
             print("✓ Split configuration updated")
             pause()
@@ -682,6 +691,7 @@ def menu_visualize_multinomial(s: MultinomialAppState) -> None:
             "Plot feature coefficients per class",
             "Plot class probability distributions",
             "Plot probability heatmap",
+            "Plot one-vs-rest ROC curves (test set)",
             "Back",
         ]
         choice = ask_choice("", options)
@@ -690,7 +700,7 @@ def menu_visualize_multinomial(s: MultinomialAppState) -> None:
                 print("✗ No trained model!")
                 pause()
                 continue
-            plot_loss_curve(s.model.loss_history)
+            plot_loss_curve(s.model.loss_history, epochs=loss_epochs(s.model))
             pause()
         elif choice == 1:
             if s.model is None or s.X_test is None or s.y_test is None:
@@ -730,5 +740,14 @@ def menu_visualize_multinomial(s: MultinomialAppState) -> None:
             class_names = s.class_names if s.class_names else None
             plot_multiclass_probability_heatmap(y_proba, s.y_test, class_names)
             pause()
+        elif choice == 5:
+            if s.model is None or s.X_test is None or s.y_test is None:
+                print("✗ Need trained model and test set!")
+                pause()
+                continue
+            y_proba = s.model.predict_proba(s.X_test)
+            class_names = s.class_names if s.class_names else None
+            plot_roc_curve(s.y_test, y_proba, class_names)
+            pause()
         else:
             return
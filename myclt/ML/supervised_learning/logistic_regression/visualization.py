@@ -7,16 +7,15 @@ Uses matplotlib for professional visualizations:
     - Feature importance (coefficients)
     - Probability distribution (by class)
     - Performance metrics comparison
-    - ROC curve
+    - ROC / precision-recall curves (binary and one-vs-rest)
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Optional, Tuple, List
-from matplotlib.patches import Rectangle
 
 from .preprocessing import standardize_apply
-from ...visualization_utils import plot_loss_curve
+from .metrics import roc_curve, precision_recall_curve, auc, roc_auc_score, average_precision_score
+from ...visualization_utils import plot_loss_curve, show_figure, downsample
 
 
 # ============================================================================
@@ -33,6 +32,8 @@ def plot_confusion_matrix_heatmap(tp: int, fp: int, fn: int, tn: int) -> None:
         fn: False Negatives
         tn: True Negatives
     """
+    import matplotlib.pyplot as plt
+
     cm = np.array([[tn, fp], 
                    [fn, tp]])
     
@@ -60,7 +61,7 @@ def plot_confusion_matrix_heatmap(tp: int, fp: int, fn: int, tn: int) -> None:
     cbar.set_label("Count", fontsize=11)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 def plot_feature_coefficients(feature_names: list, coefficients: np.ndarray) -> None:
@@ -74,6 +75,8 @@ def plot_feature_coefficients(feature_names: list, coefficients: np.ndarray) ->
         feature_names: Names of features
         coefficients: Model weights for each feature
     """
+    import matplotlib.pyplot as plt
+
     if coefficients is None:
         print("No model trained yet")
         return
@@ -100,7 +103,7 @@ def plot_feature_coefficients(feature_names: list, coefficients: np.ndarray) ->
                va='center', ha='left' if v > 0 else 'right', fontsize=10)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 def plot_probability_distribution(probabilities: np.ndarray, y_true: Optional[np.ndarray] = None) -> None:
@@ -114,6 +117,8 @@ def plot_probability_distribution(probabilities: np.ndarray, y_true: Optional[np
         probabilities: Array of predicted probabilities [0, 1]
         y_true: Optional true labels for class-separated analysis
     """
+    import matplotlib.pyplot as plt
+
     if y_true is None:
         fig, ax = plt.subplots(figsize=(10, 6))
         
@@ -127,7 +132,7 @@ def plot_probability_distribution(probabilities: np.ndarray, y_true: Optional[np
         ax.grid(True, alpha=0.3)
         
         plt.tight_layout()
-        plt.show()
+        show_figure()
     else:
         fig, axes = plt.subplots(1, 2, figsize=(14, 5))
         
@@ -155,7 +160,7 @@ def plot_probability_distribution(probabilities: np.ndarray, y_true: Optional[np
         
         plt.suptitle("Probability Distribution by True Class", fontsize=14, fontweight='bold', y=1.02)
         plt.tight_layout()
-        plt.show()
+        show_figure()
 
 
 def plot_metrics_comparison(accuracy: float, precision: float, recall: float, f1: float) -> None:
@@ -168,6 +173,8 @@ def plot_metrics_comparison(accuracy: float, precision: float, recall: float, f1
         recall: Recall score [0, 1]
         f1: F1 score [0, 1]
     """
+    import matplotlib.pyplot as plt
+
     metrics = ['Accuracy', 'Precision', 'Recall', 'F1 Score']
     scores = [accuracy, precision, recall, f1]
     colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D']
@@ -191,68 +198,101 @@ def plot_metrics_comparison(accuracy: float, precision: float, recall: float, f1
     ax.legend()
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
-def plot_roc_curve(y_true: np.ndarray, y_proba: np.ndarray) -> None:
+def plot_roc_curve(y_true: np.ndarray, y_proba: np.ndarray,
+                   class_names: Optional[List[str]] = None) -> None:
     """
-    Plot ROC curve for binary classification.
+    Plot ROC curve for binary or one-vs-rest multiclass classification.
     
     Args:
-        y_true: True binary labels (0 or 1)
-        y_proba: Predicted probabilities [0, 1]
+        y_true: True labels (0 or 1 for binary, 0..K-1 for multiclass)
+        y_proba: Predicted probabilities — (n_samples,) for binary or
+                 (n_samples, K) from MultinomialLogisticRegression.predict_proba
+        class_names: Optional class names for the one-vs-rest legend
     """
-    sorted_indices = np.argsort(-y_proba)
-    y_sorted = y_true[sorted_indices]
-    
-    n_pos = np.sum(y_true == 1)
-    n_neg = np.sum(y_true == 0)
-    
-    if n_pos == 0 or n_neg == 0:
-        print("ROC curve requires both positive and negative samples")
-        return
+    import matplotlib.pyplot as plt
+
+    y_proba = np.asarray(y_proba)
+    fig, ax = plt.subplots(figsize=(8, 8))
     
-    fpr_list = [0.0]
-    tpr_list = [0.0]
+    if y_proba.ndim == 1:
+        try:
+            fpr, tpr, _ = roc_curve(y_true, y_proba)
+        except ValueError:
+            plt.close(fig)
+            print("ROC curve requires both positive and negative samples")
+            return
+        roc_auc = auc(fpr, tpr)
+        ax.plot(fpr, tpr, color='#2E86AB', lw=2.5, label=f'ROC Curve (AUC = {roc_auc:.4f})')
+        title = "ROC Curve"
+    else:
+        n_classes = y_proba.shape[1]
+        if class_names is None:
+            class_names = [f"Class {k}" for k in range(n_classes)]
+        colors = plt.cm.tab10(np.linspace(0, 1, max(n_classes, 1)))
+        for k in range(n_classes):
+            if not (0 < np.count_nonzero(y_true == k) < len(y_true)):
+                continue  # AUC undefined for this class on this test set
+            fpr, tpr, _ = roc_curve(y_true, y_proba[:, k], pos_label=k)
+            ax.plot(fpr, tpr, color=colors[k], lw=2,
+                    label=f'{class_names[k]} (AUC = {auc(fpr, tpr):.4f})')
+        try:
+            macro_auc = roc_auc_score(y_true, y_proba, average='macro')
+        except ValueError:
+            plt.close(fig)
+            print("ROC curve requires both positive and negative samples")
+            return
+        title = f"One-vs-Rest ROC Curves (macro AUC = {macro_auc:.4f})"
     
-    tp = 0
-    fp = 0
+    ax.plot([0, 1], [0, 1], color='red', lw=2, linestyle='--', label='Random Classifier (AUC = 0.5)')
     
-    for i, idx in enumerate(sorted_indices):
-        if y_sorted[i] == 1:
-            tp += 1
-        else:
-            fp += 1
-        
-        tpr = tp / n_pos if n_pos > 0 else 0
-        fpr = fp / n_neg if n_neg > 0 else 0
-        
-        fpr_list.append(fpr)
-        tpr_list.append(tpr)
+    ax.set_xlim([0.0, 1.0])
+    ax.set_ylim([0.0, 1.05])
+    ax.set_xlabel("False Positive Rate", fontsize=12)
+    ax.set_ylabel("True Positive Rate", fontsize=12)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.legend(loc="lower right", fontsize=11)
+    ax.grid(True, alpha=0.3)
     
-    fpr_list = np.array(fpr_list)
-    tpr_list = np.array(tpr_list)
+    plt.tight_layout()
+    show_figure()
+
+
+def plot_precision_recall_curve(y_true: np.ndarray, y_proba: np.ndarray) -> None:
+    """
+    Plot precision-recall curve for binary classification.
     
-    # Calculate AUC
-    auc = 0.0
-    for i in range(1, len(fpr_list)):
-        auc += (fpr_list[i] - fpr_list[i-1]) * (tpr_list[i] + tpr_list[i-1]) / 2.0
+    Args:
+        y_true: True binary labels (0 or 1)
+        y_proba: Predicted probabilities [0, 1]
+    """
+    import matplotlib.pyplot as plt
+
+    try:
+        precision, recall, _ = precision_recall_curve(y_true, y_proba)
+    except ValueError:
+        print("Precision-recall curve requires positive samples")
+        return
+    ap = average_precision_score(y_true, y_proba)
+    baseline = float(np.mean(np.asarray(y_true) == 1))
     
     fig, ax = plt.subplots(figsize=(8, 8))
     
-    ax.plot(fpr_list, tpr_list, color='#2E86AB', lw=2.5, label=f'ROC Curve (AUC = {auc:.4f})')
-    ax.plot([0, 1], [0, 1], color='red', lw=2, linestyle='--', label='Random Classifier (AUC = 0.5)')
+    ax.step(recall, precision, where='post', color='#2E86AB', lw=2.5, label=f'PR Curve (AP = {ap:.4f})')
+    ax.axhline(y=baseline, color='red', lw=2, linestyle='--', label=f'Random Classifier (AP = {baseline:.4f})')
     
     ax.set_xlim([0.0, 1.0])
     ax.set_ylim([0.0, 1.05])
-    ax.set_xlabel("False Positive Rate", fontsize=12)
-    ax.set_ylabel("True Positive Rate", fontsize=12)
-    ax.set_title("ROC Curve", fontsize=14, fontweight='bold')
-    ax.legend(loc="lower right", fontsize=11)
+    ax.set_xlabel("Recall", fontsize=12)
+    ax.set_ylabel("Precision", fontsize=12)
+    ax.set_title("Precision-Recall Curve", fontsize=14, fontweight='bold')
+    ax.legend(loc="lower left", fontsize=11)
     ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 def plot_1d_logistic_regression(x_raw: np.ndarray, y_true: np.ndarray, 
@@ -269,6 +309,8 @@ def plot_1d_logistic_regression(x_raw: np.ndarray, y_true: np.ndarray,
         scaler_mean: Optional scaling mean
         scaler_std: Optional scaling std
     """
+    import matplotlib.pyplot as plt
+
     if x_raw.ndim == 1:
         x_raw = x_raw.reshape(-1, 1)
     
@@ -285,13 +327,14 @@ def plot_1d_logistic_regression(x_raw: np.ndarray, y_true: np.ndarray,
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    jitter = np.random.normal(0, 0.02, size=len(y_true))
-    y_jittered = y_true + jitter
+    x_pts, y_pts = downsample(x_raw, y_true)
+    jitter = np.random.normal(0, 0.02, size=len(y_pts))
+    y_jittered = y_pts + jitter
     
-    mask_0 = y_true == 0
-    mask_1 = y_true == 1
-    ax.scatter(x_raw[mask_0], y_jittered[mask_0], alpha=0.5, s=50, color='#E63946', label='Class 0')
-    ax.scatter(x_raw[mask_1], y_jittered[mask_1], alpha=0.5, s=50, color='#06A77D', label='Class 1')
+    mask_0 = y_pts == 0
+    mask_1 = y_pts == 1
+    ax.scatter(x_pts[mask_0], y_jittered[mask_0], alpha=0.5, s=50, color='#E63946', label='Class 0')
+    ax.scatter(x_pts[mask_1], y_jittered[mask_1], alpha=0.5, s=50, color='#06A77D', label='Class 1')
     
     ax.plot(x_grid, y_proba, color='#2E86AB', linewidth=2.5, label='Logistic Curve')
     
@@ -305,7 +348,7 @@ def plot_1d_logistic_regression(x_raw: np.ndarray, y_true: np.ndarray,
     ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 # ============================================================================
@@ -320,6 +363,8 @@ def plot_multiclass_confusion_matrix(cm: np.ndarray, class_names: Optional[List[
         cm: Confusion matrix (K, K) where cm[i,j] = count of class i predicted as class j
         class_names: Optional list of class names for labels
     """
+    import matplotlib.pyplot as plt
+
     n_classes = cm.shape[0]
     
     if class_names is None:
@@ -349,7 +394,7 @@ def plot_multiclass_confusion_matrix(cm: np.ndarray, class_names: Optional[List[
     cbar.set_label("Count", fontsize=11)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 def plot_multiclass_probability_heatmap(probabilities: np.ndarray, y_true: np.ndarray,
@@ -367,6 +412,9 @@ def plot_multiclass_probability_heatmap(probabilities: np.ndarray, y_true: np.nd
         class_names: Optional list of class names
         n_samples_to_show: Number of samples to display (default 20)
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Rectangle
+
     n_classes = probabilities.shape[1]
     n_show = min(n_samples_to_show, probabilities.shape[0])
     
@@ -404,7 +452,7 @@ def plot_multiclass_probability_heatmap(probabilities: np.ndarray, y_true: np.nd
     cbar.set_label("Probability", fontsize=11)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 def plot_multiclass_feature_importance(feature_names: List[str], W: np.ndarray,
@@ -419,6 +467,8 @@ def plot_multiclass_feature_importance(feature_names: List[str], W: np.ndarray,
         W: Weight matrix (n_features, n_classes)
         class_names: Optional list of class names
     """
+    import matplotlib.pyplot as plt
+
     n_features, n_classes = W.shape
     
     if class_names is None:
@@ -448,7 +498,7 @@ def plot_multiclass_feature_importance(feature_names: List[str], W: np.ndarray,
     
     plt.suptitle("Feature Coefficients per Class", fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 def plot_class_probability_distributions(probabilities: np.ndarray, y_true: np.ndarray,
@@ -464,6 +514,8 @@ def plot_class_probability_distributions(probabilities: np.ndarray, y_true: np.n
         y_true: True labels (n_samples,)
         class_names: Optional list of class names
     """
+    import matplotlib.pyplot as plt
+
     n_classes = probabilities.shape[1]
     
     if class_names is None:
@@ -503,4 +555,4 @@ def plot_class_probability_distributions(probabilities: np.ndarray, y_true: np.n
     
     plt.suptitle("Predicted Probability Distributions by True Class", fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.show()
+    show_figure()
@@ -7,6 +7,7 @@ Provides from-scratch implementations of:
         LinearSVM       — Binary linear SVM (hinge loss + gradient descent)
         KernelSVM       — Binary non-linear SVM (kernel trick + dual GD)
         OneVsRestSVM    — Multiclass SVM via One-vs-Rest strategy
+        MulticlassLinearSVM — Multiclass linear SVM (Crammer–Singer, joint loss)
 
     REGRESSION:
         LinearSVR       — Linear Support Vector Regression (ε-insensitive loss)
@@ -30,6 +31,7 @@ from .core import (
     LinearSVM,
     KernelSVM,
     OneVsRestSVM,
+    MulticlassLinearSVM,
     LinearSVR,
     KernelSVR,
     get_kernel,
@@ -16,7 +16,7 @@ import numpy as np
 from .data import Dataset, Prepareddata
 from .core import LinearSVM, KernelSVM, LinearSVR, KernelSVR
 from .preprocessing import train_test_split, standardize_fit, standardize_apply
-from myclt.ML.base_models import universal_rebuild_split, universal_print_status
+from myclt.ML.base_models import universal_rebuild_split, universal_print_status, SUPPORTED_DTYPES
 
 
 @dataclass
@@ -40,6 +40,7 @@ class AppState:
     test_size: float = 0.2
     seed: int = 42
     use_scaling: bool = True
+    dtype: str = "float64"  # compute precision: "float32" or "float64"
 
     # === Model hyperparameters ===
     
@@ -87,6 +88,9 @@ class AppState:
     # Mode: 'classifier' or 'regressor'
     mode: str = "classifier"
 
+    # Original labels of the encoded 0/1 target (classifiers, e.g. ["no", "yes"])
+    class_names: Optional[List[str]] = None
+
     # Valid model types for validation
     VALID_MODEL_TYPES = {"linear_svm", "kernel_svm", "linear_svr", "kernel_svr"}
 
@@ -111,6 +115,8 @@ class AppState:
             raise ValueError(f"learning_rate must be > 0, got {self.learning_rate}")
         if self.epochs < 1:
             raise ValueError(f"epochs must be >= 1, got {self.epochs}")
+        if self.dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"dtype must be one of {SUPPORTED_DTYPES}, got '{self.dtype}'")
 
     def reset_metrics(self) -> None:
         """Clear all evaluation metrics."""
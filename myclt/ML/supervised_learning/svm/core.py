@@ -7,6 +7,7 @@ Provides from-scratch implementations of:
         ─ LinearSVM:        Binary linear SVM with hinge loss + SGD
         ─ KernelSVM:        Binary non-linear SVM with kernel trick + primal RKHS GD
         ─ OneVsRestSVM:     Multiclass wrapper (OvR) for any binary SVM
+        ─ MulticlassLinearSVM: Multiclass linear SVM (Crammer–Singer), one W for all classes
 
     REGRESSION (SVR):
         ─ LinearSVR:        Linear Support Vector Regression (epsilon-insensitive)
@@ -27,9 +28,14 @@ Example:
 """
 
 import numpy as np
+from functools import partial
 from typing import Optional, Tuple, List, Dict, Any, Callable
 import warnings
 
+from myclt.ML.base_models import resolve_dtype
+from myclt.ML.base_training import StepFn, run_training_loop, gradient_norm
+from myclt.ML.profiling import count, profiled
+
 
 # ============================================================================
 # Kernel functions
@@ -50,11 +56,16 @@ def _polynomial_kernel(X1: np.ndarray, X2: np.ndarray,
 def _rbf_kernel(X1: np.ndarray, X2: np.ndarray, gamma: float = 1.0) -> np.ndarray:
     """RBF (Gaussian) kernel: K(x, z) = exp(-γ · ||x - z||²)"""
     # ||x - z||² = ||x||² + ||z||² - 2·x·z
-    X1_norm = np.sum(X1 ** 2, axis=1, keepdims=True)  # (n1, 1)
-    X2_norm = np.sum(X2 ** 2, axis=1, keepdims=True)  # (n2, 1)
-    distances = X1_norm + X2_norm.T - 2.0 * (X1 @ X2.T)
-    distances = np.maximum(distances, 0.0)  # Numerical safety
-    return np.exp(-gamma * distances)
+    # Built in place in the (n1, n2) Gram buffer: no extra O(n²) temporaries
+    X1_norm = np.einsum('ij,ij->i', X1, X1)[:, None]  # (n1, 1)
+    X2_norm = np.einsum('ij,ij->i', X2, X2)[None, :]  # (1, n2)
+    K = X1 @ X2.T
+    K *= -2.0
+    K += X1_norm
+    K += X2_norm
+    np.maximum(K, 0.0, out=K)  # Numerical safety
+    K *= -gamma
+    return np.exp(K, out=K)
 
 
 def _sigmoid_kernel(X1: np.ndarray, X2: np.ndarray,
@@ -91,23 +102,22 @@ def get_kernel(name: str, **kernel_params) -> Callable:
 
     base_fn = KERNEL_FUNCTIONS[name]
 
+    # functools.partial over the module-level kernels (not a lambda), so
+    # models holding kernel_fn can be pickled (e.g. sent to worker processes)
     if name == 'linear':
         return base_fn
     elif name == 'poly':
-        return lambda X1, X2: base_fn(
-            X1, X2,
+        return partial(
+            base_fn,
             degree=kernel_params.get('degree', 3),
             gamma=kernel_params.get('gamma', 1.0),
             coef0=kernel_params.get('coef0', 1.0)
         )
     elif name == 'rbf':
-        return lambda X1, X2: base_fn(
-            X1, X2,
-            gamma=kernel_params.get('gamma', 1.0)
-        )
+        return partial(base_fn, gamma=kernel_params.get('gamma', 1.0))
     elif name == 'sigmoid':
-        return lambda X1, X2: base_fn(
-            X1, X2,
+        return partial(
+            base_fn,
             gamma=kernel_params.get('gamma', 1.0),
             coef0=kernel_params.get('coef0', 0.0)
         )
@@ -180,26 +190,45 @@ class BaseLinearModel:
     Provides shared gradient-descent training loop, serialisation,
     and early stopping — subclasses only implement loss/gradient logic.
 
+    The loop also stops once the TRAINING objective has converged
+    (``tol`` / ``n_iter_no_change``, see ConvergenceMonitor); the number of
+    epochs actually run is stored in ``n_iter_``. The loss is evaluated
+    every ``log_every`` epochs (see myclt.ML.base_training).
+
+    ``dtype`` selects the compute precision ("float32" / "float64");
+    None follows the training data.
+
     Attributes shared by subclasses:
-        w, b, C, learning_rate, epochs, batch_size,
-        loss_history, support_vectors, n_support_vectors, _fitted
+        w, b, C, learning_rate, epochs, batch_size, tol, n_iter_no_change,
+        dtype, n_iter_, loss_history, support_vectors, n_support_vectors,
+        _fitted
     """
 
+    # X may be a myclt.ML.sparse.CSRMatrix (only X @ w, X.T @ v and row
+    # indexing are used on it)
+    accepts_sparse = True
+
     # List of parameter names for serialisation.
     # Subclasses can extend via ``_linear_params + ['my_param']``.
     _linear_params = [
         'w', 'b', 'C', 'learning_rate', 'epochs', 'batch_size',
-        'log_every', 'n_support_vectors', '_fitted',
+        'log_every', 'tol', 'n_iter_no_change', 'dtype', 'n_iter_',
+        'n_support_vectors', '_fitted',
     ]
 
     def __init__(self, C: float = 1.0, learning_rate: float = 0.001,
                  epochs: int = 1000, batch_size: int = 0,
-                 log_every: int = 10):
+                 log_every: int = 10, tol: Optional[float] = 1e-6,
+                 n_iter_no_change: int = 10, dtype: Optional[str] = None):
         self.C = C
         self.learning_rate = learning_rate
         self.epochs = epochs
         self.batch_size = batch_size
         self.log_every = log_every
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.dtype = dtype  # compute precision (None = follow X)
+        self.n_iter_: int = 0
 
         self.w: Optional[np.ndarray] = None
         self.b: float = 0.0
@@ -221,6 +250,28 @@ class BaseLinearModel:
         """Compute gradients w.r.t. w and b."""
         raise NotImplementedError
 
+    def _loss_and_gradients(self, X: np.ndarray, y: np.ndarray,
+                            compute_loss: bool
+                            ) -> Tuple[Optional[float], np.ndarray, float]:
+        """
+        Fused loss + gradient evaluation (one forward pass).
+
+        Default: calls _compute_loss / _compute_gradients separately;
+        subclasses override to share ``X @ w`` between the two.
+        """
+        loss = self._compute_loss(X, y) if compute_loss else None
+        dw, db = self._compute_gradients(X, y)
+        return loss, dw, db
+
+    def _init_params(self, n_features: int, dtype: np.dtype) -> None:
+        """Zero-initialize the parameters (w: (n_features,), b: scalar)."""
+        self.w = np.zeros(n_features, dtype=dtype)
+        self.b = 0.0
+
+    def _cast_targets(self, y: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """Targets as used by the loss/gradients (default: compute dtype)."""
+        return np.asarray(y, dtype=dtype)
+
     # -- Shared properties --------------------------------------------------
 
     @property
@@ -252,10 +303,55 @@ class BaseLinearModel:
         """
         if not self.is_trained:
             raise RuntimeError("Model not trained yet! Call fit() first.")
-        return X @ self.w + self.b
+        return X.astype(self.w.dtype, copy=False) @ self.w + self.b
 
     # -- Shared training loop -----------------------------------------------
 
+    def _make_step(self, X: np.ndarray, y_for_grad: np.ndarray,
+                   y_for_loss: np.ndarray) -> StepFn:
+        """
+        Build the per-epoch update used by run_training_loop().
+
+        Full batch: one fused loss/gradient evaluation per epoch (the loss
+        is only computed on logging epochs). Mini-batch: one shuffled pass
+        over the data; the loss is evaluated on the full training set
+        before the pass on logging epochs.
+        """
+        n_samples = X.shape[0]
+
+        if self.batch_size <= 0 or self.batch_size >= n_samples:
+            def full_batch_step(compute_loss: bool):
+                if y_for_grad is y_for_loss:
+                    loss, dw, db = self._loss_and_gradients(X, y_for_grad, compute_loss)
+                else:
+                    loss = self._compute_loss(X, y_for_loss) if compute_loss else None
+                    dw, db = self._compute_gradients(X, y_for_grad)
+                self.w -= self.learning_rate * dw
+                self.b -= self.learning_rate * db
+                return loss, gradient_norm(dw, db)
+
+            return full_batch_step
+
+        batch_size = self.batch_size
+
+        def minibatch_step(compute_loss: bool):
+            loss = self._compute_loss(X, y_for_loss) if compute_loss else None
+
+            indices = np.random.permutation(n_samples)
+            X_shuffled = X[indices]
+            y_shuffled = y_for_grad[indices]
+
+            for start_idx in range(0, n_samples, batch_size):
+                end_idx = min(start_idx + batch_size, n_samples)
+                dw, db = self._compute_gradients(X_shuffled[start_idx:end_idx],
+                                                 y_shuffled[start_idx:end_idx])
+                self.w -= self.learning_rate * dw
+                self.b -= self.learning_rate * db
+            return loss, None
+
+        return minibatch_step
+
+    @profiled("shared_fit_loop")
     def _shared_fit_loop(self, X: np.ndarray, y_for_grad: np.ndarray,
                          y_for_loss: np.ndarray,
                          early_stopping: bool = False,
@@ -267,6 +363,11 @@ class BaseLinearModel:
         Shared gradient-descent loop used by both fit() and
         fit_with_early_stopping().
 
+        Delegates epoch bookkeeping to run_training_loop(): the training
+        (and validation) loss is evaluated every ``log_every`` epochs and
+        training stops when the objective converges (``tol``), or when the
+        validation loss stops improving for ``patience`` epochs.
+
         Args:
             X:             Training features
             y_for_grad:    Targets used in gradient computation
@@ -277,64 +378,30 @@ class BaseLinearModel:
             patience:      Patience for early stopping
             verbose:       Print progress
         """
-        n_samples, n_features = X.shape
-
-        self.w = np.zeros(n_features, dtype=float)
-        self.b = 0.0
-        self.loss_history = []
-
-        # Mini-batch setup
-        if self.batch_size <= 0 or self.batch_size >= n_samples:
-            batch_size = n_samples
-            use_minibatch = False
-        else:
-            batch_size = min(self.batch_size, n_samples)
-            use_minibatch = True
-
-        best_val_loss = float('inf')
-        patience_counter = 0
-
-        for epoch in range(1, self.epochs + 1):
-            if use_minibatch:
-                indices = np.random.permutation(n_samples)
-                X_shuffled = X[indices]
-                y_shuffled = y_for_grad[indices]
-
-                if epoch % self.log_every == 0 or epoch == 1 or epoch == self.epochs:
-                    loss = self._compute_loss(X, y_for_loss)
-                    self.loss_history.append(loss)
-
-                for start_idx in range(0, n_samples, batch_size):
-                    end_idx = min(start_idx + batch_size, n_samples)
-                    X_batch = X_shuffled[start_idx:end_idx]
-                    y_batch = y_shuffled[start_idx:end_idx]
-                    dw, db = self._compute_gradients(X_batch, y_batch)
-                    self.w -= self.learning_rate * dw
-                    self.b -= self.learning_rate * db
-            else:
-                dw, db = self._compute_gradients(X, y_for_grad)
-                self.w -= self.learning_rate * dw
-                self.b -= self.learning_rate * db
-                loss = self._compute_loss(X, y_for_loss)
-                self.loss_history.append(loss)
-
-            # Early stopping logic
-            if early_stopping and X_val is not None:
-                val_loss = self._compute_loss(X_val, y_val_for_loss)
-
-                if val_loss < best_val_loss - 1e-8:
-                    best_val_loss = val_loss
-                    patience_counter = 0
-                else:
-                    patience_counter += 1
+        # Cast once to the compute dtype (keeps y_for_grad is y_for_loss)
+        dtype = resolve_dtype(self.dtype, X)
+        X = X.astype(dtype, copy=False)
+        same_targets = y_for_grad is y_for_loss
+        y_for_grad = self._cast_targets(y_for_grad, dtype)
+        y_for_loss = y_for_grad if same_targets else self._cast_targets(y_for_loss, dtype)
 
-                if verbose and epoch % 100 == 0:
-                    print(f"Epoch {epoch}: Val Loss = {val_loss:.6f}")
+        self._init_params(X.shape[1], dtype)
 
-                if patience_counter >= patience:
-                    if verbose:
-                        print(f"Early stopping at epoch {epoch}")
-                    break
+        val_loss = None
+        if early_stopping and X_val is not None:
+            X_val = X_val.astype(dtype, copy=False)
+            y_val_for_loss = self._cast_targets(y_val_for_loss, dtype)
+            val_loss = lambda: self._compute_loss(X_val, y_val_for_loss)
+
+        result = run_training_loop(
+            self._make_step(X, y_for_grad, y_for_loss), self.epochs,
+            log_every=self.log_every,
+            tol=self.tol, n_iter_no_change=self.n_iter_no_change,
+            val_loss=val_loss, patience=patience, min_delta=1e-8,
+            verbose=verbose, train_loss=lambda: self._compute_loss(X, y_for_loss),
+        )
+        self.loss_history = result.loss_history
+        self.n_iter_ = result.n_iter
 
         self._identify_support_vectors(X, y_for_loss)
         self._fitted = True
@@ -352,6 +419,7 @@ class BaseLinearModel:
 
     # -- Public fit / early stopping ----------------------------------------
 
+    @profiled("fit", attach=True)
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """
         Train the model using gradient descent.
@@ -362,6 +430,7 @@ class BaseLinearModel:
         """
         raise NotImplementedError
 
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50,
@@ -377,6 +446,21 @@ class BaseLinearModel:
         """
         raise NotImplementedError
 
+    def _partial_fit_step(self, X: np.ndarray, y_internal: np.ndarray) -> None:
+        """
+        One update on a chunk of rows (shared by subclasses' partial_fit).
+
+        Initializes ``w`` on the first call and reuses the regular step
+        (full-batch on the chunk, or mini-batches when ``batch_size`` is set).
+        Support vectors are not tracked in this mode.
+        """
+        if self.w is None:
+            self._init_params(X.shape[1], resolve_dtype(self.dtype, X))
+        X = X.astype(self.w.dtype, copy=False)
+        y_internal = self._cast_targets(y_internal, self.w.dtype)
+        self._make_step(X, y_internal, y_internal)(False)
+        self._fitted = True
+
     # -- Serialisation ------------------------------------------------------
 
     def get_params(self) -> Dict[str, Any]:
@@ -390,16 +474,19 @@ class BaseLinearModel:
                 params[key] = val.item()
             else:
                 params[key] = val
+        if self.w is not None:
+            params['dtype'] = self.w.dtype.name
         return params
 
     def set_params(self, params: Dict[str, Any]) -> None:
         """Set model parameters from loaded data."""
+        dtype = resolve_dtype(params.get('dtype'))
         for key in self._linear_params:
             if key not in params:
                 continue
             val = params[key]
             if key == 'w' and val is not None:
-                setattr(self, key, np.array(val, dtype=float))
+                setattr(self, key, np.array(val, dtype=dtype))
             elif key in ('_fitted',):
                 setattr(self, key, bool(val))
             else:
@@ -439,9 +526,13 @@ class LinearSVM(BaseLinearModel):
     model_type = "linear_svm"
 
     def __init__(self, C: float = 1.0, learning_rate: float = 0.001,
-                 epochs: int = 1000, batch_size: int = 0):
+                 epochs: int = 1000, batch_size: int = 0,
+                 tol: Optional[float] = 1e-6, n_iter_no_change: int = 10,
+                 dtype: Optional[str] = None):
         super().__init__(C=C, learning_rate=learning_rate,
-                         epochs=epochs, batch_size=batch_size)
+                         epochs=epochs, batch_size=batch_size,
+                         tol=tol, n_iter_no_change=n_iter_no_change,
+                         dtype=dtype)
         self.support_vector_labels: Optional[np.ndarray] = None
         self._label_map: Optional[Dict] = None
 
@@ -459,7 +550,7 @@ class LinearSVM(BaseLinearModel):
         """
         if not self.is_trained:
             raise RuntimeError("Model not trained yet! Call fit() first.")
-        return X @ self.w + self.b
+        return X.astype(self.w.dtype, copy=False) @ self.w + self.b
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -536,6 +627,23 @@ class LinearSVM(BaseLinearModel):
 
         return dw, db
 
+    def _loss_and_gradients(self, X: np.ndarray, y: np.ndarray,
+                            compute_loss: bool
+                            ) -> Tuple[Optional[float], np.ndarray, float]:
+        """Hinge loss and its gradients from a single ``X @ w`` pass."""
+        n = X.shape[0]
+        margins = y * (X @ self.w + self.b)
+
+        loss = None
+        if compute_loss:
+            loss = float(np.mean(np.maximum(0, 1 - margins))
+                         + (self.lambda_ / 2.0) * np.dot(self.w, self.w))
+
+        y_viol = np.where(margins < 1, y, 0.0)
+        dw = -(1.0 / n) * (X.T @ y_viol) + self.lambda_ * self.w
+        db = -(1.0 / n) * np.sum(y_viol)
+        return loss, dw, db
+
     def _identify_support_vectors(self, X: np.ndarray,
                                   y: np.ndarray) -> None:
         """Identify support vectors (points with margin ≤ 1)."""
@@ -546,6 +654,7 @@ class LinearSVM(BaseLinearModel):
         self.support_vector_labels = y[sv_mask]
         self.n_support_vectors = np.sum(sv_mask)
 
+    @profiled("fit", attach=True)
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """
         Train the Linear SVM using gradient descent.
@@ -558,6 +667,7 @@ class LinearSVM(BaseLinearModel):
         self._label_map = {'original': np.unique(y), 'svm': np.array([-1, 1])}
         self._shared_fit_loop(X, y_internal, y_internal)
 
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50,
@@ -581,10 +691,40 @@ class LinearSVM(BaseLinearModel):
             patience=patience, verbose=verbose
         )
 
+    def partial_fit(self, X: np.ndarray, y: np.ndarray,
+                    classes: Optional[np.ndarray] = None) -> "LinearSVM":
+        """
+        Update the model with one gradient step on a chunk of rows.
+
+        A chunk may contain only one class, so both labels must be passed
+        via ``classes`` on the first call (out-of-core training, see
+        myclt.ML.streaming). The larger label maps to +1.
+
+        Args:
+            X: Feature chunk (n_chunk_samples, n_features)
+            y: Target chunk (n_chunk_samples,) with labels from ``classes``
+            classes: The two class labels (required on the first call)
+
+        Returns:
+            self
+        """
+        if self._label_map is None:
+            if classes is None or len(np.unique(classes)) != 2:
+                raise ValueError(
+                    "!partial_fit() needs classes=[label0, label1] on the first call!"
+                )
+            self._label_map = {'original': np.unique(classes), 'svm': np.array([-1, 1])}
+        positive = self._label_map['original'][1]
+        self._partial_fit_step(X, np.where(y == positive, 1.0, -1.0))
+        return self
+
     def get_params(self) -> Dict[str, Any]:
         """Get all model parameters for saving."""
         params = super().get_params()
-        params['_label_map'] = self._label_map
+        params['_label_map'] = (
+            {k: v.tolist() for k, v in self._label_map.items()}
+            if self._label_map is not None else None
+        )
         if self.support_vector_labels is not None:
             params['support_vector_labels'] = self.support_vector_labels.tolist()
         else:
@@ -594,7 +734,11 @@ class LinearSVM(BaseLinearModel):
     def set_params(self, params: Dict[str, Any]) -> None:
         """Set model parameters from loaded data."""
         super().set_params(params)
-        self._label_map = params.get('_label_map')
+        label_map = params.get('_label_map')
+        self._label_map = (
+            {k: np.asarray(v) for k, v in label_map.items()}
+            if label_map is not None else None
+        )
         svl = params.get('support_vector_labels')
         self.support_vector_labels = np.array(svl, dtype=float) if svl is not None else None
 
@@ -612,9 +756,12 @@ class BaseKernelModel:
     restoration, and early stopping — subclasses only implement the
     loss/gradient logic specific to classification or regression.
 
+    ``dtype`` selects the compute precision ("float32" / "float64");
+    float32 halves the memory of the stored O(n²) kernel matrix.
+
     Attributes shared by subclasses:
         beta, b, C, kernel_name, gamma, degree, coef0,
-        learning_rate, epochs, loss_history,
+        learning_rate, epochs, dtype, loss_history,
         X_train_stored, y_train_stored,
         support_vectors, support_vector_indices, support_vector_labels,
         n_support_vectors, _fitted
@@ -623,7 +770,8 @@ class BaseKernelModel:
     def __init__(self, kernel: str = 'rbf', C: float = 1.0,
                  gamma: float = 1.0, degree: int = 3, coef0: float = 1.0,
                  learning_rate: float = 0.001, epochs: int = 1000,
-                 grad_clip: float = 10.0, log_every: int = 5):
+                 grad_clip: float = 10.0, log_every: int = 5,
+                 dtype: Optional[str] = None):
         self.kernel_name = kernel
         self.C = C
         self.gamma = gamma
@@ -633,6 +781,7 @@ class BaseKernelModel:
         self.epochs = epochs
         self.grad_clip = grad_clip
         self.log_every = log_every
+        self.dtype = dtype  # compute precision (None = follow X)
 
         # Kernel function — reconstructed by set_params(), set in __init__
         self.kernel_fn: Callable = get_kernel(
@@ -670,9 +819,14 @@ class BaseKernelModel:
 
     # -- Kernel utility -----------------------------------------------------
 
+    @profiled("kernel")
     def _compute_kernel_matrix(self, X1: np.ndarray, X2: np.ndarray) -> np.ndarray:
-        """Compute kernel matrix K(X1, X2)."""
-        return self.kernel_fn(X1, X2)
+        """Compute kernel matrix K(X1, X2) in the training dtype."""
+        if self.X_train_stored is not None:
+            X1 = X1.astype(self.X_train_stored.dtype, copy=False)
+        K = self.kernel_fn(X1, X2)
+        count(kernel_bytes=K.nbytes)
+        return K
 
     # -- Abstract hooks (must be overridden) --------------------------------
 
@@ -710,6 +864,7 @@ class BaseKernelModel:
 
     # -- Shared training loop -----------------------------------------------
 
+    @profiled("kernel_fit_loop")
     def _shared_kernel_fit_loop(
         self, X: np.ndarray, y: np.ndarray,
         early_stopping: bool = False,
@@ -730,10 +885,11 @@ class BaseKernelModel:
             verbose:        Print progress
         """
         n_samples = X.shape[0]
+        dtype = resolve_dtype(self.dtype, X)
 
-        self.X_train_stored = X.copy()
-        self.y_train_stored = y.copy().astype(float)
-        self.beta = np.zeros(n_samples, dtype=float)
+        self.X_train_stored = X.astype(dtype)  # always a copy
+        self.y_train_stored = y.astype(dtype)
+        self.beta = np.zeros(n_samples, dtype=dtype)
         self.b = 0.0
         self.loss_history = []
 
@@ -741,10 +897,12 @@ class BaseKernelModel:
         if n_samples > 5000:
             warnings.warn(
                 f"Kernel model with {n_samples} samples stores O(n²) kernel "
-                f"matrices (~{n_samples * n_samples * 8 / 1e6:.0f} MB). "
+                f"matrices (~{n_samples * n_samples * dtype.itemsize / 1e6:.0f} MB). "
                 f"For large datasets, consider LinearSVM / LinearSVR "
                 f"or reduce data size."
             )
+        X = self.X_train_stored
+        y = self.y_train_stored
         K = self._compute_kernel_matrix(X, X)
         K_val = None
         if early_stopping and X_val is not None:
@@ -753,6 +911,7 @@ class BaseKernelModel:
         best_val_loss = float('inf')
         patience_counter = 0
 
+        epoch = 0
         for epoch in range(1, self.epochs + 1):
             # Forward pass
             f = K @ self.beta + self.b
@@ -790,8 +949,12 @@ class BaseKernelModel:
                 if patience_counter >= patience:
                     if verbose:
                         print(f"Early stopping at epoch {epoch}")
+                    if epoch % self.log_every != 0 and epoch != 1:
+                        self.loss_history.append(self._compute_loss())
                     break
 
+        count(epochs=epoch)
+
         # Identify support vectors
         self._identify_kernel_support_vectors(K)
 
@@ -826,10 +989,12 @@ class BaseKernelModel:
 
     # -- Public fit / early stopping ----------------------------------------
 
+    @profiled("fit", attach=True)
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """Train the kernel model. Subclasses must override."""
         raise NotImplementedError
 
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50,
@@ -866,6 +1031,8 @@ class BaseKernelModel:
             '_fitted': self._fitted,
             'grad_clip': float(self.grad_clip),
             'log_every': int(self.log_every),
+            'dtype': (self.beta.dtype.name if self.beta is not None
+                      else self.dtype),
 
             # Training data — enables immediate predict() after restore
             'X_train_stored': (
@@ -898,8 +1065,10 @@ class BaseKernelModel:
         For memory-constrained scenarios, set ``X_train_stored = None``
         after set_params() and later restore with set_training_data().
         """
+        self.dtype = params.get('dtype', self.dtype)
+        dtype = resolve_dtype(self.dtype)
         self.beta = (
-            np.array(params['beta'], dtype=float)
+            np.array(params['beta'], dtype=dtype)
             if params.get('beta') is not None else None
         )
         self.b = float(params.get('b', 0.0))
@@ -924,9 +1093,9 @@ class BaseKernelModel:
 
         # Restore training data (if saved)
         xt = params.get('X_train_stored')
-        self.X_train_stored = np.array(xt, dtype=float) if xt is not None else None
+        self.X_train_stored = np.array(xt, dtype=dtype) if xt is not None else None
         yt = params.get('y_train_stored')
-        self.y_train_stored = np.array(yt, dtype=float) if yt is not None else None
+        self.y_train_stored = np.array(yt, dtype=dtype) if yt is not None else None
 
         # Restore support vector info
         sv_labels = params.get('support_vector_labels')
@@ -974,8 +1143,9 @@ class BaseKernelModel:
             X_train: Training feature matrix
             y_train: Training target vector
         """
-        self.X_train_stored = X_train.copy()
-        self.y_train_stored = y_train.copy().astype(float)
+        dtype = self.beta.dtype if self.beta is not None else resolve_dtype(self.dtype, X_train)
+        self.X_train_stored = X_train.astype(dtype)
+        self.y_train_stored = y_train.astype(dtype)
 
         # Re-identify support vectors from restored beta
         if self.beta is not None:
@@ -1027,11 +1197,12 @@ class KernelSVM(BaseKernelModel):
     def __init__(self, kernel: str = 'rbf', C: float = 1.0,
                  gamma: float = 1.0, degree: int = 3, coef0: float = 1.0,
                  learning_rate: float = 0.001, epochs: int = 1000,
-                 grad_clip: float = 10.0, log_every: int = 5):
+                 grad_clip: float = 10.0, log_every: int = 5,
+                 dtype: Optional[str] = None):
         super().__init__(
             kernel=kernel, C=C, gamma=gamma, degree=degree,
             coef0=coef0, learning_rate=learning_rate, epochs=epochs,
-            grad_clip=grad_clip, log_every=log_every
+            grad_clip=grad_clip, log_every=log_every, dtype=dtype
         )
 
     def decision_function(self, X: np.ndarray) -> np.ndarray:
@@ -1119,6 +1290,7 @@ class KernelSVM(BaseKernelModel):
         margins = self.y_train_stored * f_final
         return margins <= 1.0 + 1e-6
 
+    @profiled("fit", attach=True)
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """
         Train Kernel SVM by minimising the primal RKHS objective with GD.
@@ -1130,6 +1302,7 @@ class KernelSVM(BaseKernelModel):
         y_internal = _validate_binary_labels(y)
         self._shared_kernel_fit_loop(X, y_internal)
 
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50,
@@ -1195,7 +1368,8 @@ class OneVsRestSVM:
             self.base_estimator_kwargs = {
                 k: getattr(base_estimator, k)
                 for k in ['C', 'learning_rate', 'epochs', 'batch_size',
-                          'gamma', 'degree', 'coef0', 'kernel']
+                          'gamma', 'degree', 'coef0', 'kernel',
+                          'tol', 'n_iter_no_change', 'dtype']
                 if hasattr(base_estimator, k)
             }
 
@@ -1203,6 +1377,7 @@ class OneVsRestSVM:
         self.classes_: Optional[np.ndarray] = None
         self.n_classes: int = 0
         self._fitted: bool = False
+        self._inverse_mapping: Optional[Dict] = None
 
     @property
     def is_trained(self) -> bool:
@@ -1212,6 +1387,7 @@ class OneVsRestSVM:
         """Create a fresh binary estimator instance."""
         return self.base_estimator_class(**self.base_estimator_kwargs)
 
+    @profiled("fit", attach=True)
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """
         Train one binary SVM per class (One-vs-Rest).
@@ -1331,7 +1507,17 @@ class OneVsRestSVM:
         else:
             self.classes_ = None
 
+        # Same label remapping as fit()
+        if self.classes_ is not None and not np.array_equal(self.classes_, np.arange(self.n_classes)):
+            self._inverse_mapping = dict(enumerate(self.classes_.tolist()))
+        else:
+            self._inverse_mapping = None
+
         self.base_estimator_kwargs = params.get('base_estimator_kwargs', {'C': 1.0})
+        estimator_classes = {cls.__name__: cls for cls in (LinearSVM, KernelSVM)}
+        self.base_estimator_class = estimator_classes.get(
+            params.get('base_estimator_class'), self.base_estimator_class
+        )
 
         # Restore estimators
         self.estimators = []
@@ -1341,6 +1527,7 @@ class OneVsRestSVM:
             est.set_params(est_params)
             self.estimators.append(est)
 
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50,
@@ -1396,6 +1583,304 @@ class OneVsRestSVM:
         self._fitted = True
 
 
+# ============================================================================
+# MulticlassLinearSVM — Multiclass SVM (Crammer–Singer)
+# ============================================================================
+
+class MulticlassLinearSVM(BaseLinearModel):
+    """
+    Multiclass linear SVM with the joint Crammer–Singer hinge loss.
+
+    Unlike OneVsRestSVM (K binary SVMs, K passes over X per epoch), one
+    weight matrix is trained for all classes and every batch is scored
+    with a single ``X @ W``.
+
+    Mathematical model:
+        s(x) = x · W + b                    W: (n_features, K), b: (K,)
+        y_hat = argmax_k s_k(x)
+
+    Loss function (primal form):
+        L = (1/n) · Σ max(0, 1 + max_{r≠y_i} s_r(x_i) - s_{y_i}(x_i)) + (λ/2) · ||W||²
+
+    where λ = 1/C. Each margin-violating sample pushes its true class
+    up and its strongest rival class down.
+
+    ``w`` holds W and ``b`` the per-class intercepts, so the shared
+    training loop (full batch / mini-batches, convergence, early stopping)
+    is the one of LinearSVM.
+
+    Example:
+        >>> model = MulticlassLinearSVM(C=1.0, learning_rate=0.01, epochs=500)
+        >>> model.fit(X_train, y_train)               # y can have 3+ classes
+        >>> preds = model.predict(X_test)
+        >>> scores = model.decision_function(X_test)  # (n_samples, n_classes)
+    """
+
+    model_type = "multiclass_linear_svm"
+
+    def __init__(self, C: float = 1.0, learning_rate: float = 0.001,
+                 epochs: int = 1000, batch_size: int = 0,
+                 tol: Optional[float] = 1e-6, n_iter_no_change: int = 10,
+                 dtype: Optional[str] = None):
+        super().__init__(C=C, learning_rate=learning_rate,
+                         epochs=epochs, batch_size=batch_size,
+                         tol=tol, n_iter_no_change=n_iter_no_change,
+                         dtype=dtype)
+        self.classes_: Optional[np.ndarray] = None
+        self.n_classes: int = 0
+        self.support_vector_labels: Optional[np.ndarray] = None
+
+    # -- Labels ---------------------------------------------------------------
+
+    def _set_classes(self, classes: np.ndarray) -> None:
+        classes = np.unique(classes)
+        if len(classes) < 2:
+            raise ValueError(f"!Need at least 2 classes, found {len(classes)}!")
+        self.classes_ = classes
+        self.n_classes = len(classes)
+
+    def _encode(self, y: np.ndarray) -> np.ndarray:
+        """Map labels to column indices 0..K-1 of W."""
+        y = np.asarray(y)
+        idx = np.searchsorted(self.classes_, y)
+        idx[idx == self.n_classes] = 0
+        unknown = self.classes_[idx] != y
+        if np.any(unknown):
+            raise ValueError(f"!Unknown class labels: {np.unique(y[unknown]).tolist()}!")
+        return idx
+
+    @property
+    def _labels_are_indices(self) -> bool:
+        return np.array_equal(self.classes_, np.arange(self.n_classes))
+
+    def _init_params(self, n_features: int, dtype: np.dtype) -> None:
+        self.w = np.zeros((n_features, self.n_classes), dtype=dtype)
+        self.b = np.zeros(self.n_classes, dtype=dtype)
+
+    def _cast_targets(self, y: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        return np.asarray(y, dtype=np.intp)
+
+    # -- Prediction -----------------------------------------------------------
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute the class scores s(x) = x·W + b.
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+
+        Returns:
+            Score matrix (n_samples, n_classes)
+        """
+        if not self.is_trained:
+            raise RuntimeError("Model not trained yet! Call fit() first.")
+        return X.astype(self.w.dtype, copy=False) @ self.w + self.b
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict class labels using argmax over the class scores.
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+
+        Returns:
+            Predicted class labels (n_samples,); indices 0..K-1 when the
+            training labels were 0..K-1
+        """
+        predictions = np.argmax(self.decision_function(X), axis=1)
+        if not self._labels_are_indices:
+            predictions = self.classes_[predictions]
+        return predictions
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Get pseudo-probabilities via softmax of the class scores.
+
+        Like OneVsRestSVM.predict_proba these are normalized scores, not
+        calibrated probabilities.
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+
+        Returns:
+            Probability-like matrix (n_samples, n_classes), rows sum to 1
+        """
+        scores = self.decision_function(X)
+        scores -= np.max(scores, axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= np.sum(scores, axis=1, keepdims=True)
+        return scores
+
+    # -- Loss / gradients -----------------------------------------------------
+
+    def _hinge(self, X: np.ndarray, y: np.ndarray
+               ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Crammer–Singer hinge per sample from one ``X @ W`` pass.
+
+        Returns:
+            Tuple of (rival class index, 1 + s_rival - s_true) per sample
+        """
+        rows = np.arange(X.shape[0])
+        scores = X @ self.w + self.b
+        true_scores = scores[rows, y]
+        scores[rows, y] = -np.inf
+        rival = np.argmax(scores, axis=1)
+        return rival, 1.0 + scores[rows, rival] - true_scores
+
+    def _compute_loss(self, X: np.ndarray, y: np.ndarray) -> float:
+        """
+        Compute the full primal objective (hinge + regularization).
+
+        Args:
+            X: Feature matrix
+            y: Class indices 0..K-1
+
+        Returns:
+            Total loss value
+        """
+        _, hinge = self._hinge(X, y)
+        return float(np.mean(np.maximum(0, hinge))
+                     + (self.lambda_ / 2.0) * np.vdot(self.w, self.w))
+
+    def _compute_gradients(self, X: np.ndarray, y: np.ndarray
+                           ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute gradients of the primal objective w.r.t. W and b.
+
+        For a margin-violating sample i with rival class r:
+            ∂L/∂W[:, r] += x_i,   ∂L/∂W[:, y_i] -= x_i   (same for b)
+        collected in a dense (n_samples, K) matrix G with at most two
+        non-zeros (+1 / -1) per row, so that
+            dW = (1/n) · Xᵀ G + λ·W,   db = (1/n) · Σ_i G_i
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+            y: Class indices 0..K-1
+
+        Returns:
+            Tuple of (dW, db)
+        """
+        return self._loss_and_gradients(X, y, compute_loss=False)[1:]
+
+    def _loss_and_gradients(self, X: np.ndarray, y: np.ndarray,
+                            compute_loss: bool
+                            ) -> Tuple[Optional[float], np.ndarray, np.ndarray]:
+        """Crammer–Singer loss and its gradients from a single ``X @ W`` pass."""
+        n = X.shape[0]
+        rival, hinge = self._hinge(X, y)
+
+        loss = None
+        if compute_loss:
+            loss = float(np.mean(np.maximum(0, hinge))
+                         + (self.lambda_ / 2.0) * np.vdot(self.w, self.w))
+
+        violators = np.flatnonzero(hinge > 0)
+        G = np.zeros((n, self.n_classes), dtype=self.w.dtype)
+        G[violators, rival[violators]] = 1.0
+        G[violators, y[violators]] = -1.0
+
+        dW = X.T @ G
+        dW *= 1.0 / n
+        dW += self.lambda_ * self.w
+        db = G.sum(axis=0) / n
+        return loss, dW, db
+
+    def _identify_support_vectors(self, X: np.ndarray,
+                                  y: np.ndarray) -> None:
+        """Identify support vectors (points with multiclass margin ≤ 1)."""
+        _, hinge = self._hinge(X, y)
+        sv_mask = hinge >= -1e-6
+        self.support_vectors = X[sv_mask]
+        self.support_vector_labels = self.classes_[y[sv_mask]]
+        self.n_support_vectors = int(np.sum(sv_mask))
+
+    # -- Training ---------------------------------------------------------------
+
+    @profiled("fit", attach=True)
+    def fit(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Train the multiclass SVM using gradient descent.
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+            y: Target vector (n_samples,) with 2+ unique labels
+        """
+        self._set_classes(y)
+        y_internal = self._encode(y)
+        self._shared_fit_loop(X, y_internal, y_internal)
+
+    @profiled("fit_with_early_stopping", attach=True)
+    def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
+                                X_val: np.ndarray, y_val: np.ndarray,
+                                patience: int = 50,
+                                verbose: bool = False) -> None:
+        """
+        Train with early stopping to prevent overfitting.
+
+        Args:
+            X_train, y_train: Training data
+            X_val, y_val: Validation data (labels seen in y_train)
+            patience: Number of epochs without improvement before stopping
+            verbose: Print progress information
+        """
+        self._set_classes(y_train)
+        y_train_internal = self._encode(y_train)
+        self._shared_fit_loop(
+            X_train, y_train_internal, y_train_internal,
+            early_stopping=True,
+            X_val=X_val, y_val_for_loss=self._encode(y_val),
+            patience=patience, verbose=verbose
+        )
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray,
+                    classes: Optional[np.ndarray] = None) -> "MulticlassLinearSVM":
+        """
+        Update the model with one gradient step on a chunk of rows.
+
+        A chunk may miss some classes, so all labels must be passed via
+        ``classes`` on the first call (see myclt.ML.streaming).
+
+        Args:
+            X: Feature chunk (n_chunk_samples, n_features)
+            y: Target chunk (n_chunk_samples,) with labels from ``classes``
+            classes: All class labels (required on the first call)
+
+        Returns:
+            self
+        """
+        if self.classes_ is None:
+            if classes is None:
+                raise ValueError("!partial_fit() needs classes=[...] on the first call!")
+            self._set_classes(classes)
+        self._partial_fit_step(X, self._encode(y))
+        return self
+
+    # -- Serialisation ----------------------------------------------------------
+
+    def get_params(self) -> Dict[str, Any]:
+        """Get all model parameters for saving."""
+        params = super().get_params()
+        params['classes_'] = self.classes_.tolist() if self.classes_ is not None else None
+        params['n_classes'] = int(self.n_classes)
+        params['support_vector_labels'] = (
+            self.support_vector_labels.tolist()
+            if self.support_vector_labels is not None else None
+        )
+        return params
+
+    def set_params(self, params: Dict[str, Any]) -> None:
+        """Set model parameters from loaded data."""
+        super().set_params(params)
+        classes = params.get('classes_')
+        self.classes_ = np.array(classes) if classes is not None else None
+        self.n_classes = int(params.get('n_classes', 0))
+        if self.w is not None:
+            self.b = np.asarray(self.b, dtype=self.w.dtype)
+        svl = params.get('support_vector_labels')
+        self.support_vector_labels = np.array(svl) if svl is not None else None
+
+
 # ============================================================================
 # LinearSVR — Linear Support Vector Regression
 # ============================================================================
@@ -1425,9 +1910,12 @@ class LinearSVR(BaseLinearModel):
 
     def __init__(self, C: float = 1.0, epsilon: float = 0.1,
                  learning_rate: float = 0.001, epochs: int = 1000,
-                 batch_size: int = 0):
+                 batch_size: int = 0, tol: Optional[float] = 1e-6,
+                 n_iter_no_change: int = 10, dtype: Optional[str] = None):
         super().__init__(C=C, learning_rate=learning_rate,
-                         epochs=epochs, batch_size=batch_size)
+                         epochs=epochs, batch_size=batch_size,
+                         tol=tol, n_iter_no_change=n_iter_no_change,
+                         dtype=dtype)
         self.epsilon = epsilon
 
     def predict(self, X: np.ndarray) -> np.ndarray:
@@ -1442,7 +1930,7 @@ class LinearSVR(BaseLinearModel):
         """
         if not self.is_trained:
             raise RuntimeError("Model not trained yet!")
-        return X @ self.w + self.b
+        return X.astype(self.w.dtype, copy=False) @ self.w + self.b
 
     def _compute_loss(self, X: np.ndarray, y: np.ndarray) -> float:
         """Compute the ε-insensitive loss objective."""
@@ -1478,6 +1966,24 @@ class LinearSVR(BaseLinearModel):
 
         return dw, db
 
+    def _loss_and_gradients(self, X: np.ndarray, y: np.ndarray,
+                            compute_loss: bool
+                            ) -> Tuple[Optional[float], np.ndarray, float]:
+        """ε-insensitive loss and its gradients from a single ``X @ w`` pass."""
+        n = X.shape[0]
+        residual = y - (X @ self.w + self.b)
+
+        loss = None
+        if compute_loss:
+            loss = float(np.mean(np.maximum(0, np.abs(residual) - self.epsilon))
+                         + (self.lambda_ / 2.0) * np.dot(self.w, self.w))
+
+        direction = np.where(residual > self.epsilon, 1.0,
+                             np.where(residual < -self.epsilon, -1.0, 0.0))
+        dw = -(X.T @ direction) / n + self.lambda_ * self.w
+        db = -np.mean(direction)
+        return loss, dw, db
+
     def _identify_support_vectors(self, X: np.ndarray,
                                   y: np.ndarray) -> None:
         """Identify support vectors (outside or on tube boundary)."""
@@ -1487,6 +1993,7 @@ class LinearSVR(BaseLinearModel):
         self.support_vectors = X[sv_mask]
         self.n_support_vectors = np.sum(sv_mask)
 
+    @profiled("fit", attach=True)
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """
         Train the Linear SVR model using gradient descent.
@@ -1497,6 +2004,7 @@ class LinearSVR(BaseLinearModel):
         """
         self._shared_fit_loop(X, y, y)
 
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50,
@@ -1517,6 +2025,21 @@ class LinearSVR(BaseLinearModel):
             patience=patience, verbose=verbose
         )
 
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> "LinearSVR":
+        """
+        Update the model with one gradient step on a chunk of rows
+        (out-of-core training, see myclt.ML.streaming).
+
+        Args:
+            X: Feature chunk (n_chunk_samples, n_features)
+            y: Target chunk (n_chunk_samples,)
+
+        Returns:
+            self
+        """
+        self._partial_fit_step(X, y)
+        return self
+
 
 # ============================================================================
 # KernelSVR — Non-Linear Support Vector Regression with Kernel Trick
@@ -1548,11 +2071,12 @@ class KernelSVR(BaseKernelModel):
     def __init__(self, kernel: str = 'rbf', C: float = 1.0, epsilon: float = 0.1,
                  gamma: float = 1.0, degree: int = 3, coef0: float = 1.0,
                  learning_rate: float = 0.001, epochs: int = 1000,
-                 grad_clip: float = 10.0, log_every: int = 5):
+                 grad_clip: float = 10.0, log_every: int = 5,
+                 dtype: Optional[str] = None):
         super().__init__(
             kernel=kernel, C=C, gamma=gamma, degree=degree,
             coef0=coef0, learning_rate=learning_rate, epochs=epochs,
-            grad_clip=grad_clip, log_every=log_every
+            grad_clip=grad_clip, log_every=log_every, dtype=dtype
         )
         self.epsilon = epsilon
 
@@ -1633,6 +2157,7 @@ class KernelSVR(BaseKernelModel):
         super().set_params(params)
         self.epsilon = float(params.get('epsilon', 0.1))
 
+    @profiled("fit", attach=True)
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """
         Train Kernel SVR by minimising the primal RKHS objective with GD.
@@ -1646,6 +2171,7 @@ class KernelSVR(BaseKernelModel):
         """
         self._shared_kernel_fit_loop(X, y)
 
+    @profiled("fit_with_early_stopping", attach=True)
     def fit_with_early_stopping(self, X_train: np.ndarray, y_train: np.ndarray,
                                 X_val: np.ndarray, y_val: np.ndarray,
                                 patience: int = 50,
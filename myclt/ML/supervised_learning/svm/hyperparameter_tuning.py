@@ -23,8 +23,37 @@ from typing import Dict, List, Tuple, Any, Type
 from itertools import product
 
 from .core import LinearSVM, KernelSVM, LinearSVR, KernelSVR
-from .preprocessing import standardize_fit, standardize_apply
-from .metrics import accuracy, multiclass_f1_score, mean_squared_error
+from .preprocessing import standardize_fit, standardize_apply, KFold
+from .metrics import accuracy, multiclass_f1_score, mean_squared_error, roc_auc_score
+from myclt.ML.profiling import profiled
+
+
+def _roc_auc(model, X: np.ndarray, y: np.ndarray) -> float:
+    """ROC AUC from decision scores (binary, or one-vs-rest for OneVsRestSVM)."""
+    scores = model.decision_function(X)
+    if scores.ndim == 1:
+        return roc_auc_score(y, scores, pos_label=np.max(y))
+    return roc_auc_score(y, scores, labels=getattr(model, 'classes_', None))
+
+
+# Scoring name -> (display label, scorer(model, X_test, y_test)); higher is better
+SCORERS = {
+    'f1_macro': ('F1', lambda m, X, y: multiclass_f1_score(y, m.predict(X), average='macro')),
+    'accuracy': ('accuracy', lambda m, X, y: accuracy(y, m.predict(X))),
+    'roc_auc': ('ROC AUC', _roc_auc),
+    'neg_mse': ('(neg) MSE', lambda m, X, y: -mean_squared_error(y, m.predict(X))),
+}
+
+DEFAULT_SCORING = {'classifier': 'f1_macro', 'regressor': 'neg_mse'}
+
+
+def _resolve_scoring(scoring: str, task: str) -> str:
+    """Default the scoring for the task and validate it."""
+    if scoring is None:
+        scoring = DEFAULT_SCORING[task]
+    if scoring not in SCORERS:
+        raise ValueError(f"!Unknown scoring '{scoring}'. Use one of: {list(SCORERS)}!")
+    return scoring
 
 
 def _create_model(model_class: Type, params: Dict[str, Any]):
@@ -60,98 +89,59 @@ def _create_model(model_class: Type, params: Dict[str, Any]):
     return model_class(**valid_params)
 
 
+def _make_folds(X: np.ndarray, y: np.ndarray, cv_folds: int, task: str, seed: int) -> KFold:
+    """Draw the CV folds once per search; stratified for classification."""
+    return KFold(X.shape[0], cv_folds, y=y if task == 'classifier' else None, seed=seed)
+
+
+@profiled("tuning_evaluation")
 def _evaluate_params_cv(X: np.ndarray, y: np.ndarray,
                         model_class: Type, params: Dict[str, Any],
-                        cv_folds: int = 5,
+                        folds: KFold,
                         task: str = 'classifier',
-                        verbose: bool = False) -> float:
+                        verbose: bool = False,
+                        scoring: str = None) -> float:
     """
     Evaluate a single parameter configuration using k-fold CV.
 
-    Uses random permutation of indices for fold assignment, and applies
-    stratified sampling for classification tasks to preserve class ratios.
+    The folds are precomputed by the caller (stratified for classification)
+    so every configuration is scored on the same splits.
 
     Args:
         X: Feature matrix
         y: Target vector
         model_class: Model class to evaluate
         params: Hyperparameters
-        cv_folds: Number of CV folds
+        folds: KFold of (train_idx, test_idx) index arrays
         task: 'classifier' or 'regressor'
         verbose: If True, print fold progress
+        scoring: Key of SCORERS (default: 'f1_macro' for classification,
+                 'neg_mse' for regression)
 
     Returns:
-        Mean score across folds (macro-F1 for classification, -MSE for regression)
+        Mean score across folds
     """
+    _, scorer = SCORERS[_resolve_scoring(scoring, task)]
     fold_scores = []
-    n_samples = len(X)
-
-    if task == 'classifier':
-        # Stratified k-fold: preserve class proportions in each fold
-        classes = np.unique(y)
-        class_indices = {cls: np.where(y == cls)[0] for cls in classes}
-
-        fold_indices = [[] for _ in range(cv_folds)]
-        for cls in classes:
-            cls_idx = class_indices[cls].copy()
-            np.random.shuffle(cls_idx)
-            # Distribute class samples across folds
-            splits = np.array_split(cls_idx, cv_folds)
-            for fold in range(cv_folds):
-                fold_indices[fold].extend(splits[fold].tolist())
-
-        for fold in range(cv_folds):
-            if verbose:
-                print(f"    Fold {fold + 1}/{cv_folds}", end="\r")
-
-            test_idx = np.array(fold_indices[fold], dtype=int)
-            train_idx = np.setdiff1d(np.arange(n_samples), test_idx)
-
-            X_train, y_train = X[train_idx], y[train_idx]
-            X_test, y_test = X[test_idx], y[test_idx]
-
-            # Scale
-            X_train_scaled, mean, std = standardize_fit(X_train)
-            X_test_scaled = standardize_apply(X_test, mean, std)
-
-            # Train model
-            model = _create_model(model_class, params)
-            model.fit(X_train_scaled, y_train)
-
-            # Evaluate with macro-averaged F1 (stable across all class distributions)
-            y_pred = model.predict(X_test_scaled)
-            score = multiclass_f1_score(y_test, y_pred, average='macro')
-            fold_scores.append(score)
-    else:
-        # Random permutation for regression (no stratification needed)
-        indices = np.random.permutation(n_samples)
-        fold_size = n_samples // cv_folds
-
-        for fold in range(cv_folds):
-            if verbose:
-                print(f"    Fold {fold + 1}/{cv_folds}", end="\r")
-
-            test_start = fold * fold_size
-            test_end = test_start + fold_size if fold < cv_folds - 1 else n_samples
-
-            test_indices = indices[test_start:test_end]
-            train_indices = np.concatenate([indices[:test_start], indices[test_end:]])
-
-            X_train, y_train = X[train_indices], y[train_indices]
-            X_test, y_test = X[test_indices], y[test_indices]
-
-            # Scale
-            X_train_scaled, mean, std = standardize_fit(X_train)
-            X_test_scaled = standardize_apply(X_test, mean, std)
-
-            # Train model
-            model = _create_model(model_class, params)
-            model.fit(X_train_scaled, y_train)
-
-            # Evaluate
-            y_pred = model.predict(X_test_scaled)
-            score = -mean_squared_error(y_test, y_pred)
-            fold_scores.append(score)
+    inplace = np.issubdtype(X.dtype, np.floating)
+
+    for fold, (train_idx, test_idx) in enumerate(folds):
+        if verbose:
+            print(f"    Fold {fold + 1}/{len(folds)}", end="\r")
+
+        X_train, y_train = X[train_idx], y[train_idx]
+        X_test, y_test = X[test_idx], y[test_idx]
+
+        # Scale (the fold slices are fresh copies: scale them in place)
+        X_train_scaled, mean, std = standardize_fit(X_train, out=X_train if inplace else None)
+        X_test_scaled = standardize_apply(X_test, mean, std, out=X_test if inplace else None)
+
+        # Train model
+        model = _create_model(model_class, params)
+        model.fit(X_train_scaled, y_train)
+
+        # Evaluate
+        fold_scores.append(scorer(model, X_test_scaled, y_test))
 
     if verbose:
         print()  # Clear the progress line
@@ -160,21 +150,23 @@ def _evaluate_params_cv(X: np.ndarray, y: np.ndarray,
 
 
 def _print_results(best_params: Dict[str, Any], best_score: float,
-                   task: str, search_type: str = "SEARCH") -> None:
+                   metric: str, search_type: str = "SEARCH") -> None:
     """Print formatted search results."""
-    metric = 'F1' if task == 'classifier' else '(neg) MSE'
     print(f"{'=' * 70}")
     print(f"Best params: {best_params}")
     print(f"Best {metric}: {best_score:.6f}")
     print(f"{'=' * 70}\n")
 
 
+@profiled("tuning")
 def grid_search_cv(X: np.ndarray, y: np.ndarray,
                    model_class: Type,
                    param_grid: Dict[str, List[Any]],
                    cv_folds: int = 5,
                    task: str = 'classifier',
-                   verbose: bool = True) -> Tuple[Dict[str, Any], float]:
+                   verbose: bool = True,
+                   scoring: str = None,
+                   seed: int = 42) -> Tuple[Dict[str, Any], float]:
     """
     Grid search with k-fold cross-validation.
 
@@ -189,6 +181,9 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
         cv_folds: Number of CV folds
         task: 'classifier' or 'regressor'
         verbose: Print progress
+        scoring: 'f1_macro', 'accuracy', 'roc_auc' (classifier) or
+                 'neg_mse' (regressor); default depends on task
+        seed: Random seed for the fold assignment
 
     Returns:
         Tuple of (best_params, best_score)
@@ -199,6 +194,9 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
     if not param_grid:
         raise ValueError("param_grid cannot be empty")
 
+    scoring = _resolve_scoring(scoring, task)
+    metric = SCORERS[scoring][0]
+
     param_names = list(param_grid.keys())
     param_values = [param_grid[name] for name in param_names]
 
@@ -211,6 +209,7 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
     best_params = None
 
     show_fold_progress = verbose and cv_folds > 5
+    folds = _make_folds(X, y, cv_folds, task, seed)
 
     if verbose:
         print(f"\n{'=' * 70}")
@@ -222,8 +221,8 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
         params = dict(zip(param_names, values))
 
         avg_score = _evaluate_params_cv(
-            X, y, model_class, params, cv_folds, task,
-            verbose=show_fold_progress
+            X, y, model_class, params, folds, task,
+            verbose=show_fold_progress, scoring=scoring
         )
 
         if avg_score > best_score:
@@ -231,15 +230,15 @@ def grid_search_cv(X: np.ndarray, y: np.ndarray,
             best_params = params.copy()
 
         if verbose and combo_idx % max(1, total_combinations // 10 + 1) == 0:
-            metric = 'F1' if task == 'classifier' else '(neg) MSE'
             print(f"  Progress: {combo_idx}/{total_combinations} | Best {metric}: {best_score:.6f}")
 
     if verbose:
-        _print_results(best_params, best_score, task, "GRID SEARCH")
+        _print_results(best_params, best_score, metric, "GRID SEARCH")
 
     return best_params, best_score
 
 
+@profiled("tuning")
 def random_search_cv(X: np.ndarray, y: np.ndarray,
                      model_class: Type,
                      param_distributions: Dict[str, List[Any]],
@@ -247,7 +246,8 @@ def random_search_cv(X: np.ndarray, y: np.ndarray,
                      cv_folds: int = 5,
                      task: str = 'classifier',
                      seed: int = 42,
-                     verbose: bool = True) -> Tuple[Dict[str, Any], float]:
+                     verbose: bool = True,
+                     scoring: str = None) -> Tuple[Dict[str, Any], float]:
     """
     Random search with k-fold cross-validation.
 
@@ -261,8 +261,10 @@ def random_search_cv(X: np.ndarray, y: np.ndarray,
         n_iter: Number of random combinations to test
         cv_folds: Number of CV folds
         task: 'classifier' or 'regressor'
-        seed: Random seed for reproducibility
+        seed: Random seed for the parameter sampling and fold assignment
         verbose: Print progress
+        scoring: 'f1_macro', 'accuracy', 'roc_auc' (classifier) or
+                 'neg_mse' (regressor); default depends on task
 
     Returns:
         Tuple of (best_params, best_score)
@@ -273,11 +275,15 @@ def random_search_cv(X: np.ndarray, y: np.ndarray,
     if not param_distributions:
         raise ValueError("param_distributions cannot be empty")
 
+    scoring = _resolve_scoring(scoring, task)
+    metric = SCORERS[scoring][0]
+
     rng = np.random.RandomState(seed)
     best_score = -float('inf')
     best_params = None
 
     show_fold_progress = verbose and cv_folds > 5
+    folds = _make_folds(X, y, cv_folds, task, seed)
 
     if verbose:
         print(f"\n{'=' * 70}")
@@ -290,8 +296,8 @@ def random_search_cv(X: np.ndarray, y: np.ndarray,
             params[param_name] = rng.choice(values)
 
         avg_score = _evaluate_params_cv(
-            X, y, model_class, params, cv_folds, task,
-            verbose=show_fold_progress
+            X, y, model_class, params, folds, task,
+            verbose=show_fold_progress, scoring=scoring
         )
 
         if avg_score > best_score:
@@ -299,10 +305,9 @@ def random_search_cv(X: np.ndarray, y: np.ndarray,
             best_params = params.copy()
 
         if verbose and (iteration + 1) % max(1, n_iter // 5 + 1) == 0:
-            metric = 'F1' if task == 'classifier' else '(neg) MSE'
             print(f"  Progress: {iteration + 1}/{n_iter} | Best {metric}: {best_score:.6f}")
 
     if verbose:
-        _print_results(best_params, best_score, task, "RANDOM SEARCH")
+        _print_results(best_params, best_score, metric, "RANDOM SEARCH")
 
     return best_params, best_score
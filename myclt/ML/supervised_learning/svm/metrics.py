@@ -3,6 +3,11 @@ Evaluation metrics for SVM classification and regression.
 
 Provides both classification metrics (accuracy, precision, recall, F1, confusion matrix)
 and regression metrics (MSE, MAE, R², RMSE, MAPE).
+Threshold curves (roc_curve, precision_recall_curve, roc_auc_score) for
+binary and one-vs-rest scores are re-exported from myclt.ML.base_metrics,
+as are the streaming accumulators (ConfusionMatrixAccumulator,
+RegressionAccumulator, HistogramAUCAccumulator) whose update / merge /
+result API evaluates chunked or multi-process predictions.
 
 Example:
     >>> from myclt.ML.supervised_learning.svm.metrics import accuracy, precision_recall_f1
@@ -14,7 +19,22 @@ Example:
 import warnings
 
 import numpy as np
-from typing import Optional, List
+from typing import Optional, List, Tuple
+
+from myclt.ML.base_metrics import (
+    confusion_matrix_counts,
+    binary_counts,
+    precision_recall_f1_from_cm,
+    roc_curve,
+    precision_recall_curve,
+    auc,
+    roc_auc_score,
+    average_precision_score,
+    ConfusionMatrixAccumulator,
+    RegressionAccumulator,
+    HistogramAUCAccumulator,
+    unique_labels,
+)
 
 
 # ============================================================================
@@ -43,8 +63,7 @@ def _precision_per_class(y_true: np.ndarray, y_pred: np.ndarray,
     Precision = TP / (TP + FP), where TP/FP are defined with the given
     class_label as the positive class.
     """
-    tp = int(np.sum((y_true == class_label) & (y_pred == class_label)))
-    fp = int(np.sum((y_true != class_label) & (y_pred == class_label)))
+    tp, fp, _, _ = binary_counts(y_true, y_pred, pos_label=class_label)
     if tp + fp == 0:
         return 0.0
     return tp / (tp + fp)
@@ -58,18 +77,46 @@ def _recall_per_class(y_true: np.ndarray, y_pred: np.ndarray,
     Recall = TP / (TP + FN), where TP/FN are defined with the given
     class_label as the positive class.
     """
-    tp = int(np.sum((y_true == class_label) & (y_pred == class_label)))
-    fn = int(np.sum((y_true == class_label) & (y_pred != class_label)))
+    tp, _, fn, _ = binary_counts(y_true, y_pred, pos_label=class_label)
     if tp + fn == 0:
         return 0.0
     return tp / (tp + fn)
 
 
+def _true_class_scores(y_true: np.ndarray, y_pred: np.ndarray
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-class scores for every class present in y_true (used internally).
+
+    The confusion matrix is built once over the union of labels, so
+    predictions of labels unseen in y_true still count as errors.
+
+    Returns:
+        (classes, precision, recall, f1, support) — one entry per class
+    """
+    labels = unique_labels(y_true, y_pred)
+    cm = confusion_matrix_counts(y_true, y_pred, labels=labels)
+    present = cm.sum(axis=1) > 0
+    p, r, f1 = precision_recall_f1_from_cm(cm, average=None)
+    return labels[present], p[present], r[present], f1[present], cm.sum(axis=1)[present]
+
+
+def _average(scores: np.ndarray, support: np.ndarray, average: str) -> float:
+    """Macro (unweighted) or weighted (by support) mean of per-class scores."""
+    if scores.shape[0] == 0:
+        return 0.0
+    if average == 'weighted':
+        return float(scores @ (support / support.sum()))
+    return float(scores.mean())
+
+
 def confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray,
                      labels: Optional[List[int]] = None) -> np.ndarray:
     """
     Compute confusion matrix (supports both binary and multiclass).
 
+    Built in O(n + K²) with a single ``np.bincount`` pass.
+
     Args:
         y_true: True labels
         y_pred: Predicted labels
@@ -80,16 +127,9 @@ def confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray,
         For binary [0,1] labels: [[TN, FP], [FN, TP]]
     """
     if labels is None:
-        labels = sorted(np.unique(np.concatenate([y_true, y_pred])).astype(int).tolist())
-
-    n_labels = len(labels)
-    cm = np.zeros((n_labels, n_labels), dtype=int)
-
-    for i, true_label in enumerate(labels):
-        for j, pred_label in enumerate(labels):
-            cm[i, j] = int(np.sum((y_true == true_label) & (y_pred == pred_label)))
+        labels = unique_labels(y_true, y_pred).astype(int)
 
-    return cm
+    return confusion_matrix_counts(y_true, y_pred, labels=np.asarray(labels))
 
 
 def precision_score(y_true: np.ndarray, y_pred: np.ndarray,
@@ -137,17 +177,13 @@ def f1_score(y_true: np.ndarray, y_pred: np.ndarray,
     Returns:
         F1 score (0.0 to 1.0)
     """
-    p = precision_score(y_true, y_pred, pos_label)
-    r = recall_score(y_true, y_pred, pos_label)
-    if p + r == 0:
-        return 0.0
-    return 2.0 * p * r / (p + r)
+    return precision_recall_f1(y_true, y_pred, pos_label)[2]
 
 
 def precision_recall_f1(y_true: np.ndarray, y_pred: np.ndarray,
                         pos_label: int = 1) -> tuple:
     """
-    Compute precision, recall, and F1 score in one call.
+    Compute precision, recall, and F1 score in one call (one pass over the data).
 
     Args:
         y_true: True labels
@@ -157,9 +193,10 @@ def precision_recall_f1(y_true: np.ndarray, y_pred: np.ndarray,
     Returns:
         Tuple of (precision, recall, f1)
     """
-    p = precision_score(y_true, y_pred, pos_label)
-    r = recall_score(y_true, y_pred, pos_label)
-    f1 = f1_score(y_true, y_pred, pos_label)
+    tp, fp, fn, _ = binary_counts(y_true, y_pred, pos_label=pos_label)
+    p = tp / (tp + fp) if tp + fp > 0 else 0.0
+    r = tp / (tp + fn) if tp + fn > 0 else 0.0
+    f1 = 2.0 * p * r / (p + r) if p + r > 0 else 0.0
     return p, r, f1
 
 
@@ -176,7 +213,7 @@ def classification_report(y_true: np.ndarray, y_pred: np.ndarray,
     Returns:
         Formatted classification report string
     """
-    classes = sorted(np.unique(y_true))
+    classes, precisions, recalls, f1s, supports = _true_class_scores(y_true, y_pred)
     if target_names is None:
         target_names = [str(c) for c in classes]
 
@@ -184,19 +221,17 @@ def classification_report(y_true: np.ndarray, y_pred: np.ndarray,
     lines.append(f"{'':>15} {'precision':>10} {'recall':>10} {'f1-score':>10} {'support':>10}")
     lines.append("-" * 55)
 
-    for cls, name in zip(classes, target_names):
-        p = precision_score(y_true, y_pred, pos_label=cls)
-        r = recall_score(y_true, y_pred, pos_label=cls)
-        f1 = f1_score(y_true, y_pred, pos_label=cls)
-        support = int(np.sum(y_true == cls))
-        lines.append(f"{name:>15} {p:>10.4f} {r:>10.4f} {f1:>10.4f} {support:>10}")
+    for k, name in enumerate(target_names[:len(classes)]):
+        lines.append(f"{name:>15} {precisions[k]:>10.4f} {recalls[k]:>10.4f} "
+                     f"{f1s[k]:>10.4f} {int(supports[k]):>10}")
 
     # Averages
     lines.append("-" * 55)
-    macro_p = np.mean([precision_score(y_true, y_pred, pos_label=c) for c in classes])
-    macro_r = np.mean([recall_score(y_true, y_pred, pos_label=c) for c in classes])
-    macro_f1 = np.mean([f1_score(y_true, y_pred, pos_label=c) for c in classes])
-    lines.append(f"{'macro avg':>15} {macro_p:>10.4f} {macro_r:>10.4f} {macro_f1:>10.4f} {len(y_true):>10}")
+    for label, average in (('macro avg', 'macro'), ('weighted avg', 'weighted')):
+        avg_p = _average(precisions, supports, average)
+        avg_r = _average(recalls, supports, average)
+        avg_f1 = _average(f1s, supports, average)
+        lines.append(f"{label:>15} {avg_p:>10.4f} {avg_r:>10.4f} {avg_f1:>10.4f} {len(y_true):>10}")
 
     acc = accuracy(y_true, y_pred)
     lines.append(f"{'accuracy':>15} {'':>10} {'':>10} {acc:>10.4f} {len(y_true):>10}")
@@ -216,18 +251,17 @@ def multiclass_precision(y_true: np.ndarray, y_pred: np.ndarray,
     Args:
         y_true: True labels
         y_pred: Predicted labels
-        average: 'macro' (unweighted mean) or 'micro' (global average).
+        average: 'macro' (unweighted mean), 'weighted' (mean weighted by
+                 support) or 'micro' (global average).
                  Note: micro-precision equals accuracy.
 
     Returns:
         Precision score
     """
-    classes = np.unique(y_true)
-    if average == 'macro':
-        scores = [_precision_per_class(y_true, y_pred, c) for c in classes]
-        return float(np.mean(scores))
-    else:  # micro: precision = recall = F1 = accuracy
+    if average == 'micro':  # precision = recall = F1 = accuracy
         return accuracy(y_true, y_pred)
+    _, p, _, _, support = _true_class_scores(y_true, y_pred)
+    return _average(p, support, average)
 
 
 def multiclass_recall(y_true: np.ndarray, y_pred: np.ndarray,
@@ -238,28 +272,26 @@ def multiclass_recall(y_true: np.ndarray, y_pred: np.ndarray,
     Args:
         y_true: True labels
         y_pred: Predicted labels
-        average: 'macro' (unweighted mean) or 'micro' (global average).
+        average: 'macro' (unweighted mean), 'weighted' (mean weighted by
+                 support) or 'micro' (global average).
                  Note: micro-recall equals accuracy.
 
     Returns:
         Recall score
     """
-    classes = np.unique(y_true)
-    if average == 'macro':
-        scores = [_recall_per_class(y_true, y_pred, c) for c in classes]
-        return float(np.mean(scores))
-    else:  # micro: precision = recall = F1 = accuracy
+    if average == 'micro':  # precision = recall = F1 = accuracy
         return accuracy(y_true, y_pred)
+    _, _, r, _, support = _true_class_scores(y_true, y_pred)
+    return _average(r, support, average)
 
 
 def multiclass_f1_score(y_true: np.ndarray, y_pred: np.ndarray,
                         average: str = 'macro') -> float:
-    """Compute multiclass F1 score."""
-    p = multiclass_precision(y_true, y_pred, average)
-    r = multiclass_recall(y_true, y_pred, average)
-    if p + r == 0:
-        return 0.0
-    return 2.0 * p * r / (p + r)
+    """Compute multiclass F1 score (macro = mean of per-class F1)."""
+    if average == 'micro':
+        return accuracy(y_true, y_pred)
+    _, _, _, f1, support = _true_class_scores(y_true, y_pred)
+    return _average(f1, support, average)
 
 
 def multiclass_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray,
@@ -267,6 +299,8 @@ def multiclass_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray,
     """
     Compute K×K confusion matrix for multiclass classification.
 
+    Built in O(n + K²) with a single ``np.bincount(K * y_true + y_pred)``.
+
     Args:
         y_true: True labels (0..K-1)
         y_pred: Predicted labels (0..K-1)
@@ -275,12 +309,11 @@ def multiclass_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray,
     Returns:
         Confusion matrix of shape (n_classes, n_classes)
     """
+    y_true = np.asarray(y_true).astype(int, copy=False)
+    y_pred = np.asarray(y_pred).astype(int, copy=False)
     if n_classes is None:
-        n_classes = len(np.unique(np.concatenate([y_true, y_pred])))
-    cm = np.zeros((n_classes, n_classes), dtype=int)
-    for t, p in zip(y_true, y_pred):
-        cm[int(t), int(p)] += 1
-    return cm
+        n_classes = max(int(y_true.max()), int(y_pred.max())) + 1
+    return confusion_matrix_counts(y_true, y_pred, labels=np.arange(n_classes))
 
 
 def print_multiclass_classification_report(y_true: np.ndarray, y_pred: np.ndarray,
@@ -288,13 +321,14 @@ def print_multiclass_classification_report(y_true: np.ndarray, y_pred: np.ndarra
     """
     Print a formatted multiclass classification report.
 
+    All numbers come from one confusion matrix.
+
     Args:
         y_true: True labels
         y_pred: Predicted labels
         class_names: Optional names for classes
     """
-    classes = sorted(np.unique(y_true))
-    n_classes = len(classes)
+    classes, precisions, recalls, f1s, supports = _true_class_scores(y_true, y_pred)
 
     if class_names is None:
         class_names = [f"Class {int(c)}" for c in classes]
@@ -307,26 +341,19 @@ def print_multiclass_classification_report(y_true: np.ndarray, y_pred: np.ndarra
     print(header)
     print("-" * 55)
 
-    for c, name in zip(classes, class_names):
-        # Binary one-vs-rest metrics for each class
-        y_true_bin = (y_true == c).astype(int)
-        y_pred_bin = (y_pred == c).astype(int)
-        p = precision_score(y_true_bin, y_pred_bin, pos_label=1)
-        r = recall_score(y_true_bin, y_pred_bin, pos_label=1)
-        f1 = f1_score(y_true_bin, y_pred_bin, pos_label=1)
-        support = int(np.sum(y_true == c))
-        print(f"{name:>15} {p:>10.4f} {r:>10.4f} {f1:>10.4f} {support:>10}")
+    for k, name in enumerate(class_names[:len(classes)]):
+        print(f"{name:>15} {precisions[k]:>10.4f} {recalls[k]:>10.4f} "
+              f"{f1s[k]:>10.4f} {int(supports[k]):>10}")
 
     print("-" * 55)
 
-    macro_p = multiclass_precision(y_true, y_pred, average='macro')
-    macro_r = multiclass_recall(y_true, y_pred, average='macro')
-    macro_f1 = multiclass_f1_score(y_true, y_pred, average='macro')
-    micro_f1 = multiclass_f1_score(y_true, y_pred, average='micro')
     acc = accuracy(y_true, y_pred)
-
-    print(f"{'macro avg':>15} {macro_p:>10.4f} {macro_r:>10.4f} {macro_f1:>10.4f} {len(y_true):>10}")
-    print(f"{'micro avg':>15} {'':>10} {'':>10} {micro_f1:>10.4f} {len(y_true):>10}")
+    for label, average in (('macro avg', 'macro'), ('weighted avg', 'weighted')):
+        avg_p = _average(precisions, supports, average)
+        avg_r = _average(recalls, supports, average)
+        avg_f1 = _average(f1s, supports, average)
+        print(f"{label:>15} {avg_p:>10.4f} {avg_r:>10.4f} {avg_f1:>10.4f} {len(y_true):>10}")
+    print(f"{'micro avg':>15} {'':>10} {'':>10} {acc:>10.4f} {len(y_true):>10}")
     print(f"{'accuracy':>15} {'':>10} {'':>10} {acc:>10.4f} {len(y_true):>10}")
     print("=" * 70)
 
@@ -1,21 +1,22 @@
 """
-Application state for Multiclass SVM workflow (One-vs-Rest).
+Application state for Multiclass SVM workflow (One-vs-Rest or Crammer–Singer).
 
 Manages data, model, hyperparameters, and metrics throughout the session.
 Follows the same pattern as logistic_regression/multinomial_app_state.py.
 
 Supports:
     - Multiclass SVM Classification (OneVsRestSVM with LinearSVM or KernelSVM)
+    - Multiclass Linear SVM with the joint Crammer–Singer loss (MulticlassLinearSVM)
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Union
 import numpy as np
 
 from .data import Dataset, Prepareddata
-from .core import LinearSVM, KernelSVM, OneVsRestSVM
+from .core import LinearSVM, KernelSVM, OneVsRestSVM, MulticlassLinearSVM
 from .preprocessing import train_test_split, standardize_fit, standardize_apply
-from myclt.ML.base_models import universal_rebuild_split, universal_print_status
+from myclt.ML.base_models import universal_rebuild_split, universal_print_status, SUPPORTED_DTYPES
 
 
 @dataclass
@@ -28,7 +29,7 @@ class MultinomialAppState:
         - Train/test split
         - Scaling parameters
         - Model hyperparameters (base estimator type, C, kernel, gamma, etc.)
-        - Trained OneVsRestSVM model and evaluation metrics
+        - Trained OneVsRestSVM / MulticlassLinearSVM model and evaluation metrics
         - Class names for display
     """
 
@@ -40,9 +41,10 @@ class MultinomialAppState:
     test_size: float = 0.2
     seed: int = 42
     use_scaling: bool = True
+    dtype: str = "float64"  # compute precision: "float32" or "float64"
 
     # === Model hyperparameters ===
-    base_estimator_type: str = "linear"  # 'linear' or 'kernel'
+    base_estimator_type: str = "linear"  # 'linear', 'kernel' (OvR) or 'crammer_singer'
     C: float = 1.0
     learning_rate: float = 0.001
     epochs: int = 1000
@@ -68,7 +70,7 @@ class MultinomialAppState:
     scaler_std: Optional[np.ndarray] = None
 
     # Trained model
-    model: Optional[OneVsRestSVM] = None
+    model: Optional[Union[OneVsRestSVM, MulticlassLinearSVM]] = None
 
     # Evaluation metrics
     metrics: dict = field(default_factory=dict)
@@ -81,9 +83,9 @@ class MultinomialAppState:
             self.metrics = {}
 
         # Validate model type
-        if self.base_estimator_type not in ('linear', 'kernel'):
+        if self.base_estimator_type not in ('linear', 'kernel', 'crammer_singer'):
             raise ValueError(
-                f"base_estimator_type must be 'linear' or 'kernel', "
+                f"base_estimator_type must be 'linear', 'kernel' or 'crammer_singer', "
                 f"got '{self.base_estimator_type}'"
             )
 
@@ -99,6 +101,8 @@ class MultinomialAppState:
 
         if self.epochs < 1:
             raise ValueError(f"epochs must be >= 1, got {self.epochs}")
+        if self.dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"dtype must be one of {SUPPORTED_DTYPES}, got '{self.dtype}'")
 
         if self.batch_size < 0:
             raise ValueError(f"batch_size must be >= 0, got {self.batch_size}")
@@ -135,6 +139,8 @@ def print_status(s: MultinomialAppState) -> None:
             parts.append(f"kernel={state.kernel}")
             if state.kernel == "rbf":
                 parts.append(f"γ={state.gamma}")
+        elif state.base_estimator_type == "crammer_singer":
+            parts.append("crammer-singer")
         else:
             parts.append("linear")
         return ", ".join(parts)
@@ -142,12 +148,14 @@ def print_status(s: MultinomialAppState) -> None:
     extra = ""
     if s.model is not None and s.model.is_trained:
         extra = f" | classes={s.model.n_classes}"
-        if s.model.estimators:
+        if getattr(s.model, 'estimators', None):
             total_sv = sum(
                 getattr(est, 'n_support_vectors', 0)
                 for est in s.model.estimators
             )
             extra += f" | SV={total_sv}"
+        elif isinstance(s.model, MulticlassLinearSVM):
+            extra += f" | SV={s.model.n_support_vectors}"
 
     universal_print_status(s, f"Multiclass SVM{extra}", format_metrics, format_regularization)
 
@@ -1,9 +1,9 @@
 """
-User interface helpers for Multiclass SVM (OneVsRestSVM).
+User interface helpers for Multiclass SVM (OneVsRestSVM, MulticlassLinearSVM).
 
 Provides interactive prompts and menus for multiclass SVM workflow:
     - Data loading, feature/target selection
-    - Model configuration (linear or kernel base estimator)
+    - Model configuration (linear or kernel base estimator, or Crammer–Singer)
     - Training with progress
     - Evaluation with multiclass metrics
     - Prediction (single & batch)
@@ -17,7 +17,7 @@ from typing import Optional
 
 from .multinomial_app_state import MultinomialAppState, print_status, rebuild_split
 from .data import Dataset, Prepareddata, load_csv_dataset, manual_input_dataset
-from .core import OneVsRestSVM, LinearSVM, KernelSVM
+from .core import OneVsRestSVM, MulticlassLinearSVM, LinearSVM, KernelSVM
 from .preprocessing import standardize_apply
 from .metrics import (
     accuracy, multiclass_precision, multiclass_recall, multiclass_f1_score,
@@ -26,11 +26,13 @@ from .metrics import (
 from .visualization import (
     plot_confusion_matrix,
     plot_svm_decision_boundary_2d,
-    plot_support_vector_info
+    plot_support_vector_info,
+    plot_roc_curve
 )
-from .session_adapter import OneVsRestSVMSessionAdapter
+from .session_adapter import OneVsRestSVMSessionAdapter, MulticlassLinearSVMSessionAdapter
 from myclt.ML.session_storage import SessionStorage
 from myclt.ML.batch_predict import batch_predict_from_csv
+from myclt.ML.profiling import maybe_profile, print_profile
 from myclt.common.input_validation import ask_yes_no, ask_int, ask_float, ask_choice
 from myclt.common.ui_helpers import clear_screen, print_header, pause
 from myclt.ML.base.base_data import select_features_and_target
@@ -52,14 +54,12 @@ def configure_multiclass_hyperparameters() -> dict:
     print("=" * 70)
 
     # Choose base estimator type
-    est_options = ["Linear SVM (faster)", "Kernel SVM (non-linear)"]
+    est_options = ["Linear SVM (faster)", "Kernel SVM (non-linear)",
+                   "Crammer–Singer linear SVM (one joint model, fastest for many classes)"]
     est_choice = ask_choice("Select base estimator type:", est_options)
 
     config = {}
-    if est_choice == 0:
-        config['base_estimator_type'] = 'linear'
-    else:
-        config['base_estimator_type'] = 'kernel'
+    config['base_estimator_type'] = ('linear', 'kernel', 'crammer_singer')[est_choice]
 
     # C parameter
     C = ask_float("Regularization C (0.001-1000, default=1.0):",
@@ -141,7 +141,7 @@ def select_features_interactive(s: MultinomialAppState) -> None:
         return
 
     try:
-        s.prepareddata = select_features_and_target(s.dataset)
+        s.prepareddata = select_features_and_target(s.dataset, dtype=s.dtype)
         # Validate multiclass
         n_classes = len(np.unique(s.prepareddata.Y))
         if n_classes < 2:
@@ -177,6 +177,7 @@ def configure_split_interactive(s: MultinomialAppState) -> None:
     s.test_size = ask_float("Test set size (0.05-0.5):", min_val=0.05, max_val=0.5, default=0.2)
     s.seed = ask_int("Random seed:", min_val=0, max_val=10000, default=42)
     s.use_scaling = ask_yes_no("Use feature scaling?", default=True)
+    s.dtype = "float32" if ask_yes_no("Use float32 compute mode (halves memory)?", default=(s.dtype == "float32")) else "float64"
     rebuild_split(s)
     print("✓ Split updated")
     pause()
@@ -208,27 +209,39 @@ def train_model_interactive(s: MultinomialAppState) -> None:
         return
 
     print("\n" + "=" * 70)
-    print("TRAINING MULTICLASS SVM (One-vs-Rest)")
+    print("TRAINING MULTICLASS SVM (" +
+          ("Crammer–Singer" if s.base_estimator_type == 'crammer_singer' else "One-vs-Rest") + ")")
     print("=" * 70)
 
     try:
-        if s.base_estimator_type == 'linear':
-            base_estimator = LinearSVM(C=s.C, learning_rate=s.learning_rate, epochs=s.epochs)
+        if s.base_estimator_type == 'crammer_singer':
+            s.model = MulticlassLinearSVM(C=s.C, learning_rate=s.learning_rate, epochs=s.epochs,
+                                          batch_size=s.batch_size)
         else:
-            base_estimator = KernelSVM(
-                kernel=s.kernel, C=s.C,
-                gamma=s.gamma, degree=s.degree, coef0=s.coef0,
-                learning_rate=s.learning_rate, epochs=s.epochs
-            )
-
-        s.model = OneVsRestSVM(base_estimator=base_estimator)
-        s.model.fit(s.X_train, s.y_train)
+            if s.base_estimator_type == 'linear':
+                base_estimator = LinearSVM(C=s.C, learning_rate=s.learning_rate, epochs=s.epochs)
+            else:
+                base_estimator = KernelSVM(
+                    kernel=s.kernel, C=s.C,
+                    gamma=s.gamma, degree=s.degree, coef0=s.coef0,
+                    learning_rate=s.learning_rate, epochs=s.epochs
+                )
+            s.model = OneVsRestSVM(base_estimator=base_estimator)
+        profile = ask_yes_no("Profile training (time, memory, kernel size)?", default=False)
+        with maybe_profile(profile):
+            s.model.fit(s.X_train, s.y_train)
 
         print(f"✓ Training complete!")
-        print(f"  Number of classifiers: {s.model.n_classes}")
-        for k, est in enumerate(s.model.estimators):
-            n_sv = getattr(est, 'n_support_vectors', 0)
-            print(f"  Class {k}: {n_sv} support vectors")
+        if isinstance(s.model, MulticlassLinearSVM):
+            print(f"  Classes: {s.model.n_classes} (one joint model, {s.model.n_iter_} epochs)")
+            print(f"  Support vectors: {s.model.n_support_vectors}")
+        else:
+            print(f"  Number of classifiers: {s.model.n_classes}")
+            for k, est in enumerate(s.model.estimators):
+                n_sv = getattr(est, 'n_support_vectors', 0)
+                print(f"  Class {k}: {n_sv} support vectors")
+        if profile:
+            print_profile(s.model)
         pause()
     except Exception as e:
         print(f"✗ Training error: {e}")
@@ -428,6 +441,12 @@ def menu_evaluate(s: MultinomialAppState) -> None:
             print("  • Trains K binary SVM classifiers (one per class)")
             print("  • Each: class k vs all others")
             print("  • Prediction = argmax of decision scores")
+
+            print("\nCRAMMER–SINGER STRATEGY:")
+            print("─" * 70)
+            print("  • Trains one weight matrix W (features × classes) jointly")
+            print("  • Loss: 1 + best wrong-class score − true-class score")
+            print("  • All class scores from a single X @ W per batch")
             pause()
         else:
             return
@@ -435,7 +454,8 @@ def menu_evaluate(s: MultinomialAppState) -> None:
 
 def menu_save_load(s: MultinomialAppState) -> None:
     """Save/Load multiclass SVM sessions."""
-    adapter = OneVsRestSVMSessionAdapter()
+    adapters = {a.algorithm_name: a for a in (OneVsRestSVMSessionAdapter(),
+                                              MulticlassLinearSVMSessionAdapter())}
     storage = SessionStorage()
 
     while True:
@@ -464,6 +484,7 @@ def menu_save_load(s: MultinomialAppState) -> None:
                 continue
 
             try:
+                adapter = adapters[getattr(s.model, 'model_type', 'ovr_svm')]
                 session_data, arrays = adapter.extract(s)
                 storage.save_session(session_data, f"./ml_sessions/{name}", arrays, verbose=True)
                 print(f"✓ Saved: {name}")
@@ -486,7 +507,7 @@ def menu_save_load(s: MultinomialAppState) -> None:
             name = sessions[idx]
             try:
                 sd, arrays = storage.load_session(f"./ml_sessions/{name}", verbose=True)
-                adapter.restore(sd, arrays, s)
+                adapters.get(sd.model_type, adapters['ovr_svm']).restore(sd, arrays, s)
                 print(f"✓ Loaded: {name}")
                 if s.metrics:
                     print(f"  Metrics: {', '.join(f'{k}={v:.4f}' for k, v in s.metrics.items())}")
@@ -580,6 +601,7 @@ def menu_visualize(s: MultinomialAppState) -> None:
             "Plot confusion matrix",
             "Plot decision boundary (2D only)",
             "Support vector info",
+            "Plot one-vs-rest ROC curves",
             "Back",
         ]
         choice = ask_choice("", options)
@@ -619,5 +641,19 @@ def menu_visualize(s: MultinomialAppState) -> None:
                 continue
             plot_support_vector_info(s.model)
             pause()
+        elif choice == 3:
+            if s.model is None or not s.model.is_trained:
+                print("!No model!")
+                pause()
+                continue
+            if s.X_test is None or s.y_test is None:
+                print("!No test data!")
+                pause()
+                continue
+            names = s.class_names if s.class_names else None
+            plot_roc_curve(s.y_test, s.model.decision_function(s.X_test),
+                           labels=s.model.classes_, class_names=names,
+                           title="Multiclass SVM ROC")
+            pause()
         else:
             return
@@ -5,6 +5,8 @@ Provides:
     - train_test_split()   : Split data into train/test sets
     - standardize_fit()    : Compute scaling parameters (mean, std)
     - standardize_apply()  : Apply standardization to data
+    - Scaler               : Reusable / streaming scaler (fit, partial_fit, transform(out=))
+    - KFold                : Index-only (optionally stratified) K-fold splitter
 
 All functions are re-exported from `myclt.ML.base_models` so that SVM
 users can import them locally.
@@ -20,10 +22,14 @@ from myclt.ML.base_models import (
     train_test_split,
     standardize_fit,
     standardize_apply,
+    Scaler,
+    KFold,
 )
 
 __all__ = [
     'train_test_split',
     'standardize_fit',
     'standardize_apply',
+    'Scaler',
+    'KFold',
 ]
@@ -5,6 +5,7 @@ Provides adapters for:
     - Binary LinearSVM
     - Binary KernelSVM
     - OneVsRestSVM (multiclass)
+    - MulticlassLinearSVM (multiclass, Crammer–Singer)
     - LinearSVR
     - KernelSVR
 
@@ -16,7 +17,7 @@ import ast
 from typing import List, Dict, Any, Optional
 import numpy as np
 
-from .core import LinearSVM, KernelSVM, OneVsRestSVM, LinearSVR, KernelSVR
+from .core import LinearSVM, KernelSVM, OneVsRestSVM, MulticlassLinearSVM, LinearSVR, KernelSVR
 from .data import Dataset, Prepareddata
 from . import preprocessing
 
@@ -240,3 +241,24 @@ class OneVsRestSVMSessionAdapter(BaseSessionAdapter):
 
     def validate_session(self, session_data: SessionData) -> bool:
         return super().validate_session(session_data)
+
+
+class MulticlassLinearSVMSessionAdapter(BaseSessionAdapter):
+    """Adapter for MulticlassLinearSVM (Crammer–Singer) session serialization."""
+
+    algorithm_name = "multiclass_linear_svm"
+    model_class = MulticlassLinearSVM
+    dataset_class = Dataset
+    prepareddata_class = Prepareddata
+    preprocessing_module = preprocessing
+
+    hyperparam_specs: List[Dict[str, Any]] = [
+        {"name": "C", "default": 1.0},
+        {"name": "batch_size", "default": 0},
+    ]
+
+    def restore(self, session_data: SessionData, arrays: Dict[str, np.ndarray], app_state: Any) -> None:
+        """Restore; marks the multiclass state as Crammer–Singer."""
+        super().restore(session_data, arrays, app_state)
+        if hasattr(app_state, 'base_estimator_type'):
+            app_state.base_estimator_type = 'crammer_singer'
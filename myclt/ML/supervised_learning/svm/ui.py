@@ -23,7 +23,7 @@ from .visualization import (
     plot_loss_curve, plot_confusion_matrix,
     plot_svm_decision_boundary_2d,
     plot_true_vs_pred, plot_residuals,
-    plot_svr_tube, plot_support_vector_info
+    plot_svr_tube, plot_support_vector_info, plot_roc_curve
 )
 from .session_adapter import (
     LinearSVMSessionAdapter, KernelSVMSessionAdapter,
@@ -31,6 +31,8 @@ from .session_adapter import (
 )
 from myclt.ML.session_storage import SessionStorage
 from myclt.ML.batch_predict import batch_predict_from_csv
+from myclt.ML.profiling import maybe_profile, print_profile
+from myclt.ML.visualization_utils import loss_epochs
 from myclt.common.input_validation import ask_yes_no, ask_int, ask_float, ask_choice
 from myclt.common.ui_helpers import clear_screen, print_header, pause
 
@@ -240,6 +242,7 @@ def configure_split_interactive(s: AppState) -> None:
     s.test_size = ask_float("Test set size (0.05-0.5):", min_val=0.05, max_val=0.5, default=0.2)
     s.seed = ask_int("Random seed:", min_val=0, max_val=10000, default=42)
     s.use_scaling = ask_yes_no("Use feature scaling (standardization)?", default=True)
+    s.dtype = "float32" if ask_yes_no("Use float32 compute mode (halves memory)?", default=(s.dtype == "float32")) else "float64"
     rebuild_split(s)
     print("✓ Split configuration updated")
     pause()
@@ -316,6 +319,7 @@ def train_model_interactive(s: AppState) -> None:
 
         # Optional early stopping
         use_early_stopping = ask_yes_no("Use early stopping? (validation split)", default=False)
+        profile = ask_yes_no("Profile training (time, memory, kernel size)?", default=False)
         if use_early_stopping and hasattr(s.model, 'fit_with_early_stopping'):
             n_train = len(s.X_train)
             val_size = int(0.2 * n_train)
@@ -325,25 +329,33 @@ def train_model_interactive(s: AppState) -> None:
             y_val = s.y_train[:val_size]
             patience = ask_int("Patience (epochs without improvement):",
                                min_val=5, max_val=200, default=50)
-            s.model.fit_with_early_stopping(
-                X_train_part, y_train_part, X_val, y_val,
-                patience=patience, verbose=True
-            )
+            with maybe_profile(profile):
+                s.model.fit_with_early_stopping(
+                    X_train_part, y_train_part, X_val, y_val,
+                    patience=patience, verbose=True
+                )
         else:
-            s.model.fit(s.X_train, s.y_train)
+            with maybe_profile(profile):
+                s.model.fit(s.X_train, s.y_train)
 
         print(f"✓ Training complete ({len(s.model.loss_history)} checkpoints)")
+        if hasattr(s.model, 'n_iter_'):
+            print(f"  Epochs run: {s.model.n_iter_}/{s.model.epochs}")
         if hasattr(s.model, 'n_support_vectors'):
             print(f"  Support vectors: {s.model.n_support_vectors}")
+        if profile:
+            print_profile(s.model)
 
         # Show loss history
         if s.model.loss_history and ask_yes_no("Show loss curve?", default=True):
             if s.mode == 'classifier':
                 plot_loss_curve(s.model.loss_history, ylabel="Hinge Loss",
-                                title=f"{s.model_type.upper()} Loss Curve")
+                                title=f"{s.model_type.upper()} Loss Curve",
+                                epochs=loss_epochs(s.model))
             else:
                 plot_loss_curve(s.model.loss_history, ylabel="ε-Insensitive Loss",
-                                title=f"{s.model_type.upper()} Loss Curve")
+                                title=f"{s.model_type.upper()} Loss Curve",
+                                epochs=loss_epochs(s.model))
 
     except Exception as e:
         print(f"✗ Training error: {e}")
@@ -773,6 +785,7 @@ def menu_visualize(s: AppState) -> None:
             "Plot True vs Predicted (regression)",
             "Plot residuals (regression)",
             "Support vector info",
+            "Plot ROC curve (classification)",
             "Back",
         ]
         choice = ask_choice("", options)
@@ -781,7 +794,7 @@ def menu_visualize(s: AppState) -> None:
                 print("✗ No loss history!")
                 pause()
                 continue
-            plot_loss_curve(s.model.loss_history)
+            plot_loss_curve(s.model.loss_history, epochs=loss_epochs(s.model))
             pause()
         elif choice == 1:
             if s.model is None or not s.model.is_trained:
@@ -841,5 +854,16 @@ def menu_visualize(s: AppState) -> None:
                 continue
             plot_support_vector_info(s.model)
             pause()
+        elif choice == 6:
+            if s.model is None or s.mode != 'classifier':
+                print("✗ Need trained classifier!")
+                pause()
+                continue
+            if s.X_test is None or s.y_test is None:
+                print("✗ No test data!")
+                pause()
+                continue
+            plot_roc_curve(s.y_test, s.model.decision_function(s.X_test))
+            pause()
         else:
             return
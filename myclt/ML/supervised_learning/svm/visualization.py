@@ -5,6 +5,7 @@ Provides:
     - Training loss curves
     - Decision boundary plots (2D)
     - Confusion matrices (binary + multiclass)
+    - ROC curves from decision scores (binary + one-vs-rest)
     - Support vector visualization
     - True vs Predicted (for regression)
     - Regression residual plots
@@ -13,21 +14,24 @@ Example:
     >>> from myclt.ML.supervised_learning.svm.visualization import (
     ...     plot_loss_curve, plot_svm_decision_boundary_2d
     ... )
-    >>> plot_loss_curve(model.loss_history)
+    >>> plot_loss_curve(model.loss_history, epochs=loss_epochs(model))
     >>> plot_svm_decision_boundary_2d(model, X_test, y_test)
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Optional, List
 
+from .metrics import roc_curve, auc, roc_auc_score
+from ...visualization_utils import show_figure, downsample, loss_epochs
+
 
 # ============================================================================
 # Loss Curve
 # ============================================================================
 
 def plot_loss_curve(history: List[float], ylabel: str = "Loss",
-                    title: str = "SVM Training Loss Curve") -> None:
+                    title: str = "SVM Training Loss Curve",
+                    epochs: Optional[np.ndarray] = None) -> None:
     """
     Plot training loss curve across epochs.
 
@@ -35,38 +39,142 @@ def plot_loss_curve(history: List[float], ylabel: str = "Loss",
         history: List of loss values from each epoch/checkpoint
         ylabel: Label for y-axis
         title: Title for the plot
+        epochs: Epoch number of each history entry (see
+                visualization_utils.loss_epochs); defaults to 1..len(history)
     """
+    import matplotlib.pyplot as plt
+
     if not history:
         print("No loss history to display")
         return
 
+    if epochs is None:
+        epochs = np.arange(1, len(history) + 1)
+
     plt.figure(figsize=(10, 6))
-    plt.plot(np.arange(1, len(history) + 1), history, 'b-', linewidth=2)
+    plt.plot(epochs, history, 'b-', linewidth=2)
     plt.xlabel("Epoch", fontsize=12)
     plt.ylabel(ylabel, fontsize=12)
     plt.title(title, fontsize=14)
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 # ============================================================================
 # Decision Boundary (2D)
 # ============================================================================
 
+def _is_kernel_model(model) -> bool:
+    """True for kernel models (or OvR over kernel models), whose scoring is costly."""
+    if hasattr(model, 'X_train_stored'):
+        return True
+    base = getattr(model, 'base_estimator_class', None)
+    return base is not None and hasattr(base, '_compute_kernel_matrix')
+
+
+def _labels_from_scores(scores: np.ndarray, multiclass: bool) -> np.ndarray:
+    """Class index per point, derived from decision scores (no second model pass)."""
+    if not multiclass:
+        return (scores >= 0).astype(int)  # same rule as LinearSVM/KernelSVM.predict
+    return np.argmax(scores, axis=-1)       # same rule as OneVsRestSVM.predict
+
+
+def _bilinear_upsample(coarse: np.ndarray, step: int) -> np.ndarray:
+    """Bilinear interpolation of an (nc, nc[, K]) node grid onto every step-th fine point."""
+    nc = coarse.shape[0]
+    fine = np.arange((nc - 1) * step + 1)
+    cell = np.minimum(fine // step, nc - 2)
+    t = (fine - cell * step) / step
+
+    # Interpolate along rows, then along columns
+    t_r = t.reshape(-1, *([1] * (coarse.ndim - 1)))
+    rows = coarse[cell] * (1 - t_r) + coarse[cell + 1] * t_r
+    t_c = t.reshape(1, -1, *([1] * (coarse.ndim - 2)))
+    return rows[:, cell] * (1 - t_c) + rows[:, cell + 1] * t_c
+
+
+def _decision_grid(model, xs: np.ndarray, ys: np.ndarray,
+                   adaptive: bool, coarse_step: int,
+                   levels: tuple = (-1.0, 0.0, 1.0)) -> tuple:
+    """
+    Decision scores on the xs × ys mesh, computing decision_function once per point.
+
+    Adaptive mode evaluates a coarse grid (every ``coarse_step``-th point),
+    marks the coarse cells whose corners straddle a contour level (binary)
+    or disagree on the argmax class (multiclass), grows that set by one
+    cell to catch boundaries passing between nodes, and evaluates only the
+    fine points inside it. The rest of the mesh is bilinearly interpolated,
+    which is exact for labels there since no boundary crosses those cells.
+    Features narrower than one coarse cell can be missed.
+
+    Returns:
+        (scores shaped (ny, nx) or (ny, nx, K), number of points evaluated)
+    """
+    xx, yy = np.meshgrid(xs, ys)
+    if not adaptive:
+        scores = model.decision_function(np.c_[xx.ravel(), yy.ravel()])
+        return scores.reshape(xx.shape + scores.shape[1:]), xx.size
+
+    step = coarse_step
+    node_x, node_y = xs[::step], ys[::step]
+    cx, cy = np.meshgrid(node_x, node_y)
+    coarse = model.decision_function(np.c_[cx.ravel(), cy.ravel()])
+    coarse = coarse.reshape(cx.shape + coarse.shape[1:])
+    n_evaluated = cx.size
+
+    # Coarse cells that contain (part of) a contour
+    corners = [coarse[:-1, :-1], coarse[1:, :-1], coarse[:-1, 1:], coarse[1:, 1:]]
+    if coarse.ndim == 2:
+        cmin = np.minimum.reduce(corners)
+        cmax = np.maximum.reduce(corners)
+        active = np.zeros(cmin.shape, dtype=bool)
+        for level in levels:
+            active |= (cmin <= level) & (cmax >= level)
+    else:
+        labels = [np.argmax(c, axis=-1) for c in corners]
+        active = (labels[0] != labels[1]) | (labels[0] != labels[2]) | (labels[0] != labels[3])
+
+    # Grow by one cell in every direction
+    grown = np.pad(active, 1)
+    active = (grown[1:-1, 1:-1] | grown[:-2, 1:-1] | grown[2:, 1:-1] | grown[1:-1, :-2]
+              | grown[1:-1, 2:] | grown[:-2, :-2] | grown[:-2, 2:] | grown[2:, :-2] | grown[2:, 2:])
+
+    scores = _bilinear_upsample(coarse, step)
+
+    # Fine points inside active cells (cell edges included), minus the known nodes
+    refine = np.zeros(xx.shape, dtype=bool)
+    block = np.kron(active, np.ones((step, step), dtype=bool))
+    refine[:-1, :-1] = block
+    refine[-1, :-1] = block[-1]
+    refine[:-1, -1] = block[:, -1]
+    refine[-1, -1] = block[-1, -1]
+    refine[::step, ::step] = False
+
+    if refine.any():
+        pts = np.c_[xx[refine], yy[refine]]
+        scores[refine] = model.decision_function(pts)
+        n_evaluated += pts.shape[0]
+    return scores, n_evaluated
+
+
 def plot_svm_decision_boundary_2d(model, X: np.ndarray, y: np.ndarray,
                                    title: str = "SVM Decision Boundary",
                                    feature_names: Optional[List[str]] = None,
                                    show_support_vectors: bool = True,
                                    resolution: int = 100,
-                                   cmap: str = None) -> None:
+                                   cmap: str = None,
+                                   adaptive: Optional[bool] = None,
+                                   coarse_step: int = 8) -> None:
     """
     Plot 2D decision boundary for trained SVM model.
 
-    Only works with 2 features (for visualization purposes).
+    Only works with 2 features (for visualization purposes). The decision
+    function is evaluated once per mesh point and the class regions are
+    derived from it.
 
     Args:
-        model: Trained SVM model with decision_function() and predict() methods
+        model: Trained SVM model with a decision_function() method
         X: Feature matrix (n_samples, 2) — must have exactly 2 features
         y: Target labels (0 or 1 for classification)
         title: Plot title
@@ -74,7 +182,12 @@ def plot_svm_decision_boundary_2d(model, X: np.ndarray, y: np.ndarray,
         show_support_vectors: Highlight support vectors
         resolution: Grid resolution for contour plot
         cmap: Colormap for the contour (auto-selected if None)
+        adaptive: Coarse-to-fine evaluation that only scores fine points
+                  near the boundary (default: on for kernel models)
+        coarse_step: Fine points per coarse cell side in adaptive mode
     """
+    import matplotlib.pyplot as plt
+
     if X.shape[1] != 2:
         print("✗ Decision boundary plot requires exactly 2 features")
         return
@@ -88,29 +201,33 @@ def plot_svm_decision_boundary_2d(model, X: np.ndarray, y: np.ndarray,
     if cmap is None:
         cmap = "coolwarm" if n_classes <= 2 else "tab10"
 
+    if adaptive is None:
+        adaptive = _is_kernel_model(model)
+    coarse_step = max(2, int(coarse_step))
+    if adaptive:
+        # Round up so the coarse nodes land on the mesh edges
+        resolution = -(-(resolution - 1) // coarse_step) * coarse_step + 1
+
     # Create mesh grid
     x_min, x_max = X[:, 0].min() - 0.5, X[:, 0].max() + 0.5
     y_min, y_max = X[:, 1].min() - 0.5, X[:, 1].max() + 0.5
-    xx, yy = np.meshgrid(
-        np.linspace(x_min, x_max, resolution),
-        np.linspace(y_min, y_max, resolution)
-    )
-
-    # Predict on mesh
-    grid_points = np.c_[xx.ravel(), yy.ravel()]
+    xs = np.linspace(x_min, x_max, resolution)
+    ys = np.linspace(y_min, y_max, resolution)
+    xx, yy = np.meshgrid(xs, ys)
 
     try:
-        scores = model.decision_function(grid_points).reshape(xx.shape)
-        Z = model.predict(grid_points).reshape(xx.shape)
+        scores, _ = _decision_grid(model, xs, ys, adaptive, coarse_step)
     except Exception as e:
         print(f"✗ Could not compute decision boundary: {e}")
         return
+    multiclass = scores.ndim == xx.ndim + 1
+    Z = _labels_from_scores(scores, multiclass)
 
     plt.figure(figsize=(10, 8))
 
     # Plot decision boundary and margins
     plt.contourf(xx, yy, Z, alpha=0.3, cmap=cmap, levels=np.arange(-0.5, n_classes + 0.5, 1))
-    if n_classes == 2:
+    if n_classes == 2 and not multiclass:
         plt.contour(xx, yy, scores, levels=[-1, 0, 1], colors='k',
                     linestyles=['--', '-', '--'], linewidths=[1, 2, 1])
         plt.contourf(xx, yy, scores, levels=[-1, 0, 1], alpha=0.1, colors=['blue', 'red'])
@@ -119,10 +236,11 @@ def plot_svm_decision_boundary_2d(model, X: np.ndarray, y: np.ndarray,
     colors = ['blue', 'red'] if n_classes <= 2 else [f"C{i}" for i in range(n_classes)]
     markers = ['o', 's', '^', 'D', 'v']
 
+    X_pts, y_pts = downsample(X, y)
     for i, label in enumerate(unique_labels):
-        mask = y == label
+        mask = y_pts == label
         plt.scatter(
-            X[mask, 0], X[mask, 1],
+            X_pts[mask, 0], X_pts[mask, 1],
             c=colors[i % len(colors)],
             marker=markers[i % len(markers)],
             label=f"Class {int(label)}",
@@ -149,7 +267,7 @@ def plot_svm_decision_boundary_2d(model, X: np.ndarray, y: np.ndarray,
     plt.legend(loc='best')
     plt.grid(True, alpha=0.2)
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 # ============================================================================
@@ -167,6 +285,8 @@ def plot_confusion_matrix(cm: np.ndarray,
         class_names: Optional class names for axis labels
         title: Plot title
     """
+    import matplotlib.pyplot as plt
+
     n_classes = cm.shape[0]
     if class_names is None:
         class_names = [str(i) for i in range(n_classes)]
@@ -192,7 +312,66 @@ def plot_confusion_matrix(cm: np.ndarray,
     plt.ylabel('True Label', fontsize=12)
     plt.xlabel('Predicted Label', fontsize=12)
     plt.tight_layout()
-    plt.show()
+    show_figure()
+
+
+# ============================================================================
+# ROC Curve
+# ============================================================================
+
+def plot_roc_curve(y_true: np.ndarray, scores: np.ndarray,
+                   labels: Optional[np.ndarray] = None,
+                   class_names: Optional[List[str]] = None,
+                   title: str = "ROC Curve") -> None:
+    """
+    Plot ROC curve(s) from SVM decision scores.
+
+    Args:
+        y_true: True labels
+        scores: decision_function output — (n_samples,) for a binary SVM
+                (positive class = largest label) or (n_samples, K) for
+                OneVsRestSVM (one curve per class)
+        labels: Class label of each score column (default: 0..K-1)
+        class_names: Optional class names for the legend
+        title: Plot title
+    """
+    import matplotlib.pyplot as plt
+
+    scores = np.asarray(scores)
+    plt.figure(figsize=(8, 7))
+
+    try:
+        if scores.ndim == 1:
+            fpr, tpr, _ = roc_curve(y_true, scores, pos_label=np.max(y_true))
+            plt.plot(fpr, tpr, lw=2, label=f'AUC = {auc(fpr, tpr):.4f}')
+        else:
+            n_classes = scores.shape[1]
+            if labels is None:
+                labels = np.arange(n_classes)
+            if class_names is None:
+                class_names = [str(c) for c in labels]
+            per_class = roc_auc_score(y_true, scores, average=None, labels=labels)
+            for k in range(n_classes):
+                if np.isnan(per_class[k]):
+                    continue  # class missing from y_true (or the only one present)
+                fpr, tpr, _ = roc_curve(y_true, scores[:, k], pos_label=labels[k])
+                plt.plot(fpr, tpr, lw=2, label=f'{class_names[k]} (AUC = {per_class[k]:.4f})')
+            title = f"{title} — one-vs-rest, macro AUC = {np.nanmean(per_class):.4f}"
+    except ValueError as e:
+        plt.close()
+        print(e)
+        return
+
+    plt.plot([0, 1], [0, 1], 'r--', lw=1.5, label='Random (AUC = 0.5)')
+    plt.xlim(0.0, 1.0)
+    plt.ylim(0.0, 1.05)
+    plt.xlabel('False Positive Rate', fontsize=12)
+    plt.ylabel('True Positive Rate', fontsize=12)
+    plt.title(title, fontsize=14)
+    plt.legend(loc='lower right')
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    show_figure()
 
 
 # ============================================================================
@@ -209,8 +388,10 @@ def plot_true_vs_pred(y_true: np.ndarray, y_pred: np.ndarray,
         y_pred: Predicted values
         title: Plot title
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(8, 6))
-    plt.scatter(y_true, y_pred, alpha=0.6, edgecolors='k', s=50)
+    plt.scatter(*downsample(y_true, y_pred), alpha=0.6, edgecolors='k', s=50)
 
     mn = min(float(y_true.min()), float(y_pred.min()))
     mx = max(float(y_true.max()), float(y_pred.max()))
@@ -222,7 +403,7 @@ def plot_true_vs_pred(y_true: np.ndarray, y_pred: np.ndarray,
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 # ============================================================================
@@ -239,10 +420,12 @@ def plot_residuals(y_true: np.ndarray, y_pred: np.ndarray,
         y_pred: Predicted values
         title: Plot title
     """
+    import matplotlib.pyplot as plt
+
     residuals = y_true - y_pred
 
     plt.figure(figsize=(8, 6))
-    plt.scatter(y_pred, residuals, alpha=0.6, edgecolors='k', s=50)
+    plt.scatter(*downsample(y_pred, residuals), alpha=0.6, edgecolors='k', s=50)
     plt.axhline(y=0, color='r', linestyle='--', linewidth=2)
 
     plt.xlabel("Predicted Values", fontsize=12)
@@ -250,7 +433,7 @@ def plot_residuals(y_true: np.ndarray, y_pred: np.ndarray,
     plt.title(title, fontsize=14)
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 # ============================================================================
@@ -273,14 +456,17 @@ def plot_svr_tube(X: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray,
         feature_idx: Which feature to use for x-axis
         title: Plot title
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
 
     x_vals = X[:, feature_idx]
 
-    # Sort by x for clean plotting
-    sort_idx = np.argsort(x_vals)
-    x_sorted = x_vals[sort_idx]
-    y_pred_sorted = y_pred[sort_idx]
+    # Sort by x for clean plotting (the tube is drawn from a thinned subset)
+    x_line, y_line = downsample(x_vals, y_pred)
+    sort_idx = np.argsort(x_line)
+    x_sorted = x_line[sort_idx]
+    y_pred_sorted = y_line[sort_idx]
 
     plt.plot(x_sorted, y_pred_sorted, 'b-', linewidth=2, label='Prediction')
     plt.fill_between(x_sorted,
@@ -293,10 +479,12 @@ def plot_svr_tube(X: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray,
     inside_mask = residuals <= epsilon
     outside_mask = ~inside_mask
 
-    plt.scatter(x_vals[inside_mask], y_true[inside_mask],
+    x_in, y_in = downsample(x_vals[inside_mask], y_true[inside_mask])
+    x_out, y_out = downsample(x_vals[outside_mask], y_true[outside_mask])
+    plt.scatter(x_in, y_in,
                 c='green', marker='o', s=50, alpha=0.6,
                 label='Inside tube')
-    plt.scatter(x_vals[outside_mask], y_true[outside_mask],
+    plt.scatter(x_out, y_out,
                 c='red', marker='x', s=80, alpha=0.8,
                 label='Outside tube (support vectors)')
 
@@ -306,7 +494,7 @@ def plot_svr_tube(X: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray,
     plt.legend(loc='best')
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.show()
+    show_figure()
 
 
 # ============================================================================
@@ -6,14 +6,116 @@ Provides reusable plotting functions that are model-agnostic:
     - General scatter plots for true vs predicted
     - Confusion matrices
     - Performance metrics comparisons
+    - Figure output (interactive window or headless file rendering)
 """
 
+import os
+from contextlib import contextmanager
+
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Optional, List
 
 
-def plot_loss_curve(history: List[float], ylabel: str = "Loss", title: str = "Training Loss Curve") -> None:
+# ============================================================================
+# Figure Output
+# ============================================================================
+
+# Scatter plots keep at most this many points (None = no limit)
+MAX_SCATTER_POINTS: Optional[int] = 20000
+
+# Active output file set by render_to(); None means interactive plt.show()
+_render_path: Optional[str] = None
+
+
+@contextmanager
+def render_to(path: str):
+    """
+    Redirect show_figure() to save figures to a file instead of a window.
+
+    The format is taken from the file extension (.png, .svg, ...).
+
+    Args:
+        path: Output file path
+
+    Example:
+        >>> with render_to("reports/loss.png"):
+        ...     plot_loss_curve(model.loss_history)
+    """
+    global _render_path
+    previous, _render_path = _render_path, path
+    try:
+        yield path
+    finally:
+        _render_path = previous
+
+
+def show_figure(fig=None) -> None:
+    """
+    Show the current figure, or save and close it inside render_to().
+
+    Args:
+        fig: Figure to output (default: current figure)
+    """
+    import matplotlib.pyplot as plt
+
+    if _render_path is None:
+        plt.show()
+        return
+
+    fig = fig if fig is not None else plt.gcf()
+    directory = os.path.dirname(_render_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(_render_path, dpi=100, bbox_inches="tight")
+    plt.close(fig)
+
+
+def downsample(*arrays: np.ndarray, max_points: Optional[int] = None,
+               seed: int = 0) -> tuple:
+    """
+    Randomly subsample aligned arrays down to a scatter point budget.
+
+    Rows are picked without replacement and kept in their original order,
+    so the same rows are selected from every array.
+
+    Args:
+        *arrays: Arrays sharing the same first dimension
+        max_points: Point budget (default: MAX_SCATTER_POINTS)
+        seed: Random seed for the subsample
+
+    Returns:
+        Tuple of (possibly) subsampled arrays
+    """
+    limit = MAX_SCATTER_POINTS if max_points is None else max_points
+    n = len(arrays[0])
+    if limit is None or n <= limit:
+        return arrays
+
+    keep = np.sort(np.random.default_rng(seed).choice(n, size=int(limit), replace=False))
+    return tuple(np.asarray(a)[keep] for a in arrays)
+
+
+# ============================================================================
+# Shared Plots
+# ============================================================================
+
+
+def loss_epochs(model) -> np.ndarray:
+    """
+    Epoch numbers of ``model.loss_history`` (one entry per logging checkpoint).
+
+    Args:
+        model: Trained model with loss_history (and log_every / n_iter_ if
+               the loss was only evaluated every N epochs)
+    """
+    from myclt.ML.base_training import checkpoint_epochs
+
+    n_iter = getattr(model, 'n_iter_', None) or getattr(model, 'epochs', None)
+    return checkpoint_epochs(len(model.loss_history), getattr(model, 'log_every', 1), n_iter)
+
+
+def plot_loss_curve(history: List[float], ylabel: str = "Loss", title: str = "Training Loss Curve",
+                    epochs: Optional[np.ndarray] = None) -> None:
     """
     Plot training loss curve across epochs.
     
@@ -21,21 +123,28 @@ def plot_loss_curve(history: List[float], ylabel: str = "Loss", title: str = "Tr
     Automatically detects appropriate label based on loss values.
     
     Args:
-        history: List of loss values from each epoch
+        history: List of loss values (one per logging checkpoint)
         ylabel: Label for y-axis (e.g., "MSE Loss", "Cross-Entropy Loss")
         title: Title for the plot
+        epochs: Epoch number of each history entry (see loss_epochs);
+                defaults to 1..len(history)
     """
+    import matplotlib.pyplot as plt
+
     if not history:
         print("No loss history to display")
         return
     
+    if epochs is None:
+        epochs = np.arange(1, len(history) + 1)
+    
     plt.figure()
-    plt.plot(np.arange(1, len(history) + 1), history)
+    plt.plot(epochs, history)
     plt.xlabel("Epoch")
     plt.ylabel(ylabel)
     plt.title(title)
     plt.grid(True)
-    plt.show()
+    show_figure()
 
 
 def plot_true_vs_pred(y_true: np.ndarray, y_pred: np.ndarray, title: str = "True vs Predicted") -> None:
@@ -49,8 +158,10 @@ def plot_true_vs_pred(y_true: np.ndarray, y_pred: np.ndarray, title: str = "True
         y_pred: Predicted values
         title: Title for the plot
     """
+    import matplotlib.pyplot as plt
+
     plt.figure()
-    plt.scatter(y_true, y_pred)
+    plt.scatter(*downsample(y_true, y_pred))
     
     mn = min(float(y_true.min()), float(y_pred.min()))
     mx = max(float(y_true.max()), float(y_pred.max()))
@@ -60,4 +171,4 @@ def plot_true_vs_pred(y_true: np.ndarray, y_pred: np.ndarray, title: str = "True
     plt.ylabel("y_pred")
     plt.title(title)
     plt.grid(True)
-    plt.show()
+    show_figure()
@@ -1,8 +1,13 @@
 """
 Entry point for `python -m myclt`.
+
+Without arguments the interactive menu is started; with arguments the
+scriptable command line in myclt.cli is used.
 """
 
-from myclt.main import choose_category
+import sys
+
+from myclt.cli import main
 
 if __name__ == "__main__":
-    choose_category()
+    sys.exit(main())
@@ -0,0 +1,640 @@
+"""
+Scriptable command line — ``myclt <command> ...``.
+
+Every subcommand calls the library APIs directly (core models, tuning,
+``batch_predict_from_csv``, ``SessionStorage``, the cleaner) and writes one
+JSON document to stdout; progress messages printed by the library go to
+stderr. ``serve`` logs its address to stderr and prints its metrics when
+stopped with Ctrl+C. No UI or plotting module is imported.
+
+Usage:
+    myclt                                   interactive menu
+    myclt train data.csv --target y --model logistic_regression --save run1
+    myclt tune data.csv --target y --model kernel_svm --param C=0.1,1,10 --param gamma=0.1,1
+    myclt predict run1 new_rows.csv --output predictions.csv
+    myclt evaluate run1
+    myclt export run1 run1.npz
+    myclt session list | show run1 | rm run1
+    myclt serve run1 --port 8000
+    myclt clean [--yes [--permanent]] [--manifest scan.json | --from-manifest scan.json]
+    myclt clean --min-age 7 --exclude '*.lock' --free 2G --index ~/.myclt/clean.json
+    myclt new ~/code/tool --template python --var owner=me
+
+Exit status is 0 on success and 1 on error ({"ok": false, "error": ...}).
+"""
+
+import argparse
+import ast
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_SESSIONS_DIR = "./ml_sessions"
+
+# Model task -> batch_predict_from_csv model_type
+_BATCH_TYPES = {"regression": "regression", "binary": "binary", "multiclass": "multinomial"}
+
+# Model types tuned by svm.hyperparameter_tuning
+_SVM_TUNABLE = ("linear_svm", "kernel_svm", "linear_svr", "kernel_svr")
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _to_json(obj: Any) -> Any:
+    """json.dumps fallback for numpy values."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _session_path(name: str, sessions_dir: str) -> str:
+    """A session is given either as a directory or as a name in sessions_dir."""
+    if os.path.isdir(name):
+        return name
+    path = os.path.join(sessions_dir, name)
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"!Session not found: {name}!")
+    return path
+
+
+def _parse_value(text: str) -> Any:
+    """Parse a literal (number, bool, None, ...) and fall back to the string."""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def _parse_params(items: List[str]) -> Dict[str, List[Any]]:
+    """['C=0.1,1', 'kernel=rbf'] -> {'C': [0.1, 1], 'kernel': ['rbf']}"""
+    grid = {}
+    for item in items:
+        name, sep, values = item.partition("=")
+        if not sep or not name.strip() or not values.strip():
+            raise ValueError(f"!Invalid --param '{item}', expected NAME=V1,V2,...!")
+        grid[name.strip()] = [_parse_value(v.strip()) for v in values.split(",") if v.strip()]
+    return grid
+
+
+def _load_training_data(args: argparse.Namespace, task: str):
+    """Load the CSV, select columns and encode the target for the task."""
+    from myclt.ML.base.base_data import load_csv_dataset, prepare_features_and_target
+    from myclt.ML.model_registry import encode_target
+
+    ds = load_csv_dataset(args.data, delimiter=args.delimiter)
+    features = [f.strip() for f in args.features.split(",")] if args.features else None
+    prepared = prepare_features_and_target(ds, args.target, features, dtype=args.dtype)
+    prepared.Y, class_names = encode_target(task, prepared.Y)
+    return ds, prepared, class_names
+
+
+def _scores(model: Any, X: np.ndarray) -> Optional[np.ndarray]:
+    """Probabilities if the model has them, otherwise decision scores."""
+    for method in ("predict_proba", "decision_function"):
+        if hasattr(model, method):
+            return np.asarray(getattr(model, method)(X))
+    return None
+
+
+def _class_labels(task: str, model: Any, class_names: Optional[List[str]],
+                  y: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """
+    Encoded label set of a classifier, taken from the model rather than the
+    test split (which may be missing a class the model still predicts).
+    """
+    if task == "binary":
+        return np.arange(2)
+    n_classes = int(getattr(model, "n_classes", 0) or 0) or len(class_names or ())
+    if not n_classes:
+        n_classes = int(max(np.max(y), np.max(y_pred))) + 1
+    return np.arange(n_classes)
+
+
+def evaluate_model(task: str, model: Any, X: np.ndarray, y: np.ndarray,
+                   class_names: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    Test-set metrics for a trained model.
+
+    Args:
+        task: "regression", "binary" or "multiclass"
+        model: Trained model
+        X: Features (already scaled like the training data)
+        y: Encoded targets
+        class_names: Original class labels (fallback for the class count)
+
+    Returns:
+        regression: mse, rmse, mae, r2;
+        binary: accuracy, precision, recall, f1, roc_auc;
+        multiclass: accuracy, precision/recall/f1 macro, f1_weighted, roc_auc (OvR macro)
+    """
+    from myclt.ML.base_metrics import (ConfusionMatrixAccumulator, RegressionAccumulator,
+                                       precision_recall_f1_from_cm, roc_auc_score)
+
+    y_pred = np.asarray(model.predict(X))
+    if task == "regression":
+        res = RegressionAccumulator().update(y, y_pred).result()
+        return {k: float(res[k]) for k in ("mse", "rmse", "mae", "r2")}
+
+    labels = _class_labels(task, model, class_names, y, y_pred)
+    res = ConfusionMatrixAccumulator(labels).update(y.astype(int), y_pred.astype(int)).result()
+    if task == "binary":
+        p, r, f1 = precision_recall_f1_from_cm(res["confusion_matrix"], "binary")
+        metrics = {"accuracy": res["accuracy"], "precision": p, "recall": r, "f1": f1}
+    else:
+        metrics = {"accuracy": res["accuracy"]}
+        metrics.update({k: res[k] for k in ("precision_macro", "recall_macro",
+                                            "f1_macro", "f1_weighted")})
+
+    scores = _scores(model, X)
+    if scores is not None and (task == "binary") == (scores.ndim == 1):
+        try:
+            metrics["roc_auc"] = roc_auc_score(y.astype(int), scores, labels=labels)
+        except ValueError:
+            pass  # a class is missing from the test split
+    return {k: float(v) for k, v in metrics.items()}
+
+
+def _test_arrays(state: Any):
+    """Scaled test split of a restored or freshly trained app state."""
+    if state.X_test is None or state.y_test is None:
+        raise RuntimeError("!Session has no test split!")
+    return state.X_test, np.asarray(state.y_test)
+
+
+# ============================================================================
+# Commands
+# ============================================================================
+
+def cmd_train(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.ML.model_registry import (build_model, get_spec, import_ref, new_state,
+                                         save_session_state)
+
+    spec = get_spec(args.model)
+    ds, prepared, class_names = _load_training_data(args, spec.task)
+
+    # The session keeps only the selected columns with the encoded target,
+    # so string columns never end up as object arrays in data.npz
+    columns = prepared.feature_names + [prepared.target_name]
+    ds = type(ds)(data=np.column_stack([prepared.X, prepared.Y]).astype(prepared.X.dtype),
+                  columns=columns)
+
+    state = new_state(args.model)
+    state.dataset, state.prepareddata = ds, prepared
+    state.test_size, state.seed = args.test_size, args.seed
+    state.use_scaling, state.dtype = not args.no_scaling, args.dtype
+
+    params = {
+        "learning_rate": args.lr, "epochs": args.epochs,
+        "lambda_l1": args.l1, "lambda_l2": args.l2, "threshold": args.threshold,
+        "C": args.C, "kernel": args.kernel, "gamma": args.gamma, "degree": args.degree,
+        "coef0": args.coef0, "epsilon": args.epsilon, "batch_size": args.batch_size,
+        "base_estimator_type": args.base, "dtype": args.dtype,
+    }
+    # Unset hyperparameters take the interactive defaults of the app state;
+    # set ones are mirrored on the state so the session records them
+    for name, value in params.items():
+        if hasattr(state, name):
+            if value is None:
+                params[name] = getattr(state, name)
+            else:
+                setattr(state, name, value)
+    if hasattr(state, "use_l1"):
+        state.use_l1, state.use_l2 = bool(args.l1), bool(args.l2)
+    if class_names and hasattr(state, "class_names"):
+        state.class_names = class_names
+
+    import_ref(spec.state.split(":")[0] + ":rebuild_split")(state)
+
+    from myclt.ML.profiling import maybe_profile
+
+    model = build_model(args.model, params)
+    t0 = time.perf_counter()
+    with maybe_profile(args.profile, trace_memory=args.profile == "memory"):
+        if args.early_stopping:
+            n_val = max(1, int(0.2 * len(state.X_train)))
+            model.fit_with_early_stopping(state.X_train[n_val:], state.y_train[n_val:],
+                                          state.X_train[:n_val], state.y_train[:n_val],
+                                          patience=args.early_stopping, verbose=False)
+        else:
+            model.fit(state.X_train, state.y_train)
+    seconds = time.perf_counter() - t0
+    state.model = model
+
+    state.metrics = evaluate_model(spec.task, model, *_test_arrays(state),
+                                   class_names=class_names)
+
+    session = None
+    if args.save:
+        session = args.save if os.sep in args.save else os.path.join(args.sessions_dir, args.save)
+        save_session_state(args.model, state, session)
+
+    result = {
+        "model_type": args.model, "task": spec.task,
+        "n_train": int(len(state.X_train)), "n_test": int(len(state.X_test)),
+        "features": prepared.feature_names, "target": prepared.target_name,
+        "class_names": class_names, "metrics": state.metrics,
+        "train_seconds": seconds, "session": session,
+    }
+    if args.profile:
+        result["profile"] = getattr(model, "profile_", None)
+    return result
+
+
+def cmd_tune(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.ML.model_registry import get_spec, import_ref
+
+    spec = get_spec(args.model)
+    _, prepared, _ = _load_training_data(args, spec.task)
+    X, y = prepared.X, prepared.Y
+    grid = _parse_params(args.param)
+    if not grid:
+        raise ValueError("!At least one --param NAME=V1,V2,... is required!")
+
+    t0 = time.perf_counter()
+    if args.model == "linear_regression":
+        from myclt.ML.supervised_learning.linear_regression.hyperparameter_tuning import \
+            grid_search_regularization
+
+        unknown = set(grid) - {"lambda_l1", "lambda_l2"}
+        if unknown:
+            raise ValueError(f"!linear_regression tunes only lambda_l1 / lambda_l2, got {sorted(unknown)}!")
+        res = grid_search_regularization(X, y, lambda_l1_grid=grid.get("lambda_l1", [0.0]),
+                                         lambda_l2_grid=grid.get("lambda_l2", [0.0]),
+                                         k_folds=args.cv, seed=args.seed,
+                                         use_scaling=not args.no_scaling)
+        best = {"lambda_l1": res["best_lambda_l1"], "lambda_l2": res["best_lambda_l2"]}
+        scoring, score = "mse", res["best_mse"]
+    elif args.model == "logistic_regression":
+        from myclt.ML.supervised_learning.logistic_regression import hyperparameter_tuning as ht
+
+        scoring = args.scoring or "f1"
+        if args.search == "grid":
+            best, score = ht.grid_search_cv(X, y, grid, args.cv, verbose=False, scoring=scoring,
+                                            seed=args.seed)
+        else:
+            best, score = ht.random_search_cv(X, y, grid, args.n_iter, args.cv, seed=args.seed,
+                                              verbose=False, scoring=scoring)
+    elif args.model in _SVM_TUNABLE:
+        from myclt.ML.supervised_learning.svm import hyperparameter_tuning as ht
+
+        model_class = import_ref(spec.model)
+        task = "regressor" if spec.task == "regression" else "classifier"
+        scoring = ht._resolve_scoring(args.scoring, task)
+        if args.search == "grid":
+            best, score = ht.grid_search_cv(X, y, model_class, grid, args.cv, task,
+                                            verbose=False, scoring=scoring, seed=args.seed)
+        else:
+            best, score = ht.random_search_cv(X, y, model_class, grid, args.n_iter, args.cv,
+                                              task, seed=args.seed, verbose=False,
+                                              scoring=scoring)
+    else:
+        raise ValueError(f"!Tuning is not available for '{args.model}'!")
+
+    return {"model_type": args.model, "search": args.search, "cv": args.cv,
+            "scoring": scoring, "best_params": best, "best_score": float(score),
+            "seconds": time.perf_counter() - t0}
+
+
+def cmd_predict(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.ML.batch_predict import batch_predict_from_csv
+    from myclt.ML.model_registry import get_spec, load_session_state
+
+    model_type, state = load_session_state(_session_path(args.session, args.sessions_dir))
+    std = getattr(state, "scaled_std", None)
+    if std is None:
+        std = getattr(state, "scaler_std", None)
+    res = batch_predict_from_csv(
+        args.data, state.model, state.prepareddata.feature_names,
+        use_scaling=state.use_scaling, scaler_mean=state.scaler_mean, scaler_std=std,
+        delimiter=args.delimiter, output_path=args.output,
+        model_type=_BATCH_TYPES[get_spec(model_type).task],
+        class_names=getattr(state, "class_names", None) or None,
+        add_original_features=args.with_features,
+        sparse=True if args.sparse else None,
+    )
+    return {"model_type": model_type, "n_samples": int(res["n_samples"]),
+            "sparse": res["sparse"], "output_path": res["output_path"]}
+
+
+def cmd_evaluate(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.ML.model_registry import get_spec, load_session_state
+
+    model_type, state = load_session_state(_session_path(args.session, args.sessions_dir))
+    X_test, y_test = _test_arrays(state)
+    return {"model_type": model_type, "n_test": int(len(X_test)),
+            "metrics": evaluate_model(get_spec(model_type).task, state.model, X_test, y_test,
+                                      class_names=getattr(state, "class_names", None) or None)}
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cmd_session(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.ML.session_storage import SessionStorage
+
+    storage = SessionStorage()
+    if args.action == "list":
+        sessions = []
+        for name in sorted(storage.list_sessions(args.sessions_dir)):
+            path = os.path.join(args.sessions_dir, name)
+            config = _read_json(os.path.join(path, "config.json"))
+            sessions.append({"name": name, "model_type": config.get("model_type"),
+                             "timestamp": _read_json(os.path.join(path, "metadata.json")).get("timestamp"),
+                             "metrics": config.get("metrics", {})})
+        return {"sessions_dir": args.sessions_dir, "sessions": sessions}
+
+    if not args.names:
+        raise ValueError(f"!'session {args.action}' needs at least one session name!")
+    paths = [_session_path(name, args.sessions_dir) for name in args.names]
+
+    if args.action == "show":
+        shown = []
+        for path in paths:
+            config = _read_json(os.path.join(path, "config.json"))
+            config["n_train"] = len(config.pop("train_indices", None) or [])
+            config["n_test"] = len(config.pop("test_indices", None) or [])
+            shown.append({"path": path, "metadata": _read_json(os.path.join(path, "metadata.json")),
+                          "config": config})
+        return {"sessions": shown}
+
+    for path in paths:
+        storage.delete_session(path, verbose=False)
+    return {"deleted": paths}
+
+
+def cmd_clean(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.legacy_code import cleaner
+
+    index = None
+    if args.from_manifest:
+        stats = cleaner.load_manifest(args.from_manifest)
+    else:
+        policy = cleaner.CleanPolicy(
+            min_age_days=args.min_age, include=args.include or [], exclude=args.exclude or [],
+            min_size=cleaner.parse_size(args.min_size) if args.min_size else 0,
+            quota=cleaner.parse_size(args.quota) if args.quota else None,
+            free_bytes=cleaner.parse_size(args.free) if args.free else None)
+        index = cleaner.ScanIndex.load(args.index) if args.index else None
+        dirs = args.dirs or cleaner.get_temp_dirs()
+        stats = cleaner.scan_directories(dirs, workers=args.workers, collect=True,
+                                         policy=policy, index=index)
+        if index is not None:
+            index.save(args.index)
+        if args.manifest:
+            cleaner.save_manifest(stats, args.manifest)
+
+    # saved manifests and reused index listings can be out of date
+    verify = bool(args.from_manifest or (index is not None and index.reused))
+    report = []
+    total = cleaner.DeleteReport(permanent=args.permanent)
+    for st in stats:
+        entry = {"path": st.path, "files": st.files, "bytes": st.bytes, "dirs": st.dirs,
+                 "errors": st.errors, "seconds": st.seconds, "cached_dirs": st.cached,
+                 "matched": st.matched, "matched_bytes": st.matched_bytes,
+                 "largest": [{"name": n, "files": f, "bytes": b}
+                             for n, f, b in st.largest_children(args.top)]}
+        if args.yes:
+            deleted = cleaner.delete_files(st.entries, permanent=args.permanent,
+                                           workers=args.workers, batch_size=args.batch_size,
+                                           verify=verify)
+            entry.update(deleted=deleted.files, freed=deleted.bytes, failed=deleted.failed,
+                         skipped=deleted.skipped)
+            total.add(deleted)
+        report.append(entry)
+
+    result = {"dry_run": not args.yes, "directories": report,
+              "files": sum(r["files"] for r in report), "bytes": sum(r["bytes"] for r in report),
+              "matched": sum(r["matched"] for r in report),
+              "matched_bytes": sum(r["matched_bytes"] for r in report)}
+    if args.manifest and not args.from_manifest:
+        result["manifest"] = os.path.abspath(args.manifest)
+    if args.yes:
+        result["delete"] = {"permanent": args.permanent, "files": total.files,
+                            "bytes": total.bytes, "failed": total.failed,
+                            "skipped": total.skipped,
+                            "seconds": total.seconds, "files_per_s": total.files_per_s,
+                            "mb_per_s": total.mb_per_s}
+    return result
+
+
+def cmd_new(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.legacy_code import project_creator
+
+    template = project_creator.get_template(args.template)
+    variables = {}
+    for item in args.var or []:
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"!Invalid --var '{item}', expected NAME=VALUE!")
+        variables[name.strip()] = value
+    missing = [n for n, v in template.variables.items() if v is None and n not in variables]
+    if missing:
+        raise ValueError(f"!Template '{args.template}' needs --var for: {missing}!")
+
+    path = os.path.abspath(args.path)
+    if os.path.exists(path) and os.listdir(path) and not args.force:
+        raise FileExistsError(f"!{path} exists and is not empty (use --force)!")
+    os.makedirs(path, exist_ok=True)
+    report = project_creator.create_project(path, args.template, use_cache=not args.no_cache,
+                                            variables=variables, git=not args.no_git,
+                                            venv=not args.no_venv)
+    render = report.render
+    return {"path": path, "template": args.template,
+            "dirs": render.dirs, "files": render.files, "bytes": render.bytes,
+            "rendered": render.rendered, "git": report.git, "venv": report.venv,
+            "steps": report.timer.steps,
+            "seconds": time.perf_counter() - report.timer.start}
+
+
+def cmd_export(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.ML.inference import export_artifact
+
+    return export_artifact(_session_path(args.session, args.sessions_dir), args.output)
+
+
+def cmd_serve(args: argparse.Namespace) -> Dict[str, Any]:
+    from myclt.ML.serving import PredictionService, load_models, make_server
+
+    paths = [s if "=" in s else _session_path(s, args.sessions_dir) for s in args.sessions]
+    service = PredictionService(load_models(paths), batching=not args.no_batching,
+                                max_batch_rows=args.max_batch, max_wait_ms=args.max_wait_ms)
+    server = make_server(service, args.host, args.port, verbose=args.verbose)
+    host, port = server.server_address[:2]
+    print(json.dumps({"url": f"http://{host}:{port}", "models": list(service.models)}), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return {"url": f"http://{host}:{port}", **service.metrics()}
+
+
+# ============================================================================
+# Argument parsing
+# ============================================================================
+
+def _add_data_args(p: argparse.ArgumentParser) -> None:
+    from myclt.ML.model_registry import MODEL_TYPES
+
+    p.add_argument("data", help="training CSV")
+    p.add_argument("--target", required=True, help="target column name")
+    p.add_argument("--features", help="comma-separated feature columns (default: all others)")
+    p.add_argument("--model", required=True, choices=list(MODEL_TYPES))
+    p.add_argument("--delimiter", help="CSV delimiter (auto-detected by default)")
+    p.add_argument("--dtype", default="float64", choices=["float32", "float64"])
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--no-scaling", action="store_true", help="do not standardize features")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="myclt", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions-dir", default=DEFAULT_SESSIONS_DIR)
+    parser.add_argument("--indent", type=int, default=2, help="JSON indent (0 = one line)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("train", help="train a model and optionally save the session")
+    _add_data_args(p)
+    p.add_argument("--test-size", type=float, default=0.2)
+    p.add_argument("--lr", type=float)
+    p.add_argument("--epochs", type=int)
+    p.add_argument("--l1", type=float, help="L1 strength (linear_regression)")
+    p.add_argument("--l2", type=float, help="L2 strength (linear / logistic regression)")
+    p.add_argument("--threshold", type=float, help="decision threshold (logistic_regression)")
+    p.add_argument("--C", type=float)
+    p.add_argument("--kernel", choices=["linear", "rbf", "poly", "sigmoid"])
+    p.add_argument("--gamma", type=float)
+    p.add_argument("--degree", type=int)
+    p.add_argument("--coef0", type=float)
+    p.add_argument("--epsilon", type=float, help="tube width (SVR)")
+    p.add_argument("--batch-size", type=int)
+    p.add_argument("--base", choices=["linear", "kernel"], help="binary estimator (ovr_svm)")
+    p.add_argument("--early-stopping", type=int, metavar="PATIENCE",
+                   help="hold out 20%% of the training split and stop after PATIENCE epochs")
+    p.add_argument("--profile", nargs="?", const="time", choices=["time", "memory"],
+                   help="profile the fit (phase times, epochs/s, kernel size, peak RSS); "
+                        "'memory' also traces allocations")
+    p.add_argument("--save", metavar="NAME_OR_DIR", help="save the session")
+    p.set_defaults(func=cmd_train)
+
+    p = sub.add_parser("tune", help="cross-validated hyperparameter search")
+    _add_data_args(p)
+    p.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2,...")
+    p.add_argument("--search", choices=["grid", "random"], default="grid")
+    p.add_argument("--n-iter", type=int, default=10)
+    p.add_argument("--cv", type=int, default=5)
+    p.add_argument("--scoring")
+    p.set_defaults(func=cmd_tune)
+
+    p = sub.add_parser("predict", help="batch predictions from a saved session")
+    p.add_argument("session")
+    p.add_argument("data", help="CSV with the feature columns only, or a libsvm file")
+    p.add_argument("--output")
+    p.add_argument("--delimiter")
+    p.add_argument("--with-features", action="store_true",
+                   help="copy the input features into the output CSV")
+    p.add_argument("--sparse", action="store_true",
+                   help="load a CSV as a sparse matrix (libsvm files always are)")
+    p.set_defaults(func=cmd_predict)
+
+    p = sub.add_parser("evaluate", help="metrics of a saved session on its test split")
+    p.add_argument("session")
+    p.set_defaults(func=cmd_evaluate)
+
+    p = sub.add_parser("session", help="list, show or delete saved sessions")
+    p.add_argument("action", choices=["list", "show", "rm"])
+    p.add_argument("names", nargs="*")
+    p.set_defaults(func=cmd_session)
+
+    p = sub.add_parser("export", help="write a compact inference artifact (.npz) of a session")
+    p.add_argument("session")
+    p.add_argument("output", help="artifact path (.npz)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("serve", help="HTTP JSON prediction server for saved sessions")
+    p.add_argument("sessions", nargs="+", metavar="SESSION", help="session name, path or NAME=PATH")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000, help="0 picks a free port")
+    p.add_argument("--max-batch", type=int, default=1024, help="rows per coalesced predict call")
+    p.add_argument("--max-wait-ms", type=float, default=1.0,
+                   help="how long a batch waits for more requests")
+    p.add_argument("--no-batching", action="store_true", help="one predict call per request")
+    p.add_argument("--verbose", action="store_true", help="log every request to stderr")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("clean", help="report (or delete with --yes) temporary files")
+    p.add_argument("dirs", nargs="*", help="directories (default: system temp/cache dirs)")
+    p.add_argument("--yes", action="store_true", help="move the files to trash")
+    p.add_argument("--permanent", action="store_true",
+                   help="with --yes: delete with os.unlink instead of the trash")
+    p.add_argument("--workers", type=int,
+                   help="scan / unlink threads (default: cpu_count + 4, max 32)")
+    p.add_argument("--batch-size", type=int, default=500,
+                   help="files per send2trash call / unlink task")
+    p.add_argument("--manifest", metavar="PATH", help="save the scanned file list as JSON")
+    p.add_argument("--from-manifest", metavar="PATH",
+                   help="use a saved file list instead of scanning")
+    p.add_argument("--min-age", type=float, default=0.0, metavar="DAYS",
+                   help="only files not modified for this many days")
+    p.add_argument("--min-size", metavar="SIZE", help="only files of at least SIZE (e.g. 10M)")
+    p.add_argument("--include", action="append", metavar="GLOB",
+                   help="only files matching GLOB (name or relative path, repeatable)")
+    p.add_argument("--exclude", action="append", metavar="GLOB",
+                   help="skip files / directories matching GLOB (repeatable)")
+    p.add_argument("--quota", metavar="SIZE",
+                   help="per directory: delete oldest files until it is at most SIZE")
+    p.add_argument("--free", metavar="SIZE", help="largest files first until SIZE is freed")
+    p.add_argument("--index", metavar="PATH",
+                   help="reuse unchanged directory listings of the previous run stored here")
+    p.add_argument("--top", type=int, default=5, help="largest subdirectories listed per root")
+    p.set_defaults(func=cmd_clean)
+
+    p = sub.add_parser("new", help="create a project from a template (venv, git)")
+    p.add_argument("path", help="project directory (created)")
+    p.add_argument("--template", default="python",
+                   help="built-in language or template in ~/.myclt/templates (default: python)")
+    p.add_argument("--var", action="append", metavar="NAME=VALUE", help="template variable")
+    p.add_argument("--no-git", action="store_true")
+    p.add_argument("--no-venv", action="store_true")
+    p.add_argument("--no-cache", action="store_true",
+                   help="run the venv command instead of cloning the cached base venv")
+    p.add_argument("--force", action="store_true", help="allow an existing non-empty directory")
+    p.set_defaults(func=cmd_new)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a subcommand, or the interactive menu when called without arguments."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        from myclt.main import choose_category
+        choose_category()
+        return 0
+
+    args = build_parser().parse_args(argv)
+    stdout = sys.stdout
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            result = {"ok": True, "command": args.command, **args.func(args)}
+        code = 0
+    except Exception as e:
+        result = {"ok": False, "command": args.command, "error": str(e).strip("!")}
+        code = 1
+    stdout.write(json.dumps(result, indent=args.indent or None, default=_to_json) + "\n")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,36 @@
 #!/usr/bin/env python3
 """
 cleaner.py is a minimal utility for cleaning temporary files.
+
+The temp directories are walked once: the scan records a manifest of
+(path, size, mtime) per root, and the delete phase works from that list
+instead of walking again. A manifest can be saved as JSON and deleted
+later (``myclt clean --manifest`` / ``--from-manifest``).
+
+A CleanPolicy (minimum age and size, include / exclude globs, per-root
+quota, "largest first until N bytes are freed") is applied while
+scanning, and a ScanIndex of the previous run's directory listings lets
+unchanged directories be taken over without listing them again.
 """
 
+import json
 import os
 import platform
-from typing import List, Tuple
-from send2trash import send2trash
+import queue
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+MANIFEST_FORMAT = 1
+
+# ScanIndex of the interactive cleaner (outside every directory in CLEAN_PATHS)
+INDEX_PATH = os.path.join(os.path.expanduser("~"), ".myclt", "cleaner_index.json")
+
+# (path, size in bytes, mtime)
+FileEntry = Tuple[str, int, float]
 
 CLEAN_PATHS = {
     "Windows": [
@@ -52,6 +76,354 @@ def get_temp_dirs() -> List[str]:
     return dirs
 
 
+# ============================================================================
+# Policies
+# ============================================================================
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as "500", "200K", "1.5G" or "2GB" (1024-based)."""
+    value = str(text).strip().upper()
+    if value.endswith("B") and len(value) > 1 and value[-2] in _SIZE_UNITS:
+        value = value[:-1]
+    unit = value[-1] if value and value[-1] in _SIZE_UNITS else ""
+    try:
+        return int(float(value[:len(value) - len(unit)]) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"!Invalid size '{text}'!") from None
+
+
+@dataclass
+class CleanPolicy:
+    """
+    Which files a scan selects for deletion.
+
+    min_age_days, min_size, include and exclude are checked per file while
+    scanning; quota and free_bytes then choose among the matching files.
+    Patterns are fnmatch globs tried against the name and against the path
+    relative to the root ("/" separated); a directory matching an exclude
+    pattern is not scanned at all.
+    """
+    min_age_days: float = 0.0
+    min_size: int = 0
+    include: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+    # per root: oldest matching files first until the root is at most this size
+    quota: Optional[int] = None
+    # over all roots: largest matching files first until this much is freed
+    free_bytes: Optional[int] = None
+
+    @property
+    def selects(self) -> bool:
+        """True if quota / free_bytes need the full list of matching files."""
+        return self.quota is not None or self.free_bytes is not None
+
+    def cutoff(self, now: Optional[float] = None) -> float:
+        """Newest mtime a file may have to be old enough."""
+        return (time.time() if now is None else now) - self.min_age_days * 86400
+
+    def matches(self, rel_path: str, name: str, size: int, mtime: float, cutoff: float) -> bool:
+        if size < self.min_size or mtime > cutoff:
+            return False
+        if self.include and not any(fnmatch(name, p) or fnmatch(rel_path, p)
+                                    for p in self.include):
+            return False
+        return not any(fnmatch(name, p) or fnmatch(rel_path, p) for p in self.exclude)
+
+    def excludes_dir(self, rel_path: str, name: str) -> bool:
+        return any(fnmatch(name, p) or fnmatch(rel_path, p) for p in self.exclude)
+
+    def select(self, stats: List["DirStats"]) -> None:
+        """Apply quota and free_bytes to the scanned entries, in place."""
+        if self.quota is not None:
+            for st in stats:
+                excess = st.bytes - self.quota
+                chosen: List[FileEntry] = []
+                for entry in sorted(st.entries, key=lambda e: e[2]):
+                    if excess <= 0:
+                        break
+                    chosen.append(entry)
+                    excess -= entry[1]
+                st.entries = chosen
+        if self.free_bytes is not None:
+            ranked = sorted(((e[1], i, e) for i, st in enumerate(stats) for e in st.entries),
+                            key=lambda t: t[0], reverse=True)
+            for st in stats:
+                st.entries = []
+            freed = 0
+            for size, i, entry in ranked:
+                if freed >= self.free_bytes:
+                    break
+                stats[i].entries.append(entry)
+                freed += size
+        for st in stats:
+            st.matched = len(st.entries)
+            st.matched_bytes = sum(e[1] for e in st.entries)
+
+
+# ============================================================================
+# Index of previous runs
+# ============================================================================
+
+class ScanIndex:
+    """
+    Directory listings of the previous scan, keyed by directory mtime.
+
+    A directory whose mtime has not changed since the last run has the
+    same entries, so its recorded listing is reused and only one stat of
+    the directory is needed instead of a scandir plus a stat per file.
+    Subdirectories are still visited (their changes do not touch the
+    parent's mtime), and the recorded file sizes / mtimes can be stale if
+    a file was rewritten in place — delete_files(verify=True) checks them
+    again before deleting. Directories modified less than RACY_SECONDS
+    before the scan started are not recorded (their mtime may not move
+    on a change within the same clock tick).
+    """
+
+    FORMAT = 1
+    RACY_SECONDS = 2.0
+
+    def __init__(self, previous: Optional[Dict[str, list]] = None):
+        self.previous: Dict[str, list] = previous or {}
+        self.current: Dict[str, list] = {}
+        self.started_ns = time.time_ns()
+        self.reused = 0
+
+    @classmethod
+    def load(cls, path: str) -> "ScanIndex":
+        """Read an index file; a missing or unreadable one gives an empty index."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if data.get("format") != cls.FORMAT:
+            return cls()
+        return cls(data["dirs"])
+
+    def save(self, path: str) -> None:
+        """Write the listings recorded during this run."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": self.FORMAT, "created_ns": self.started_ns,
+                       "dirs": self.current}, f)
+        os.replace(tmp, path)
+
+    def lookup(self, path: str, mtime_ns: int) -> Optional[list]:
+        record = self.previous.get(path)
+        if record is not None and record[0] == mtime_ns:
+            return record
+        return None
+
+    def record(self, path: str, mtime_ns: int, files: list, subdirs: List[str]) -> None:
+        if mtime_ns < self.started_ns - self.RACY_SECONDS * 1e9:
+            self.current[path] = [mtime_ns, files, subdirs]
+
+
+# ============================================================================
+# Scanning
+# ============================================================================
+
+@dataclass
+class DirStats:
+    """Scan totals of one root directory."""
+    path: str
+    files: int = 0
+    bytes: int = 0
+    dirs: int = 0
+    errors: int = 0                 # entries / directories that could not be read
+    # top-level entry of the root -> [files, bytes] ("." = files directly in the root)
+    children: Dict[str, List[int]] = field(default_factory=dict)
+    seconds: float = 0.0
+    # manifest: the files selected for deletion (only when scanned with collect=True)
+    entries: Optional[List[FileEntry]] = field(default=None, repr=False)
+    matched: int = 0                # files selected by the policy (all without one)
+    matched_bytes: int = 0
+    cached: int = 0                 # directories taken from the ScanIndex
+
+    def largest_children(self, n: int = 5) -> List[Tuple[str, int, int]]:
+        """The n top-level entries with the most bytes: (name, files, bytes)."""
+        ranked = sorted(self.children.items(), key=lambda kv: kv[1][1], reverse=True)
+        return [(name, f, b) for name, (f, b) in ranked[:n]]
+
+
+class _Listing(NamedTuple):
+    files: int
+    bytes: int
+    errors: int
+    subdirs: List[Tuple[str, str]]          # (path, relative path) to scan next
+    entries: Optional[List[FileEntry]]      # matching files if collect
+    matched: int
+    matched_bytes: int
+    record: Optional[tuple]                 # (mtime_ns, files, subdir names) for the index
+    cached: bool
+
+
+def _scan_dir(path: str, rel: str, collect: bool = False,
+              policy: Optional[CleanPolicy] = None, cutoff: float = 0.0,
+              index: Optional[ScanIndex] = None) -> _Listing:
+    """
+    List one directory with os.scandir (or take it from the index).
+
+    Symlinks are counted as files and never followed (like os.walk).
+    """
+    errors = 0
+    cached = False
+    mtime_ns = None
+    listing: List[tuple] = []           # (name, size, mtime)
+    subnames: List[str] = []
+    try:
+        if index is not None:
+            mtime_ns = os.stat(path, follow_symlinks=False).st_mtime_ns
+            record = index.lookup(path, mtime_ns)
+            if record is not None:
+                _, listing, subnames = record
+                cached = True
+        if not cached:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subnames.append(entry.name)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            listing.append((entry.name, st.st_size, st.st_mtime))
+                    except OSError:
+                        errors += 1
+    except OSError:
+        errors += 1
+
+    prefix = rel + "/" if rel else ""
+    files = size = matched = matched_bytes = 0
+    entries: Optional[List[FileEntry]] = [] if collect else None
+    for name, fsize, mtime in listing:
+        files += 1
+        size += fsize
+        if policy is None or policy.matches(prefix + name, name, fsize, mtime, cutoff):
+            matched += 1
+            matched_bytes += fsize
+            if collect:
+                entries.append((os.path.join(path, name), fsize, mtime))
+    subdirs = [(os.path.join(path, n), prefix + n) for n in subnames
+               if policy is None or not policy.excludes_dir(prefix + n, n)]
+    record = (mtime_ns, listing, subnames) if index is not None and not errors else None
+    return _Listing(files, size, errors, subdirs, entries, matched, matched_bytes, record, cached)
+
+
+def scan_directories(paths: List[str], workers: Optional[int] = None,
+                     progress: Optional[Callable[[int, int, int], None]] = None,
+                     progress_interval: float = 0.2,
+                     collect: bool = False,
+                     policy: Optional[CleanPolicy] = None,
+                     index: Optional[ScanIndex] = None) -> List[DirStats]:
+    """
+    Count files and bytes under several roots concurrently.
+
+    Every directory is one task of a shared thread pool (scandir and stat
+    release the GIL), so a single huge root is split across the workers
+    too, not only separate roots. Workers push their listings to a queue
+    and the totals are merged in the calling thread; workers=1 scans in
+    the calling thread without a pool.
+
+    Args:
+        paths: Root directories (missing ones give empty stats)
+        workers: Thread count (default: min(32, cpu_count + 4))
+        progress: Called as progress(files, bytes, dirs) at most every
+                  progress_interval seconds and once at the end
+        progress_interval: Seconds between progress calls
+        collect: Also record the manifest (DirStats.entries) of every root
+        policy: Select only matching files (entries / matched); a policy
+                with a quota or free_bytes implies collect
+        index: Reuse the listings of unchanged directories from a previous
+               run and record this run's listings in index.current
+
+    Returns:
+        One DirStats per root (paths made absolute), in the order of paths
+    """
+    collect = collect or (policy is not None and policy.selects)
+    cutoff = policy.cutoff() if policy is not None else 0.0
+    paths = [os.path.abspath(p) for p in paths]
+    stats = [DirStats(p, entries=[] if collect else None) for p in paths]
+    t0 = time.perf_counter()
+    totals = [0, 0, 0]
+    last_report = [t0]
+    todo = [(i, p, "") for i, p in enumerate(paths) if os.path.isdir(p)]
+
+    def merge(root: int, path: str, rel: str, listing: _Listing) -> List[Tuple[int, str, str]]:
+        st = stats[root]
+        st.files += listing.files
+        st.bytes += listing.bytes
+        st.dirs += 1
+        st.errors += listing.errors
+        st.matched += listing.matched
+        st.matched_bytes += listing.matched_bytes
+        st.cached += listing.cached
+        if listing.entries:
+            st.entries.extend(listing.entries)
+        if listing.record is not None:
+            index.record(path, *listing.record)
+        now = time.perf_counter()
+        st.seconds = now - t0
+        if listing.files:
+            child = st.children.setdefault(rel.split("/", 1)[0] or ".", [0, 0])
+            child[0] += listing.files
+            child[1] += listing.bytes
+        totals[0] += listing.files
+        totals[1] += listing.bytes
+        totals[2] += 1
+        if progress and now - last_report[0] >= progress_interval:
+            progress(*totals)
+            last_report[0] = now
+        return [(root, sub, sub_rel) for sub, sub_rel in listing.subdirs]
+
+    if workers == 1:
+        while todo:
+            root, path, rel = todo.pop()
+            todo.extend(merge(root, path, rel, _scan_dir(path, rel, collect, policy, cutoff, index)))
+    else:
+        results: "queue.SimpleQueue" = queue.SimpleQueue()
+
+        def task(root: int, path: str, rel: str) -> None:
+            try:
+                results.put((root, path, rel, _scan_dir(path, rel, collect, policy, cutoff, index)))
+            except BaseException:
+                results.put((root, path, rel, _Listing(0, 0, 1, [], None, 0, 0, None, False)))
+                raise
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for item in todo:
+                pool.submit(task, *item)
+            outstanding = len(todo)
+            while outstanding:
+                try:
+                    root, path, rel, listing = results.get(timeout=progress_interval)
+                except queue.Empty:
+                    if progress:
+                        progress(*totals)
+                    continue
+                outstanding -= 1
+                for item in merge(root, path, rel, listing):
+                    pool.submit(task, *item)
+                    outstanding += 1
+
+    if policy is not None and policy.selects:
+        policy.select(stats)
+    if index is not None:
+        index.reused += sum(st.cached for st in stats)
+    if progress:
+        progress(*totals)
+    return stats
+
+
+def print_progress(files: int, size: int, dirs: int) -> None:
+    """Live one-line progress for scan_directories."""
+    sys.stdout.write(f"\r  scanned {files:,} files, {size / 1024**2:,.1f} MB in {dirs:,} directories")
+    sys.stdout.flush()
+
+
 def scan_directory(path: str) -> Tuple[int, int]:
     """
     Counts the number of files and their total size in a directory.
@@ -59,74 +431,280 @@ def scan_directory(path: str) -> Tuple[int, int]:
     Returns:
         Tuple of (file_count, total_size_in_bytes)
     """
-    total_size = 0
-    file_count = 0
-    if not os.path.exists(path):
-        return 0, 0
+    st = scan_directories([path])[0]
+    return st.files, st.bytes
 
-    for root, _, files in os.walk(path):
-        for f in files:
-            try:
-                fp = os.path.join(root, f)
-                total_size += os.path.getsize(fp)
-                file_count += 1
-            except (FileNotFoundError, PermissionError):
-                pass
-    return file_count, total_size
 
+# ============================================================================
+# Manifest
+# ============================================================================
+
+def save_manifest(stats: List[DirStats], path: str) -> None:
+    """
+    Write scanned roots (scan_directories(..., collect=True)) to a JSON file.
 
-def clean_directory(path: str) -> Tuple[int, int]:
+    File paths are stored relative to their root to keep the file small.
     """
-    Move all files in a directory to trash.
+    roots = []
+    for st in stats:
+        if st.entries is None:
+            raise ValueError(f"!{st.path} was scanned without a manifest (collect=True)!")
+        start = len(os.path.join(st.path, ""))
+        roots.append({
+            "path": st.path, "files": st.files, "bytes": st.bytes, "dirs": st.dirs,
+            "errors": st.errors, "seconds": st.seconds, "children": st.children,
+            "matched": st.matched, "matched_bytes": st.matched_bytes, "cached": st.cached,
+            "entries": [[fp[start:], size, mtime] for fp, size, mtime in st.entries],
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"format": MANIFEST_FORMAT, "created": time.time(), "roots": roots}, f)
+
+
+def load_manifest(path: str) -> List[DirStats]:
+    """Read a manifest written by save_manifest."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"!Unsupported manifest format {data.get('format')}!")
+    stats = []
+    for root in data["roots"]:
+        base = root["path"]
+        entries = [(os.path.join(base, rel), size, mtime) for rel, size, mtime in root["entries"]]
+        stats.append(DirStats(
+            base, files=root["files"], bytes=root["bytes"], dirs=root["dirs"],
+            errors=root["errors"], children=root["children"], seconds=root["seconds"],
+            entries=entries, matched=root.get("matched", len(entries)),
+            matched_bytes=root.get("matched_bytes", sum(e[1] for e in entries)),
+            cached=root.get("cached", 0)))
+    return stats
+
+
+# ============================================================================
+# Deleting
+# ============================================================================
+
+@dataclass
+class DeleteReport:
+    """Result and throughput of one delete_files call."""
+    files: int = 0
+    bytes: int = 0
+    failed: int = 0
+    skipped: int = 0                # changed since the scan (verify=True)
+    seconds: float = 0.0
+    permanent: bool = False
+
+    @property
+    def files_per_s(self) -> float:
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / 1024**2 / self.seconds if self.seconds > 0 else 0.0
+
+    def add(self, other: "DeleteReport") -> None:
+        self.files += other.files
+        self.bytes += other.bytes
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.seconds += other.seconds
+
+
+def _unchanged(batch: List[FileEntry]) -> Tuple[List[FileEntry], int, int]:
+    """Entries whose size and mtime still match: (entries, skipped, failed)."""
+    keep = []
+    skipped = failed = 0
+    for entry in batch:
+        try:
+            st = os.stat(entry[0], follow_symlinks=False)
+        except OSError:
+            failed += 1
+            continue
+        if st.st_size == entry[1] and st.st_mtime == entry[2]:
+            keep.append(entry)
+        else:
+            skipped += 1
+    return keep, skipped, failed
+
+
+def _trash_batch(batch: List[FileEntry], verify: bool = False) -> Tuple[int, int, int, int]:
+    """send2trash one batch; on an error retry file by file to count the failures."""
+    from send2trash import send2trash
+
+    skipped = failed = 0
+    if verify:
+        batch, skipped, failed = _unchanged(batch)
+    if not batch:
+        return 0, 0, failed, skipped
+    try:
+        send2trash([fp for fp, _, _ in batch])
+        return len(batch), sum(size for _, size, _ in batch), failed, skipped
+    except Exception:
+        pass
+    # files before the failing one are already in the trash
+    deleted = freed = 0
+    for fp, size, _ in batch:
+        if not os.path.lexists(fp):
+            deleted += 1
+            freed += size
+            continue
+        try:
+            send2trash(fp)
+            deleted += 1
+            freed += size
+        except Exception:
+            failed += 1
+    return deleted, freed, failed, skipped
+
+
+def _unlink_batch(batch: List[FileEntry], verify: bool = False) -> Tuple[int, int, int, int]:
+    skipped = failed = 0
+    if verify:
+        batch, skipped, failed = _unchanged(batch)
+    deleted = freed = 0
+    for fp, size, _ in batch:
+        try:
+            os.unlink(fp)
+            deleted += 1
+            freed += size
+        except OSError:
+            failed += 1
+    return deleted, freed, failed, skipped
+
+
+def delete_files(entries: Iterable[FileEntry], permanent: bool = False,
+                 workers: Optional[int] = None, batch_size: int = 500, verify: bool = False,
+                 progress: Optional[Callable[[int, int, int], None]] = None) -> DeleteReport:
+    """
+    Delete the files of a manifest without walking the directories again.
+
+    Files go to the trash in batches of batch_size (one send2trash call per
+    batch, in order: concurrent trash moves would race for the names in the
+    trash). With permanent=True they are removed with os.unlink by a
+    thread pool, batch_size files per task. Freed bytes are the sizes
+    recorded in the manifest. With verify=True every file is stat'ed
+    first and left alone if its size or mtime differ from the manifest
+    (in use since the scan, or a stale ScanIndex listing).
+
+    Args:
+        entries: (path, size, mtime) tuples, e.g. DirStats.entries
+        permanent: os.unlink instead of send2trash (cannot be undone)
+        workers: Threads for permanent deletes (default: min(32, cpu_count + 4))
+        batch_size: Files per send2trash call / unlink task
+        verify: Skip files that changed since the scan
+        progress: Called as progress(deleted, bytes, failed) after every batch
 
     Returns:
-        Tuple of (deleted_count, freed_size_in_bytes)
+        DeleteReport with the counts and the elapsed time
     """
-    deleted = 0
-    freed = 0
-    if not os.path.exists(path):
-        return 0, 0
+    entries = list(entries)
+    batches = [entries[i:i + batch_size] for i in range(0, len(entries), max(1, batch_size))]
+    report = DeleteReport(permanent=permanent)
+    t0 = time.perf_counter()
 
-    for root, _, files in os.walk(path):
-        for f in files:
-            try:
-                fp = os.path.join(root, f)
-                size = os.path.getsize(fp)
-                send2trash(fp)
-                deleted += 1
-                freed += size
-            except Exception:
-                pass
-    return deleted, freed
+    def merge(result: Tuple[int, int, int, int]) -> None:
+        report.files += result[0]
+        report.bytes += result[1]
+        report.failed += result[2]
+        report.skipped += result[3]
+        if progress:
+            progress(report.files, report.bytes, report.failed)
+
+    if not permanent:
+        for batch in batches:
+            merge(_trash_batch(batch, verify))
+    elif workers == 1 or len(batches) <= 1:
+        for batch in batches:
+            merge(_unlink_batch(batch, verify))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(_unlink_batch, b, verify) for b in batches]):
+                merge(future.result())
+
+    report.seconds = time.perf_counter() - t0
+    return report
+
+
+def format_report(report: DeleteReport) -> str:
+    """One-line summary with throughput."""
+    action = "Deleted" if report.permanent else "Moved to trash"
+    line = (f"{action}: {report.files:,} files, {report.bytes / 1024**2:.2f} MB in "
+            f"{report.seconds:.1f} s ({report.files_per_s:,.0f} files/s, "
+            f"{report.mb_per_s:,.1f} MB/s)")
+    if report.failed:
+        line += f", {report.failed:,} failed"
+    if report.skipped:
+        line += f", {report.skipped:,} changed since the scan (kept)"
+    return line
+
+
+def clean_directory(path: str, permanent: bool = False,
+                    policy: Optional[CleanPolicy] = None) -> Tuple[int, int]:
+    """
+    Move all files in a directory to trash (or delete them with permanent=True).
+
+    Args:
+        path: Directory to clean
+        permanent: os.unlink instead of the trash
+        policy: Only delete the files the policy selects
+
+    Returns:
+        Tuple of (deleted_count, freed_size_in_bytes)
+    """
+    st = scan_directories([path], collect=True, policy=policy)[0]
+    report = delete_files(st.entries, permanent=permanent)
+    return report.files, report.bytes
 
 
 def main() -> None:
     """Entry point for the cleaner utility."""
     dirs = get_temp_dirs()
+    answer = input("Only delete files older than how many days? [1]: ").strip()
+    try:
+        policy = CleanPolicy(min_age_days=float(answer or 1))
+    except ValueError:
+        print("Invalid number, using 1 day")
+        policy = CleanPolicy(min_age_days=1)
+    index = ScanIndex.load(INDEX_PATH)
     print("scanning temporary directories...\n")
 
-    total_files, total_size = 0, 0
-    for d in dirs:
-        files, size = scan_directory(d)
-        total_files += files
-        total_size += size
+    t0 = time.perf_counter()
+    results = scan_directories(dirs, progress=print_progress, collect=True,
+                               policy=policy, index=index)
+    elapsed = time.perf_counter() - t0
+    print("\n")
+    try:
+        index.save(INDEX_PATH)
+    except OSError as e:
+        print(f"Could not save the scan index: {e}")
+
+    for st in results:
+        if st.dirs == 0:
+            continue
+        print(f"{st.path}: {st.files:,} files, {st.bytes / 1024**2:.2f} MB "
+              f"({st.matched:,} files, {st.matched_bytes / 1024**2:.2f} MB old enough)")
+        for name, files, size in st.largest_children(3):
+            print(f"    {name:<30} {files:>10,} files {size / 1024**2:>10.2f} MB")
 
-    print(f"Found: {total_files} number of temporary files")
+    total_files = sum(st.matched for st in results)
+    total_size = sum(st.matched_bytes for st in results)
+    print(f"\nFound: {total_files} number of temporary files ({elapsed:.1f} s, "
+          f"{index.reused:,} unchanged directories reused)")
     print(f"The total size of these files: {total_size / 1024**2:.2f} MB\n")
 
     confirm = input("Do you want to delete them (they have been moved to the trash) y/n?: ").strip().lower()
 
     if confirm == "y":
-        deleted, freed = 0, 0
-        for d in dirs:
-            del_files, del_size = clean_directory(d)
-            deleted += del_files
-            freed += del_size
-        print(f"\nDeleted: {deleted} files")
-        print(f"Amount of freed memory: {freed / 1024**2:.2f} MB")
+        def show(deleted: int, size: int, failed: int) -> None:
+            sys.stdout.write(f"\r  {deleted:,}/{total_files:,} files, {size / 1024**2:,.1f} MB")
+            sys.stdout.flush()
+
+        report = delete_files((e for st in results for e in st.entries), verify=True,
+                              progress=show)
+        print("\n")
+        print(format_report(report))
     else:
         print("\nOperation is prohibited")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
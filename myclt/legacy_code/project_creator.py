@@ -1,11 +1,57 @@
 """
 project_creator.py is a basic utility for creating a simple structure for new projects.
+
+Creating a venv with ``python -m venv`` spends seconds in ensurepip, so a
+base venv per interpreter is built once in a template cache (CACHE_DIR)
+and new projects get a clone of it: files are reflinked or hardlinked
+where the filesystem allows (copied otherwise) and the few files holding
+the venv's absolute path (activate scripts, pip launchers, pyvenv.cfg)
+are rewritten. If cloning fails the venv is created ``--without-pip`` and
+pip is unpacked from a cached wheel. Git init/commit and the venv run
+concurrently and every step is timed.
+
+Besides the built-in LANGUAGES, templates are loaded from TEMPLATES_DIR
+(``~/.myclt/templates``), one directory per template:
+
+    <name>/template.json    {"description": "...", "venv": true,
+                             "variables": {"license": "MIT", "author": null}}
+    <name>/files/...        the project tree
+
+File and directory names and text files may use ``{{ variable }}``;
+project_name, package_name, author, year and date are always defined,
+variables with a null default are asked for. "venv" is true (the Python
+venv), a venv command, or false. Templates are indexed once into a cached
+manifest (directories, files, which files need substitution), which is
+only refreshed for templates whose directories changed; the tree is then
+materialized with one mkdir per directory and parallel file writes.
 """
 
+import getpass
+import hashlib
+import json
 import os
 import platform
+import re
+import shutil
+import stat
 import subprocess
-from typing import Optional
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from glob import glob
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# Template cache: one base venv per interpreter and the pip wheel
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".myclt", "project_cache")
+CACHE_FORMAT = 1
+_CACHE_META = "myclt-cache.json"
+
+# User templates and their cached manifest
+TEMPLATES_DIR = os.path.join(os.path.expanduser("~"), ".myclt", "templates")
+MANIFEST_PATH = os.path.join(CACHE_DIR, "templates_manifest.json")
+MANIFEST_FORMAT = 1
 
 # A dictionary that will build a structure depending on the programming language
 LANGUAGES = {
@@ -51,17 +97,20 @@ LANGUAGES = {
 
 
 def choose_language() -> str:
-    """Asks the user for a programming language and returns it."""
-    print("\nAvailable languages:")
-    for lang in LANGUAGES:
-        print(f" - {lang}")
+    """Asks the user for a template (built-in language or on-disk template) and returns it."""
+    templates = load_templates()
+    print("\nAvailable templates:")
+    for name, template in templates.items():
+        print(f" - {name:<16} {template.description}")
+    if not os.path.isdir(TEMPLATES_DIR):
+        print(f"\n(add your own templates to {TEMPLATES_DIR})")
 
     while True:
-        choice = input("\nSpecify the language you will use in the project: ").strip().lower()
-        if choice in LANGUAGES:
-            print(f"\nLanguage selected: {choice}")
+        choice = input("\nSpecify the template you will use in the project: ").strip().lower()
+        if choice in templates:
+            print(f"\nTemplate selected: {choice}")
             return choice
-        print("!Unknown language. Try again!\n")
+        print("!Unknown template. Try again!\n")
 
 
 def create_project_folder() -> Optional[str]:
@@ -103,67 +152,745 @@ def create_project_folder() -> Optional[str]:
     return project_path
 
 
-def generate_project_structure(project_path: str, language: str) -> None:
-    """Creates all folders and files according to the selected language."""
-    config = LANGUAGES[language]
+# ============================================================================
+# Templates
+# ============================================================================
+
+_VARIABLE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Files above this size are copied with shutil.copyfile instead of read + write
+_COPYFILE_MIN = 1024 * 1024
+
+# [relative path, size, mtime_ns, render] of a template file
+TemplateFile = List[Any]
+
+
+@dataclass
+class ProjectTemplate:
+    """A project skeleton: a built-in LANGUAGES entry or a template directory."""
+    name: str
+    description: str = ""
+    venv_command: Optional[str] = None
+    variables: Dict[str, Any] = field(default_factory=dict)
+    root: Optional[str] = None                                  # files/ of an on-disk template
+    dirs: List[str] = field(default_factory=list)               # relative, may hold {{vars}}
+    files: List[TemplateFile] = field(default_factory=list)     # on-disk files
+    contents: Dict[str, str] = field(default_factory=dict)      # built-in files: path -> text
+
+    @classmethod
+    def from_language(cls, name: str, config: Dict[str, Any]) -> "ProjectTemplate":
+        contents = dict(config["files"])
+        contents[config["main_file"]] = config["main_file_content"]
+        return cls(name, config.get("description", ""), config.get("venv_command"),
+                   dirs=list(config["folders"]), contents=contents)
+
+
+@dataclass
+class RenderReport:
+    """Result of one render_template call."""
+    dirs: int = 0
+    files: int = 0
+    bytes: int = 0
+    rendered: int = 0               # files with variables substituted (others are copied)
+    seconds: float = 0.0
+
+
+def substitute(text: str, variables: Dict[str, Any]) -> str:
+    """Replace {{ name }} with the variable; unknown names are left as they are."""
+    def repl(match: "re.Match") -> str:
+        value = variables.get(match.group(1))
+        return match.group(0) if value is None else str(value)
+    return _VARIABLE.sub(repl, text)
+
+
+def _needs_render(path: str) -> bool:
+    """Text file containing a {{ variable }} (binary files are copied as they are)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if b"{{" not in data:
+        return False
+    try:
+        return _VARIABLE.search(data.decode("utf-8")) is not None
+    except UnicodeDecodeError:
+        return False
+
+
+def _index_template(template_dir: str) -> Dict[str, Any]:
+    """Walk one template directory into its manifest entry."""
+    with open(os.path.join(template_dir, "template.json"), "r", encoding="utf-8") as f:
+        config = json.load(f)
+    root = os.path.join(template_dir, "files")
+    dirs: Dict[str, int] = {}
+    files: List[TemplateFile] = []
+    if os.path.isdir(root):
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            path = os.path.join(root, rel)
+            dirs[rel] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                for entry in it:
+                    child = os.path.join(rel, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(child)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        files.append([child, st.st_size, st.st_mtime_ns,
+                                      _needs_render(entry.path)])
+    return {"config": config,
+            "config_mtime_ns": os.stat(os.path.join(template_dir, "template.json")).st_mtime_ns,
+            "root": root, "dirs": dirs, "files": sorted(files)}
+
+
+def _entry_is_current(template_dir: str, entry: Dict[str, Any]) -> bool:
+    """One stat per directory: listings only change with the directory mtime."""
+    try:
+        if os.stat(os.path.join(template_dir, "template.json")).st_mtime_ns != entry["config_mtime_ns"]:
+            return False
+        root = entry["root"]
+        if not entry["dirs"]:
+            return not os.path.isdir(root)
+        return all(os.stat(os.path.join(root, rel)).st_mtime_ns == mtime
+                   for rel, mtime in entry["dirs"].items())
+    except OSError:
+        return False
+
+
+def _venv_command(value: Any) -> Optional[str]:
+    if value is True:
+        return LANGUAGES["python"]["venv_command"]
+    return value or None
+
+
+def load_templates(templates_dir: Optional[str] = None,
+                   manifest_path: Optional[str] = None) -> Dict[str, ProjectTemplate]:
+    """
+    Built-in templates plus the template directories in templates_dir.
+
+    The manifest at manifest_path is reused for unchanged templates and
+    rewritten when a template was added, changed or removed. On-disk
+    templates override built-in ones of the same name; a template that
+    cannot be read is reported and skipped.
+
+    Args:
+        templates_dir: Directory of templates (default: TEMPLATES_DIR)
+        manifest_path: Cached manifest (default: MANIFEST_PATH)
+
+    Returns:
+        Dict of template name -> ProjectTemplate
+    """
+    templates_dir = templates_dir or TEMPLATES_DIR
+    manifest_path = manifest_path or MANIFEST_PATH
+    templates = {name: ProjectTemplate.from_language(name, config)
+                 for name, config in LANGUAGES.items()}
+    if not os.path.isdir(templates_dir):
+        return templates
+
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != MANIFEST_FORMAT or manifest.get("dir") != templates_dir:
+            manifest = {}
+    except (OSError, ValueError):
+        manifest = {}
+    cached = manifest.get("templates", {})
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    changed = False
+    with os.scandir(templates_dir) as it:
+        names = sorted(e.name for e in it
+                       if e.is_dir() and os.path.isfile(os.path.join(e.path, "template.json")))
+    for name in names:
+        template_dir = os.path.join(templates_dir, name)
+        entry = cached.get(name)
+        if entry is None or not _entry_is_current(template_dir, entry):
+            try:
+                entry = _index_template(template_dir)
+            except (OSError, ValueError) as e:
+                print(f"!Skipping template '{name}': {e}!")
+                continue
+            changed = True
+        entries[name] = entry
+        config = entry["config"]
+        templates[name] = ProjectTemplate(
+            name, config.get("description", ""), _venv_command(config.get("venv", False)),
+            variables=dict(config.get("variables", {})), root=entry["root"],
+            dirs=sorted(rel for rel in entry["dirs"] if rel), files=entry["files"])
+
+    if changed or set(cached) != set(entries):
+        try:
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            tmp = manifest_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"format": MANIFEST_FORMAT, "dir": templates_dir, "templates": entries}, f)
+            os.replace(tmp, manifest_path)
+        except OSError as e:
+            print(f"!Cannot save the template manifest: {e}!")
+    return templates
+
+
+def get_template(name: str) -> ProjectTemplate:
+    """Look up a template by name."""
+    templates = load_templates()
+    if name not in templates:
+        raise ValueError(f"!Unknown template '{name}'. Use one of: {list(templates)}!")
+    return templates[name]
+
 
-    for folder in config["folders"]:
-        folder_path = os.path.join(project_path, folder)
-        os.makedirs(folder_path, exist_ok=True)
-        print(f"Created folder: {folder_path}")
+def default_variables(project_path: str) -> Dict[str, Any]:
+    """Variables every template can use."""
+    project_name = os.path.basename(os.path.abspath(project_path))
+    package_name = re.sub(r"\W", "_", project_name.lower()) or "project"
+    if package_name[0].isdigit():
+        package_name = "_" + package_name
+    try:
+        author = getpass.getuser()
+    except Exception:
+        author = ""
+    return {"project_name": project_name, "package_name": package_name, "author": author,
+            "year": time.strftime("%Y"), "date": time.strftime("%Y-%m-%d")}
+
+
+def _target(project_path: str, rel: str, variables: Dict[str, Any]) -> str:
+    rel = os.path.normpath(substitute(rel, variables))
+    if os.path.isabs(rel) or rel == ".." or rel.startswith(".." + os.sep):
+        raise ValueError(f"!Template path '{rel}' points outside the project!")
+    return os.path.normpath(os.path.join(project_path, rel))
+
+
+def _write_batch(jobs: List[tuple], variables: Dict[str, Any]) -> tuple:
+    """Write (target, source path or None, text or None, file entry) jobs: (files, bytes, rendered)."""
+    files = size = rendered = 0
+    for target, src, text, item in jobs:
+        executable = False
+        if src is not None:
+            st = os.stat(src)
+            executable = bool(st.st_mode & 0o111)
+            render = item[3]
+            if (st.st_size, st.st_mtime_ns) != (item[1], item[2]):
+                render = _needs_render(src)         # edited since it was indexed
+            if not render and st.st_size > _COPYFILE_MIN:
+                shutil.copyfile(src, target)        # sendfile / copy_file_range
+                data = None
+            else:
+                with open(src, "rb") as f:
+                    data = f.read()
+                if render:
+                    data = substitute(data.decode("utf-8"), variables).encode("utf-8")
+        else:
+            render = True
+            data = substitute(text, variables).encode("utf-8")
+        if data is not None:
+            with open(target, "wb") as f:
+                f.write(data)
+        if executable:
+            os.chmod(target, stat.S_IMODE(st.st_mode))
+        files += 1
+        size += st.st_size if data is None else len(data)
+        rendered += render
+    return files, size, rendered
+
+
+def render_template(template: ProjectTemplate, project_path: str,
+                    variables: Optional[Dict[str, Any]] = None,
+                    workers: Optional[int] = None, batch_size: int = 64) -> RenderReport:
+    """
+    Materialize a template in project_path.
 
-    for file_path, content in config["files"].items():
-        full_path = os.path.join(project_path, file_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        print(f"Created file: {full_path}")
+    All target directories are created first (one mkdir each, parents
+    before children), then the files are written by a thread pool in
+    batches: files without variables are copied, the others rendered.
 
-    main_path = os.path.join(project_path, config["main_file"])
-    os.makedirs(os.path.dirname(main_path), exist_ok=True)
-    with open(main_path, "w", encoding="utf-8") as f:
-        f.write(config["main_file_content"])
-    print(f"Created main file: {main_path}")
+    Args:
+        template: Template to render
+        project_path: Existing project root
+        variables: Overrides for default_variables and the template defaults
+        workers: Writer threads (default: cpu_count + 4, max 32)
+        batch_size: Files per thread-pool task
 
+    Returns:
+        RenderReport
+    """
+    t0 = time.perf_counter()
+    values = default_variables(project_path)
+    values.update({k: substitute(str(v), values) for k, v in template.variables.items()
+                   if v is not None})
+    values.update(variables or {})
+
+    jobs = [(_target(project_path, item[0], values), os.path.join(template.root, item[0]),
+             None, item) for item in template.files]
+    jobs += [(_target(project_path, rel, values), None, text, None)
+             for rel, text in template.contents.items()]
+
+    dirs = {_target(project_path, rel, values) for rel in template.dirs}
+    dirs.update(os.path.dirname(job[0]) for job in jobs)
+    dirs.discard(os.path.normpath(project_path))
+    report = RenderReport()
+    for directory in sorted(dirs):
+        try:
+            os.mkdir(directory)
+            report.dirs += 1
+        except FileExistsError:
+            pass
+        except FileNotFoundError:                   # parent outside the listed dirs
+            os.makedirs(directory, exist_ok=True)
+            report.dirs += 1
+
+    batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+    if len(batches) <= 1:
+        results = [_write_batch(batch, values) for batch in batches]
+    else:
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda batch: _write_batch(batch, values), batches))
+    for files, size, rendered in results:
+        report.files += files
+        report.bytes += size
+        report.rendered += rendered
+    report.seconds = time.perf_counter() - t0
+    return report
+
+
+def generate_project_structure(project_path: str, language: str,
+                               variables: Optional[Dict[str, Any]] = None) -> RenderReport:
+    """Creates all folders and files of the selected template."""
+    report = render_template(get_template(language), project_path, variables)
+    print(f"Created {report.dirs} folders and {report.files} files "
+          f"({report.bytes / 1024:.1f} KB) in {report.seconds:.3f} s")
     print("\nProject structure has been successfully created!")
+    return report
+
+
+# ============================================================================
+# Step timing
+# ============================================================================
+
+class StepTimer:
+    """Wall time per named step (steps may run in different threads)."""
+
+    def __init__(self):
+        self.steps: Dict[str, float] = {}
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def step(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + time.perf_counter() - t0
+
+    def format(self) -> str:
+        """Table of the steps in the order they started, plus the total wall time."""
+        total = time.perf_counter() - self.start
+        width = max([len(name) for name in self.steps] + [20])
+        lines = [f"{'step':<{width}} {'seconds':>8}", "-" * (width + 9)]
+        lines += [f"{name:<{width}} {seconds:>8.3f}" for name, seconds in self.steps.items()]
+        lines.append(f"{'total (wall)':<{width}} {total:>8.3f}")
+        return "\n".join(lines)
+
+
+# ============================================================================
+# Git
+# ============================================================================
 
+def _git(args, cwd: str) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
 
-def initialize_git(project_path: str) -> None:
-    """Initialize Git repository with first commit."""
+
+def initialize_git(project_path: str, timer: Optional[StepTimer] = None) -> bool:
+    """
+    Initialize Git repository with first commit.
+
+    The venv directory is excluded from the commit explicitly, so the commit
+    is right even while the venv is being created in parallel.
+
+    Returns:
+        True if the first commit was made
+    """
+    timer = timer or StepTimer()
     print("\nInitializing Git repository...")
 
-    try:
-        subprocess.run(["git", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    except FileNotFoundError:
+    if shutil.which("git") is None:
         print("!Git is not installed or not found in PATH!")
-        return
+        return False
 
-    subprocess.run(["git", "init"], cwd=project_path)
+    with timer.step("git init"):
+        res = _git(["init"], project_path)
+    if res.returncode != 0:
+        print(f"!git init failed: {res.stderr.strip()}!")
+        return False
     print("Git repository initialized.")
 
-    subprocess.run(["git", "add", "."], cwd=project_path)
-    subprocess.run(["git", "commit", "-m", "Initial project structure"], cwd=project_path)
+    with timer.step("git commit"):
+        _git(["add", "--", ".", ":(exclude)venv"], project_path)
+        res = _git(["commit", "-m", "Initial project structure"], project_path)
+    if res.returncode != 0:
+        print(f"!git commit failed: {(res.stderr or res.stdout).strip()}!")
+        return False
     print("First commit implemented.")
+    return True
 
 
-def initialize_venv(project_path: str, language: str) -> None:
-    """Create a virtual environment (Python only)."""
-    if language != "python":
-        return
+# ============================================================================
+# Virtual environments
+# ============================================================================
 
-    print("\nCreating virtual environment...")
-    config = LANGUAGES[language]
-    venv_command = config["venv_command"]
+class Interpreter(NamedTuple):
+    """The Python a venv command runs, as reported by itself."""
+    executable: str     # resolved sys.executable (not a pyenv/asdf shim)
+    version: str        # "3.12.1"
+    bundled: str        # ensurepip/_bundled directory ("" without ensurepip)
+    mtime_ns: int
+
+    @property
+    def key(self) -> str:
+        """Cache key: changes when the interpreter is replaced or upgraded."""
+        digest = hashlib.sha1(f"{self.executable}|{self.mtime_ns}".encode()).hexdigest()[:10]
+        return f"{self.version}-{digest}"
+
+    @property
+    def site_packages(self) -> str:
+        """site-packages relative to the venv root."""
+        if platform.system() == "Windows":
+            return os.path.join("Lib", "site-packages")
+        major, minor = self.version.split(".")[:2]
+        return os.path.join("lib", f"python{major}.{minor}", "site-packages")
+
+
+_PROBE = (
+    "import json, os, sys\n"
+    "try:\n"
+    "    import ensurepip\n"
+    "    bundled = os.path.join(os.path.dirname(ensurepip.__file__), '_bundled')\n"
+    "except ImportError:\n"
+    "    bundled = ''\n"
+    "print(json.dumps([sys.executable, '%d.%d.%d' % sys.version_info[:3], bundled]))\n"
+)
+
+
+def probe_interpreter(command: str) -> Interpreter:
+    """Ask the interpreter behind a command ("python3", a shim, a path) who it is."""
+    res = subprocess.run([command, "-c", _PROBE], capture_output=True, text=True, check=True)
+    executable, version, bundled = json.loads(res.stdout)
+    return Interpreter(executable, version, bundled, os.stat(executable).st_mtime_ns)
 
+
+def _bin_dir(venv_path: str) -> str:
+    return os.path.join(venv_path, "Scripts" if platform.system() == "Windows" else "bin")
+
+
+def build_base_venv(interp: Interpreter) -> str:
+    """
+    Build the cached base venv for an interpreter (once; slow, runs ensurepip).
+
+    The venv is built in a temporary directory and renamed into place, so a
+    concurrent or interrupted build never leaves a half-built cache entry.
+
+    Returns:
+        Cache entry directory (contains ``venv/`` and the cache metadata)
+    """
+    entry = os.path.join(CACHE_DIR, "venvs", interp.key)
+    if os.path.isfile(os.path.join(entry, _CACHE_META)):
+        return entry
+
+    tmp = f"{entry}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    venv_path = os.path.join(tmp, "venv")
     try:
-        subprocess.run(venv_command.split(), cwd=project_path, check=True)
-    except subprocess.CalledProcessError:
-        print("!Failed to create virtual environment!")
-        return
+        subprocess.run([interp.executable, "-m", "venv", venv_path],
+                       capture_output=True, text=True, check=True)
+        meta = {"format": CACHE_FORMAT, "built_at": venv_path,
+                "executable": interp.executable, "version": interp.version}
+        with open(os.path.join(tmp, _CACHE_META), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            pass                    # another process finished first
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if not os.path.isfile(os.path.join(entry, _CACHE_META)):
+        raise OSError(f"cache entry {entry} was not created")
+    return entry
+
+
+_FICLONE = 0x40049409           # Linux ioctl: share the extents (copy-on-write)
+
+
+def _reflink(src: str, dst: str) -> None:
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def _clone_file(src: str, dst: str, mode: str) -> str:
+    """Reflink, hardlink or copy one file, trying them in that order from mode."""
+    if mode in ("auto", "reflink"):
+        try:
+            _reflink(src, dst)
+            return "reflink"
+        except (OSError, ImportError):
+            pass
+    if mode in ("auto", "reflink", "hardlink"):
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def _clone_tree(src: str, dst: str, mode: str = "auto") -> str:
+    """
+    Recreate a directory tree, keeping symlinks as symlinks.
+
+    The first file decides the method (reflink > hardlink > copy) for the
+    rest, so an unsupported method is only tried once.
+
+    Returns:
+        The method used for the files
+    """
+    os.mkdir(dst)
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), target)
+                elif entry.is_dir():
+                    os.mkdir(target)
+                    stack.append((entry.path, target))
+                else:
+                    mode = _clone_file(entry.path, target, mode)
+    return mode
+
+
+def _relocate(venv_path: str, old_path: str) -> int:
+    """
+    Point a cloned venv at its new location.
+
+    Rewritten files are replaced (never modified in place), so hardlinks
+    into the cache are broken instead of changing the cache.
+
+    Returns:
+        Number of files rewritten
+    """
+    old, new = old_path.encode(), os.path.abspath(venv_path).encode()
+    bin_dir = _bin_dir(venv_path)
+    candidates = [os.path.join(venv_path, "pyvenv.cfg")]
+    candidates += [os.path.join(bin_dir, name) for name in os.listdir(bin_dir)]
+    rewritten = 0
+    for path in candidates:
+        if os.path.islink(path) or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        if old not in data:
+            continue
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data.replace(old, new))
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+        rewritten += 1
+    return rewritten
+
+
+def clone_venv(entry: str, venv_path: str, mode: str = "auto") -> str:
+    """
+    Create venv_path as a clone of a cached base venv.
+
+    Args:
+        entry: Cache entry directory returned by build_base_venv
+        venv_path: Venv to create (must not exist)
+        mode: "auto", "reflink", "hardlink" or "copy"
+
+    Returns:
+        The file method used
+    """
+    with open(os.path.join(entry, _CACHE_META), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    used = _clone_tree(os.path.join(entry, "venv"), venv_path, mode)
+    _relocate(venv_path, meta["built_at"])
+    return used
+
+
+def cached_pip_wheel(interp: Interpreter) -> Optional[str]:
+    """The pip wheel bundled with the interpreter, kept in CACHE_DIR/wheels."""
+    wheels = os.path.join(CACHE_DIR, "wheels")
+    bundled = sorted(glob(os.path.join(interp.bundled, "pip-*.whl"))) if interp.bundled else []
+    if not bundled:
+        cached = sorted(glob(os.path.join(wheels, "pip-*.whl")))
+        return cached[-1] if cached else None
+    target = os.path.join(wheels, os.path.basename(bundled[-1]))
+    if not os.path.exists(target):
+        try:
+            os.makedirs(wheels, exist_ok=True)
+            shutil.copy2(bundled[-1], target + ".tmp")
+            os.replace(target + ".tmp", target)
+        except OSError:
+            return bundled[-1]
+    return target
+
+
+_PIP_LAUNCHER = """#!{python}
+# -*- coding: utf-8 -*-
+import re
+import sys
+from pip._internal.cli.main import main
+if __name__ == "__main__":
+    sys.argv[0] = re.sub(r"(-script\\.pyw|\\.exe)?$", "", sys.argv[0])
+    sys.exit(main())
+"""
+
+
+def install_pip_from_wheel(venv_path: str, interp: Interpreter, wheel: str) -> None:
+    """Unpack a pip wheel into a venv created --without-pip (and add pip launchers)."""
+    with zipfile.ZipFile(wheel) as zf:
+        zf.extractall(os.path.join(venv_path, interp.site_packages))
+    if platform.system() == "Windows":
+        return                  # "python -m pip" works; .exe launchers need pip itself
+    bin_dir = _bin_dir(venv_path)
+    major, minor = interp.version.split(".")[:2]
+    launcher = _PIP_LAUNCHER.format(python=os.path.join(os.path.abspath(bin_dir), "python"))
+    for name in ("pip", f"pip{major}", f"pip{major}.{minor}"):
+        path = os.path.join(bin_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(launcher)
+        os.chmod(path, 0o755)
+
+
+def _cached_venv(venv_path: str, command: str, timer: StepTimer) -> str:
+    """Clone the cached base venv, or --without-pip + the cached pip wheel."""
+    with timer.step("venv: probe interpreter"):
+        interp = probe_interpreter(command)
+    entry = os.path.join(CACHE_DIR, "venvs", interp.key)
+    try:
+        if not os.path.isfile(os.path.join(entry, _CACHE_META)):
+            print("Building the base venv cache (first run for this interpreter)...")
+            with timer.step("venv: build cache"):
+                entry = build_base_venv(interp)
+        with timer.step("venv: clone"):
+            return f"clone ({clone_venv(entry, venv_path)})"
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"!Cannot clone the cached venv: {e}!")
+        shutil.rmtree(venv_path, ignore_errors=True)
+
+    wheel = cached_pip_wheel(interp)
+    if wheel is None:
+        raise OSError("no pip wheel available")
+    with timer.step("venv: create --without-pip"):
+        subprocess.run([interp.executable, "-m", "venv", "--without-pip", venv_path],
+                       capture_output=True, text=True, check=True)
+    with timer.step("venv: unpack pip wheel"):
+        install_pip_from_wheel(venv_path, interp, wheel)
+    return "without-pip + cached pip wheel"
+
+
+def initialize_venv(project_path: str, language: str, use_cache: bool = True,
+                    timer: Optional[StepTimer] = None) -> Optional[str]:
+    """
+    Create a virtual environment (templates with a venv command only).
+
+    Args:
+        project_path: Project root (the venv goes to ``venv/``)
+        language: Template name
+        use_cache: Clone the template cache's base venv instead of running
+                   the venv command (an existing venv/ always uses the command)
+        timer: Collects the step times
+
+    Returns:
+        How the venv was created, or None if it was not
+    """
+    command = get_template(language).venv_command
+    if not command:
+        return None
 
-    print("Successfully created virtual environment.")
+    timer = timer or StepTimer()
+    print("\nCreating virtual environment...")
+    venv_command = command.split()
     venv_path = os.path.join(project_path, "venv")
+
+    method = None
+    if use_cache and not os.path.exists(venv_path):
+        try:
+            method = _cached_venv(venv_path, venv_command[0], timer)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            print(f"!Template cache unavailable ({e}), running the venv command!")
+            shutil.rmtree(venv_path, ignore_errors=True)
+
+    if method is None:
+        try:
+            with timer.step("venv: python -m venv"):
+                subprocess.run(venv_command, cwd=project_path, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            print("!Failed to create virtual environment!")
+            return None
+        method = "venv command"
+
+    print(f"Successfully created virtual environment ({method}).")
     print(f"Venv location: {venv_path}")
+    return method
+
+
+@dataclass
+class ProjectReport:
+    """What create_project did."""
+    render: RenderReport
+    git: Optional[bool] = None      # first commit made (None: not requested)
+    venv: Optional[str] = None      # how the venv was created (None: no venv)
+    timer: StepTimer = field(default_factory=StepTimer)
+
+
+def create_project(project_path: str, language: str, use_cache: bool = True,
+                   variables: Optional[Dict[str, Any]] = None, git: bool = True,
+                   venv: bool = True) -> "ProjectReport":
+    """
+    Generate the structure, then run git init/commit and the venv concurrently.
+
+    Args:
+        project_path: Existing project root
+        language: Template name
+        use_cache: Clone the venv from the template cache
+        variables: Template variables (see render_template)
+        git: Initialize a repository with a first commit
+        venv: Create the template's venv
+
+    Returns:
+        ProjectReport (its timer has the time of every step)
+    """
+    timer = StepTimer()
+    with timer.step("structure"):
+        render = generate_project_structure(project_path, language, variables)
+    report = ProjectReport(render, timer=timer)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        git_result = pool.submit(initialize_git, project_path, timer) if git else None
+        venv_result = (pool.submit(initialize_venv, project_path, language, use_cache, timer)
+                       if venv else None)
+        report.git = git_result.result() if git_result else None
+        report.venv = venv_result.result() if venv_result else None
+    return report
+
+
+def ask_variables(language: str) -> Dict[str, Any]:
+    """Ask for the template variables that have no default."""
+    variables = {}
+    for name, default in get_template(language).variables.items():
+        if default is None:
+            variables[name] = input(f"Value for '{name}': ").strip()
+    return variables
 
 
 def main() -> None:
@@ -177,11 +904,10 @@ def main() -> None:
         print("\nOperation cancelled.")
         return
 
-    generate_project_structure(project_path, language)
-    initialize_git(project_path)
-    initialize_venv(project_path, language)
+    report = create_project(project_path, language, variables=ask_variables(language))
 
-    print("\nThe initial project structure has been successfully created.")
+    print("\nThe initial project structure has been successfully created.\n")
+    print(report.timer.format())
 
 
 if __name__ == "__main__":
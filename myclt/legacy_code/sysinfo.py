@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+sysinfo.py is a small system monitor built on psutil.
+
+Each sample reads CPU, memory, disk I/O, network and a few watched
+processes (inside psutil's ``oneshot()``, so a process's /proc files are
+read once per sample) into one record of a NumPy structured dtype. The
+history is a fixed-size ring buffer of these records, and a recording is
+the same records appended to a binary file after a short JSON header, so
+a replay is a single ``np.frombuffer``. The CPU time spent sampling is
+measured for every sample (``monitor_cpu`` column, % of one CPU), and
+run() stretches the interval if sampling would cost more than
+max_overhead percent of a CPU (about 0.4 ms per sample on Linux, so
+this only happens below ~50 ms intervals).
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import psutil
+
+MAGIC = b"MYCLTSYS"
+RECORD_FORMAT = 1
+
+# float32 keeps ~7 significant digits, plenty for bytes and percentages
+SYSTEM_FIELDS = [
+    ("time", "<f8"),            # unix time
+    ("cpu", "<f4"),             # % of all CPUs
+    ("mem_used", "<f4"),        # bytes
+    ("mem_percent", "<f4"),
+    ("swap_used", "<f4"),       # bytes
+    ("disk_read", "<f4"),       # bytes/s since the previous sample
+    ("disk_write", "<f4"),
+    ("net_sent", "<f4"),
+    ("net_recv", "<f4"),
+    ("monitor_cpu", "<f4"),     # % of one CPU spent taking this sample
+]
+# per watched process: cpu (% of one CPU), rss (bytes), threads
+PROCESS_FIELDS = ["cpu", "rss", "threads"]
+
+
+def record_dtype(n_processes: int) -> np.dtype:
+    """Structured dtype of one sample with n_processes watched processes."""
+    fields: List[tuple] = list(SYSTEM_FIELDS)
+    if n_processes:
+        fields += [(f"proc_{name}", "<f4", (n_processes,)) for name in PROCESS_FIELDS]
+    return np.dtype(fields)
+
+
+# ============================================================================
+# History
+# ============================================================================
+
+class RingBuffer:
+    """Fixed-size history of records; the oldest ones are overwritten."""
+
+    def __init__(self, capacity: int, dtype: np.dtype):
+        if capacity < 1:
+            raise ValueError("!Capacity must be at least 1!")
+        self.data = np.zeros(capacity, dtype=dtype)
+        self.count = 0                  # records appended so far
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return len(self.data)
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, record: np.ndarray) -> None:
+        with self._lock:
+            self.data[self.count % self.capacity] = record
+            self.count += 1
+
+    def view(self) -> np.ndarray:
+        """Copy of the stored records, oldest first."""
+        with self._lock:
+            if self.count <= self.capacity:
+                return self.data[:self.count].copy()
+            head = self.count % self.capacity
+            return np.concatenate((self.data[head:], self.data[:head]))
+
+    def last(self) -> Optional[np.ndarray]:
+        with self._lock:
+            return self.data[(self.count - 1) % self.capacity].copy() if self.count else None
+
+
+# ============================================================================
+# Sampling
+# ============================================================================
+
+class SystemMonitor:
+    """
+    Periodic sampler of system and per-process statistics.
+
+    Args:
+        interval: Seconds between samples
+        capacity: Samples kept in the ring buffer
+        pids: Processes to watch (default: this process; [] for none)
+        max_overhead: run() lengthens the interval when the sampling CPU
+                      time exceeds this % of one CPU (None = never)
+    """
+
+    def __init__(self, interval: float = 1.0, capacity: int = 3600,
+                 pids: Optional[Sequence[int]] = None, max_overhead: Optional[float] = 1.0):
+        if interval <= 0:
+            raise ValueError("!Interval must be positive!")
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.pids = [os.getpid()] if pids is None else list(pids)
+        try:
+            self._procs = [psutil.Process(pid) for pid in self.pids]
+            self.names = [p.name() for p in self._procs]
+        except psutil.NoSuchProcess as e:
+            raise ValueError(f"!No process with PID {e.pid}!") from None
+        self.dtype = record_dtype(len(self.pids))
+        self.history = RingBuffer(capacity, self.dtype)
+        self.samples = 0
+        self.sample_seconds = 0.0       # CPU time spent in sample()
+        self.cost = 0.0                 # moving average of the CPU seconds per sample
+        self.started = time.time()
+        self._record = np.zeros((), dtype=self.dtype)
+        self._counters: Optional[Tuple[float, np.ndarray]] = None
+        self._file = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # the first cpu_percent(None) call only sets the reference point
+        psutil.cpu_percent(None)
+        for proc in self._procs:
+            try:
+                proc.cpu_percent(None)
+            except psutil.Error:
+                pass
+
+    @property
+    def overhead_percent(self) -> float:
+        """CPU time spent sampling, in % of the wall time since the start."""
+        elapsed = time.time() - self.started
+        return self.sample_seconds / elapsed * 100 if elapsed > 0 else 0.0
+
+    def sample(self) -> np.ndarray:
+        """Take one sample, store it (history, recording) and return it."""
+        cpu0 = time.thread_time()
+        now = time.time()
+        rec = self._record
+        rec["time"] = now
+        rec["cpu"] = psutil.cpu_percent(None)
+        vm = psutil.virtual_memory()
+        rec["mem_used"] = vm.used
+        rec["mem_percent"] = vm.percent
+        rec["swap_used"] = psutil.swap_memory().used
+
+        # nowrap=False skips psutil's wrap bookkeeping; a wrapped counter
+        # gives one negative delta, clipped to 0 below
+        disk = psutil.disk_io_counters(nowrap=False)     # None without disks (containers)
+        net = psutil.net_io_counters(nowrap=False)
+        counters = np.array([disk.read_bytes if disk else 0, disk.write_bytes if disk else 0,
+                             net.bytes_sent, net.bytes_recv], dtype=np.float64)
+        if self._counters is not None and now > self._counters[0]:
+            rates = np.maximum(counters - self._counters[1], 0) / (now - self._counters[0])
+        else:
+            rates = np.zeros(4)
+        rec["disk_read"], rec["disk_write"], rec["net_sent"], rec["net_recv"] = rates
+        previous = self._counters[0] if self._counters is not None else None
+        self._counters = (now, counters)
+
+        for i, proc in enumerate(self._procs):
+            try:
+                with proc.oneshot():
+                    rec["proc_cpu"][i] = proc.cpu_percent(None)
+                    rec["proc_rss"][i] = proc.memory_info().rss
+                    rec["proc_threads"][i] = proc.num_threads()
+            except psutil.Error:            # exited or not accessible
+                rec["proc_cpu"][i] = rec["proc_rss"][i] = rec["proc_threads"][i] = np.nan
+
+        spent = time.thread_time() - cpu0
+        self.sample_seconds += spent
+        self.samples += 1
+        if self.samples > 1:            # the first sample pays for opening files
+            self.cost = spent if self.samples == 2 else 0.8 * self.cost + 0.2 * spent
+        period = now - previous if previous is not None else self.interval
+        rec["monitor_cpu"] = spent / max(period, 1e-9) * 100
+        self.history.append(rec)
+        if self._file is not None:
+            self._file.write(rec.tobytes())
+        return rec.copy()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def start_recording(self, path: str) -> None:
+        """Append every following sample to a recording file."""
+        self.stop_recording()
+        header = json.dumps({
+            "format": RECORD_FORMAT, "interval": self.interval, "started": time.time(),
+            "pids": self.pids, "names": self.names, "fields": list(self.dtype.names),
+        }).encode("utf-8")
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + struct.pack("<I", len(header)) + header)
+
+    def stop_recording(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # Loop
+    # ------------------------------------------------------------------
+
+    def run(self, duration: Optional[float] = None,
+            callback: Optional[Callable[[np.ndarray], None]] = None) -> None:
+        """
+        Sample every interval seconds until duration has passed or stop().
+
+        Sample times are fixed in advance (start + k * interval), so a slow
+        callback does not make the samples drift.
+        """
+        self._stop.clear()
+        begin = start = time.monotonic()
+        k = 0
+        while not self._stop.is_set():
+            rec = self.sample()
+            if callback:
+                callback(rec)
+            k += 1
+            # keep 20% headroom below max_overhead
+            if (self.max_overhead is not None
+                    and self.cost * 100 > 0.8 * self.max_overhead * self.interval):
+                self.interval = self.cost * 100 / (0.8 * self.max_overhead)
+                start, k = time.monotonic(), 0
+            next_t = start + k * self.interval
+            if duration is not None and next_t - begin > duration:
+                break
+            self._stop.wait(max(0.0, next_t - time.monotonic()))
+
+    def start(self, callback: Optional[Callable[[np.ndarray], None]] = None) -> None:
+        """Sample in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self.run, kwargs={"callback": callback},
+                                        name="sysinfo-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop run() / the background thread and close the recording."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self.stop_recording()
+
+
+# ============================================================================
+# Replay and reports
+# ============================================================================
+
+def load_recording(path: str) -> Tuple[Dict[str, Any], np.ndarray]:
+    """
+    Read a recording written by SystemMonitor.start_recording.
+
+    Returns:
+        (header, records) — a truncated last record (the monitor was
+        killed mid-write) is dropped
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"!{path} is not a sysinfo recording!")
+        (size,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(size).decode("utf-8"))
+        if header.get("format") != RECORD_FORMAT:
+            raise ValueError(f"!Unsupported recording format {header.get('format')}!")
+        data = f.read()
+    dtype = record_dtype(len(header["pids"]))
+    n = len(data) // dtype.itemsize
+    return header, np.frombuffer(data, dtype=dtype, count=n)
+
+
+def replay(path: str, speed: float = 0.0,
+           callback: Optional[Callable[[np.ndarray], None]] = None) -> np.ndarray:
+    """
+    Feed the records of a recording to callback (default: print them).
+
+    Args:
+        path: Recording file
+        speed: 1.0 = original pace, 10.0 = ten times faster, 0 = no waiting
+        callback: Called with every record
+
+    Returns:
+        All records of the recording
+    """
+    header, records = load_recording(path)
+    if callback is None:
+        names = header["names"]
+
+        def callback(rec: np.ndarray) -> None:
+            print(format_sample(rec, names))
+
+    for i, rec in enumerate(records):
+        if speed > 0 and i:
+            time.sleep(max(0.0, (rec["time"] - records[i - 1]["time"]) / speed))
+        callback(rec)
+    return records
+
+
+def _mb(value: float) -> str:
+    return f"{value / 1024**2:7.2f}"
+
+
+def format_sample(rec: np.ndarray, names: Sequence[str] = ()) -> str:
+    """One line of a sample for the terminal."""
+    line = (f"{datetime.fromtimestamp(float(rec['time'])):%H:%M:%S}  "
+            f"cpu {rec['cpu']:5.1f}%  mem {rec['mem_used'] / 1024**3:5.2f} GB "
+            f"({rec['mem_percent']:4.1f}%)  disk r/w {_mb(rec['disk_read'])} {_mb(rec['disk_write'])} MB/s  "
+            f"net up/down {_mb(rec['net_sent'])} {_mb(rec['net_recv'])} MB/s")
+    for i, name in enumerate(names):
+        line += (f"  [{name} {rec['proc_cpu'][i]:5.1f}% {rec['proc_rss'][i] / 1024**2:6.1f} MB "
+                 f"{rec['proc_threads'][i]:.0f} thr]")
+    return line + f"  monitor {rec['monitor_cpu']:.2f}%"
+
+
+def summarize(records: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """Mean and max of every numeric field (per-process fields per process)."""
+    summary: Dict[str, Dict[str, float]] = {}
+    if len(records) == 0:
+        return summary
+    for name in records.dtype.names:
+        if name == "time":
+            continue
+        column = records[name].astype(np.float64)
+        indexed = column.ndim == 2          # per-process fields
+        if not indexed:
+            column = column[:, None]
+        for i in range(column.shape[1]):
+            key = f"{name}[{i}]" if indexed else name
+            values = column[:, i]
+            summary[key] = {"mean": float(np.nanmean(values)), "max": float(np.nanmax(values))}
+    return summary
+
+
+def print_summary(records: np.ndarray, names: Sequence[str] = ()) -> None:
+    """Table of the mean and max of a run."""
+    if len(records) == 0:
+        print("No samples")
+        return
+    span = float(records["time"][-1] - records["time"][0])
+    print(f"\n{len(records)} samples over {span:.1f} s")
+    print(f"{'field':<24} {'mean':>14} {'max':>14}")
+    print("-" * 54)
+    for key, stats in summarize(records).items():
+        label = key
+        if key.startswith("proc_") and "[" in key and names:
+            label = f"{key.split('[')[0]} {names[int(key.split('[')[1][:-1])]}"
+        print(f"{label:<24} {stats['mean']:>14,.2f} {stats['max']:>14,.2f}")
+
+
+# ============================================================================
+# Menu entry
+# ============================================================================
+
+def _ask_float(prompt: str, default: Optional[float]) -> Optional[float]:
+    answer = input(prompt).strip()
+    if not answer:
+        return default
+    try:
+        return float(answer)
+    except ValueError:
+        print(f"Invalid number, using {default}")
+        return default
+
+
+def main() -> None:
+    """Entry point for the system monitor."""
+    print("1. Live monitor")
+    print("2. Replay a recording")
+    choice = input("\nSelect an option: ").strip()
+
+    if choice == "2":
+        path = input("Recording file: ").strip()
+        speed = _ask_float("Speed (1 = real time, 0 = no waiting) [0]: ", 0.0)
+        header, _ = load_recording(path)
+        print(f"\nrecorded {datetime.fromtimestamp(header['started']):%Y-%m-%d %H:%M:%S}, "
+              f"every {header['interval']} s, processes: {', '.join(header['names']) or '-'}\n")
+        print_summary(replay(path, speed), header["names"])
+        return
+
+    interval = _ask_float("Sampling interval in seconds [1]: ", 1.0)
+    duration = _ask_float("Duration in seconds (empty = until Ctrl+C): ", None)
+    answer = input("PIDs to watch, comma separated (empty = this process): ").strip()
+    try:
+        pids = [int(p) for p in answer.split(",")] if answer else None
+    except ValueError:
+        print("Invalid PID list, watching this process")
+        pids = None
+    record_path = input("Record to file (empty = no recording): ").strip()
+
+    monitor = SystemMonitor(interval=interval, pids=pids)
+    if record_path:
+        monitor.start_recording(record_path)
+    print("\nPress Ctrl+C to stop\n")
+    try:
+        monitor.run(duration, callback=lambda rec: print(format_sample(rec, monitor.names)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        monitor.stop()
+
+    print_summary(monitor.history.view(), monitor.names)
+    print(f"\nSampling overhead: {monitor.overhead_percent:.3f}% of one CPU "
+          f"({monitor.sample_seconds / max(monitor.samples, 1) * 1e3:.2f} ms per sample)")
+    if record_path:
+        print(f"Recorded {monitor.samples} samples to {record_path} "
+              f"({os.path.getsize(record_path):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,40 @@
+import importlib
 import os
 
-from myclt.ML.supervised_learning.linear_regression.cli import main as run_linear_regression
-from myclt.ML.supervised_learning.logistic_regression.cli import main as run_logistic_regression
-from myclt.ML.supervised_learning.logistic_regression.cli_multinomial import main as run_multinomial_logistic_regression
-from myclt.ML.supervised_learning.svm.cli import main as run_svm
-from myclt.ML.supervised_learning.svm.cli_multinomial import main as run_svm_multinomial
-from myclt.legacy_code.cleaner import main as run_cleaner
-from myclt.legacy_code.project_creator import main as run_project_creator
-
+# Menu entries are "module:function" references, imported only when the
+# operation is selected, so the first menu does not pay for NumPy,
+# matplotlib and every algorithm UI.
 MENU_STRUCTURE = {
     "Machine learning algorithms with a teacher": {
-        "Linear Regression for Forecasting Continuous Values": run_linear_regression,
-        "Logistic Regression for Binary Classification": run_logistic_regression,
-        "Multinomial Logistic Regression for Multiclass Classification": run_multinomial_logistic_regression,
-        "Support Vector Machines (SVM) for Classification and Regression": run_svm,
-        "Multiclass SVM (One-vs-Rest)": run_svm_multinomial,
+        "Linear Regression for Forecasting Continuous Values":
+            "myclt.ML.supervised_learning.linear_regression.cli:main",
+        "Logistic Regression for Binary Classification":
+            "myclt.ML.supervised_learning.logistic_regression.cli:main",
+        "Multinomial Logistic Regression for Multiclass Classification":
+            "myclt.ML.supervised_learning.logistic_regression.cli_multinomial:main",
+        "Support Vector Machines (SVM) for Classification and Regression":
+            "myclt.ML.supervised_learning.svm.cli:main",
+        "Multiclass SVM (One-vs-Rest)":
+            "myclt.ML.supervised_learning.svm.cli_multinomial:main",
     },
     "Machine learning algorithms without a teacher": {},
     "Machine learning algorithms with reinforcement": {},
     "Legacy Code": {
-        "Cleaning temporary files": run_cleaner,
-        "Creating a minimal structure for a new project": run_project_creator,
+        "Cleaning temporary files": "myclt.legacy_code.cleaner:main",
+        "Creating a minimal structure for a new project": "myclt.legacy_code.project_creator:main",
+        "System information monitor": "myclt.legacy_code.sysinfo:main",
     },
 }
 
 
+def resolve_entry(entry):
+    """Import a menu entry ("package.module:function"); callables pass through."""
+    if callable(entry):
+        return entry
+    module_name, func_name = entry.split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
 # clears the terminal
 def clear_screen() -> None:
     """Clear the terminal screen."""
@@ -41,10 +51,10 @@ def print_header(title: str) -> None:
 
 # Executes the script
 def run_script(func) -> None:
-    """Run a callable (function) and wait for user input to return."""
+    """Run a menu entry (callable or "module:function") and wait for user input to return."""
     clear_screen()
     try:
-        func()
+        resolve_entry(func)()
     except Exception as e:
         print(f"!ERROR!: {e}")
     input("\nPress Enter to return to the menu...")